@@ -42,6 +42,9 @@ def main():
     exclude=["interlocksdiags"]
     packages = find_packages('src', exclude=exclude)
 
+    package_data = {'pynutaq.nutaq': ['registers/*.csv'],
+                    'pynutaq.perseus': ['sequences/*.csv']}
+
     scripts = [
         'scripts/Nutaq',
         'scripts/NutaqDiags'
@@ -55,6 +58,7 @@ def main():
           url=url,
           package_dir=package_dir,
           packages=packages,
+          package_data=package_data,
           scripts=scripts
     )
 
@@ -28,26 +28,23 @@ __author__ = 'antmil'
 
 __docformat__ = 'restructuredtext'
 
-try:
-    import eapi
-except ImportError, e:
-    print "#############################################"
-    print "                 WARNING"
-    print "#############################################"
-    print "It's not possible to import perseus eapi. "
-    print "This device can run only in simulated mode.  "
-    print "#############################################\n"
-    #raise
+import eapi
 
 from pynutaq.perseus.perseusdecorators import ensure_write_method
 
 class Mi125(object):
 
-    def __init__(self, board_state, board_number, clksrc):
-
-        self._board_state = board_state
+    def __init__(self, transport, board_number, clksrc, configure=True):
+        """transport is the EapiTransport of the perseus, so the board calls
+        share its connections and priorities.
+        """
+        self._transport = transport
         self.board_number = board_number
 
+        if configure:
+            self.configure(clksrc)
+
+    def configure(self, clksrc):
         self.power_up()
 
         self.reset()
@@ -59,11 +56,11 @@ class Mi125(object):
 
     @ensure_write_method
     def power_up(self):
-        return eapi.MI125_powerup_send(self._board_state, self.board_number)
+        return self._transport.call(eapi.MI125_powerup_send, self.board_number)
 
     @ensure_write_method
     def reset(self):
-        return eapi.MI125_mi125_reset_send(self._board_state, self.board_number)
+        return self._transport.call(eapi.MI125_mi125_reset_send, self.board_number)
 
     def read_temperature(self):
         # tempmode = "templc"
@@ -84,7 +81,7 @@ class Mi125(object):
 
     @ensure_write_method
     def _set_config(self, groupch, lvds, randmode, binmode):
-        return eapi.MI125_mi125_set_config_send(self._board_state, self.board_number, groupch, lvds, randmode, binmode)
+        return self._transport.call(eapi.MI125_mi125_set_config_send, self.board_number, groupch, lvds, randmode, binmode)
 
     def set_clock_source(self, clksrc):
         if clksrc.lower() == 'bottomfmc':
@@ -93,9 +90,12 @@ class Mi125(object):
             clksrc = "EXT"
         clksrc = getattr(eapi, "MI125_CLKSRC" + clksrc.upper())
         self._set_clock_source(clksrc)
-        ret, channellanecalib, channelcalibstatus = eapi.MI125_mi125_get_channelcalibstatus_send(self._board_state,
-                                                                                                 self.board_number)
+
+    def is_calibrated(self):
+        ret, channellanecalib, channelcalibstatus = self._transport.call(
+            eapi.MI125_mi125_get_channelcalibstatus_send, self.board_number)
+        return ret >= 0 and bool(channelcalibstatus)
 
     @ensure_write_method
     def _set_clock_source(self, clksrc):
-        return eapi.MI125_mi125_set_clksrc_send(self._board_state, self.board_number, clksrc)
+        return self._transport.call(eapi.MI125_mi125_set_clksrc_send, self.board_number, clksrc)
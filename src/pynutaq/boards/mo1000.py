@@ -29,23 +29,34 @@ __author__ = 'antmil'
 __docformat__ = 'restructuredtext'
 
 import time
-try:
-    import eapi
-    from adp_exception import *
-except ImportError, e:
-    print e
-    #raise
+
+import eapi
+from adp_exception import *
 
 from pynutaq.perseus.perseusdecorators import ensure_write_method
+from pynutaq.perseus.perseusexceptions import PerseusTransportError
+
+# Settling times (s). Mo1000_GetStatus_send does not tell when the ports or
+# the pll are settled, so the board is given the whole time.
+PORTS_SETTLE_TIME = 2
+PLL_CALIBRATION_SETTLE_TIME = 2
+PLL_SYNC_SETTLE_TIME = 1
 
 
 class Mo1000(object):
     #@todo: finish to extract the board_number
 
-    def __init__(self, board_state, board_number=1):
-        self._board_state = board_state
+    def __init__(self, transport, board_number=1, configure=True):
+        """transport is the EapiTransport of the perseus, so the board calls
+        share its connections and priorities.
+        """
+        self._transport = transport
         self._board_number = board_number
 
+        if configure:
+            self.configure()
+
+    def configure(self):
         self.power_up()
         self.reset()
         self.init()
@@ -74,20 +85,20 @@ class Mo1000(object):
 
     @ensure_write_method
     def power_up(self):
-        return eapi.Mo1000_PowerUp_send(self._board_state, self._board_number)
+        return self._transport.call(eapi.Mo1000_PowerUp_send, self._board_number)
 
     @ensure_write_method
     def reset(self):
-        return eapi.Mo1000_Reset_send(self._board_state, self._board_number)
+        return self._transport.call(eapi.Mo1000_Reset_send, self._board_number)
 
     @ensure_write_method
     def init(self):
-        return eapi.Mo1000_Init_send(self._board_state, self._board_number)
+        return self._transport.call(eapi.Mo1000_Init_send, self._board_number)
 
     @ensure_write_method
     def write(self, board_number, device, address, value):
         # return eapi.Mo1000_WriteReg_send(self._board_state, board_number, device, address, value)
-        return eapi.Mo1000_WriteClockConfig_send(self._board_state, board_number)
+        return self._transport.call(eapi.Mo1000_WriteClockConfig_send, board_number)
 
     def configure_800MHZ(self):
         print "MO1000 1 configure 80MHz ext (DAC 80MSPS 1X)..."
@@ -102,8 +113,8 @@ class Mo1000(object):
     def configure_dacs(self):
         mode = "1x"
         mode = getattr(eapi, "eAd9148Inter" + mode.capitalize())
-        ret = eapi.Mo1000_SetDacParInterpolation_send(self._board_state, 1, mode)
-        ret = eapi.Mo1000_DoDacUpdate_send(self._board_state, self._board_number)
+        ret = self._transport.call(eapi.Mo1000_SetDacParInterpolation_send, 1, mode)
+        ret = self._transport.call(eapi.Mo1000_DoDacUpdate_send, self._board_number)
 
     def configure_clock(self):
         print "MO1000 1 clock configuration (ignore mmcm lock error from here)"
@@ -111,22 +122,24 @@ class Mo1000(object):
         src_clk = getattr(eapi, "eMo1000ClkSrc" + src_clk.capitalize())
         master_clk_mode = "manual"
         master_clk_mode = getattr(eapi, "eMo1000MasterClk" + master_clk_mode.capitalize())
-        ret = eapi.Mo1000_SetClockConfig_send(self._board_state,1, src_clk, 80000000, 80000000, master_clk_mode, 80000000)
-        ret = eapi.Mo1000_WriteClockConfig_send(self._board_state, self._board_number)
+        ret = self._transport.call(eapi.Mo1000_SetClockConfig_send, 1, src_clk, 80000000, 80000000, master_clk_mode, 80000000)
+        ret = self._transport.call(eapi.Mo1000_WriteClockConfig_send, self._board_number)
         print "DONE (end ignore mmcm lock error)"
 
-    def configure_ports(self):
+    def configure_ports(self, settle=True):
+        """settle=False leaves the PORTS_SETTLE_TIME wait to the caller."""
         device = "ports"
         device = getattr(eapi, "eMo1000Device" + device.capitalize())
         self.write(self._board_number, device, 0, 0x9d)
-        time.sleep(2)
+        if settle:
+            time.sleep(PORTS_SETTLE_TIME)
 
     def pll_calibration(self):
         print "pll calibration"
         device = "pll"
         device = getattr(eapi, "eMo1000Device" + device.capitalize())
         self.write(self._board_number, device, 6, 0x848E012)
-        time.sleep(2)
+        time.sleep(PLL_CALIBRATION_SETTLE_TIME)
         print "DONE"
 
     def pll_sync(self):
@@ -134,21 +147,26 @@ class Mo1000(object):
         device = "ports"
         device = getattr(eapi, "eMo1000Device" + device.capitalize())
         self.write(self._board_number, device, 1, 3)
-        time.sleep(1)
+        time.sleep(PLL_SYNC_SETTLE_TIME)
         device = "core"
         device = getattr(eapi, "eMo1000Device" + device.capitalize())
         self.write(self._board_number, device, 1, 0x10)
         print "DONE"
-        time.sleep(1)
+        time.sleep(PLL_SYNC_SETTLE_TIME)
+
+    def is_calibrated(self):
+        ret, lane_calib, frame_calib, sync_calib, calib_status = self._transport.call(
+            eapi.Mo1000_GetChannelCalibStatus_send, self._board_number)
+        return ret >= 0 and bool(calib_status)
 
     def get_status(self):
-        ret, status, compare = eapi.Mo1000_GetStatus_send(self._board_state, self._board_number)
+        ret, status, compare = self._transport.call(eapi.Mo1000_GetStatus_send, self._board_number)
         print "Status = " + status
         print "Compare = " + compare
 
     def calibration(self):
         print "MO1000 1 calibration"
-        ret = eapi.Mo1000_DoDacCalibration_send(self._board_state, self._board_number)
+        ret = self._transport.call(eapi.Mo1000_DoDacCalibration_send, self._board_number)
         print "DONE"
         # ret, uChannelLaneCalib, uChannelFrameCalib, uChannelSyncCalib, uCalibStatus = eapi.Mo1000_GetChannelCalibStatus_send(
         #    self._board_state, self._board_number)
@@ -166,12 +184,12 @@ class Mo1000(object):
         # ret = eapi.Mo1000_SetDacOutCtrl_send(self._board_state, 1, 1, state)
         for i in range(1,9):
             channel = get_channel(i)
-            ret = eapi.Mo1000_SetDacOutCtrl_send(self._board_state, 1, channel, state)
+            ret = self._transport.call(eapi.Mo1000_SetDacOutCtrl_send, 1, channel, state)
             if ret < 0:
-                raise adp_exception(ret)
+                raise PerseusTransportError('Mo1000_SetDacOutCtrl', ret, detail="dac %d" % i)
         print "DONE"
 
     def display_dac_error(self):
         print "Displays any dac error that happened"
-        ret, status, compare = eapi.Mo1000_GetStatus_send(self._board_state, self._board_number)
+        ret, status, compare = self._transport.call(eapi.Mo1000_GetStatus_send, self._board_number)
         print "DONE"
@@ -46,8 +46,7 @@ from pynutaq.perseus.perseusutils import read_direct, write_direct, read_diag_di
 def get_GainTetrode1(perseus, address, cavity):
     try:
         offset = get_offset('read', cavity)
-        perseus.write(offset, address)
-        value = perseus.read(offset) / 19898.0
+        value = perseus.read_many(offset, [address])[0] / 19898.0
         return value
     except Exception, e:
         raise e
@@ -63,8 +62,7 @@ def set_GainTetrode1(perseus, GainTetrode1, address, cavity):
 def get_GainTetrode2(perseus, address, cavity):
     try:
         offset = get_offset('read', cavity)
-        perseus.write(offset, address)
-        value = perseus.read(offset) / 19898.0
+        value = perseus.read_many(offset, [address])[0] / 19898.0
         return value
     except Exception, e:
         raise e
@@ -80,8 +78,7 @@ def set_GainTetrode2(perseus, GainTetrode2, address, cavity):
 def get_GainOl(perseus, address, cavity):
     try:
         offset = get_offset('read', cavity)
-        perseus.write(offset, address)
-        value = perseus.read(offset)
+        value = perseus.read_many(offset, [address])[0]
         # value = math.floor((value * 2.0) / 127)
         value = (value * 2.0) / 127
         return value
@@ -101,8 +98,7 @@ def get_Freqsquare(perseus, address, cavity):
     try:
         offset = get_offset('read', cavity)
         # @warning: read direct??
-        perseus.write(offset, address)
-        value = perseus.read(offset) / 80000.0
+        value = perseus.read_many(offset, [address])[0] / 80000.0
         return value
     except Exception, e:
         raise e
@@ -376,20 +372,6 @@ def set_FdlTriggerDelay(perseus, value, address, cavity):
 #     except Exception, e:
 #         raise e
 
-def read_bit_direct(perseus, address, position, cavity):
-    try:
-        value = read_direct(perseus, address, cavity)
-        return bool((value >> position) & 1)
-    except Exception, e:
-        raise e
-
-def read_diag_bit_direct(perseus, address, position, cavity):
-    try:
-        value = read_diag_direct(perseus, address, cavity)
-        return bool((value >> position) & 1)
-    except Exception, e:
-        raise e
-
 
 def read_diag_timestamp(perseus, address, cavity):
     try:
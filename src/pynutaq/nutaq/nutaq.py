@@ -30,8 +30,8 @@ __docformat__ = 'restructuredtext'
 
 # standard library imports
 import time
-import numpy
 import math
+import json
 import datetime
 
 # 3rd party imports
@@ -46,16 +46,24 @@ import pynutaq.extra as extra_func
 
 import pynutaq.perseus.perseusutils as perseus_utils
 
-try:
-    from pynutaq.perseus.perseusdefs import *
-    from pynutaq.perseus.perseusfactory import Perseus
-except ImportError, e:
-    print e
+from pynutaq.perseus.perseusscheduler import prioritized, PRIORITY_SAFETY, PRIORITY_ACQUISITION
+from pynutaq.perseus.perseusscheduler import PRIORITY_MAINTENANCE
+from pynutaq.perseus.perseusexceptions import PerseusArgumentError
 
+from pynutaq.nutaq.nutaqdevice import NutaqDeviceMixin, MAX_DIAGNOSTICS
+from pynutaq.nutaq.nutaqtuning import TuningController
+from pynutaq.nutaq.nutaqramp import RampEngine
+from pynutaq.nutaq.nutaqconditioning import ConditioningSequencer, load_profile
 
-class Nutaq(Device):
+from pynutaq.perseus.perseusdefs import *
+
+
+class Nutaq(NutaqDeviceMixin, Device):
     __metaclass__ = DeviceMeta
 
+    nutaq_type = 'loops'
+    derived_diagnostics = True
+
     KpA = attribute(label='KpA',
                                    dtype=float,
                                    display_level=DispLevel.OPERATOR,
@@ -5142,16 +5150,270 @@ class Nutaq(Device):
     perseusType = device_property(dtype=str, default_value='simulated')
     perseusIp = device_property(dtype=str, default_value='192.168.0.141')
     FDLPath = device_property(dtype=str, default_value='/tmp')
+    SettingsPath = device_property(dtype=str, default_value='/tmp')
+    InitProfileDepth = device_property(dtype=int, default_value=10)
+    InitProfileFile = device_property(dtype=str, default_value='')
+    RetryAttempts = device_property(dtype=int, default_value=3)
+    RetryDeadline = device_property(dtype=float, default_value=1.0)
+    DiagStaleTime = device_property(dtype=float, default_value=10.0)
+    StatisticsWindow = device_property(dtype=int, default_value=100)
+    WriteMinInterval = device_property(dtype=float, default_value=0.05)
+    RestoreMemorized = device_property(dtype=bool, default_value=False)
+    SharedMemory = device_property(dtype=bool, default_value=True)
+    SharedMemoryPath = device_property(dtype=str, default_value='/dev/shm')
+    ApplyPhaseShift = device_property(dtype=bool, default_value=False)
+    TuningLoopPeriod = device_property(dtype=float, default_value=0.1)
+    TuningLoopGain = device_property(dtype=float, default_value=1.0)
+    TuningLoopMaxSteps = device_property(dtype=int, default_value=100)
+    TuningLoopMinInterval = device_property(dtype=float, default_value=1.0)
+    TuningLoopMoveUpSign = device_property(dtype=int, default_value=1)
+    RampStepPeriod = device_property(dtype=float, default_value=0.1)
+    ConditioningWatchPeriod = device_property(dtype=float, default_value=0.01)
+    ConditioningBackoffSteps = device_property(dtype=int, default_value=1)
+    ConditioningBackoffHold = device_property(dtype=float, default_value=10.0)
+    ConditioningSignal = device_property(dtype=str, default_value='')
+    ConditioningSignalMax = device_property(dtype=float, default_value=1000.0)
+    ConditioningHistorySize = device_property(dtype=int, default_value=1000)
+
+    InitProfile = attribute(label='InitProfile',
+                            dtype=str,
+                            display_level=DispLevel.EXPERT,
+                            access=AttrWriteType.READ,
+                            fget="get_InitProfile",
+                            doc="json with the step timings of the last hardware inits"
+                            )
+
+    ErrorCounts = attribute(label='ErrorCounts',
+                            dtype=str,
+                            display_level=DispLevel.EXPERT,
+                            access=AttrWriteType.READ,
+                            fget="get_ErrorCounts",
+                            doc="json with the number of board errors of each class"
+                            )
+
+    SchedulerStatistics = attribute(label='SchedulerStatistics',
+                                    dtype=str,
+                                    display_level=DispLevel.EXPERT,
+                                    access=AttrWriteType.READ,
+                                    fget="get_SchedulerStatistics",
+                                    doc="json with the connection wait times (ms) of each priority class"
+                                    )
+
+    DiagnosticsA = attribute(label='DiagnosticsA',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsA",
+                             doc="diagnostics of chain A, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsB = attribute(label='DiagnosticsB',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsB",
+                             doc="diagnostics of chain B, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsNames = attribute(label='DiagnosticsNames',
+                                 dtype=(str,),
+                                 max_dim_x=MAX_DIAGNOSTICS,
+                                 display_level=DispLevel.EXPERT,
+                                 access=AttrWriteType.READ,
+                                 fget="get_DiagnosticsNames",
+                                 doc="diagnostics attribute names, without cavity"
+                                 )
+
+    DiagnosticsIQA = attribute(label='DiagnosticsIQA',
+                               dtype=((float,),),
+                               max_dim_x=2, max_dim_y=MAX_DIAGNOSTICS,
+                               display_level=DispLevel.EXPERT,
+                               access=AttrWriteType.READ,
+                               fget="get_DiagnosticsIQA",
+                               doc="[I, Q] pairs of chain A, indexed as DiagnosticsIQNames"
+                               )
+
+    DiagnosticsIQB = attribute(label='DiagnosticsIQB',
+                               dtype=((float,),),
+                               max_dim_x=2, max_dim_y=MAX_DIAGNOSTICS,
+                               display_level=DispLevel.EXPERT,
+                               access=AttrWriteType.READ,
+                               fget="get_DiagnosticsIQB",
+                               doc="[I, Q] pairs of chain B, indexed as DiagnosticsIQNames"
+                               )
+
+    DiagnosticsIQNames = attribute(label='DiagnosticsIQNames',
+                                   dtype=(str,),
+                                   max_dim_x=MAX_DIAGNOSTICS,
+                                   display_level=DispLevel.EXPERT,
+                                   access=AttrWriteType.READ,
+                                   fget="get_DiagnosticsIQNames",
+                                   doc="I/Q pair names, I is Diag_I<name><cavity>"
+                                   )
+
+    DiagnosticsMeanA = attribute(label='DiagnosticsMeanA',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsMeanA",
+                             doc="rolling Mean of the diagnostics of chain A, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsMeanB = attribute(label='DiagnosticsMeanB',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsMeanB",
+                             doc="rolling Mean of the diagnostics of chain B, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsStdA = attribute(label='DiagnosticsStdA',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsStdA",
+                             doc="rolling Std of the diagnostics of chain A, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsStdB = attribute(label='DiagnosticsStdB',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsStdB",
+                             doc="rolling Std of the diagnostics of chain B, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsMinA = attribute(label='DiagnosticsMinA',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsMinA",
+                             doc="rolling Min of the diagnostics of chain A, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsMinB = attribute(label='DiagnosticsMinB',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsMinB",
+                             doc="rolling Min of the diagnostics of chain B, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsMaxA = attribute(label='DiagnosticsMaxA',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsMaxA",
+                             doc="rolling Max of the diagnostics of chain A, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsMaxB = attribute(label='DiagnosticsMaxB',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsMaxB",
+                             doc="rolling Max of the diagnostics of chain B, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsPeakToPeakA = attribute(label='DiagnosticsPeakToPeakA',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsPeakToPeakA",
+                             doc="rolling PeakToPeak of the diagnostics of chain A, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsPeakToPeakB = attribute(label='DiagnosticsPeakToPeakB',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsPeakToPeakB",
+                             doc="rolling PeakToPeak of the diagnostics of chain B, indexed as DiagnosticsNames"
+                             )
+
+    TuningLoopStatistics = attribute(label='TuningLoopStatistics',
+                                     dtype=str,
+                                     display_level=DispLevel.EXPERT,
+                                     access=AttrWriteType.READ,
+                                     fget="get_TuningLoopStatistics",
+                                     doc="json with the counters and timing (ms) of the tuning loops"
+                                     )
+
+    RampStatus = attribute(label='RampStatus',
+                           dtype=str,
+                           display_level=DispLevel.EXPERT,
+                           access=AttrWriteType.READ,
+                           fget="get_RampStatus",
+                           doc="json with the state and progress of the setpoint ramps"
+                           )
+
+    ConditioningStatus = attribute(label='ConditioningStatus',
+                                   dtype=str,
+                                   display_level=DispLevel.EXPERT,
+                                   access=AttrWriteType.READ,
+                                   fget="get_ConditioningStatus",
+                                   doc="json with the step, trips and watched diagnostics of the conditioning"
+                                   )
+
+    ConditioningHistory = attribute(label='ConditioningHistory',
+                                    dtype=str,
+                                    display_level=DispLevel.EXPERT,
+                                    access=AttrWriteType.READ,
+                                    fget="get_ConditioningHistory",
+                                    doc="json with the [time, event, step, duty, amplitude] records of the conditioning"
+                                    )
 
     def init_device(self):
         Device.init_device(self)
+        self.init_nutaq()
         try:
-            self.perseus = Perseus().new_perseus(self.perseusType, self.perseusIp)
+            self.connect_perseus()
+            self.tuning_loops = dict((cavity, TuningController(self.perseus, cavity, self.TuningLoopPeriod,
+                                                               self.TuningLoopGain, self.TuningLoopMaxSteps,
+                                                               self.TuningLoopMinInterval,
+                                                               move_up_sign=self.TuningLoopMoveUpSign))
+                                     for cavity in ('A', 'B'))
+            self.ramps = RampEngine(self.perseus, self.RampStepPeriod, self.ramp_progress)
+            self.conditioning = dict((cavity, ConditioningSequencer(self.perseus, cavity, 'loops',
+                                                                    self.ConditioningWatchPeriod,
+                                                                    self.ConditioningBackoffSteps,
+                                                                    self.ConditioningBackoffHold,
+                                                                    self.ConditioningSignal,
+                                                                    self.ConditioningSignalMax,
+                                                                    self.ConditioningHistorySize))
+                                     for cavity in ('A', 'B'))
             self.set_events()
             self.set_state(DevState.ON)
         except Exception, e:
             print e
             self.set_state(DevState.FAULT)
+            return
+        if self.RestoreMemorized:
+            try:
+                self.restore_memorized()
+            except Exception, e:
+                print "Memorized settings not restored: %s" % e
+
+    def delete_device(self):
+        self.delete_nutaq()
+        for tuning_loop in getattr(self, 'tuning_loops', {}).values():
+            tuning_loop.stop()
+        if hasattr(self, 'ramps'):
+            self.ramps.abort('device deleted')
+        for sequencer in getattr(self, 'conditioning', {}).values():
+            sequencer.stop()
 
     def set_events(self):
         self.set_change_event('KpA', True)
@@ -5604,6 +5866,8 @@ class Nutaq(Device):
         self.set_change_event('Diag_PhMoa', True)
         self.set_change_event('Diag_PhControlslowpia', True)
         self.set_change_event('Diag_PhControlslowpib', True)
+        self.set_diagnostics_events()
+        self.set_change_event('RampStatus', True, False)
 
 
     @DebugIt()
@@ -5644,75 +5908,75 @@ class Nutaq(Device):
 
     @DebugIt()
     def get_PhaseShiftCavA(self):
-        return perseus_utils.read_angle(self.perseus, 2, 'A')
+        return self.get_setting("PhaseShiftCavA", perseus_utils.read_angle(self.perseus, 2, 'A'))
 
     @DebugIt()
     def set_PhaseShiftCavA(self, PhaseShiftCavA):
-        perseus_utils.write_angle(self.perseus, PhaseShiftCavA, 2, 'A')
-        self.push_change_event("PhaseShiftCavA", PhaseShiftCavA)
+        self.writes.submit("PhaseShiftCavA", PhaseShiftCavA, perseus_utils.write_angle,
+                           self.perseus, PhaseShiftCavA, 2, 'A')
 
     @DebugIt()
     def get_PhaseShiftCavB(self):
-        return perseus_utils.read_angle(self.perseus, 2, 'B')
+        return self.get_setting("PhaseShiftCavB", perseus_utils.read_angle(self.perseus, 2, 'B'))
 
     @DebugIt()
     def set_PhaseShiftCavB(self, PhaseShiftCavB):
-        perseus_utils.write_angle(self.perseus, PhaseShiftCavB, 2, 'B')
-        self.push_change_event("PhaseShiftCavB", PhaseShiftCavB)
+        self.writes.submit("PhaseShiftCavB", PhaseShiftCavB, perseus_utils.write_angle,
+                           self.perseus, PhaseShiftCavB, 2, 'B')
 
     @DebugIt()
     def get_PhaseShiftFwcavA(self):
-        return perseus_utils.read_angle(self.perseus, 3, 'A')
+        return self.get_setting("PhaseShiftFwcavA", perseus_utils.read_angle(self.perseus, 3, 'A'))
 
     @DebugIt()
     def set_PhaseShiftFwcavA(self, PhaseShiftFwcavA):
-        perseus_utils.write_angle(self.perseus, PhaseShiftFwcavA, 3, 'A')
-        self.push_change_event("PhaseShiftFwcavA", PhaseShiftFwcavA)
+        self.writes.submit("PhaseShiftFwcavA", PhaseShiftFwcavA, perseus_utils.write_angle,
+                           self.perseus, PhaseShiftFwcavA, 3, 'A')
 
     @DebugIt()
     def get_PhaseShiftFwcavB(self):
-        return perseus_utils.read_angle(self.perseus, 3, 'B')
+        return self.get_setting("PhaseShiftFwcavB", perseus_utils.read_angle(self.perseus, 3, 'B'))
 
     @DebugIt()
     def set_PhaseShiftFwcavB(self, PhaseShiftFwcavB):
-        perseus_utils.write_angle(self.perseus, PhaseShiftFwcavB, 3, 'B')
-        self.push_change_event("PhaseShiftFwcavB", PhaseShiftFwcavB)
+        self.writes.submit("PhaseShiftFwcavB", PhaseShiftFwcavB, perseus_utils.write_angle,
+                           self.perseus, PhaseShiftFwcavB, 3, 'B')
 
     @DebugIt()
     def get_PhaseShiftFwtet1A(self):
-        return perseus_utils.read_angle(self.perseus, 4, 'A')
+        return self.get_setting("PhaseShiftFwtet1A", perseus_utils.read_angle(self.perseus, 4, 'A'))
 
     @DebugIt()
     def set_PhaseShiftFwtet1A(self, PhaseShiftFwtet1A):
-        perseus_utils.write_angle(self.perseus, PhaseShiftFwtet1A, 4, 'A')
-        self.push_change_event("PhaseShiftFwtet1A", PhaseShiftFwtet1A)
+        self.writes.submit("PhaseShiftFwtet1A", PhaseShiftFwtet1A, perseus_utils.write_angle,
+                           self.perseus, PhaseShiftFwtet1A, 4, 'A')
 
     @DebugIt()
     def get_PhaseShiftFwtet1B(self):
-        return perseus_utils.read_angle(self.perseus, 4, 'B')
+        return self.get_setting("PhaseShiftFwtet1B", perseus_utils.read_angle(self.perseus, 4, 'B'))
 
     @DebugIt()
     def set_PhaseShiftFwtet1B(self, PhaseShiftFwtet1B):
-        perseus_utils.write_angle(self.perseus, PhaseShiftFwtet1B, 4, 'B')
-        self.push_change_event("PhaseShiftFwtet1B", PhaseShiftFwtet1B)
+        self.writes.submit("PhaseShiftFwtet1B", PhaseShiftFwtet1B, perseus_utils.write_angle,
+                           self.perseus, PhaseShiftFwtet1B, 4, 'B')
 
     @DebugIt()
     def get_PhaseShiftFwtet2A(self):
-        return perseus_utils.read_angle(self.perseus, 5, 'A')
+        return self.get_setting("PhaseShiftFwtet2A", perseus_utils.read_angle(self.perseus, 5, 'A'))
 
     @DebugIt()
     def set_PhaseShiftFwtet2A(self, PhaseShiftFwtet2A):
-        perseus_utils.write_angle(self.perseus, PhaseShiftFwtet2A, 5, 'A')
-        self.push_change_event("PhaseShiftFwtet2A", PhaseShiftFwtet2A)
+        self.writes.submit("PhaseShiftFwtet2A", PhaseShiftFwtet2A, perseus_utils.write_angle,
+                           self.perseus, PhaseShiftFwtet2A, 5, 'A')
 
     @DebugIt()
     def get_PhaseShiftFwtet2B(self):
-        return perseus_utils.read_angle(self.perseus, 5, 'B')
+        return self.get_setting("PhaseShiftFwtet2B", perseus_utils.read_angle(self.perseus, 5, 'B'))
 
     @DebugIt()
     def set_PhaseShiftFwtet2B(self, PhaseShiftFwtet2B):
-        perseus_utils.write_angle(self.perseus, PhaseShiftFwtet2B, 5, 'B')
-        self.push_change_event("PhaseShiftFwtet2B", PhaseShiftFwtet2B)
+        self.writes.submit("PhaseShiftFwtet2B", PhaseShiftFwtet2B, perseus_utils.write_angle,
+                           self.perseus, PhaseShiftFwtet2B, 5, 'B')
 
     @DebugIt()
     def get_PilimitA(self):
@@ -5782,57 +6046,57 @@ class Nutaq(Device):
 
     @DebugIt()
     def get_PhaseShiftFwcircinA(self):
-        return perseus_utils.read_angle(self.perseus, 9, 'A')
+        return self.get_setting("PhaseShiftFwcircinA", perseus_utils.read_angle(self.perseus, 9, 'A'))
 
     @DebugIt()
     def set_PhaseShiftFwcircinA(self, PhaseShiftFwcircinA):
-        perseus_utils.write_angle(self.perseus, PhaseShiftFwcircinA, 9, 'A')
-        self.push_change_event("PhaseShiftFwcircinA", PhaseShiftFwcircinA)
+        self.writes.submit("PhaseShiftFwcircinA", PhaseShiftFwcircinA, perseus_utils.write_angle,
+                           self.perseus, PhaseShiftFwcircinA, 9, 'A')
 
     @DebugIt()
     def get_PhaseShiftFwcircinB(self):
-        return perseus_utils.read_angle(self.perseus, 9, 'B')
+        return self.get_setting("PhaseShiftFwcircinB", perseus_utils.read_angle(self.perseus, 9, 'B'))
 
     @DebugIt()
     def set_PhaseShiftFwcircinB(self, PhaseShiftFwcircinB):
-        perseus_utils.write_angle(self.perseus, PhaseShiftFwcircinB, 9, 'B')
-        self.push_change_event("PhaseShiftFwcircinB", PhaseShiftFwcircinB)
+        self.writes.submit("PhaseShiftFwcircinB", PhaseShiftFwcircinB, perseus_utils.write_angle,
+                           self.perseus, PhaseShiftFwcircinB, 9, 'B')
 
     @DebugIt()
     def get_PhaseShiftControlSignalTet1A(self):
-        return perseus_utils.read_angle(self.perseus, 10, 'A')
+        return self.get_setting("PhaseShiftControlSignalTet1A", perseus_utils.read_angle(self.perseus, 10, 'A'))
 
     @DebugIt()
     def set_PhaseShiftControlSignalTet1A(self, PhaseShiftControlSignalTet1A):
-        perseus_utils.write_angle(self.perseus, PhaseShiftControlSignalTet1A, 10, 'A')
-        self.push_change_event("PhaseShiftControlSignalTet1A", PhaseShiftControlSignalTet1A)
+        self.writes.submit("PhaseShiftControlSignalTet1A", PhaseShiftControlSignalTet1A, perseus_utils.write_angle,
+                           self.perseus, PhaseShiftControlSignalTet1A, 10, 'A')
 
     @DebugIt()
     def get_PhaseShiftControlSignalTet1B(self):
-        return perseus_utils.read_angle(self.perseus, 10, 'B')
+        return self.get_setting("PhaseShiftControlSignalTet1B", perseus_utils.read_angle(self.perseus, 10, 'B'))
 
     @DebugIt()
     def set_PhaseShiftControlSignalTet1B(self, PhaseShiftControlSignalTet1B):
-        perseus_utils.write_angle(self.perseus, PhaseShiftControlSignalTet1B, 10, 'B')
-        self.push_change_event("PhaseShiftControlSignalTet1B", PhaseShiftControlSignalTet1B)
+        self.writes.submit("PhaseShiftControlSignalTet1B", PhaseShiftControlSignalTet1B, perseus_utils.write_angle,
+                           self.perseus, PhaseShiftControlSignalTet1B, 10, 'B')
 
     @DebugIt()
     def get_PhaseShiftControlSignalTet2A(self):
-        return perseus_utils.read_angle(self.perseus, 11, 'A')
+        return self.get_setting("PhaseShiftControlSignalTet2A", perseus_utils.read_angle(self.perseus, 11, 'A'))
 
     @DebugIt()
     def set_PhaseShiftControlSignalTet2A(self, PhaseShiftControlSignalTet2A):
-        perseus_utils.write_angle(self.perseus, PhaseShiftControlSignalTet2A, 11, 'A')
-        self.push_change_event("PhaseShiftControlSignalTet2A", PhaseShiftControlSignalTet2A)
+        self.writes.submit("PhaseShiftControlSignalTet2A", PhaseShiftControlSignalTet2A, perseus_utils.write_angle,
+                           self.perseus, PhaseShiftControlSignalTet2A, 11, 'A')
 
     @DebugIt()
     def get_PhaseShiftControlSignalTet2B(self):
-        return perseus_utils.read_angle(self.perseus, 11, 'B')
+        return self.get_setting("PhaseShiftControlSignalTet2B", perseus_utils.read_angle(self.perseus, 11, 'B'))
 
     @DebugIt()
     def set_PhaseShiftControlSignalTet2B(self, PhaseShiftControlSignalTet2B):
-        perseus_utils.write_angle(self.perseus, PhaseShiftControlSignalTet2B, 11, 'B')
-        self.push_change_event("PhaseShiftControlSignalTet2B", PhaseShiftControlSignalTet2B)
+        self.writes.submit("PhaseShiftControlSignalTet2B", PhaseShiftControlSignalTet2B, perseus_utils.write_angle,
+                           self.perseus, PhaseShiftControlSignalTet2B, 11, 'B')
 
     @DebugIt()
     def get_GainTetrode1A(self):
@@ -5932,75 +6196,79 @@ class Nutaq(Device):
 
     @DebugIt()
     def get_AmprefinA(self):
-        return perseus_utils.read_milivolts(self.perseus, 19, 'A')
+        return self.get_setting("AmprefinA", perseus_utils.read_milivolts(self.perseus, 19, 'A'))
 
     @DebugIt()
     def set_AmprefinA(self, AmprefinA):
-        perseus_utils.write_milivolts(self.perseus, AmprefinA, 19, 'A')
-        self.push_change_event("AmprefinA", AmprefinA)
+        self.ramps.abort_setpoint("AmprefinA", 'operator write')
+        self.writes.submit("AmprefinA", AmprefinA, perseus_utils.write_milivolts,
+                           self.perseus, AmprefinA, 19, 'A')
 
     @DebugIt()
     def get_AmprefinB(self):
-        return perseus_utils.read_milivolts(self.perseus, 19, 'B')
+        return self.get_setting("AmprefinB", perseus_utils.read_milivolts(self.perseus, 19, 'B'))
 
     @DebugIt()
     def set_AmprefinB(self, AmprefinB):
-        perseus_utils.write_milivolts(self.perseus, AmprefinB, 19, 'B')
-        self.push_change_event("AmprefinB", AmprefinB)
+        self.ramps.abort_setpoint("AmprefinB", 'operator write')
+        self.writes.submit("AmprefinB", AmprefinB, perseus_utils.write_milivolts,
+                           self.perseus, AmprefinB, 19, 'B')
 
     @DebugIt()
     def get_PhrefinA(self):
-        return perseus_utils.read_angle(self.perseus, 20, 'A')
+        return self.get_setting("PhrefinA", perseus_utils.read_angle(self.perseus, 20, 'A'))
 
     @DebugIt()
     def set_PhrefinA(self, PhrefinA):
-        perseus_utils.write_angle(self.perseus, PhrefinA, 20, 'A')
-        self.push_change_event("PhrefinA", PhrefinA)
+        self.ramps.abort_setpoint("PhrefinA", 'operator write')
+        self.writes.submit("PhrefinA", PhrefinA, perseus_utils.write_angle,
+                           self.perseus, PhrefinA, 20, 'A')
 
     @DebugIt()
     def get_PhrefinB(self):
-        return perseus_utils.read_angle(self.perseus, 20, 'B')
+        return self.get_setting("PhrefinB", perseus_utils.read_angle(self.perseus, 20, 'B'))
 
     @DebugIt()
     def set_PhrefinB(self, PhrefinB):
-        perseus_utils.write_angle(self.perseus, PhrefinB, 20, 'B')
-        self.push_change_event("PhrefinB", PhrefinB)
+        self.ramps.abort_setpoint("PhrefinB", 'operator write')
+        self.writes.submit("PhrefinB", PhrefinB, perseus_utils.write_angle,
+                           self.perseus, PhrefinB, 20, 'B')
 
     @DebugIt()
     def get_AmprefminA(self):
-        return perseus_utils.read_milivolts(self.perseus, 21, 'A')
+        return self.get_setting("AmprefminA", perseus_utils.read_milivolts(self.perseus, 21, 'A'))
 
     @DebugIt()
     def set_AmprefminA(self, AmprefminA):
-        perseus_utils.write_milivolts(self.perseus, AmprefminA, 21, 'A')
-        self.push_change_event("AmprefminA", AmprefminA)
+        self.writes.submit("AmprefminA", AmprefminA, perseus_utils.write_milivolts,
+                           self.perseus, AmprefminA, 21, 'A')
 
     @DebugIt()
     def get_AmprefminB(self):
-        return perseus_utils.read_milivolts(self.perseus, 21, 'B')
+        return self.get_setting("AmprefminB", perseus_utils.read_milivolts(self.perseus, 21, 'B'))
 
     @DebugIt()
     def set_AmprefminB(self, AmprefminB):
-        perseus_utils.write_milivolts(self.perseus, AmprefminB, 21, 'B')
-        self.push_change_event("AmprefminB", AmprefminB)
+        self.writes.submit("AmprefminB", AmprefminB, perseus_utils.write_milivolts,
+                           self.perseus, AmprefminB, 21, 'B')
 
     @DebugIt()
     def get_PhrefminA(self):
-        return perseus_utils.read_angle(self.perseus, 22, 'A')
+        return self.get_setting("PhrefminA", perseus_utils.read_angle(self.perseus, 22, 'A'))
 
     @DebugIt()
     def set_PhrefminA(self, PhrefminA):
-        perseus_utils.write_angle(self.perseus, PhrefminA, 22, 'A')
-        self.push_change_event("PhrefminA", PhrefminA)
+        self.writes.submit("PhrefminA", PhrefminA, perseus_utils.write_angle,
+                           self.perseus, PhrefminA, 22, 'A')
 
     @DebugIt()
     def get_PhrefminB(self):
-        return perseus_utils.read_angle(self.perseus, 22, 'B')
+        return self.get_setting("PhrefminB", perseus_utils.read_angle(self.perseus, 22, 'B'))
 
     @DebugIt()
     def set_PhrefminB(self, PhrefminB):
-        perseus_utils.write_angle(self.perseus, PhrefminB, 22, 'B')
-        self.push_change_event("PhrefminB", PhrefminB)
+        self.writes.submit("PhrefminB", PhrefminB, perseus_utils.write_angle,
+                           self.perseus, PhrefminB, 22, 'B')
 
     @DebugIt()
     def get_PhaseIncreaseRateA(self):
@@ -6550,21 +6818,21 @@ class Nutaq(Device):
 
     @DebugIt()
     def get_PiLimitFastPiIqA(self):
-        return perseus_utils.read_milivolts(self.perseus, 124, 'A')
+        return self.get_setting("PiLimitFastPiIqA", perseus_utils.read_milivolts(self.perseus, 124, 'A'))
 
     @DebugIt()
     def set_PiLimitFastPiIqA(self, PiLimitFastPiIqA):
-        perseus_utils.write_milivolts(self.perseus, PiLimitFastPiIqA, 124, 'A')
-        self.push_change_event("PiLimitFastPiIqA", PiLimitFastPiIqA)
+        self.writes.submit("PiLimitFastPiIqA", PiLimitFastPiIqA, perseus_utils.write_milivolts,
+                           self.perseus, PiLimitFastPiIqA, 124, 'A')
 
     @DebugIt()
     def get_PiLimitFastPiIqB(self):
-        return perseus_utils.read_milivolts(self.perseus, 124, 'B')
+        return self.get_setting("PiLimitFastPiIqB", perseus_utils.read_milivolts(self.perseus, 124, 'B'))
 
     @DebugIt()
     def set_PiLimitFastPiIqB(self, PiLimitFastPiIqB):
-        perseus_utils.write_milivolts(self.perseus, PiLimitFastPiIqB, 124, 'B')
-        self.push_change_event("PiLimitFastPiIqB", PiLimitFastPiIqB)
+        self.writes.submit("PiLimitFastPiIqB", PiLimitFastPiIqB, perseus_utils.write_milivolts,
+                           self.perseus, PiLimitFastPiIqB, 124, 'B')
 
     @DebugIt()
     def get_PulseModeEnableA(self):
@@ -6706,21 +6974,21 @@ class Nutaq(Device):
 
     @DebugIt()
     def get_PhaseOffsetA(self):
-        return perseus_utils.read_angle(self.perseus, 304, 'A')
+        return self.get_setting("PhaseOffsetA", perseus_utils.read_angle(self.perseus, 304, 'A'))
 
     @DebugIt()
     def set_PhaseOffsetA(self, PhaseOffsetA):
-        perseus_utils.write_angle(self.perseus, PhaseOffsetA, 304, 'A')
-        self.push_change_event("PhaseOffsetA", PhaseOffsetA)
+        self.writes.submit("PhaseOffsetA", PhaseOffsetA, perseus_utils.write_angle,
+                           self.perseus, PhaseOffsetA, 304, 'A')
 
     @DebugIt()
     def get_PhaseOffsetB(self):
-        return perseus_utils.read_angle(self.perseus, 304, 'B')
+        return self.get_setting("PhaseOffsetB", perseus_utils.read_angle(self.perseus, 304, 'B'))
 
     @DebugIt()
     def set_PhaseOffsetB(self, PhaseOffsetB):
-        perseus_utils.write_angle(self.perseus, PhaseOffsetB, 304, 'B')
-        self.push_change_event("PhaseOffsetB", PhaseOffsetB)
+        self.writes.submit("PhaseOffsetB", PhaseOffsetB, perseus_utils.write_angle,
+                           self.perseus, PhaseOffsetB, 304, 'B')
 
     @DebugIt()
     def get_MoveA(self):
@@ -6808,39 +7076,39 @@ class Nutaq(Device):
 
     @DebugIt()
     def get_MarginupA(self):
-        return perseus_utils.read_angle(self.perseus, 309, 'A')
+        return self.get_setting("MarginupA", perseus_utils.read_angle(self.perseus, 309, 'A'))
 
     @DebugIt()
     def set_MarginupA(self, MarginupA):
-        perseus_utils.write_angle(self.perseus, MarginupA, 309, 'A')
-        self.push_change_event("MarginupA", MarginupA)
+        self.writes.submit("MarginupA", MarginupA, perseus_utils.write_angle,
+                           self.perseus, MarginupA, 309, 'A')
 
     @DebugIt()
     def get_MarginupB(self):
-        return perseus_utils.read_angle(self.perseus, 309, 'B')
+        return self.get_setting("MarginupB", perseus_utils.read_angle(self.perseus, 309, 'B'))
 
     @DebugIt()
     def set_MarginupB(self, MarginupB):
-        perseus_utils.write_angle(self.perseus, MarginupB, 309, 'B')
-        self.push_change_event("MarginupB", MarginupB)
+        self.writes.submit("MarginupB", MarginupB, perseus_utils.write_angle,
+                           self.perseus, MarginupB, 309, 'B')
 
     @DebugIt()
     def get_MarginlowA(self):
-        return perseus_utils.read_angle(self.perseus, 310, 'A')
+        return self.get_setting("MarginlowA", perseus_utils.read_angle(self.perseus, 310, 'A'))
 
     @DebugIt()
     def set_MarginlowA(self, MarginlowA):
-        perseus_utils.write_angle(self.perseus, MarginlowA, 310, 'A')
-        self.push_change_event("MarginlowA", MarginlowA)
+        self.writes.submit("MarginlowA", MarginlowA, perseus_utils.write_angle,
+                           self.perseus, MarginlowA, 310, 'A')
 
     @DebugIt()
     def get_MarginlowB(self):
-        return perseus_utils.read_angle(self.perseus, 310, 'B')
+        return self.get_setting("MarginlowB", perseus_utils.read_angle(self.perseus, 310, 'B'))
 
     @DebugIt()
     def set_MarginlowB(self, MarginlowB):
-        perseus_utils.write_angle(self.perseus, MarginlowB, 310, 'B')
-        self.push_change_event("MarginlowB", MarginlowB)
+        self.writes.submit("MarginlowB", MarginlowB, perseus_utils.write_angle,
+                           self.perseus, MarginlowB, 310, 'B')
 
     @DebugIt()
     def get_TuningdelayA(self):
@@ -7168,2095 +7436,1794 @@ class Nutaq(Device):
 
     @DebugIt()
     def read_Diag_IcavLoopsA(self):
-        return self._Diag_IcavLoopsA
+        return self.get_diag("Diag_IcavLoopsA", self._Diag_IcavLoopsA)
 
     @DebugIt()
     def read_Diag_IcavLoopsB(self):
-        return self._Diag_IcavLoopsB
+        return self.get_diag("Diag_IcavLoopsB", self._Diag_IcavLoopsB)
 
     @DebugIt()
     def read_Diag_QcavLoopsA(self):
-        return self._Diag_QcavLoopsA
+        return self.get_diag("Diag_QcavLoopsA", self._Diag_QcavLoopsA)
 
     @DebugIt()
     def read_Diag_QcavLoopsB(self):
-        return self._Diag_QcavLoopsB
+        return self.get_diag("Diag_QcavLoopsB", self._Diag_QcavLoopsB)
 
     @DebugIt()
     def read_Diag_IcontrolA(self):
-        return self._Diag_IcontrolA
+        return self.get_diag("Diag_IcontrolA", self._Diag_IcontrolA)
 
     @DebugIt()
     def read_Diag_IcontrolB(self):
-        return self._Diag_IcontrolB
+        return self.get_diag("Diag_IcontrolB", self._Diag_IcontrolB)
 
     @DebugIt()
     def read_Diag_QcontrolA(self):
-        return self._Diag_QcontrolA
+        return self.get_diag("Diag_QcontrolA", self._Diag_QcontrolA)
 
     @DebugIt()
     def read_Diag_QcontrolB(self):
-        return self._Diag_QcontrolB
+        return self.get_diag("Diag_QcontrolB", self._Diag_QcontrolB)
 
     @DebugIt()
     def read_Diag_Icontrol1A(self):
-        return self._Diag_Icontrol1A
+        return self.get_diag("Diag_Icontrol1A", self._Diag_Icontrol1A)
 
     @DebugIt()
     def read_Diag_Icontrol1B(self):
-        return self._Diag_Icontrol1B
+        return self.get_diag("Diag_Icontrol1B", self._Diag_Icontrol1B)
 
     @DebugIt()
     def read_Diag_Qcontrol1A(self):
-        return self._Diag_Qcontrol1A
+        return self.get_diag("Diag_Qcontrol1A", self._Diag_Qcontrol1A)
 
     @DebugIt()
     def read_Diag_Qcontrol1B(self):
-        return self._Diag_Qcontrol1B
+        return self.get_diag("Diag_Qcontrol1B", self._Diag_Qcontrol1B)
 
     @DebugIt()
     def read_Diag_Icontrol2A(self):
-        return self._Diag_Icontrol2A
+        return self.get_diag("Diag_Icontrol2A", self._Diag_Icontrol2A)
 
     @DebugIt()
     def read_Diag_Icontrol2B(self):
-        return self._Diag_Icontrol2B
+        return self.get_diag("Diag_Icontrol2B", self._Diag_Icontrol2B)
 
     @DebugIt()
     def read_Diag_Qcontrol2A(self):
-        return self._Diag_Qcontrol2A
+        return self.get_diag("Diag_Qcontrol2A", self._Diag_Qcontrol2A)
 
     @DebugIt()
     def read_Diag_Qcontrol2B(self):
-        return self._Diag_Qcontrol2B
+        return self.get_diag("Diag_Qcontrol2B", self._Diag_Qcontrol2B)
 
     @DebugIt()
     def read_Diag_IerrorA(self):
-        return self._Diag_IerrorA
+        return self.get_diag("Diag_IerrorA", self._Diag_IerrorA)
 
     @DebugIt()
     def read_Diag_IerrorB(self):
-        return self._Diag_IerrorB
+        return self.get_diag("Diag_IerrorB", self._Diag_IerrorB)
 
     @DebugIt()
     def read_Diag_QerrorA(self):
-        return self._Diag_QerrorA
+        return self.get_diag("Diag_QerrorA", self._Diag_QerrorA)
 
     @DebugIt()
     def read_Diag_QerrorB(self):
-        return self._Diag_QerrorB
+        return self.get_diag("Diag_QerrorB", self._Diag_QerrorB)
 
     @DebugIt()
     def read_Diag_IerroraccumA(self):
-        return self._Diag_IerroraccumA
+        return self.get_diag("Diag_IerroraccumA", self._Diag_IerroraccumA)
 
     @DebugIt()
     def read_Diag_IerroraccumB(self):
-        return self._Diag_IerroraccumB
+        return self.get_diag("Diag_IerroraccumB", self._Diag_IerroraccumB)
 
     @DebugIt()
     def read_Diag_QerroraccumA(self):
-        return self._Diag_QerroraccumA
+        return self.get_diag("Diag_QerroraccumA", self._Diag_QerroraccumA)
 
     @DebugIt()
     def read_Diag_QerroraccumB(self):
-        return self._Diag_QerroraccumB
+        return self.get_diag("Diag_QerroraccumB", self._Diag_QerroraccumB)
 
     @DebugIt()
     def read_Diag_IrefA(self):
-        return self._Diag_IrefA
+        return self.get_diag("Diag_IrefA", self._Diag_IrefA)
 
     @DebugIt()
     def read_Diag_IrefB(self):
-        return self._Diag_IrefB
+        return self.get_diag("Diag_IrefB", self._Diag_IrefB)
 
     @DebugIt()
     def read_Diag_QrefA(self):
-        return self._Diag_QrefA
+        return self.get_diag("Diag_QrefA", self._Diag_QrefA)
 
     @DebugIt()
     def read_Diag_QrefB(self):
-        return self._Diag_QrefB
+        return self.get_diag("Diag_QrefB", self._Diag_QrefB)
 
     @DebugIt()
     def read_Diag_IFwCavLoopsA(self):
-        return self._Diag_IFwCavLoopsA
+        return self.get_diag("Diag_IFwCavLoopsA", self._Diag_IFwCavLoopsA)
 
     @DebugIt()
     def read_Diag_IFwCavLoopsB(self):
-        return self._Diag_IFwCavLoopsB
+        return self.get_diag("Diag_IFwCavLoopsB", self._Diag_IFwCavLoopsB)
 
     @DebugIt()
     def read_Diag_QFwCavLoopsA(self):
-        return self._Diag_QFwCavLoopsA
+        return self.get_diag("Diag_QFwCavLoopsA", self._Diag_QFwCavLoopsA)
 
     @DebugIt()
     def read_Diag_QFwCavLoopsB(self):
-        return self._Diag_QFwCavLoopsB
+        return self.get_diag("Diag_QFwCavLoopsB", self._Diag_QFwCavLoopsB)
 
     @DebugIt()
     def read_Diag_IFwTet1LoopsA(self):
-        return self._Diag_IFwTet1LoopsA
+        return self.get_diag("Diag_IFwTet1LoopsA", self._Diag_IFwTet1LoopsA)
 
     @DebugIt()
     def read_Diag_IFwTet1LoopsB(self):
-        return self._Diag_IFwTet1LoopsB
+        return self.get_diag("Diag_IFwTet1LoopsB", self._Diag_IFwTet1LoopsB)
 
     @DebugIt()
     def read_Diag_QFwTet1LoopsA(self):
-        return self._Diag_QFwTet1LoopsA
+        return self.get_diag("Diag_QFwTet1LoopsA", self._Diag_QFwTet1LoopsA)
 
     @DebugIt()
     def read_Diag_QFwTet1LoopsB(self):
-        return self._Diag_QFwTet1LoopsB
+        return self.get_diag("Diag_QFwTet1LoopsB", self._Diag_QFwTet1LoopsB)
 
     @DebugIt()
     def read_Diag_IFwTet2LoopsA(self):
-        return self._Diag_IFwTet2LoopsA
+        return self.get_diag("Diag_IFwTet2LoopsA", self._Diag_IFwTet2LoopsA)
 
     @DebugIt()
     def read_Diag_IFwTet2LoopsB(self):
-        return self._Diag_IFwTet2LoopsB
+        return self.get_diag("Diag_IFwTet2LoopsB", self._Diag_IFwTet2LoopsB)
 
     @DebugIt()
     def read_Diag_QFwTet2LoopsA(self):
-        return self._Diag_QFwTet2LoopsA
+        return self.get_diag("Diag_QFwTet2LoopsA", self._Diag_QFwTet2LoopsA)
 
     @DebugIt()
     def read_Diag_QFwTet2LoopsB(self):
-        return self._Diag_QFwTet2LoopsB
+        return self.get_diag("Diag_QFwTet2LoopsB", self._Diag_QFwTet2LoopsB)
 
     @DebugIt()
     def read_Diag_IFwCircInLoopsA(self):
-        return self._Diag_IFwCircInLoopsA
+        return self.get_diag("Diag_IFwCircInLoopsA", self._Diag_IFwCircInLoopsA)
 
     @DebugIt()
     def read_Diag_IFwCircInLoopsB(self):
-        return self._Diag_IFwCircInLoopsB
+        return self.get_diag("Diag_IFwCircInLoopsB", self._Diag_IFwCircInLoopsB)
 
     @DebugIt()
     def read_Diag_QFwCircInLoopsA(self):
-        return self._Diag_QFwCircInLoopsA
+        return self.get_diag("Diag_QFwCircInLoopsA", self._Diag_QFwCircInLoopsA)
 
     @DebugIt()
     def read_Diag_QFwCircInLoopsB(self):
-        return self._Diag_QFwCircInLoopsB
+        return self.get_diag("Diag_QFwCircInLoopsB", self._Diag_QFwCircInLoopsB)
 
     @DebugIt()
     def read_Diag_ImoA(self):
-        return self._Diag_ImoA
+        return self.get_diag("Diag_ImoA", self._Diag_ImoA)
 
     @DebugIt()
     def read_Diag_ImoB(self):
-        return self._Diag_ImoB
+        return self.get_diag("Diag_ImoB", self._Diag_ImoB)
 
     @DebugIt()
     def read_Diag_QmoA(self):
-        return self._Diag_QmoA
+        return self.get_diag("Diag_QmoA", self._Diag_QmoA)
 
     @DebugIt()
     def read_Diag_QmoB(self):
-        return self._Diag_QmoB
+        return self.get_diag("Diag_QmoB", self._Diag_QmoB)
 
     @DebugIt()
     def read_Diag_Ispare1A(self):
-        return self._Diag_Ispare1A
+        return self.get_diag("Diag_Ispare1A", self._Diag_Ispare1A)
 
     @DebugIt()
     def read_Diag_Ispare1B(self):
-        return self._Diag_Ispare1B
+        return self.get_diag("Diag_Ispare1B", self._Diag_Ispare1B)
 
     @DebugIt()
     def read_Diag_Qspare1A(self):
-        return self._Diag_Qspare1A
+        return self.get_diag("Diag_Qspare1A", self._Diag_Qspare1A)
 
     @DebugIt()
     def read_Diag_Qspare1B(self):
-        return self._Diag_Qspare1B
+        return self.get_diag("Diag_Qspare1B", self._Diag_Qspare1B)
 
     @DebugIt()
     def read_Diag_Ispare2A(self):
-        return self._Diag_Ispare2A
+        return self.get_diag("Diag_Ispare2A", self._Diag_Ispare2A)
 
     @DebugIt()
     def read_Diag_Ispare2B(self):
-        return self._Diag_Ispare2B
+        return self.get_diag("Diag_Ispare2B", self._Diag_Ispare2B)
 
     @DebugIt()
     def read_Diag_Qspare2A(self):
-        return self._Diag_Qspare2A
+        return self.get_diag("Diag_Qspare2A", self._Diag_Qspare2A)
 
     @DebugIt()
     def read_Diag_Qspare2B(self):
-        return self._Diag_Qspare2B
+        return self.get_diag("Diag_Qspare2B", self._Diag_Qspare2B)
 
     @DebugIt()
     def read_Diag_IMuxCavA(self):
-        return self._Diag_IMuxCavA
+        return self.get_diag("Diag_IMuxCavA", self._Diag_IMuxCavA)
 
     @DebugIt()
     def read_Diag_IMuxCavB(self):
-        return self._Diag_IMuxCavB
+        return self.get_diag("Diag_IMuxCavB", self._Diag_IMuxCavB)
 
     @DebugIt()
     def read_Diag_QMuxCavA(self):
-        return self._Diag_QMuxCavA
+        return self.get_diag("Diag_QMuxCavA", self._Diag_QMuxCavA)
 
     @DebugIt()
     def read_Diag_QMuxCavB(self):
-        return self._Diag_QMuxCavB
+        return self.get_diag("Diag_QMuxCavB", self._Diag_QMuxCavB)
 
     @DebugIt()
     def read_Diag_IMuxFwCavA(self):
-        return self._Diag_IMuxFwCavA
+        return self.get_diag("Diag_IMuxFwCavA", self._Diag_IMuxFwCavA)
 
     @DebugIt()
     def read_Diag_IMuxFwCavB(self):
-        return self._Diag_IMuxFwCavB
+        return self.get_diag("Diag_IMuxFwCavB", self._Diag_IMuxFwCavB)
 
     @DebugIt()
     def read_Diag_QMuxFwCavA(self):
-        return self._Diag_QMuxFwCavA
+        return self.get_diag("Diag_QMuxFwCavA", self._Diag_QMuxFwCavA)
 
     @DebugIt()
     def read_Diag_QMuxFwCavB(self):
-        return self._Diag_QMuxFwCavB
+        return self.get_diag("Diag_QMuxFwCavB", self._Diag_QMuxFwCavB)
 
     @DebugIt()
     def read_Diag_IMuxFwTet1A(self):
-        return self._Diag_IMuxFwTet1A
+        return self.get_diag("Diag_IMuxFwTet1A", self._Diag_IMuxFwTet1A)
 
     @DebugIt()
     def read_Diag_IMuxFwTet1B(self):
-        return self._Diag_IMuxFwTet1B
+        return self.get_diag("Diag_IMuxFwTet1B", self._Diag_IMuxFwTet1B)
 
     @DebugIt()
     def read_Diag_QMuxFwTet1A(self):
-        return self._Diag_QMuxFwTet1A
+        return self.get_diag("Diag_QMuxFwTet1A", self._Diag_QMuxFwTet1A)
 
     @DebugIt()
     def read_Diag_QMuxFwTet1B(self):
-        return self._Diag_QMuxFwTet1B
+        return self.get_diag("Diag_QMuxFwTet1B", self._Diag_QMuxFwTet1B)
 
     @DebugIt()
     def read_Diag_IMuxFwTet2A(self):
-        return self._Diag_IMuxFwTet2A
+        return self.get_diag("Diag_IMuxFwTet2A", self._Diag_IMuxFwTet2A)
 
     @DebugIt()
     def read_Diag_IMuxFwTet2B(self):
-        return self._Diag_IMuxFwTet2B
+        return self.get_diag("Diag_IMuxFwTet2B", self._Diag_IMuxFwTet2B)
 
     @DebugIt()
     def read_Diag_QMuxFwTet2A(self):
-        return self._Diag_QMuxFwTet2A
+        return self.get_diag("Diag_QMuxFwTet2A", self._Diag_QMuxFwTet2A)
 
     @DebugIt()
     def read_Diag_QMuxFwTet2B(self):
-        return self._Diag_QMuxFwTet2B
+        return self.get_diag("Diag_QMuxFwTet2B", self._Diag_QMuxFwTet2B)
 
     @DebugIt()
     def read_Diag_IMuxFwCircInA(self):
-        return self._Diag_IMuxFwCircInA
+        return self.get_diag("Diag_IMuxFwCircInA", self._Diag_IMuxFwCircInA)
 
     @DebugIt()
     def read_Diag_IMuxFwCircInB(self):
-        return self._Diag_IMuxFwCircInB
+        return self.get_diag("Diag_IMuxFwCircInB", self._Diag_IMuxFwCircInB)
 
     @DebugIt()
     def read_Diag_QMuxFwCircInA(self):
-        return self._Diag_QMuxFwCircInA
+        return self.get_diag("Diag_QMuxFwCircInA", self._Diag_QMuxFwCircInA)
 
     @DebugIt()
     def read_Diag_QMuxFwCircInB(self):
-        return self._Diag_QMuxFwCircInB
+        return self.get_diag("Diag_QMuxFwCircInB", self._Diag_QMuxFwCircInB)
 
     @DebugIt()
     def read_Diag_AmpCavA(self):
-        return self._Diag_AmpCavA
+        return self.get_diag("Diag_AmpCavA", self._Diag_AmpCavA)
 
     @DebugIt()
     def read_Diag_AmpCavB(self):
-        return self._Diag_AmpCavB
+        return self.get_diag("Diag_AmpCavB", self._Diag_AmpCavB)
 
     @DebugIt()
     def read_Diag_AmpFwA(self):
-        return self._Diag_AmpFwA
+        return self.get_diag("Diag_AmpFwA", self._Diag_AmpFwA)
 
     @DebugIt()
     def read_Diag_AmpFwB(self):
-        return self._Diag_AmpFwB
+        return self.get_diag("Diag_AmpFwB", self._Diag_AmpFwB)
 
     @DebugIt()
     def read_Diag_AngCavFwA(self):
-        return self._Diag_AngCavFwA
+        return self.get_diag("Diag_AngCavFwA", self._Diag_AngCavFwA)
 
     @DebugIt()
     def read_Diag_AngCavFwB(self):
-        return self._Diag_AngCavFwB
+        return self.get_diag("Diag_AngCavFwB", self._Diag_AngCavFwB)
 
     @DebugIt()
     def read_Diag_AngCavLA(self):
-        return self._Diag_AngCavLA
+        return self.get_diag("Diag_AngCavLA", self._Diag_AngCavLA)
 
     @DebugIt()
     def read_Diag_AngCavLB(self):
-        return self._Diag_AngCavLB
+        return self.get_diag("Diag_AngCavLB", self._Diag_AngCavLB)
 
     @DebugIt()
     def read_Diag_AngFwLA(self):
-        return self._Diag_AngFwLA
+        return self.get_diag("Diag_AngFwLA", self._Diag_AngFwLA)
 
     @DebugIt()
     def read_Diag_AngFwLB(self):
-        return self._Diag_AngFwLB
+        return self.get_diag("Diag_AngFwLB", self._Diag_AngFwLB)
 
     @DebugIt()
     def read_Diag_Vaccum1A(self):
-        return self._Diag_Vaccum1A
+        return self.get_diag("Diag_Vaccum1A", self._Diag_Vaccum1A)
 
     @DebugIt()
     def read_Diag_Vaccum1B(self):
-        return self._Diag_Vaccum1B
+        return self.get_diag("Diag_Vaccum1B", self._Diag_Vaccum1B)
 
     @DebugIt()
     def read_Diag_Vaccum2A(self):
-        return self._Diag_Vaccum2A
+        return self.get_diag("Diag_Vaccum2A", self._Diag_Vaccum2A)
 
     @DebugIt()
     def read_Diag_Vaccum2B(self):
-        return self._Diag_Vaccum2B
+        return self.get_diag("Diag_Vaccum2B", self._Diag_Vaccum2B)
 
     @DebugIt()
     def read_Diag_IcontrolSlowpiA(self):
-        return self._Diag_IcontrolSlowpiA
+        return self.get_diag("Diag_IcontrolSlowpiA", self._Diag_IcontrolSlowpiA)
 
     @DebugIt()
     def read_Diag_IcontrolSlowpiB(self):
-        return self._Diag_IcontrolSlowpiB
+        return self.get_diag("Diag_IcontrolSlowpiB", self._Diag_IcontrolSlowpiB)
 
     @DebugIt()
     def read_Diag_QcontrolSlowpiA(self):
-        return self._Diag_QcontrolSlowpiA
+        return self.get_diag("Diag_QcontrolSlowpiA", self._Diag_QcontrolSlowpiA)
 
     @DebugIt()
     def read_Diag_QcontrolSlowpiB(self):
-        return self._Diag_QcontrolSlowpiB
+        return self.get_diag("Diag_QcontrolSlowpiB", self._Diag_QcontrolSlowpiB)
 
     @DebugIt()
     def read_Diag_IcontrolFastpiA(self):
-        return self._Diag_IcontrolFastpiA
+        return self.get_diag("Diag_IcontrolFastpiA", self._Diag_IcontrolFastpiA)
 
     @DebugIt()
     def read_Diag_IcontrolFastpiB(self):
-        return self._Diag_IcontrolFastpiB
+        return self.get_diag("Diag_IcontrolFastpiB", self._Diag_IcontrolFastpiB)
 
     @DebugIt()
     def read_Diag_QcontrolFastpiA(self):
-        return self._Diag_QcontrolFastpiA
+        return self.get_diag("Diag_QcontrolFastpiA", self._Diag_QcontrolFastpiA)
 
     @DebugIt()
     def read_Diag_QcontrolFastpiB(self):
-        return self._Diag_QcontrolFastpiB
+        return self.get_diag("Diag_QcontrolFastpiB", self._Diag_QcontrolFastpiB)
 
     @DebugIt()
     def read_Diag_VcxoPoweredA(self):
-        return self._Diag_VcxoPoweredA
+        return self.get_diag("Diag_VcxoPoweredA", self._Diag_VcxoPoweredA)
 
     @DebugIt()
     def read_Diag_VcxoPoweredB(self):
-        return self._Diag_VcxoPoweredB
+        return self.get_diag("Diag_VcxoPoweredB", self._Diag_VcxoPoweredB)
 
     @DebugIt()
     def read_Diag_VcxoRefA(self):
-        return self._Diag_VcxoRefA
+        return self.get_diag("Diag_VcxoRefA", self._Diag_VcxoRefA)
 
     @DebugIt()
     def read_Diag_VcxoRefB(self):
-        return self._Diag_VcxoRefB
+        return self.get_diag("Diag_VcxoRefB", self._Diag_VcxoRefB)
 
     @DebugIt()
     def read_Diag_VcxoLockedA(self):
-        return self._Diag_VcxoLockedA
+        return self.get_diag("Diag_VcxoLockedA", self._Diag_VcxoLockedA)
 
     @DebugIt()
     def read_Diag_VcxoLockedB(self):
-        return self._Diag_VcxoLockedB
+        return self.get_diag("Diag_VcxoLockedB", self._Diag_VcxoLockedB)
 
     @DebugIt()
     def read_Diag_VcxoCableDisconnectedA(self):
-        return self._Diag_VcxoCableDisconnectedA
+        return self.get_diag("Diag_VcxoCableDisconnectedA", self._Diag_VcxoCableDisconnectedA)
 
     @DebugIt()
     def read_Diag_VcxoCableDisconnectedB(self):
-        return self._Diag_VcxoCableDisconnectedB
+        return self.get_diag("Diag_VcxoCableDisconnectedB", self._Diag_VcxoCableDisconnectedB)
 
     @DebugIt()
     def read_Diag_IpolarForAmplitudeLoopA(self):
-        return self._Diag_IpolarForAmplitudeLoopA
+        return self.get_diag("Diag_IpolarForAmplitudeLoopA", self._Diag_IpolarForAmplitudeLoopA)
 
     @DebugIt()
     def read_Diag_IpolarForAmplitudeLoopB(self):
-        return self._Diag_IpolarForAmplitudeLoopB
+        return self.get_diag("Diag_IpolarForAmplitudeLoopB", self._Diag_IpolarForAmplitudeLoopB)
 
     @DebugIt()
     def read_Diag_QpolarForAmplitudeLoopA(self):
-        return self._Diag_QpolarForAmplitudeLoopA
+        return self.get_diag("Diag_QpolarForAmplitudeLoopA", self._Diag_QpolarForAmplitudeLoopA)
 
     @DebugIt()
     def read_Diag_QpolarForAmplitudeLoopB(self):
-        return self._Diag_QpolarForAmplitudeLoopB
+        return self.get_diag("Diag_QpolarForAmplitudeLoopB", self._Diag_QpolarForAmplitudeLoopB)
 
     @DebugIt()
     def read_Diag_IpolarForPhaseLoopA(self):
-        return self._Diag_IpolarForPhaseLoopA
+        return self.get_diag("Diag_IpolarForPhaseLoopA", self._Diag_IpolarForPhaseLoopA)
 
     @DebugIt()
     def read_Diag_IpolarForPhaseLoopB(self):
-        return self._Diag_IpolarForPhaseLoopB
+        return self.get_diag("Diag_IpolarForPhaseLoopB", self._Diag_IpolarForPhaseLoopB)
 
     @DebugIt()
     def read_Diag_QpolarForPhaseLoopA(self):
-        return self._Diag_QpolarForPhaseLoopA
+        return self.get_diag("Diag_QpolarForPhaseLoopA", self._Diag_QpolarForPhaseLoopA)
 
     @DebugIt()
     def read_Diag_QpolarForPhaseLoopB(self):
-        return self._Diag_QpolarForPhaseLoopB
+        return self.get_diag("Diag_QpolarForPhaseLoopB", self._Diag_QpolarForPhaseLoopB)
 
     @DebugIt()
     def read_Diag_AmpInputOfAmpLoopA(self):
-        return self._Diag_AmpInputOfAmpLoopA
+        return self.get_diag("Diag_AmpInputOfAmpLoopA", self._Diag_AmpInputOfAmpLoopA)
 
     @DebugIt()
     def read_Diag_AmpInputOfAmpLoopB(self):
-        return self._Diag_AmpInputOfAmpLoopB
+        return self.get_diag("Diag_AmpInputOfAmpLoopB", self._Diag_AmpInputOfAmpLoopB)
 
     @DebugIt()
     def read_Diag_PhaseInputOfAmpLoopA(self):
-        return self._Diag_PhaseInputOfAmpLoopA
+        return self.get_diag("Diag_PhaseInputOfAmpLoopA", self._Diag_PhaseInputOfAmpLoopA)
 
     @DebugIt()
     def read_Diag_PhaseInputOfAmpLoopB(self):
-        return self._Diag_PhaseInputOfAmpLoopB
+        return self.get_diag("Diag_PhaseInputOfAmpLoopB", self._Diag_PhaseInputOfAmpLoopB)
 
     @DebugIt()
     def read_Diag_AmpInputOfPhaseLoopA(self):
-        return self._Diag_AmpInputOfPhaseLoopA
+        return self.get_diag("Diag_AmpInputOfPhaseLoopA", self._Diag_AmpInputOfPhaseLoopA)
 
     @DebugIt()
     def read_Diag_AmpInputOfPhaseLoopB(self):
-        return self._Diag_AmpInputOfPhaseLoopB
+        return self.get_diag("Diag_AmpInputOfPhaseLoopB", self._Diag_AmpInputOfPhaseLoopB)
 
     @DebugIt()
     def read_Diag_PhInputOfPhaseLoopA(self):
-        return self._Diag_PhInputOfPhaseLoopA
+        return self.get_diag("Diag_PhInputOfPhaseLoopA", self._Diag_PhInputOfPhaseLoopA)
 
     @DebugIt()
     def read_Diag_PhInputOfPhaseLoopB(self):
-        return self._Diag_PhInputOfPhaseLoopB
+        return self.get_diag("Diag_PhInputOfPhaseLoopB", self._Diag_PhInputOfPhaseLoopB)
 
     @DebugIt()
     def read_Diag_AmpLoopControlOutputA(self):
-        return self._Diag_AmpLoopControlOutputA
+        return self.get_diag("Diag_AmpLoopControlOutputA", self._Diag_AmpLoopControlOutputA)
 
     @DebugIt()
     def read_Diag_AmpLoopControlOutputB(self):
-        return self._Diag_AmpLoopControlOutputB
+        return self.get_diag("Diag_AmpLoopControlOutputB", self._Diag_AmpLoopControlOutputB)
 
     @DebugIt()
     def read_Diag_AmpLoopErrorA(self):
-        return self._Diag_AmpLoopErrorA
+        return self.get_diag("Diag_AmpLoopErrorA", self._Diag_AmpLoopErrorA)
 
     @DebugIt()
     def read_Diag_AmpLoopErrorB(self):
-        return self._Diag_AmpLoopErrorB
+        return self.get_diag("Diag_AmpLoopErrorB", self._Diag_AmpLoopErrorB)
 
     @DebugIt()
     def read_Diag_AmpLoopErrorAccumA(self):
-        return self._Diag_AmpLoopErrorAccumA
+        return self.get_diag("Diag_AmpLoopErrorAccumA", self._Diag_AmpLoopErrorAccumA)
 
     @DebugIt()
     def read_Diag_AmpLoopErrorAccumB(self):
-        return self._Diag_AmpLoopErrorAccumB
+        return self.get_diag("Diag_AmpLoopErrorAccumB", self._Diag_AmpLoopErrorAccumB)
 
     @DebugIt()
     def read_Diag_PhLoopControlOutputA(self):
-        return self._Diag_PhLoopControlOutputA
+        return self.get_diag("Diag_PhLoopControlOutputA", self._Diag_PhLoopControlOutputA)
 
     @DebugIt()
     def read_Diag_PhLoopControlOutputB(self):
-        return self._Diag_PhLoopControlOutputB
+        return self.get_diag("Diag_PhLoopControlOutputB", self._Diag_PhLoopControlOutputB)
 
     @DebugIt()
     def read_Diag_PhLoopErrorA(self):
-        return self._Diag_PhLoopErrorA
+        return self.get_diag("Diag_PhLoopErrorA", self._Diag_PhLoopErrorA)
 
     @DebugIt()
     def read_Diag_PhLoopErrorB(self):
-        return self._Diag_PhLoopErrorB
+        return self.get_diag("Diag_PhLoopErrorB", self._Diag_PhLoopErrorB)
 
     @DebugIt()
     def read_Diag_PhLoopErrorAccumA(self):
-        return self._Diag_PhLoopErrorAccumA
+        return self.get_diag("Diag_PhLoopErrorAccumA", self._Diag_PhLoopErrorAccumA)
 
     @DebugIt()
     def read_Diag_PhLoopErrorAccumB(self):
-        return self._Diag_PhLoopErrorAccumB
+        return self.get_diag("Diag_PhLoopErrorAccumB", self._Diag_PhLoopErrorAccumB)
 
     @DebugIt()
     def read_Diag_IpolarControlOutputA(self):
-        return self._Diag_IpolarControlOutputA
+        return self.get_diag("Diag_IpolarControlOutputA", self._Diag_IpolarControlOutputA)
 
     @DebugIt()
     def read_Diag_IpolarControlOutputB(self):
-        return self._Diag_IpolarControlOutputB
+        return self.get_diag("Diag_IpolarControlOutputB", self._Diag_IpolarControlOutputB)
 
     @DebugIt()
     def read_Diag_QpolarControlOutputA(self):
-        return self._Diag_QpolarControlOutputA
+        return self.get_diag("Diag_QpolarControlOutputA", self._Diag_QpolarControlOutputA)
 
     @DebugIt()
     def read_Diag_QpolarControlOutputB(self):
-        return self._Diag_QpolarControlOutputB
+        return self.get_diag("Diag_QpolarControlOutputB", self._Diag_QpolarControlOutputB)
 
     @DebugIt()
     def read_Diag_IcontrolSlowpiIqA(self):
-        return self._Diag_IcontrolSlowpiIqA
+        return self.get_diag("Diag_IcontrolSlowpiIqA", self._Diag_IcontrolSlowpiIqA)
 
     @DebugIt()
     def read_Diag_IcontrolSlowpiIqB(self):
-        return self._Diag_IcontrolSlowpiIqB
+        return self.get_diag("Diag_IcontrolSlowpiIqB", self._Diag_IcontrolSlowpiIqB)
 
     @DebugIt()
     def read_Diag_QcontrolSlowpiqA(self):
-        return self._Diag_QcontrolSlowpiqA
+        return self.get_diag("Diag_QcontrolSlowpiqA", self._Diag_QcontrolSlowpiqA)
 
     @DebugIt()
     def read_Diag_QcontrolSlowpiqB(self):
-        return self._Diag_QcontrolSlowpiqB
+        return self.get_diag("Diag_QcontrolSlowpiqB", self._Diag_QcontrolSlowpiqB)
 
     @DebugIt()
     def read_Diag_IcontrolFastpiIqA(self):
-        return self._Diag_IcontrolFastpiIqA
+        return self.get_diag("Diag_IcontrolFastpiIqA", self._Diag_IcontrolFastpiIqA)
 
     @DebugIt()
     def read_Diag_IcontrolFastpiIqB(self):
-        return self._Diag_IcontrolFastpiIqB
+        return self.get_diag("Diag_IcontrolFastpiIqB", self._Diag_IcontrolFastpiIqB)
 
     @DebugIt()
     def read_Diag_QcontrolFastpiIqA(self):
-        return self._Diag_QcontrolFastpiIqA
+        return self.get_diag("Diag_QcontrolFastpiIqA", self._Diag_QcontrolFastpiIqA)
 
     @DebugIt()
     def read_Diag_QcontrolFastpiIqB(self):
-        return self._Diag_QcontrolFastpiIqB
+        return self.get_diag("Diag_QcontrolFastpiIqB", self._Diag_QcontrolFastpiIqB)
 
     @DebugIt()
     def read_Diag_IloopinputSlowpiIqA(self):
-        return self._Diag_IloopinputSlowpiIqA
+        return self.get_diag("Diag_IloopinputSlowpiIqA", self._Diag_IloopinputSlowpiIqA)
 
     @DebugIt()
     def read_Diag_IloopinputSlowpiIqB(self):
-        return self._Diag_IloopinputSlowpiIqB
+        return self.get_diag("Diag_IloopinputSlowpiIqB", self._Diag_IloopinputSlowpiIqB)
 
     @DebugIt()
     def read_Diag_QloopinputSlowpiIqA(self):
-        return self._Diag_QloopinputSlowpiIqA
+        return self.get_diag("Diag_QloopinputSlowpiIqA", self._Diag_QloopinputSlowpiIqA)
 
     @DebugIt()
     def read_Diag_QloopinputSlowpiIqB(self):
-        return self._Diag_QloopinputSlowpiIqB
+        return self.get_diag("Diag_QloopinputSlowpiIqB", self._Diag_QloopinputSlowpiIqB)
 
     @DebugIt()
     def read_Diag_IloopinputFastpiIqA(self):
-        return self._Diag_IloopinputFastpiIqA
+        return self.get_diag("Diag_IloopinputFastpiIqA", self._Diag_IloopinputFastpiIqA)
 
     @DebugIt()
     def read_Diag_IloopinputFastpiIqB(self):
-        return self._Diag_IloopinputFastpiIqB
+        return self.get_diag("Diag_IloopinputFastpiIqB", self._Diag_IloopinputFastpiIqB)
 
     @DebugIt()
     def read_Diag_QloopinputFastpiIqA(self):
-        return self._Diag_QloopinputFastpiIqA
+        return self.get_diag("Diag_QloopinputFastpiIqA", self._Diag_QloopinputFastpiIqA)
 
     @DebugIt()
     def read_Diag_QloopinputFastpiIqB(self):
-        return self._Diag_QloopinputFastpiIqB
+        return self.get_diag("Diag_QloopinputFastpiIqB", self._Diag_QloopinputFastpiIqB)
 
     @DebugIt()
     def read_Diag_IrefloopinputFastpiIqA(self):
-        return self._Diag_IrefloopinputFastpiIqA
+        return self.get_diag("Diag_IrefloopinputFastpiIqA", self._Diag_IrefloopinputFastpiIqA)
 
     @DebugIt()
     def read_Diag_IrefloopinputFastpiIqB(self):
-        return self._Diag_IrefloopinputFastpiIqB
+        return self.get_diag("Diag_IrefloopinputFastpiIqB", self._Diag_IrefloopinputFastpiIqB)
 
     @DebugIt()
     def read_Diag_QrefloopinputFastpiIqA(self):
-        return self._Diag_QrefloopinputFastpiIqA
+        return self.get_diag("Diag_QrefloopinputFastpiIqA", self._Diag_QrefloopinputFastpiIqA)
 
     @DebugIt()
     def read_Diag_QrefloopinputFastpiIqB(self):
-        return self._Diag_QrefloopinputFastpiIqB
+        return self.get_diag("Diag_QrefloopinputFastpiIqB", self._Diag_QrefloopinputFastpiIqB)
 
     @DebugIt()
     def read_Diag_MovingPlungerAutoA(self):
-        return self._Diag_MovingPlungerAutoA
+        return self.get_diag("Diag_MovingPlungerAutoA", self._Diag_MovingPlungerAutoA)
 
     @DebugIt()
     def read_Diag_MovingPlungerAutoB(self):
-        return self._Diag_MovingPlungerAutoB
+        return self.get_diag("Diag_MovingPlungerAutoB", self._Diag_MovingPlungerAutoB)
 
     @DebugIt()
     def read_Diag_FreqUpA(self):
-        return self._Diag_FreqUpA
+        return self.get_diag("Diag_FreqUpA", self._Diag_FreqUpA)
 
     @DebugIt()
     def read_Diag_FreqUpB(self):
-        return self._Diag_FreqUpB
+        return self.get_diag("Diag_FreqUpB", self._Diag_FreqUpB)
 
     @DebugIt()
     def read_Diag_ManualTuningOnA(self):
-        return self._Diag_ManualTuningOnA
+        return self.get_diag("Diag_ManualTuningOnA", self._Diag_ManualTuningOnA)
 
     @DebugIt()
     def read_Diag_ManualTuningOnB(self):
-        return self._Diag_ManualTuningOnB
+        return self.get_diag("Diag_ManualTuningOnB", self._Diag_ManualTuningOnB)
 
     @DebugIt()
     def read_Diag_ManualTuningFreqUpA(self):
-        return self._Diag_ManualTuningFreqUpA
+        return self.get_diag("Diag_ManualTuningFreqUpA", self._Diag_ManualTuningFreqUpA)
 
     @DebugIt()
     def read_Diag_ManualTuningFreqUpB(self):
-        return self._Diag_ManualTuningFreqUpB
+        return self.get_diag("Diag_ManualTuningFreqUpB", self._Diag_ManualTuningFreqUpB)
 
     @DebugIt()
     def read_Diag_FwminA(self):
-        return self._Diag_FwminA
+        return self.get_diag("Diag_FwminA", self._Diag_FwminA)
 
     @DebugIt()
     def read_Diag_FwminB(self):
-        return self._Diag_FwminB
+        return self.get_diag("Diag_FwminB", self._Diag_FwminB)
 
     @DebugIt()
     def read_Diag_EpsItckDelayA(self):
-        return self._Diag_EpsItckDelayA
+        return self.get_diag("Diag_EpsItckDelayA", self._Diag_EpsItckDelayA)
 
     @DebugIt()
     def read_Diag_EpsItckDelayB(self):
-        return self._Diag_EpsItckDelayB
+        return self.get_diag("Diag_EpsItckDelayB", self._Diag_EpsItckDelayB)
 
     @DebugIt()
     def read_Diag_FimItckDelayA(self):
-        return self._Diag_FimItckDelayA
+        return self.get_diag("Diag_FimItckDelayA", self._Diag_FimItckDelayA)
 
     @DebugIt()
     def read_Diag_FimItckDelayB(self):
-        return self._Diag_FimItckDelayB
+        return self.get_diag("Diag_FimItckDelayB", self._Diag_FimItckDelayB)
 
     @DebugIt()
     def read_Diag_FdlTrigHwInputA(self):
-        return self._Diag_FdlTrigHwInputA
+        return self.get_diag("Diag_FdlTrigHwInputA", self._Diag_FdlTrigHwInputA)
 
     @DebugIt()
     def read_Diag_FdlTrigHwInputB(self):
-        return self._Diag_FdlTrigHwInputB
+        return self.get_diag("Diag_FdlTrigHwInputB", self._Diag_FdlTrigHwInputB)
 
     @DebugIt()
     def read_Diag_FdlTrigSwInputA(self):
-        return self._Diag_FdlTrigSwInputA
+        return self.get_diag("Diag_FdlTrigSwInputA", self._Diag_FdlTrigSwInputA)
 
     @DebugIt()
     def read_Diag_FdlTrigSwInputB(self):
-        return self._Diag_FdlTrigSwInputB
+        return self.get_diag("Diag_FdlTrigSwInputB", self._Diag_FdlTrigSwInputB)
 
     @DebugIt()
     def read_Diag_EpsItckA(self):
-        return self._Diag_EpsItckA
+        return self.get_diag("Diag_EpsItckA", self._Diag_EpsItckA)
 
     @DebugIt()
     def read_Diag_EpsItckB(self):
-        return self._Diag_EpsItckB
+        return self.get_diag("Diag_EpsItckB", self._Diag_EpsItckB)
 
     @DebugIt()
     def read_Diag_AmpMuxfwcircina(self):
-        return self._Diag_AmpMuxfwcircina
+        return self.get_diag("Diag_AmpMuxfwcircina", self._Diag_AmpMuxfwcircina)
 
     @DebugIt()
     def read_Diag_AmpSpare1a(self):
-        return self._Diag_AmpSpare1a
+        return self.get_diag("Diag_AmpSpare1a", self._Diag_AmpSpare1a)
 
     @DebugIt()
     def read_Diag_AmpMuxfwcircinb(self):
-        return self._Diag_AmpMuxfwcircinb
+        return self.get_diag("Diag_AmpMuxfwcircinb", self._Diag_AmpMuxfwcircinb)
 
     @DebugIt()
     def read_Diag_AmpSpare2a(self):
-        return self._Diag_AmpSpare2a
+        return self.get_diag("Diag_AmpSpare2a", self._Diag_AmpSpare2a)
 
     @DebugIt()
     def read_Diag_AmpSpare2b(self):
-        return self._Diag_AmpSpare2b
+        return self.get_diag("Diag_AmpSpare2b", self._Diag_AmpSpare2b)
 
     @DebugIt()
     def read_Diag_AmpErrora(self):
-        return self._Diag_AmpErrora
+        return self.get_diag("Diag_AmpErrora", self._Diag_AmpErrora)
 
     @DebugIt()
     def read_Diag_AmpErrorb(self):
-        return self._Diag_AmpErrorb
+        return self.get_diag("Diag_AmpErrorb", self._Diag_AmpErrorb)
 
     @DebugIt()
     def read_Diag_AmpSpare1b(self):
-        return self._Diag_AmpSpare1b
+        return self.get_diag("Diag_AmpSpare1b", self._Diag_AmpSpare1b)
 
     @DebugIt()
     def read_Diag_AmpErroraccumb(self):
-        return self._Diag_AmpErroraccumb
+        return self.get_diag("Diag_AmpErroraccumb", self._Diag_AmpErroraccumb)
 
     @DebugIt()
     def read_Diag_AmpErroraccuma(self):
-        return self._Diag_AmpErroraccuma
+        return self.get_diag("Diag_AmpErroraccuma", self._Diag_AmpErroraccuma)
 
     @DebugIt()
     def read_Diag_AmpControlfastpiiqb(self):
-        return self._Diag_AmpControlfastpiiqb
+        return self.get_diag("Diag_AmpControlfastpiiqb", self._Diag_AmpControlfastpiiqb)
 
     @DebugIt()
     def read_Diag_AmpControlfastpiiqa(self):
-        return self._Diag_AmpControlfastpiiqa
+        return self.get_diag("Diag_AmpControlfastpiiqa", self._Diag_AmpControlfastpiiqa)
 
     @DebugIt()
     def read_Diag_AmpControla(self):
-        return self._Diag_AmpControla
+        return self.get_diag("Diag_AmpControla", self._Diag_AmpControla)
 
     @DebugIt()
     def read_Diag_AmpPolarforamplitudeloopa(self):
-        return self._Diag_AmpPolarforamplitudeloopa
+        return self.get_diag("Diag_AmpPolarforamplitudeloopa", self._Diag_AmpPolarforamplitudeloopa)
 
     @DebugIt()
     def read_Diag_AmpPolarforamplitudeloopb(self):
-        return self._Diag_AmpPolarforamplitudeloopb
+        return self.get_diag("Diag_AmpPolarforamplitudeloopb", self._Diag_AmpPolarforamplitudeloopb)
 
     @DebugIt()
     def read_Diag_AmpControlb(self):
-        return self._Diag_AmpControlb
+        return self.get_diag("Diag_AmpControlb", self._Diag_AmpControlb)
 
     @DebugIt()
     def read_Diag_AmpMuxfwtet2b(self):
-        return self._Diag_AmpMuxfwtet2b
+        return self.get_diag("Diag_AmpMuxfwtet2b", self._Diag_AmpMuxfwtet2b)
 
     @DebugIt()
     def read_Diag_AmpLoopinputfastpiiqb(self):
-        return self._Diag_AmpLoopinputfastpiiqb
+        return self.get_diag("Diag_AmpLoopinputfastpiiqb", self._Diag_AmpLoopinputfastpiiqb)
 
     @DebugIt()
     def read_Diag_AmpLoopinputfastpiiqa(self):
-        return self._Diag_AmpLoopinputfastpiiqa
+        return self.get_diag("Diag_AmpLoopinputfastpiiqa", self._Diag_AmpLoopinputfastpiiqa)
 
     @DebugIt()
     def read_Diag_AmpRefa(self):
-        return self._Diag_AmpRefa
+        return self.get_diag("Diag_AmpRefa", self._Diag_AmpRefa)
 
     @DebugIt()
     def read_Diag_AmpMuxfwcava(self):
-        return self._Diag_AmpMuxfwcava
+        return self.get_diag("Diag_AmpMuxfwcava", self._Diag_AmpMuxfwcava)
 
     @DebugIt()
     def read_Diag_AmpMuxfwcavb(self):
-        return self._Diag_AmpMuxfwcavb
+        return self.get_diag("Diag_AmpMuxfwcavb", self._Diag_AmpMuxfwcavb)
 
     @DebugIt()
     def read_Diag_AmpRefb(self):
-        return self._Diag_AmpRefb
+        return self.get_diag("Diag_AmpRefb", self._Diag_AmpRefb)
 
     @DebugIt()
     def read_Diag_AmpControl2a(self):
-        return self._Diag_AmpControl2a
+        return self.get_diag("Diag_AmpControl2a", self._Diag_AmpControl2a)
 
     @DebugIt()
     def read_Diag_AmpControl2b(self):
-        return self._Diag_AmpControl2b
+        return self.get_diag("Diag_AmpControl2b", self._Diag_AmpControl2b)
 
     @DebugIt()
     def read_Diag_AmpFwtet1loopsb(self):
-        return self._Diag_AmpFwtet1loopsb
+        return self.get_diag("Diag_AmpFwtet1loopsb", self._Diag_AmpFwtet1loopsb)
 
     @DebugIt()
     def read_Diag_AmpFwtet1loopsa(self):
-        return self._Diag_AmpFwtet1loopsa
+        return self.get_diag("Diag_AmpFwtet1loopsa", self._Diag_AmpFwtet1loopsa)
 
     @DebugIt()
     def read_Diag_AmpPolarforphaseloopb(self):
-        return self._Diag_AmpPolarforphaseloopb
+        return self.get_diag("Diag_AmpPolarforphaseloopb", self._Diag_AmpPolarforphaseloopb)
 
     @DebugIt()
     def read_Diag_AmpPolarforphaseloopa(self):
-        return self._Diag_AmpPolarforphaseloopa
+        return self.get_diag("Diag_AmpPolarforphaseloopa", self._Diag_AmpPolarforphaseloopa)
 
     @DebugIt()
     def read_Diag_AmpPolarcontroloutputb(self):
-        return self._Diag_AmpPolarcontroloutputb
+        return self.get_diag("Diag_AmpPolarcontroloutputb", self._Diag_AmpPolarcontroloutputb)
 
     @DebugIt()
     def read_Diag_AmpPolarcontroloutputa(self):
-        return self._Diag_AmpPolarcontroloutputa
+        return self.get_diag("Diag_AmpPolarcontroloutputa", self._Diag_AmpPolarcontroloutputa)
 
     @DebugIt()
     def read_Diag_AmpFwtet2loopsa(self):
-        return self._Diag_AmpFwtet2loopsa
+        return self.get_diag("Diag_AmpFwtet2loopsa", self._Diag_AmpFwtet2loopsa)
 
     @DebugIt()
     def read_Diag_AmpCavloopsa(self):
-        return self._Diag_AmpCavloopsa
+        return self.get_diag("Diag_AmpCavloopsa", self._Diag_AmpCavloopsa)
 
     @DebugIt()
     def read_Diag_AmpCavloopsb(self):
-        return self._Diag_AmpCavloopsb
+        return self.get_diag("Diag_AmpCavloopsb", self._Diag_AmpCavloopsb)
 
     @DebugIt()
     def read_Diag_AmpFwtet2loopsb(self):
-        return self._Diag_AmpFwtet2loopsb
+        return self.get_diag("Diag_AmpFwtet2loopsb", self._Diag_AmpFwtet2loopsb)
 
     @DebugIt()
     def read_Diag_AmpLoopinputslowpiiqa(self):
-        return self._Diag_AmpLoopinputslowpiiqa
+        return self.get_diag("Diag_AmpLoopinputslowpiiqa", self._Diag_AmpLoopinputslowpiiqa)
 
     @DebugIt()
     def read_Diag_AmpLoopinputslowpiiqb(self):
-        return self._Diag_AmpLoopinputslowpiiqb
+        return self.get_diag("Diag_AmpLoopinputslowpiiqb", self._Diag_AmpLoopinputslowpiiqb)
 
     @DebugIt()
     def read_Diag_AmpRefloopinputfastpiiqb(self):
-        return self._Diag_AmpRefloopinputfastpiiqb
+        return self.get_diag("Diag_AmpRefloopinputfastpiiqb", self._Diag_AmpRefloopinputfastpiiqb)
 
     @DebugIt()
     def read_Diag_AmpRefloopinputfastpiiqa(self):
-        return self._Diag_AmpRefloopinputfastpiiqa
+        return self.get_diag("Diag_AmpRefloopinputfastpiiqa", self._Diag_AmpRefloopinputfastpiiqa)
 
     @DebugIt()
     def read_Diag_AmpControl1a(self):
-        return self._Diag_AmpControl1a
+        return self.get_diag("Diag_AmpControl1a", self._Diag_AmpControl1a)
 
     @DebugIt()
     def read_Diag_AmpControl1b(self):
-        return self._Diag_AmpControl1b
+        return self.get_diag("Diag_AmpControl1b", self._Diag_AmpControl1b)
 
     @DebugIt()
     def read_Diag_AmpMuxfwtet2a(self):
-        return self._Diag_AmpMuxfwtet2a
+        return self.get_diag("Diag_AmpMuxfwtet2a", self._Diag_AmpMuxfwtet2a)
 
     @DebugIt()
     def read_Diag_AmpMuxcavb(self):
-        return self._Diag_AmpMuxcavb
+        return self.get_diag("Diag_AmpMuxcavb", self._Diag_AmpMuxcavb)
 
     @DebugIt()
     def read_Diag_AmpMuxcava(self):
-        return self._Diag_AmpMuxcava
+        return self.get_diag("Diag_AmpMuxcava", self._Diag_AmpMuxcava)
 
     @DebugIt()
     def read_Diag_AmpMuxfwtet1b(self):
-        return self._Diag_AmpMuxfwtet1b
+        return self.get_diag("Diag_AmpMuxfwtet1b", self._Diag_AmpMuxfwtet1b)
 
     @DebugIt()
     def read_Diag_AmpControlfastpib(self):
-        return self._Diag_AmpControlfastpib
+        return self.get_diag("Diag_AmpControlfastpib", self._Diag_AmpControlfastpib)
 
     @DebugIt()
     def read_Diag_AmpFwcircinloopsa(self):
-        return self._Diag_AmpFwcircinloopsa
+        return self.get_diag("Diag_AmpFwcircinloopsa", self._Diag_AmpFwcircinloopsa)
 
     @DebugIt()
     def read_Diag_AmpFwcircinloopsb(self):
-        return self._Diag_AmpFwcircinloopsb
+        return self.get_diag("Diag_AmpFwcircinloopsb", self._Diag_AmpFwcircinloopsb)
 
     @DebugIt()
     def read_Diag_AmpControlfastpia(self):
-        return self._Diag_AmpControlfastpia
+        return self.get_diag("Diag_AmpControlfastpia", self._Diag_AmpControlfastpia)
 
     @DebugIt()
     def read_Diag_AmpFwcavloopsa(self):
-        return self._Diag_AmpFwcavloopsa
+        return self.get_diag("Diag_AmpFwcavloopsa", self._Diag_AmpFwcavloopsa)
 
     @DebugIt()
     def read_Diag_AmpMuxfwtet1a(self):
-        return self._Diag_AmpMuxfwtet1a
+        return self.get_diag("Diag_AmpMuxfwtet1a", self._Diag_AmpMuxfwtet1a)
 
     @DebugIt()
     def read_Diag_AmpFwcavloopsb(self):
-        return self._Diag_AmpFwcavloopsb
+        return self.get_diag("Diag_AmpFwcavloopsb", self._Diag_AmpFwcavloopsb)
 
     @DebugIt()
     def read_Diag_AmpMob(self):
-        return self._Diag_AmpMob
+        return self.get_diag("Diag_AmpMob", self._Diag_AmpMob)
 
     @DebugIt()
     def read_Diag_AmpMoa(self):
-        return self._Diag_AmpMoa
+        return self.get_diag("Diag_AmpMoa", self._Diag_AmpMoa)
 
     @DebugIt()
     def read_Diag_AmpControlslowpia(self):
-        return self._Diag_AmpControlslowpia
+        return self.get_diag("Diag_AmpControlslowpia", self._Diag_AmpControlslowpia)
 
     @DebugIt()
     def read_Diag_AmpControlslowpib(self):
-        return self._Diag_AmpControlslowpib
+        return self.get_diag("Diag_AmpControlslowpib", self._Diag_AmpControlslowpib)
 
     @DebugIt()
     def read_Diag_PhMuxfwcircina(self):
-        return self._Diag_PhMuxfwcircina
+        return self.get_diag("Diag_PhMuxfwcircina", self._Diag_PhMuxfwcircina)
 
     @DebugIt()
     def read_Diag_PhSpare1a(self):
-        return self._Diag_PhSpare1a
+        return self.get_diag("Diag_PhSpare1a", self._Diag_PhSpare1a)
 
     @DebugIt()
     def read_Diag_PhMuxfwcircinb(self):
-        return self._Diag_PhMuxfwcircinb
+        return self.get_diag("Diag_PhMuxfwcircinb", self._Diag_PhMuxfwcircinb)
 
     @DebugIt()
     def read_Diag_PhSpare2a(self):
-        return self._Diag_PhSpare2a
+        return self.get_diag("Diag_PhSpare2a", self._Diag_PhSpare2a)
 
     @DebugIt()
     def read_Diag_PhSpare2b(self):
-        return self._Diag_PhSpare2b
+        return self.get_diag("Diag_PhSpare2b", self._Diag_PhSpare2b)
 
     @DebugIt()
     def read_Diag_PhErrora(self):
-        return self._Diag_PhErrora
+        return self.get_diag("Diag_PhErrora", self._Diag_PhErrora)
 
     @DebugIt()
     def read_Diag_PhErrorb(self):
-        return self._Diag_PhErrorb
+        return self.get_diag("Diag_PhErrorb", self._Diag_PhErrorb)
 
     @DebugIt()
     def read_Diag_PhSpare1b(self):
-        return self._Diag_PhSpare1b
+        return self.get_diag("Diag_PhSpare1b", self._Diag_PhSpare1b)
 
     @DebugIt()
     def read_Diag_PhErroraccumb(self):
-        return self._Diag_PhErroraccumb
+        return self.get_diag("Diag_PhErroraccumb", self._Diag_PhErroraccumb)
 
     @DebugIt()
     def read_Diag_PhErroraccuma(self):
-        return self._Diag_PhErroraccuma
+        return self.get_diag("Diag_PhErroraccuma", self._Diag_PhErroraccuma)
 
     @DebugIt()
     def read_Diag_PhControlfastpiiqb(self):
-        return self._Diag_PhControlfastpiiqb
+        return self.get_diag("Diag_PhControlfastpiiqb", self._Diag_PhControlfastpiiqb)
 
     @DebugIt()
     def read_Diag_PhControlfastpiiqa(self):
-        return self._Diag_PhControlfastpiiqa
+        return self.get_diag("Diag_PhControlfastpiiqa", self._Diag_PhControlfastpiiqa)
 
     @DebugIt()
     def read_Diag_PhControla(self):
-        return self._Diag_PhControla
+        return self.get_diag("Diag_PhControla", self._Diag_PhControla)
 
     @DebugIt()
     def read_Diag_PhPolarforamplitudeloopa(self):
-        return self._Diag_PhPolarforamplitudeloopa
+        return self.get_diag("Diag_PhPolarforamplitudeloopa", self._Diag_PhPolarforamplitudeloopa)
 
     @DebugIt()
     def read_Diag_PhPolarforamplitudeloopb(self):
-        return self._Diag_PhPolarforamplitudeloopb
+        return self.get_diag("Diag_PhPolarforamplitudeloopb", self._Diag_PhPolarforamplitudeloopb)
 
     @DebugIt()
     def read_Diag_PhControlb(self):
-        return self._Diag_PhControlb
+        return self.get_diag("Diag_PhControlb", self._Diag_PhControlb)
 
     @DebugIt()
     def read_Diag_PhMuxfwtet2b(self):
-        return self._Diag_PhMuxfwtet2b
+        return self.get_diag("Diag_PhMuxfwtet2b", self._Diag_PhMuxfwtet2b)
 
     @DebugIt()
     def read_Diag_PhLoopinputfastpiiqb(self):
-        return self._Diag_PhLoopinputfastpiiqb
+        return self.get_diag("Diag_PhLoopinputfastpiiqb", self._Diag_PhLoopinputfastpiiqb)
 
     @DebugIt()
     def read_Diag_PhLoopinputfastpiiqa(self):
-        return self._Diag_PhLoopinputfastpiiqa
+        return self.get_diag("Diag_PhLoopinputfastpiiqa", self._Diag_PhLoopinputfastpiiqa)
 
     @DebugIt()
     def read_Diag_PhRefa(self):
-        return self._Diag_PhRefa
+        return self.get_diag("Diag_PhRefa", self._Diag_PhRefa)
 
     @DebugIt()
     def read_Diag_PhMuxfwcava(self):
-        return self._Diag_PhMuxfwcava
+        return self.get_diag("Diag_PhMuxfwcava", self._Diag_PhMuxfwcava)
 
     @DebugIt()
     def read_Diag_PhMuxfwcavb(self):
-        return self._Diag_PhMuxfwcavb
+        return self.get_diag("Diag_PhMuxfwcavb", self._Diag_PhMuxfwcavb)
 
     @DebugIt()
     def read_Diag_PhRefb(self):
-        return self._Diag_PhRefb
+        return self.get_diag("Diag_PhRefb", self._Diag_PhRefb)
 
     @DebugIt()
     def read_Diag_PhControl2a(self):
-        return self._Diag_PhControl2a
+        return self.get_diag("Diag_PhControl2a", self._Diag_PhControl2a)
 
     @DebugIt()
     def read_Diag_PhControl2b(self):
-        return self._Diag_PhControl2b
+        return self.get_diag("Diag_PhControl2b", self._Diag_PhControl2b)
 
     @DebugIt()
     def read_Diag_PhFwtet1loopsb(self):
-        return self._Diag_PhFwtet1loopsb
+        return self.get_diag("Diag_PhFwtet1loopsb", self._Diag_PhFwtet1loopsb)
 
     @DebugIt()
     def read_Diag_PhFwtet1loopsa(self):
-        return self._Diag_PhFwtet1loopsa
+        return self.get_diag("Diag_PhFwtet1loopsa", self._Diag_PhFwtet1loopsa)
 
     @DebugIt()
     def read_Diag_PhPolarforphaseloopb(self):
-        return self._Diag_PhPolarforphaseloopb
+        return self.get_diag("Diag_PhPolarforphaseloopb", self._Diag_PhPolarforphaseloopb)
 
     @DebugIt()
     def read_Diag_PhPolarforphaseloopa(self):
-        return self._Diag_PhPolarforphaseloopa
+        return self.get_diag("Diag_PhPolarforphaseloopa", self._Diag_PhPolarforphaseloopa)
 
     @DebugIt()
     def read_Diag_PhPolarcontroloutputb(self):
-        return self._Diag_PhPolarcontroloutputb
+        return self.get_diag("Diag_PhPolarcontroloutputb", self._Diag_PhPolarcontroloutputb)
 
     @DebugIt()
     def read_Diag_PhPolarcontroloutputa(self):
-        return self._Diag_PhPolarcontroloutputa
+        return self.get_diag("Diag_PhPolarcontroloutputa", self._Diag_PhPolarcontroloutputa)
 
     @DebugIt()
     def read_Diag_PhFwtet2loopsa(self):
-        return self._Diag_PhFwtet2loopsa
+        return self.get_diag("Diag_PhFwtet2loopsa", self._Diag_PhFwtet2loopsa)
 
     @DebugIt()
     def read_Diag_PhCavloopsa(self):
-        return self._Diag_PhCavloopsa
+        return self.get_diag("Diag_PhCavloopsa", self._Diag_PhCavloopsa)
 
     @DebugIt()
     def read_Diag_PhCavloopsb(self):
-        return self._Diag_PhCavloopsb
+        return self.get_diag("Diag_PhCavloopsb", self._Diag_PhCavloopsb)
 
     @DebugIt()
     def read_Diag_PhFwtet2loopsb(self):
-        return self._Diag_PhFwtet2loopsb
+        return self.get_diag("Diag_PhFwtet2loopsb", self._Diag_PhFwtet2loopsb)
 
     @DebugIt()
     def read_Diag_PhLoopinputslowpiiqa(self):
-        return self._Diag_PhLoopinputslowpiiqa
+        return self.get_diag("Diag_PhLoopinputslowpiiqa", self._Diag_PhLoopinputslowpiiqa)
 
     @DebugIt()
     def read_Diag_PhLoopinputslowpiiqb(self):
-        return self._Diag_PhLoopinputslowpiiqb
+        return self.get_diag("Diag_PhLoopinputslowpiiqb", self._Diag_PhLoopinputslowpiiqb)
 
     @DebugIt()
     def read_Diag_PhRefloopinputfastpiiqb(self):
-        return self._Diag_PhRefloopinputfastpiiqb
+        return self.get_diag("Diag_PhRefloopinputfastpiiqb", self._Diag_PhRefloopinputfastpiiqb)
 
     @DebugIt()
     def read_Diag_PhRefloopinputfastpiiqa(self):
-        return self._Diag_PhRefloopinputfastpiiqa
+        return self.get_diag("Diag_PhRefloopinputfastpiiqa", self._Diag_PhRefloopinputfastpiiqa)
 
     @DebugIt()
     def read_Diag_PhControl1a(self):
-        return self._Diag_PhControl1a
+        return self.get_diag("Diag_PhControl1a", self._Diag_PhControl1a)
 
     @DebugIt()
     def read_Diag_PhControl1b(self):
-        return self._Diag_PhControl1b
+        return self.get_diag("Diag_PhControl1b", self._Diag_PhControl1b)
 
     @DebugIt()
     def read_Diag_PhMuxfwtet2a(self):
-        return self._Diag_PhMuxfwtet2a
+        return self.get_diag("Diag_PhMuxfwtet2a", self._Diag_PhMuxfwtet2a)
 
     @DebugIt()
     def read_Diag_PhMuxcavb(self):
-        return self._Diag_PhMuxcavb
+        return self.get_diag("Diag_PhMuxcavb", self._Diag_PhMuxcavb)
 
     @DebugIt()
     def read_Diag_PhMuxcava(self):
-        return self._Diag_PhMuxcava
+        return self.get_diag("Diag_PhMuxcava", self._Diag_PhMuxcava)
 
     @DebugIt()
     def read_Diag_PhMuxfwtet1b(self):
-        return self._Diag_PhMuxfwtet1b
+        return self.get_diag("Diag_PhMuxfwtet1b", self._Diag_PhMuxfwtet1b)
 
     @DebugIt()
     def read_Diag_PhControlfastpib(self):
-        return self._Diag_PhControlfastpib
+        return self.get_diag("Diag_PhControlfastpib", self._Diag_PhControlfastpib)
 
     @DebugIt()
     def read_Diag_PhFwcircinloopsa(self):
-        return self._Diag_PhFwcircinloopsa
+        return self.get_diag("Diag_PhFwcircinloopsa", self._Diag_PhFwcircinloopsa)
 
     @DebugIt()
     def read_Diag_PhFwcircinloopsb(self):
-        return self._Diag_PhFwcircinloopsb
+        return self.get_diag("Diag_PhFwcircinloopsb", self._Diag_PhFwcircinloopsb)
 
     @DebugIt()
     def read_Diag_PhControlfastpia(self):
-        return self._Diag_PhControlfastpia
+        return self.get_diag("Diag_PhControlfastpia", self._Diag_PhControlfastpia)
 
     @DebugIt()
     def read_Diag_PhFwcavloopsa(self):
-        return self._Diag_PhFwcavloopsa
+        return self.get_diag("Diag_PhFwcavloopsa", self._Diag_PhFwcavloopsa)
 
     @DebugIt()
     def read_Diag_PhMuxfwtet1a(self):
-        return self._Diag_PhMuxfwtet1a
+        return self.get_diag("Diag_PhMuxfwtet1a", self._Diag_PhMuxfwtet1a)
 
     @DebugIt()
     def read_Diag_PhFwcavloopsb(self):
-        return self._Diag_PhFwcavloopsb
+        return self.get_diag("Diag_PhFwcavloopsb", self._Diag_PhFwcavloopsb)
 
     @DebugIt()
     def read_Diag_PhMob(self):
-        return self._Diag_PhMob
+        return self.get_diag("Diag_PhMob", self._Diag_PhMob)
 
     @DebugIt()
     def read_Diag_PhMoa(self):
-        return self._Diag_PhMoa
+        return self.get_diag("Diag_PhMoa", self._Diag_PhMoa)
 
     @DebugIt()
     def read_Diag_PhControlslowpia(self):
-        return self._Diag_PhControlslowpia
+        return self.get_diag("Diag_PhControlslowpia", self._Diag_PhControlslowpia)
 
     @DebugIt()
     def read_Diag_PhControlslowpib(self):
-        return self._Diag_PhControlslowpib
+        return self.get_diag("Diag_PhControlslowpib", self._Diag_PhControlslowpib)
 
     @command
+    @prioritized(PRIORITY_ACQUISITION)
     def read_diagnostics(self):
-        perseus_utils.start_reading_diagnostics(self.perseus, 'A')
-        perseus_utils.start_reading_diagnostics(self.perseus, 'B')
-
-        self._Diag_IcavLoopsA = perseus_utils.read_diag_milivolts(self.perseus, 0, 'A')
-        self.push_change_event("Diag_IcavLoopsA", self._Diag_IcavLoopsA)
-        self._Diag_IcavLoopsB = perseus_utils.read_diag_milivolts(self.perseus, 0, 'B')
-        self.push_change_event("Diag_IcavLoopsB", self._Diag_IcavLoopsB)
-        self._Diag_QcavLoopsA = perseus_utils.read_diag_milivolts(self.perseus, 1, 'A')
-        self.push_change_event("Diag_QcavLoopsA", self._Diag_QcavLoopsA)
-        self._Diag_QcavLoopsB = perseus_utils.read_diag_milivolts(self.perseus, 1, 'B')
-        self.push_change_event("Diag_QcavLoopsB", self._Diag_QcavLoopsB)
-        self._Diag_IcontrolA = perseus_utils.read_diag_milivolts(self.perseus, 2, 'A')
-        self.push_change_event("Diag_IcontrolA", self._Diag_IcontrolA)
-        self._Diag_IcontrolB = perseus_utils.read_diag_milivolts(self.perseus, 2, 'B')
-        self.push_change_event("Diag_IcontrolB", self._Diag_IcontrolB)
-        self._Diag_QcontrolA = perseus_utils.read_diag_milivolts(self.perseus, 3, 'A')
-        self.push_change_event("Diag_QcontrolA", self._Diag_QcontrolA)
-        self._Diag_QcontrolB = perseus_utils.read_diag_milivolts(self.perseus, 3, 'B')
-        self.push_change_event("Diag_QcontrolB", self._Diag_QcontrolB)
-        self._Diag_Icontrol1A = perseus_utils.read_diag_milivolts(self.perseus, 4, 'A')
-        self.push_change_event("Diag_Icontrol1A", self._Diag_Icontrol1A)
-        self._Diag_Icontrol1B = perseus_utils.read_diag_milivolts(self.perseus, 4, 'B')
-        self.push_change_event("Diag_Icontrol1B", self._Diag_Icontrol1B)
-        self._Diag_Qcontrol1A = perseus_utils.read_diag_milivolts(self.perseus, 5, 'A')
-        self.push_change_event("Diag_Qcontrol1A", self._Diag_Qcontrol1A)
-        self._Diag_Qcontrol1B = perseus_utils.read_diag_milivolts(self.perseus, 5, 'B')
-        self.push_change_event("Diag_Qcontrol1B", self._Diag_Qcontrol1B)
-        self._Diag_Icontrol2A = perseus_utils.read_diag_milivolts(self.perseus, 6, 'A')
-        self.push_change_event("Diag_Icontrol2A", self._Diag_Icontrol2A)
-        self._Diag_Icontrol2B = perseus_utils.read_diag_milivolts(self.perseus, 6, 'B')
-        self.push_change_event("Diag_Icontrol2B", self._Diag_Icontrol2B)
-        self._Diag_Qcontrol2A = perseus_utils.read_diag_milivolts(self.perseus, 7, 'A')
-        self.push_change_event("Diag_Qcontrol2A", self._Diag_Qcontrol2A)
-        self._Diag_Qcontrol2B = perseus_utils.read_diag_milivolts(self.perseus, 7, 'B')
-        self.push_change_event("Diag_Qcontrol2B", self._Diag_Qcontrol2B)
-        self._Diag_IerrorA = perseus_utils.read_diag_milivolts(self.perseus, 8, 'A')
-        self.push_change_event("Diag_IerrorA", self._Diag_IerrorA)
-        self._Diag_IerrorB = perseus_utils.read_diag_milivolts(self.perseus, 8, 'B')
-        self.push_change_event("Diag_IerrorB", self._Diag_IerrorB)
-        self._Diag_QerrorA = perseus_utils.read_diag_milivolts(self.perseus, 9, 'A')
-        self.push_change_event("Diag_QerrorA", self._Diag_QerrorA)
-        self._Diag_QerrorB = perseus_utils.read_diag_milivolts(self.perseus, 9, 'B')
-        self.push_change_event("Diag_QerrorB", self._Diag_QerrorB)
-        self._Diag_IerroraccumA = perseus_utils.read_diag_milivolts(self.perseus, 10, 'A')
-        self.push_change_event("Diag_IerroraccumA", self._Diag_IerroraccumA)
-        self._Diag_IerroraccumB = perseus_utils.read_diag_milivolts(self.perseus, 10, 'B')
-        self.push_change_event("Diag_IerroraccumB", self._Diag_IerroraccumB)
-        self._Diag_QerroraccumA = perseus_utils.read_diag_milivolts(self.perseus, 11, 'A')
-        self.push_change_event("Diag_QerroraccumA", self._Diag_QerroraccumA)
-        self._Diag_QerroraccumB = perseus_utils.read_diag_milivolts(self.perseus, 11, 'B')
-        self.push_change_event("Diag_QerroraccumB", self._Diag_QerroraccumB)
-        self._Diag_IrefA = perseus_utils.read_diag_milivolts(self.perseus, 12, 'A')
-        self.push_change_event("Diag_IrefA", self._Diag_IrefA)
-        self._Diag_IrefB = perseus_utils.read_diag_milivolts(self.perseus, 12, 'B')
-        self.push_change_event("Diag_IrefB", self._Diag_IrefB)
-        self._Diag_QrefA = perseus_utils.read_diag_milivolts(self.perseus, 13, 'A')
-        self.push_change_event("Diag_QrefA", self._Diag_QrefA)
-        self._Diag_QrefB = perseus_utils.read_diag_milivolts(self.perseus, 13, 'B')
-        self.push_change_event("Diag_QrefB", self._Diag_QrefB)
-        self._Diag_IFwCavLoopsA = perseus_utils.read_diag_milivolts(self.perseus, 14, 'A')
-        self.push_change_event("Diag_IFwCavLoopsA", self._Diag_IFwCavLoopsA)
-        self._Diag_IFwCavLoopsB = perseus_utils.read_diag_milivolts(self.perseus, 14, 'B')
-        self.push_change_event("Diag_IFwCavLoopsB", self._Diag_IFwCavLoopsB)
-        self._Diag_QFwCavLoopsA = perseus_utils.read_diag_milivolts(self.perseus, 15, 'A')
-        self.push_change_event("Diag_QFwCavLoopsA", self._Diag_QFwCavLoopsA)
-        self._Diag_QFwCavLoopsB = perseus_utils.read_diag_milivolts(self.perseus, 15, 'B')
-        self.push_change_event("Diag_QFwCavLoopsB", self._Diag_QFwCavLoopsB)
-        self._Diag_IFwTet1LoopsA = perseus_utils.read_diag_milivolts(self.perseus, 16, 'A')
-        self.push_change_event("Diag_IFwTet1LoopsA", self._Diag_IFwTet1LoopsA)
-        self._Diag_IFwTet1LoopsB = perseus_utils.read_diag_milivolts(self.perseus, 16, 'B')
-        self.push_change_event("Diag_IFwTet1LoopsB", self._Diag_IFwTet1LoopsB)
-        self._Diag_QFwTet1LoopsA = perseus_utils.read_diag_milivolts(self.perseus, 17, 'A')
-        self.push_change_event("Diag_QFwTet1LoopsA", self._Diag_QFwTet1LoopsA)
-        self._Diag_QFwTet1LoopsB = perseus_utils.read_diag_milivolts(self.perseus, 17, 'B')
-        self.push_change_event("Diag_QFwTet1LoopsB", self._Diag_QFwTet1LoopsB)
-        self._Diag_IFwTet2LoopsA = perseus_utils.read_diag_milivolts(self.perseus, 18, 'A')
-        self.push_change_event("Diag_IFwTet2LoopsA", self._Diag_IFwTet2LoopsA)
-        self._Diag_IFwTet2LoopsB = perseus_utils.read_diag_milivolts(self.perseus, 18, 'B')
-        self.push_change_event("Diag_IFwTet2LoopsB", self._Diag_IFwTet2LoopsB)
-        self._Diag_QFwTet2LoopsA = perseus_utils.read_diag_milivolts(self.perseus, 19, 'A')
-        self.push_change_event("Diag_QFwTet2LoopsA", self._Diag_QFwTet2LoopsA)
-        self._Diag_QFwTet2LoopsB = perseus_utils.read_diag_milivolts(self.perseus, 19, 'B')
-        self.push_change_event("Diag_QFwTet2LoopsB", self._Diag_QFwTet2LoopsB)
-        self._Diag_IFwCircInLoopsA = perseus_utils.read_diag_milivolts(self.perseus, 20, 'A')
-        self.push_change_event("Diag_IFwCircInLoopsA", self._Diag_IFwCircInLoopsA)
-        self._Diag_IFwCircInLoopsB = perseus_utils.read_diag_milivolts(self.perseus, 20, 'B')
-        self.push_change_event("Diag_IFwCircInLoopsB", self._Diag_IFwCircInLoopsB)
-        self._Diag_QFwCircInLoopsA = perseus_utils.read_diag_milivolts(self.perseus, 21, 'A')
-        self.push_change_event("Diag_QFwCircInLoopsA", self._Diag_QFwCircInLoopsA)
-        self._Diag_QFwCircInLoopsB = perseus_utils.read_diag_milivolts(self.perseus, 21, 'B')
-        self.push_change_event("Diag_QFwCircInLoopsB", self._Diag_QFwCircInLoopsB)
-        self._Diag_ImoA = perseus_utils.read_diag_milivolts(self.perseus, 22, 'A')
-        self.push_change_event("Diag_ImoA", self._Diag_ImoA)
-        self._Diag_ImoB = perseus_utils.read_diag_milivolts(self.perseus, 22, 'B')
-        self.push_change_event("Diag_ImoB", self._Diag_ImoB)
-        self._Diag_QmoA = perseus_utils.read_diag_milivolts(self.perseus, 23, 'A')
-        self.push_change_event("Diag_QmoA", self._Diag_QmoA)
-        self._Diag_QmoB = perseus_utils.read_diag_milivolts(self.perseus, 23, 'B')
-        self.push_change_event("Diag_QmoB", self._Diag_QmoB)
-        self._Diag_Ispare1A = perseus_utils.read_diag_milivolts(self.perseus, 24, 'A')
-        self.push_change_event("Diag_Ispare1A", self._Diag_Ispare1A)
-        self._Diag_Ispare1B = perseus_utils.read_diag_milivolts(self.perseus, 24, 'B')
-        self.push_change_event("Diag_Ispare1B", self._Diag_Ispare1B)
-        self._Diag_Qspare1A = perseus_utils.read_diag_milivolts(self.perseus, 25, 'A')
-        self.push_change_event("Diag_Qspare1A", self._Diag_Qspare1A)
-        self._Diag_Qspare1B = perseus_utils.read_diag_milivolts(self.perseus, 25, 'B')
-        self.push_change_event("Diag_Qspare1B", self._Diag_Qspare1B)
-        self._Diag_Ispare2A = perseus_utils.read_diag_milivolts(self.perseus, 26, 'A')
-        self.push_change_event("Diag_Ispare2A", self._Diag_Ispare2A)
-        self._Diag_Ispare2B = perseus_utils.read_diag_milivolts(self.perseus, 26, 'B')
-        self.push_change_event("Diag_Ispare2B", self._Diag_Ispare2B)
-        self._Diag_Qspare2A = perseus_utils.read_diag_milivolts(self.perseus, 27, 'A')
-        self.push_change_event("Diag_Qspare2A", self._Diag_Qspare2A)
-        self._Diag_Qspare2B = perseus_utils.read_diag_milivolts(self.perseus, 27, 'B')
-        self.push_change_event("Diag_Qspare2B", self._Diag_Qspare2B)
-        self._Diag_IMuxCavA = perseus_utils.read_diag_milivolts(self.perseus, 28, 'A')
-        self.push_change_event("Diag_IMuxCavA", self._Diag_IMuxCavA)
-        self._Diag_IMuxCavB = perseus_utils.read_diag_milivolts(self.perseus, 28, 'B')
-        self.push_change_event("Diag_IMuxCavB", self._Diag_IMuxCavB)
-        self._Diag_QMuxCavA = perseus_utils.read_diag_milivolts(self.perseus, 29, 'A')
-        self.push_change_event("Diag_QMuxCavA", self._Diag_QMuxCavA)
-        self._Diag_QMuxCavB = perseus_utils.read_diag_milivolts(self.perseus, 29, 'B')
-        self.push_change_event("Diag_QMuxCavB", self._Diag_QMuxCavB)
-        self._Diag_IMuxFwCavA = perseus_utils.read_diag_milivolts(self.perseus, 30, 'A')
-        self.push_change_event("Diag_IMuxFwCavA", self._Diag_IMuxFwCavA)
-        self._Diag_IMuxFwCavB = perseus_utils.read_diag_milivolts(self.perseus, 30, 'B')
-        self.push_change_event("Diag_IMuxFwCavB", self._Diag_IMuxFwCavB)
-        self._Diag_QMuxFwCavA = perseus_utils.read_diag_milivolts(self.perseus, 31, 'A')
-        self.push_change_event("Diag_QMuxFwCavA", self._Diag_QMuxFwCavA)
-        self._Diag_QMuxFwCavB = perseus_utils.read_diag_milivolts(self.perseus, 31, 'B')
-        self.push_change_event("Diag_QMuxFwCavB", self._Diag_QMuxFwCavB)
-        self._Diag_IMuxFwTet1A = perseus_utils.read_diag_milivolts(self.perseus, 32, 'A')
-        self.push_change_event("Diag_IMuxFwTet1A", self._Diag_IMuxFwTet1A)
-        self._Diag_IMuxFwTet1B = perseus_utils.read_diag_milivolts(self.perseus, 32, 'B')
-        self.push_change_event("Diag_IMuxFwTet1B", self._Diag_IMuxFwTet1B)
-        self._Diag_QMuxFwTet1A = perseus_utils.read_diag_milivolts(self.perseus, 33, 'A')
-        self.push_change_event("Diag_QMuxFwTet1A", self._Diag_QMuxFwTet1A)
-        self._Diag_QMuxFwTet1B = perseus_utils.read_diag_milivolts(self.perseus, 33, 'B')
-        self.push_change_event("Diag_QMuxFwTet1B", self._Diag_QMuxFwTet1B)
-        self._Diag_IMuxFwTet2A = perseus_utils.read_diag_milivolts(self.perseus, 34, 'A')
-        self.push_change_event("Diag_IMuxFwTet2A", self._Diag_IMuxFwTet2A)
-        self._Diag_IMuxFwTet2B = perseus_utils.read_diag_milivolts(self.perseus, 34, 'B')
-        self.push_change_event("Diag_IMuxFwTet2B", self._Diag_IMuxFwTet2B)
-        self._Diag_QMuxFwTet2A = perseus_utils.read_diag_milivolts(self.perseus, 35, 'A')
-        self.push_change_event("Diag_QMuxFwTet2A", self._Diag_QMuxFwTet2A)
-        self._Diag_QMuxFwTet2B = perseus_utils.read_diag_milivolts(self.perseus, 35, 'B')
-        self.push_change_event("Diag_QMuxFwTet2B", self._Diag_QMuxFwTet2B)
-        self._Diag_IMuxFwCircInA = perseus_utils.read_diag_milivolts(self.perseus, 36, 'A')
-        self.push_change_event("Diag_IMuxFwCircInA", self._Diag_IMuxFwCircInA)
-        self._Diag_IMuxFwCircInB = perseus_utils.read_diag_milivolts(self.perseus, 36, 'B')
-        self.push_change_event("Diag_IMuxFwCircInB", self._Diag_IMuxFwCircInB)
-        self._Diag_QMuxFwCircInA = perseus_utils.read_diag_milivolts(self.perseus, 37, 'A')
-        self.push_change_event("Diag_QMuxFwCircInA", self._Diag_QMuxFwCircInA)
-        self._Diag_QMuxFwCircInB = perseus_utils.read_diag_milivolts(self.perseus, 37, 'B')
-        self.push_change_event("Diag_QMuxFwCircInB", self._Diag_QMuxFwCircInB)
-        self._Diag_AmpCavA = perseus_utils.read_diag_milivolts(self.perseus, 38, 'A')
-        self.push_change_event("Diag_AmpCavA", self._Diag_AmpCavA)
-        self._Diag_AmpCavB = perseus_utils.read_diag_milivolts(self.perseus, 38, 'B')
-        self.push_change_event("Diag_AmpCavB", self._Diag_AmpCavB)
-        self._Diag_AmpFwA = perseus_utils.read_diag_milivolts(self.perseus, 39, 'A')
-        self.push_change_event("Diag_AmpFwA", self._Diag_AmpFwA)
-        self._Diag_AmpFwB = perseus_utils.read_diag_milivolts(self.perseus, 39, 'B')
-        self.push_change_event("Diag_AmpFwB", self._Diag_AmpFwB)
-        self._Diag_AngCavFwA = perseus_utils.read_diag_angle(self.perseus, 40, 'A')
-        self.push_change_event("Diag_AngCavFwA", self._Diag_AngCavFwA)
-        self._Diag_AngCavFwB = perseus_utils.read_diag_angle(self.perseus, 40, 'B')
-        self.push_change_event("Diag_AngCavFwB", self._Diag_AngCavFwB)
-        self._Diag_AngCavLA = perseus_utils.read_diag_angle(self.perseus, 41, 'A')
-        self.push_change_event("Diag_AngCavLA", self._Diag_AngCavLA)
-        self._Diag_AngCavLB = perseus_utils.read_diag_angle(self.perseus, 41, 'B')
-        self.push_change_event("Diag_AngCavLB", self._Diag_AngCavLB)
-        self._Diag_AngFwLA = perseus_utils.read_diag_angle(self.perseus, 42, 'A')
-        self.push_change_event("Diag_AngFwLA", self._Diag_AngFwLA)
-        self._Diag_AngFwLB = perseus_utils.read_diag_angle(self.perseus, 42, 'B')
-        self.push_change_event("Diag_AngFwLB", self._Diag_AngFwLB)
-        self._Diag_Vaccum1A = bool(perseus_utils.read_diag_direct(self.perseus, 43, 'A'))
-        self.push_change_event("Diag_Vaccum1A", self._Diag_Vaccum1A)
-        self._Diag_Vaccum1B = bool(perseus_utils.read_diag_direct(self.perseus, 43, 'B'))
-        self.push_change_event("Diag_Vaccum1B", self._Diag_Vaccum1B)
-        self._Diag_Vaccum2A = bool(perseus_utils.read_diag_direct(self.perseus, 44, 'A'))
-        self.push_change_event("Diag_Vaccum2A", self._Diag_Vaccum2A)
-        self._Diag_Vaccum2B = bool(perseus_utils.read_diag_direct(self.perseus, 44, 'B'))
-        self.push_change_event("Diag_Vaccum2B", self._Diag_Vaccum2B)
-        self._Diag_IcontrolSlowpiA = perseus_utils.read_diag_milivolts(self.perseus, 45, 'A')
-        self.push_change_event("Diag_IcontrolSlowpiA", self._Diag_IcontrolSlowpiA)
-        self._Diag_IcontrolSlowpiB = perseus_utils.read_diag_milivolts(self.perseus, 45, 'B')
-        self.push_change_event("Diag_IcontrolSlowpiB", self._Diag_IcontrolSlowpiB)
-        self._Diag_QcontrolSlowpiA = perseus_utils.read_diag_milivolts(self.perseus, 46, 'A')
-        self.push_change_event("Diag_QcontrolSlowpiA", self._Diag_QcontrolSlowpiA)
-        self._Diag_QcontrolSlowpiB = perseus_utils.read_diag_milivolts(self.perseus, 46, 'B')
-        self.push_change_event("Diag_QcontrolSlowpiB", self._Diag_QcontrolSlowpiB)
-        self._Diag_IcontrolFastpiA = perseus_utils.read_diag_milivolts(self.perseus, 47, 'A')
-        self.push_change_event("Diag_IcontrolFastpiA", self._Diag_IcontrolFastpiA)
-        self._Diag_IcontrolFastpiB = perseus_utils.read_diag_milivolts(self.perseus, 47, 'B')
-        self.push_change_event("Diag_IcontrolFastpiB", self._Diag_IcontrolFastpiB)
-        self._Diag_QcontrolFastpiA = perseus_utils.read_diag_milivolts(self.perseus, 48, 'A')
-        self.push_change_event("Diag_QcontrolFastpiA", self._Diag_QcontrolFastpiA)
-        self._Diag_QcontrolFastpiB = perseus_utils.read_diag_milivolts(self.perseus, 48, 'B')
-        self.push_change_event("Diag_QcontrolFastpiB", self._Diag_QcontrolFastpiB)
-        self._Diag_VcxoPoweredA = bool(perseus_utils.read_diag_direct(self.perseus, 50, 'A'))
-        self.push_change_event("Diag_VcxoPoweredA", self._Diag_VcxoPoweredA)
-        self._Diag_VcxoPoweredB = bool(perseus_utils.read_diag_direct(self.perseus, 50, 'B'))
-        self.push_change_event("Diag_VcxoPoweredB", self._Diag_VcxoPoweredB)
-        self._Diag_VcxoRefA = bool(perseus_utils.read_diag_direct(self.perseus, 51, 'A'))
-        self.push_change_event("Diag_VcxoRefA", self._Diag_VcxoRefA)
-        self._Diag_VcxoRefB = bool(perseus_utils.read_diag_direct(self.perseus, 51, 'B'))
-        self.push_change_event("Diag_VcxoRefB", self._Diag_VcxoRefB)
-        self._Diag_VcxoLockedA = bool(perseus_utils.read_diag_direct(self.perseus, 52, 'A'))
-        self.push_change_event("Diag_VcxoLockedA", self._Diag_VcxoLockedA)
-        self._Diag_VcxoLockedB = bool(perseus_utils.read_diag_direct(self.perseus, 52, 'B'))
-        self.push_change_event("Diag_VcxoLockedB", self._Diag_VcxoLockedB)
-        self._Diag_VcxoCableDisconnectedA = bool(perseus_utils.read_diag_direct(self.perseus, 53, 'A'))
-        self.push_change_event("Diag_VcxoCableDisconnectedA", self._Diag_VcxoCableDisconnectedA)
-        self._Diag_VcxoCableDisconnectedB = bool(perseus_utils.read_diag_direct(self.perseus, 53, 'B'))
-        self.push_change_event("Diag_VcxoCableDisconnectedB", self._Diag_VcxoCableDisconnectedB)
-        self._Diag_IpolarForAmplitudeLoopA = perseus_utils.read_diag_milivolts(self.perseus, 100, 'A')
-        self.push_change_event("Diag_IpolarForAmplitudeLoopA", self._Diag_IpolarForAmplitudeLoopA)
-        self._Diag_IpolarForAmplitudeLoopB = perseus_utils.read_diag_milivolts(self.perseus, 100, 'B')
-        self.push_change_event("Diag_IpolarForAmplitudeLoopB", self._Diag_IpolarForAmplitudeLoopB)
-        self._Diag_QpolarForAmplitudeLoopA = perseus_utils.read_diag_milivolts(self.perseus, 101, 'A')
-        self.push_change_event("Diag_QpolarForAmplitudeLoopA", self._Diag_QpolarForAmplitudeLoopA)
-        self._Diag_QpolarForAmplitudeLoopB = perseus_utils.read_diag_milivolts(self.perseus, 101, 'B')
-        self.push_change_event("Diag_QpolarForAmplitudeLoopB", self._Diag_QpolarForAmplitudeLoopB)
-        self._Diag_IpolarForPhaseLoopA = perseus_utils.read_diag_milivolts(self.perseus, 102, 'A')
-        self.push_change_event("Diag_IpolarForPhaseLoopA", self._Diag_IpolarForPhaseLoopA)
-        self._Diag_IpolarForPhaseLoopB = perseus_utils.read_diag_milivolts(self.perseus, 102, 'B')
-        self.push_change_event("Diag_IpolarForPhaseLoopB", self._Diag_IpolarForPhaseLoopB)
-        self._Diag_QpolarForPhaseLoopA = perseus_utils.read_diag_milivolts(self.perseus, 103, 'A')
-        self.push_change_event("Diag_QpolarForPhaseLoopA", self._Diag_QpolarForPhaseLoopA)
-        self._Diag_QpolarForPhaseLoopB = perseus_utils.read_diag_milivolts(self.perseus, 103, 'B')
-        self.push_change_event("Diag_QpolarForPhaseLoopB", self._Diag_QpolarForPhaseLoopB)
-        self._Diag_AmpInputOfAmpLoopA = perseus_utils.read_diag_milivolts(self.perseus, 104, 'A')
-        self.push_change_event("Diag_AmpInputOfAmpLoopA", self._Diag_AmpInputOfAmpLoopA)
-        self._Diag_AmpInputOfAmpLoopB = perseus_utils.read_diag_milivolts(self.perseus, 104, 'B')
-        self.push_change_event("Diag_AmpInputOfAmpLoopB", self._Diag_AmpInputOfAmpLoopB)
-        self._Diag_PhaseInputOfAmpLoopA = perseus_utils.read_diag_milivolts(self.perseus, 105, 'A')
-        self.push_change_event("Diag_PhaseInputOfAmpLoopA", self._Diag_PhaseInputOfAmpLoopA)
-        self._Diag_PhaseInputOfAmpLoopB = perseus_utils.read_diag_milivolts(self.perseus, 105, 'B')
-        self.push_change_event("Diag_PhaseInputOfAmpLoopB", self._Diag_PhaseInputOfAmpLoopB)
-        self._Diag_AmpInputOfPhaseLoopA = perseus_utils.read_diag_milivolts(self.perseus, 106, 'A')
-        self.push_change_event("Diag_AmpInputOfPhaseLoopA", self._Diag_AmpInputOfPhaseLoopA)
-        self._Diag_AmpInputOfPhaseLoopB = perseus_utils.read_diag_milivolts(self.perseus, 106, 'B')
-        self.push_change_event("Diag_AmpInputOfPhaseLoopB", self._Diag_AmpInputOfPhaseLoopB)
-        self._Diag_PhInputOfPhaseLoopA = perseus_utils.read_diag_milivolts(self.perseus, 107, 'A')
-        self.push_change_event("Diag_PhInputOfPhaseLoopA", self._Diag_PhInputOfPhaseLoopA)
-        self._Diag_PhInputOfPhaseLoopB = perseus_utils.read_diag_milivolts(self.perseus, 107, 'B')
-        self.push_change_event("Diag_PhInputOfPhaseLoopB", self._Diag_PhInputOfPhaseLoopB)
-        self._Diag_AmpLoopControlOutputA = perseus_utils.read_diag_milivolts(self.perseus, 108, 'A')
-        self.push_change_event("Diag_AmpLoopControlOutputA", self._Diag_AmpLoopControlOutputA)
-        self._Diag_AmpLoopControlOutputB = perseus_utils.read_diag_milivolts(self.perseus, 108, 'B')
-        self.push_change_event("Diag_AmpLoopControlOutputB", self._Diag_AmpLoopControlOutputB)
-        self._Diag_AmpLoopErrorA = perseus_utils.read_diag_milivolts(self.perseus, 109, 'A')
-        self.push_change_event("Diag_AmpLoopErrorA", self._Diag_AmpLoopErrorA)
-        self._Diag_AmpLoopErrorB = perseus_utils.read_diag_milivolts(self.perseus, 109, 'B')
-        self.push_change_event("Diag_AmpLoopErrorB", self._Diag_AmpLoopErrorB)
-        self._Diag_AmpLoopErrorAccumA = perseus_utils.read_diag_milivolts(self.perseus, 110, 'A')
-        self.push_change_event("Diag_AmpLoopErrorAccumA", self._Diag_AmpLoopErrorAccumA)
-        self._Diag_AmpLoopErrorAccumB = perseus_utils.read_diag_milivolts(self.perseus, 110, 'B')
-        self.push_change_event("Diag_AmpLoopErrorAccumB", self._Diag_AmpLoopErrorAccumB)
-        self._Diag_PhLoopControlOutputA = perseus_utils.read_diag_milivolts(self.perseus, 111, 'A')
-        self.push_change_event("Diag_PhLoopControlOutputA", self._Diag_PhLoopControlOutputA)
-        self._Diag_PhLoopControlOutputB = perseus_utils.read_diag_milivolts(self.perseus, 111, 'B')
-        self.push_change_event("Diag_PhLoopControlOutputB", self._Diag_PhLoopControlOutputB)
-        self._Diag_PhLoopErrorA = perseus_utils.read_diag_milivolts(self.perseus, 112, 'A')
-        self.push_change_event("Diag_PhLoopErrorA", self._Diag_PhLoopErrorA)
-        self._Diag_PhLoopErrorB = perseus_utils.read_diag_milivolts(self.perseus, 112, 'B')
-        self.push_change_event("Diag_PhLoopErrorB", self._Diag_PhLoopErrorB)
-        self._Diag_PhLoopErrorAccumA = perseus_utils.read_diag_milivolts(self.perseus, 113, 'A')
-        self.push_change_event("Diag_PhLoopErrorAccumA", self._Diag_PhLoopErrorAccumA)
-        self._Diag_PhLoopErrorAccumB = perseus_utils.read_diag_milivolts(self.perseus, 113, 'B')
-        self.push_change_event("Diag_PhLoopErrorAccumB", self._Diag_PhLoopErrorAccumB)
-        self._Diag_IpolarControlOutputA = perseus_utils.read_diag_milivolts(self.perseus, 114, 'A')
-        self.push_change_event("Diag_IpolarControlOutputA", self._Diag_IpolarControlOutputA)
-        self._Diag_IpolarControlOutputB = perseus_utils.read_diag_milivolts(self.perseus, 114, 'B')
-        self.push_change_event("Diag_IpolarControlOutputB", self._Diag_IpolarControlOutputB)
-        self._Diag_QpolarControlOutputA = perseus_utils.read_diag_milivolts(self.perseus, 115, 'A')
-        self.push_change_event("Diag_QpolarControlOutputA", self._Diag_QpolarControlOutputA)
-        self._Diag_QpolarControlOutputB = perseus_utils.read_diag_milivolts(self.perseus, 115, 'B')
-        self.push_change_event("Diag_QpolarControlOutputB", self._Diag_QpolarControlOutputB)
-        self._Diag_IcontrolSlowpiIqA = perseus_utils.read_diag_milivolts(self.perseus, 116, 'A')
-        self.push_change_event("Diag_IcontrolSlowpiIqA", self._Diag_IcontrolSlowpiIqA)
-        self._Diag_IcontrolSlowpiIqB = perseus_utils.read_diag_milivolts(self.perseus, 116, 'B')
-        self.push_change_event("Diag_IcontrolSlowpiIqB", self._Diag_IcontrolSlowpiIqB)
-        self._Diag_QcontrolSlowpiqA = perseus_utils.read_diag_milivolts(self.perseus, 117, 'A')
-        self.push_change_event("Diag_QcontrolSlowpiqA", self._Diag_QcontrolSlowpiqA)
-        self._Diag_QcontrolSlowpiqB = perseus_utils.read_diag_milivolts(self.perseus, 117, 'B')
-        self.push_change_event("Diag_QcontrolSlowpiqB", self._Diag_QcontrolSlowpiqB)
-        self._Diag_IcontrolFastpiIqA = perseus_utils.read_diag_milivolts(self.perseus, 118, 'A')
-        self.push_change_event("Diag_IcontrolFastpiIqA", self._Diag_IcontrolFastpiIqA)
-        self._Diag_IcontrolFastpiIqB = perseus_utils.read_diag_milivolts(self.perseus, 118, 'B')
-        self.push_change_event("Diag_IcontrolFastpiIqB", self._Diag_IcontrolFastpiIqB)
-        self._Diag_QcontrolFastpiIqA = perseus_utils.read_diag_milivolts(self.perseus, 119, 'A')
-        self.push_change_event("Diag_QcontrolFastpiIqA", self._Diag_QcontrolFastpiIqA)
-        self._Diag_QcontrolFastpiIqB = perseus_utils.read_diag_milivolts(self.perseus, 119, 'B')
-        self.push_change_event("Diag_QcontrolFastpiIqB", self._Diag_QcontrolFastpiIqB)
-        self._Diag_IloopinputSlowpiIqA = perseus_utils.read_diag_milivolts(self.perseus, 120, 'A')
-        self.push_change_event("Diag_IloopinputSlowpiIqA", self._Diag_IloopinputSlowpiIqA)
-        self._Diag_IloopinputSlowpiIqB = perseus_utils.read_diag_milivolts(self.perseus, 120, 'B')
-        self.push_change_event("Diag_IloopinputSlowpiIqB", self._Diag_IloopinputSlowpiIqB)
-        self._Diag_QloopinputSlowpiIqA = perseus_utils.read_diag_milivolts(self.perseus, 121, 'A')
-        self.push_change_event("Diag_QloopinputSlowpiIqA", self._Diag_QloopinputSlowpiIqA)
-        self._Diag_QloopinputSlowpiIqB = perseus_utils.read_diag_milivolts(self.perseus, 121, 'B')
-        self.push_change_event("Diag_QloopinputSlowpiIqB", self._Diag_QloopinputSlowpiIqB)
-        self._Diag_IloopinputFastpiIqA = perseus_utils.read_diag_milivolts(self.perseus, 122, 'A')
-        self.push_change_event("Diag_IloopinputFastpiIqA", self._Diag_IloopinputFastpiIqA)
-        self._Diag_IloopinputFastpiIqB = perseus_utils.read_diag_milivolts(self.perseus, 122, 'B')
-        self.push_change_event("Diag_IloopinputFastpiIqB", self._Diag_IloopinputFastpiIqB)
-        self._Diag_QloopinputFastpiIqA = perseus_utils.read_diag_milivolts(self.perseus, 123, 'A')
-        self.push_change_event("Diag_QloopinputFastpiIqA", self._Diag_QloopinputFastpiIqA)
-        self._Diag_QloopinputFastpiIqB = perseus_utils.read_diag_milivolts(self.perseus, 123, 'B')
-        self.push_change_event("Diag_QloopinputFastpiIqB", self._Diag_QloopinputFastpiIqB)
-        self._Diag_IrefloopinputFastpiIqA = perseus_utils.read_diag_milivolts(self.perseus, 124, 'A')
-        self.push_change_event("Diag_IrefloopinputFastpiIqA", self._Diag_IrefloopinputFastpiIqA)
-        self._Diag_IrefloopinputFastpiIqB = perseus_utils.read_diag_milivolts(self.perseus, 124, 'B')
-        self.push_change_event("Diag_IrefloopinputFastpiIqB", self._Diag_IrefloopinputFastpiIqB)
-        self._Diag_QrefloopinputFastpiIqA = perseus_utils.read_diag_milivolts(self.perseus, 125, 'A')
-        self.push_change_event("Diag_QrefloopinputFastpiIqA", self._Diag_QrefloopinputFastpiIqA)
-        self._Diag_QrefloopinputFastpiIqB = perseus_utils.read_diag_milivolts(self.perseus, 125, 'B')
-        self.push_change_event("Diag_QrefloopinputFastpiIqB", self._Diag_QrefloopinputFastpiIqB)
-        self._Diag_MovingPlungerAutoA = bool(perseus_utils.read_diag_direct(self.perseus, 300, 'A'))
-        self.push_change_event("Diag_MovingPlungerAutoA", self._Diag_MovingPlungerAutoA)
-        self._Diag_MovingPlungerAutoB = bool(perseus_utils.read_diag_direct(self.perseus, 300, 'B'))
-        self.push_change_event("Diag_MovingPlungerAutoB", self._Diag_MovingPlungerAutoB)
-        self._Diag_FreqUpA = bool(perseus_utils.read_diag_direct(self.perseus, 301, 'A'))
-        self.push_change_event("Diag_FreqUpA", self._Diag_FreqUpA)
-        self._Diag_FreqUpB = bool(perseus_utils.read_diag_direct(self.perseus, 301, 'B'))
-        self.push_change_event("Diag_FreqUpB", self._Diag_FreqUpB)
-        self._Diag_ManualTuningOnA = bool(perseus_utils.read_diag_direct(self.perseus, 302, 'A'))
-        self.push_change_event("Diag_ManualTuningOnA", self._Diag_ManualTuningOnA)
-        self._Diag_ManualTuningOnB = bool(perseus_utils.read_diag_direct(self.perseus, 302, 'B'))
-        self.push_change_event("Diag_ManualTuningOnB", self._Diag_ManualTuningOnB)
-        self._Diag_ManualTuningFreqUpA = bool(perseus_utils.read_diag_direct(self.perseus, 303, 'A'))
-        self.push_change_event("Diag_ManualTuningFreqUpA", self._Diag_ManualTuningFreqUpA)
-        self._Diag_ManualTuningFreqUpB = bool(perseus_utils.read_diag_direct(self.perseus, 303, 'B'))
-        self.push_change_event("Diag_ManualTuningFreqUpB", self._Diag_ManualTuningFreqUpB)
-        self._Diag_FwminA = bool(perseus_utils.read_diag_direct(self.perseus, 307, 'A'))
-        self.push_change_event("Diag_FwminA", self._Diag_FwminA)
-        self._Diag_FwminB = bool(perseus_utils.read_diag_direct(self.perseus, 307, 'B'))
-        self.push_change_event("Diag_FwminB", self._Diag_FwminB)
-        self._Diag_EpsItckDelayA = bool(perseus_utils.read_diag_direct(self.perseus, 400, 'A'))
-        self.push_change_event("Diag_EpsItckDelayA", self._Diag_EpsItckDelayA)
-        self._Diag_EpsItckDelayB = bool(perseus_utils.read_diag_direct(self.perseus, 400, 'B'))
-        self.push_change_event("Diag_EpsItckDelayB", self._Diag_EpsItckDelayB)
-        self._Diag_FimItckDelayA = bool(perseus_utils.read_diag_direct(self.perseus, 401, 'A'))
-        self.push_change_event("Diag_FimItckDelayA", self._Diag_FimItckDelayA)
-        self._Diag_FimItckDelayB = bool(perseus_utils.read_diag_direct(self.perseus, 401, 'B'))
-        self.push_change_event("Diag_FimItckDelayB", self._Diag_FimItckDelayB)
-        self._Diag_FdlTrigHwInputA = bool(perseus_utils.read_diag_direct(self.perseus, 402, 'A'))
-        self.push_change_event("Diag_FdlTrigHwInputA", self._Diag_FdlTrigHwInputA)
-        self._Diag_FdlTrigHwInputB = bool(perseus_utils.read_diag_direct(self.perseus, 402, 'B'))
-        self.push_change_event("Diag_FdlTrigHwInputB", self._Diag_FdlTrigHwInputB)
-        self._Diag_FdlTrigSwInputA = bool(perseus_utils.read_diag_direct(self.perseus, 403, 'A'))
-        self.push_change_event("Diag_FdlTrigSwInputA", self._Diag_FdlTrigSwInputA)
-        self._Diag_FdlTrigSwInputB = bool(perseus_utils.read_diag_direct(self.perseus, 403, 'B'))
-        self.push_change_event("Diag_FdlTrigSwInputB", self._Diag_FdlTrigSwInputB)
-        self._Diag_EpsItckA = bool(perseus_utils.read_diag_direct(self.perseus, 404, 'A'))
-        self.push_change_event("Diag_EpsItckA", self._Diag_EpsItckA)
-        self._Diag_EpsItckB = bool(perseus_utils.read_diag_direct(self.perseus, 404, 'B'))
-        self.push_change_event("Diag_EpsItckB", self._Diag_EpsItckB)
-        self._Diag_AmpMuxfwcircina = math.sqrt((self._Diag_IMuxFwCircInA**2) + (self._Diag_QMuxFwCircInA**2))
-        self.push_change_event("Diag_AmpMuxfwcircina", self._Diag_AmpMuxfwcircina)
-        self._Diag_AmpSpare1a = math.sqrt((self._Diag_Ispare1A**2) + (self._Diag_Qspare1A**2))
-        self.push_change_event("Diag_AmpSpare1a", self._Diag_AmpSpare1a)
-        self._Diag_AmpMuxfwcircinb = math.sqrt((self._Diag_IMuxFwCircInB**2) + (self._Diag_QMuxFwCircInB**2))
-        self.push_change_event("Diag_AmpMuxfwcircinb", self._Diag_AmpMuxfwcircinb)
-        self._Diag_AmpSpare2a = math.sqrt((self._Diag_Ispare2A**2) + (self._Diag_Qspare2A**2))
-        self.push_change_event("Diag_AmpSpare2a", self._Diag_AmpSpare2a)
-        self._Diag_AmpSpare2b = math.sqrt((self._Diag_Ispare2B**2) + (self._Diag_Qspare2B**2))
-        self.push_change_event("Diag_AmpSpare2b", self._Diag_AmpSpare2b)
-        self._Diag_AmpErrora = math.sqrt((self._Diag_IerrorA**2) + (self._Diag_QerrorA**2))
-        self.push_change_event("Diag_AmpErrora", self._Diag_AmpErrora)
-        self._Diag_AmpErrorb = math.sqrt((self._Diag_IerrorB**2) + (self._Diag_QerrorB**2))
-        self.push_change_event("Diag_AmpErrorb", self._Diag_AmpErrorb)
-        self._Diag_AmpSpare1b = math.sqrt((self._Diag_Ispare1B**2) + (self._Diag_Qspare1B**2))
-        self.push_change_event("Diag_AmpSpare1b", self._Diag_AmpSpare1b)
-        self._Diag_AmpErroraccumb = math.sqrt((self._Diag_IerroraccumB**2) + (self._Diag_QerroraccumB**2))
-        self.push_change_event("Diag_AmpErroraccumb", self._Diag_AmpErroraccumb)
-        self._Diag_AmpErroraccuma = math.sqrt((self._Diag_IerroraccumA**2) + (self._Diag_QerroraccumA**2))
-        self.push_change_event("Diag_AmpErroraccuma", self._Diag_AmpErroraccuma)
-        self._Diag_AmpControlfastpiiqb = math.sqrt((self._Diag_IcontrolFastpiIqB**2) + (self._Diag_QcontrolFastpiIqB**2))
-        self.push_change_event("Diag_AmpControlfastpiiqb", self._Diag_AmpControlfastpiiqb)
-        self._Diag_AmpControlfastpiiqa = math.sqrt((self._Diag_IcontrolFastpiIqA**2) + (self._Diag_QcontrolFastpiIqA**2))
-        self.push_change_event("Diag_AmpControlfastpiiqa", self._Diag_AmpControlfastpiiqa)
-        self._Diag_AmpControla = math.sqrt((self._Diag_IcontrolA**2) + (self._Diag_QcontrolA**2))
-        self.push_change_event("Diag_AmpControla", self._Diag_AmpControla)
-        self._Diag_AmpPolarforamplitudeloopa = math.sqrt((self._Diag_IpolarForAmplitudeLoopA**2) + (self._Diag_QpolarForAmplitudeLoopA**2))
-        self.push_change_event("Diag_AmpPolarforamplitudeloopa", self._Diag_AmpPolarforamplitudeloopa)
-        self._Diag_AmpPolarforamplitudeloopb = math.sqrt((self._Diag_IpolarForAmplitudeLoopB**2) + (self._Diag_QpolarForAmplitudeLoopB**2))
-        self.push_change_event("Diag_AmpPolarforamplitudeloopb", self._Diag_AmpPolarforamplitudeloopb)
-        self._Diag_AmpControlb = math.sqrt((self._Diag_IcontrolB**2) + (self._Diag_QcontrolB**2))
-        self.push_change_event("Diag_AmpControlb", self._Diag_AmpControlb)
-        self._Diag_AmpMuxfwtet2b = math.sqrt((self._Diag_IMuxFwTet2B**2) + (self._Diag_QMuxFwTet2B**2))
-        self.push_change_event("Diag_AmpMuxfwtet2b", self._Diag_AmpMuxfwtet2b)
-        self._Diag_AmpLoopinputfastpiiqb = math.sqrt((self._Diag_IloopinputFastpiIqB**2) + (self._Diag_QloopinputFastpiIqB**2))
-        self.push_change_event("Diag_AmpLoopinputfastpiiqb", self._Diag_AmpLoopinputfastpiiqb)
-        self._Diag_AmpLoopinputfastpiiqa = math.sqrt((self._Diag_IloopinputFastpiIqA**2) + (self._Diag_QloopinputFastpiIqA**2))
-        self.push_change_event("Diag_AmpLoopinputfastpiiqa", self._Diag_AmpLoopinputfastpiiqa)
-        self._Diag_AmpRefa = math.sqrt((self._Diag_IrefA**2) + (self._Diag_QrefA**2))
-        self.push_change_event("Diag_AmpRefa", self._Diag_AmpRefa)
-        self._Diag_AmpMuxfwcava = math.sqrt((self._Diag_IMuxFwCavA**2) + (self._Diag_QMuxFwCavA**2))
-        self.push_change_event("Diag_AmpMuxfwcava", self._Diag_AmpMuxfwcava)
-        self._Diag_AmpMuxfwcavb = math.sqrt((self._Diag_IMuxFwCavB**2) + (self._Diag_QMuxFwCavB**2))
-        self.push_change_event("Diag_AmpMuxfwcavb", self._Diag_AmpMuxfwcavb)
-        self._Diag_AmpRefb = math.sqrt((self._Diag_IrefB**2) + (self._Diag_QrefB**2))
-        self.push_change_event("Diag_AmpRefb", self._Diag_AmpRefb)
-        self._Diag_AmpControl2a = math.sqrt((self._Diag_Icontrol2A**2) + (self._Diag_Qcontrol2A**2))
-        self.push_change_event("Diag_AmpControl2a", self._Diag_AmpControl2a)
-        self._Diag_AmpControl2b = math.sqrt((self._Diag_Icontrol2B**2) + (self._Diag_Qcontrol2B**2))
-        self.push_change_event("Diag_AmpControl2b", self._Diag_AmpControl2b)
-        self._Diag_AmpFwtet1loopsb = math.sqrt((self._Diag_IFwTet1LoopsB**2) + (self._Diag_QFwTet1LoopsB**2))
-        self.push_change_event("Diag_AmpFwtet1loopsb", self._Diag_AmpFwtet1loopsb)
-        self._Diag_AmpFwtet1loopsa = math.sqrt((self._Diag_IFwTet1LoopsA**2) + (self._Diag_QFwTet1LoopsA**2))
-        self.push_change_event("Diag_AmpFwtet1loopsa", self._Diag_AmpFwtet1loopsa)
-        self._Diag_AmpPolarforphaseloopb = math.sqrt((self._Diag_IpolarForPhaseLoopB**2) + (self._Diag_QpolarForPhaseLoopB**2))
-        self.push_change_event("Diag_AmpPolarforphaseloopb", self._Diag_AmpPolarforphaseloopb)
-        self._Diag_AmpPolarforphaseloopa = math.sqrt((self._Diag_IpolarForPhaseLoopA**2) + (self._Diag_QpolarForPhaseLoopA**2))
-        self.push_change_event("Diag_AmpPolarforphaseloopa", self._Diag_AmpPolarforphaseloopa)
-        self._Diag_AmpPolarcontroloutputb = math.sqrt((self._Diag_IpolarControlOutputB**2) + (self._Diag_QpolarControlOutputB**2))
-        self.push_change_event("Diag_AmpPolarcontroloutputb", self._Diag_AmpPolarcontroloutputb)
-        self._Diag_AmpPolarcontroloutputa = math.sqrt((self._Diag_IpolarControlOutputA**2) + (self._Diag_QpolarControlOutputA**2))
-        self.push_change_event("Diag_AmpPolarcontroloutputa", self._Diag_AmpPolarcontroloutputa)
-        self._Diag_AmpFwtet2loopsa = math.sqrt((self._Diag_IFwTet2LoopsA**2) + (self._Diag_QFwTet2LoopsA**2))
-        self.push_change_event("Diag_AmpFwtet2loopsa", self._Diag_AmpFwtet2loopsa)
-        self._Diag_AmpCavloopsa = math.sqrt((self._Diag_IcavLoopsA**2) + (self._Diag_QcavLoopsA**2))
-        self.push_change_event("Diag_AmpCavloopsa", self._Diag_AmpCavloopsa)
-        self._Diag_AmpCavloopsb = math.sqrt((self._Diag_IcavLoopsB**2) + (self._Diag_QcavLoopsB**2))
-        self.push_change_event("Diag_AmpCavloopsb", self._Diag_AmpCavloopsb)
-        self._Diag_AmpFwtet2loopsb = math.sqrt((self._Diag_IFwTet2LoopsB**2) + (self._Diag_QFwTet2LoopsB**2))
-        self.push_change_event("Diag_AmpFwtet2loopsb", self._Diag_AmpFwtet2loopsb)
-        self._Diag_AmpLoopinputslowpiiqa = math.sqrt((self._Diag_IloopinputSlowpiIqA**2) + (self._Diag_QloopinputSlowpiIqA**2))
-        self.push_change_event("Diag_AmpLoopinputslowpiiqa", self._Diag_AmpLoopinputslowpiiqa)
-        self._Diag_AmpLoopinputslowpiiqb = math.sqrt((self._Diag_IloopinputSlowpiIqB**2) + (self._Diag_QloopinputSlowpiIqB**2))
-        self.push_change_event("Diag_AmpLoopinputslowpiiqb", self._Diag_AmpLoopinputslowpiiqb)
-        self._Diag_AmpRefloopinputfastpiiqb = math.sqrt((self._Diag_IrefloopinputFastpiIqB**2) + (self._Diag_QrefloopinputFastpiIqB**2))
-        self.push_change_event("Diag_AmpRefloopinputfastpiiqb", self._Diag_AmpRefloopinputfastpiiqb)
-        self._Diag_AmpRefloopinputfastpiiqa = math.sqrt((self._Diag_IrefloopinputFastpiIqA**2) + (self._Diag_QrefloopinputFastpiIqA**2))
-        self.push_change_event("Diag_AmpRefloopinputfastpiiqa", self._Diag_AmpRefloopinputfastpiiqa)
-        self._Diag_AmpControl1a = math.sqrt((self._Diag_Icontrol1A**2) + (self._Diag_Qcontrol1A**2))
-        self.push_change_event("Diag_AmpControl1a", self._Diag_AmpControl1a)
-        self._Diag_AmpControl1b = math.sqrt((self._Diag_Icontrol1B**2) + (self._Diag_Qcontrol1B**2))
-        self.push_change_event("Diag_AmpControl1b", self._Diag_AmpControl1b)
-        self._Diag_AmpMuxfwtet2a = math.sqrt((self._Diag_IMuxFwTet2A**2) + (self._Diag_QMuxFwTet2A**2))
-        self.push_change_event("Diag_AmpMuxfwtet2a", self._Diag_AmpMuxfwtet2a)
-        self._Diag_AmpMuxcavb = math.sqrt((self._Diag_IMuxCavB**2) + (self._Diag_QMuxCavB**2))
-        self.push_change_event("Diag_AmpMuxcavb", self._Diag_AmpMuxcavb)
-        self._Diag_AmpMuxcava = math.sqrt((self._Diag_IMuxCavA**2) + (self._Diag_QMuxCavA**2))
-        self.push_change_event("Diag_AmpMuxcava", self._Diag_AmpMuxcava)
-        self._Diag_AmpMuxfwtet1b = math.sqrt((self._Diag_IMuxFwTet1B**2) + (self._Diag_QMuxFwTet1B**2))
-        self.push_change_event("Diag_AmpMuxfwtet1b", self._Diag_AmpMuxfwtet1b)
-        self._Diag_AmpControlfastpib = math.sqrt((self._Diag_IcontrolFastpiB**2) + (self._Diag_QcontrolFastpiB**2))
-        self.push_change_event("Diag_AmpControlfastpib", self._Diag_AmpControlfastpib)
-        self._Diag_AmpFwcircinloopsa = math.sqrt((self._Diag_IFwCircInLoopsA**2) + (self._Diag_QFwCircInLoopsA**2))
-        self.push_change_event("Diag_AmpFwcircinloopsa", self._Diag_AmpFwcircinloopsa)
-        self._Diag_AmpFwcircinloopsb = math.sqrt((self._Diag_IFwCircInLoopsB**2) + (self._Diag_QFwCircInLoopsB**2))
-        self.push_change_event("Diag_AmpFwcircinloopsb", self._Diag_AmpFwcircinloopsb)
-        self._Diag_AmpControlfastpia = math.sqrt((self._Diag_IcontrolFastpiA**2) + (self._Diag_QcontrolFastpiA**2))
-        self.push_change_event("Diag_AmpControlfastpia", self._Diag_AmpControlfastpia)
-        self._Diag_AmpFwcavloopsa = math.sqrt((self._Diag_IFwCavLoopsA**2) + (self._Diag_QFwCavLoopsA**2))
-        self.push_change_event("Diag_AmpFwcavloopsa", self._Diag_AmpFwcavloopsa)
-        self._Diag_AmpMuxfwtet1a = math.sqrt((self._Diag_IMuxFwTet1A**2) + (self._Diag_QMuxFwTet1A**2))
-        self.push_change_event("Diag_AmpMuxfwtet1a", self._Diag_AmpMuxfwtet1a)
-        self._Diag_AmpFwcavloopsb = math.sqrt((self._Diag_IFwCavLoopsB**2) + (self._Diag_QFwCavLoopsB**2))
-        self.push_change_event("Diag_AmpFwcavloopsb", self._Diag_AmpFwcavloopsb)
-        self._Diag_AmpMob = math.sqrt((self._Diag_ImoB**2) + (self._Diag_QmoB**2))
-        self.push_change_event("Diag_AmpMob", self._Diag_AmpMob)
-        self._Diag_AmpMoa = math.sqrt((self._Diag_ImoA**2) + (self._Diag_QmoA**2))
-        self.push_change_event("Diag_AmpMoa", self._Diag_AmpMoa)
-        self._Diag_AmpControlslowpia = math.sqrt((self._Diag_IcontrolSlowpiA**2) + (self._Diag_QcontrolSlowpiA**2))
-        self.push_change_event("Diag_AmpControlslowpia", self._Diag_AmpControlslowpia)
-        self._Diag_AmpControlslowpib = math.sqrt((self._Diag_IcontrolSlowpiB**2) + (self._Diag_QcontrolSlowpiB**2))
-        self.push_change_event("Diag_AmpControlslowpib", self._Diag_AmpControlslowpib)
-        self._Diag_PhMuxfwcircina = math.degrees(math.atan2(self._Diag_QMuxFwCircInA, self._Diag_IMuxFwCircInA))
-        self.push_change_event("Diag_PhMuxfwcircina", self._Diag_PhMuxfwcircina)
-        self._Diag_PhSpare1a = math.degrees(math.atan2(self._Diag_Qspare1A, self._Diag_Ispare1A))
-        self.push_change_event("Diag_PhSpare1a", self._Diag_PhSpare1a)
-        self._Diag_PhMuxfwcircinb = math.degrees(math.atan2(self._Diag_QMuxFwCircInB, self._Diag_IMuxFwCircInB))
-        self.push_change_event("Diag_PhMuxfwcircinb", self._Diag_PhMuxfwcircinb)
-        self._Diag_PhSpare2a = math.degrees(math.atan2(self._Diag_Qspare2A, self._Diag_Ispare2A))
-        self.push_change_event("Diag_PhSpare2a", self._Diag_PhSpare2a)
-        self._Diag_PhSpare2b = math.degrees(math.atan2(self._Diag_Qspare2B, self._Diag_Ispare2B))
-        self.push_change_event("Diag_PhSpare2b", self._Diag_PhSpare2b)
-        self._Diag_PhErrora = math.degrees(math.atan2(self._Diag_QerrorA, self._Diag_IerrorA))
-        self.push_change_event("Diag_PhErrora", self._Diag_PhErrora)
-        self._Diag_PhErrorb = math.degrees(math.atan2(self._Diag_QerrorB, self._Diag_IerrorB))
-        self.push_change_event("Diag_PhErrorb", self._Diag_PhErrorb)
-        self._Diag_PhSpare1b = math.degrees(math.atan2(self._Diag_Qspare1B, self._Diag_Ispare1B))
-        self.push_change_event("Diag_PhSpare1b", self._Diag_PhSpare1b)
-        self._Diag_PhErroraccumb = math.degrees(math.atan2(self._Diag_QerroraccumB, self._Diag_IerroraccumB))
-        self.push_change_event("Diag_PhErroraccumb", self._Diag_PhErroraccumb)
-        self._Diag_PhErroraccuma = math.degrees(math.atan2(self._Diag_QerroraccumA, self._Diag_IerroraccumA))
-        self.push_change_event("Diag_PhErroraccuma", self._Diag_PhErroraccuma)
-        self._Diag_PhControlfastpiiqb = math.degrees(math.atan2(self._Diag_QcontrolFastpiIqB, self._Diag_IcontrolFastpiIqB))
-        self.push_change_event("Diag_PhControlfastpiiqb", self._Diag_PhControlfastpiiqb)
-        self._Diag_PhControlfastpiiqa = math.degrees(math.atan2(self._Diag_QcontrolFastpiIqA, self._Diag_IcontrolFastpiIqA))
-        self.push_change_event("Diag_PhControlfastpiiqa", self._Diag_PhControlfastpiiqa)
-        self._Diag_PhControla = math.degrees(math.atan2(self._Diag_QcontrolA, self._Diag_IcontrolA))
-        self.push_change_event("Diag_PhControla", self._Diag_PhControla)
-        self._Diag_PhPolarforamplitudeloopa = math.degrees(math.atan2(self._Diag_QpolarForAmplitudeLoopA, self._Diag_IpolarForAmplitudeLoopA))
-        self.push_change_event("Diag_PhPolarforamplitudeloopa", self._Diag_PhPolarforamplitudeloopa)
-        self._Diag_PhPolarforamplitudeloopb = math.degrees(math.atan2(self._Diag_QpolarForAmplitudeLoopB, self._Diag_IpolarForAmplitudeLoopB))
-        self.push_change_event("Diag_PhPolarforamplitudeloopb", self._Diag_PhPolarforamplitudeloopb)
-        self._Diag_PhControlb = math.degrees(math.atan2(self._Diag_QcontrolB, self._Diag_IcontrolB))
-        self.push_change_event("Diag_PhControlb", self._Diag_PhControlb)
-        self._Diag_PhMuxfwtet2b = math.degrees(math.atan2(self._Diag_QMuxFwTet2B, self._Diag_IMuxFwTet2B))
-        self.push_change_event("Diag_PhMuxfwtet2b", self._Diag_PhMuxfwtet2b)
-        self._Diag_PhLoopinputfastpiiqb = math.degrees(math.atan2(self._Diag_QloopinputFastpiIqB, self._Diag_IloopinputFastpiIqB))
-        self.push_change_event("Diag_PhLoopinputfastpiiqb", self._Diag_PhLoopinputfastpiiqb)
-        self._Diag_PhLoopinputfastpiiqa = math.degrees(math.atan2(self._Diag_QloopinputFastpiIqA, self._Diag_IloopinputFastpiIqA))
-        self.push_change_event("Diag_PhLoopinputfastpiiqa", self._Diag_PhLoopinputfastpiiqa)
-        self._Diag_PhRefa = math.degrees(math.atan2(self._Diag_QrefA, self._Diag_IrefA))
-        self.push_change_event("Diag_PhRefa", self._Diag_PhRefa)
-        self._Diag_PhMuxfwcava = math.degrees(math.atan2(self._Diag_QMuxFwCavA, self._Diag_IMuxFwCavA))
-        self.push_change_event("Diag_PhMuxfwcava", self._Diag_PhMuxfwcava)
-        self._Diag_PhMuxfwcavb = math.degrees(math.atan2(self._Diag_QMuxFwCavB, self._Diag_IMuxFwCavB))
-        self.push_change_event("Diag_PhMuxfwcavb", self._Diag_PhMuxfwcavb)
-        self._Diag_PhRefb = math.degrees(math.atan2(self._Diag_QrefB, self._Diag_IrefB))
-        self.push_change_event("Diag_PhRefb", self._Diag_PhRefb)
-        self._Diag_PhControl2a = math.degrees(math.atan2(self._Diag_Qcontrol2A, self._Diag_Icontrol2A))
-        self.push_change_event("Diag_PhControl2a", self._Diag_PhControl2a)
-        self._Diag_PhControl2b = math.degrees(math.atan2(self._Diag_Qcontrol2B, self._Diag_Icontrol2B))
-        self.push_change_event("Diag_PhControl2b", self._Diag_PhControl2b)
-        self._Diag_PhFwtet1loopsb = math.degrees(math.atan2(self._Diag_QFwTet1LoopsB, self._Diag_IFwTet1LoopsB))
-        self.push_change_event("Diag_PhFwtet1loopsb", self._Diag_PhFwtet1loopsb)
-        self._Diag_PhFwtet1loopsa = math.degrees(math.atan2(self._Diag_QFwTet1LoopsA, self._Diag_IFwTet1LoopsA))
-        self.push_change_event("Diag_PhFwtet1loopsa", self._Diag_PhFwtet1loopsa)
-        self._Diag_PhPolarforphaseloopb = math.degrees(math.atan2(self._Diag_QpolarForPhaseLoopB, self._Diag_IpolarForPhaseLoopB))
-        self.push_change_event("Diag_PhPolarforphaseloopb", self._Diag_PhPolarforphaseloopb)
-        self._Diag_PhPolarforphaseloopa = math.degrees(math.atan2(self._Diag_QpolarForPhaseLoopA, self._Diag_IpolarForPhaseLoopA))
-        self.push_change_event("Diag_PhPolarforphaseloopa", self._Diag_PhPolarforphaseloopa)
-        self._Diag_PhPolarcontroloutputb = math.degrees(math.atan2(self._Diag_QpolarControlOutputB, self._Diag_IpolarControlOutputB))
-        self.push_change_event("Diag_PhPolarcontroloutputb", self._Diag_PhPolarcontroloutputb)
-        self._Diag_PhPolarcontroloutputa = math.degrees(math.atan2(self._Diag_QpolarControlOutputA, self._Diag_IpolarControlOutputA))
-        self.push_change_event("Diag_PhPolarcontroloutputa", self._Diag_PhPolarcontroloutputa)
-        self._Diag_PhFwtet2loopsa = math.degrees(math.atan2(self._Diag_QFwTet2LoopsA, self._Diag_IFwTet2LoopsA))
-        self.push_change_event("Diag_PhFwtet2loopsa", self._Diag_PhFwtet2loopsa)
-        self._Diag_PhCavloopsa = math.degrees(math.atan2(self._Diag_QcavLoopsA, self._Diag_IcavLoopsA))
-        self.push_change_event("Diag_PhCavloopsa", self._Diag_PhCavloopsa)
-        self._Diag_PhCavloopsb = math.degrees(math.atan2(self._Diag_QcavLoopsB, self._Diag_IcavLoopsB))
-        self.push_change_event("Diag_PhCavloopsb", self._Diag_PhCavloopsb)
-        self._Diag_PhFwtet2loopsb = math.degrees(math.atan2(self._Diag_QFwTet2LoopsB, self._Diag_IFwTet2LoopsB))
-        self.push_change_event("Diag_PhFwtet2loopsb", self._Diag_PhFwtet2loopsb)
-        self._Diag_PhLoopinputslowpiiqa = math.degrees(math.atan2(self._Diag_QloopinputSlowpiIqA, self._Diag_IloopinputSlowpiIqA))
-        self.push_change_event("Diag_PhLoopinputslowpiiqa", self._Diag_PhLoopinputslowpiiqa)
-        self._Diag_PhLoopinputslowpiiqb = math.degrees(math.atan2(self._Diag_QloopinputSlowpiIqB, self._Diag_IloopinputSlowpiIqB))
-        self.push_change_event("Diag_PhLoopinputslowpiiqb", self._Diag_PhLoopinputslowpiiqb)
-        self._Diag_PhRefloopinputfastpiiqb = math.degrees(math.atan2(self._Diag_QrefloopinputFastpiIqB, self._Diag_IrefloopinputFastpiIqB))
-        self.push_change_event("Diag_PhRefloopinputfastpiiqb", self._Diag_PhRefloopinputfastpiiqb)
-        self._Diag_PhRefloopinputfastpiiqa = math.degrees(math.atan2(self._Diag_QrefloopinputFastpiIqA, self._Diag_IrefloopinputFastpiIqA))
-        self.push_change_event("Diag_PhRefloopinputfastpiiqa", self._Diag_PhRefloopinputfastpiiqa)
-        self._Diag_PhControl1a = math.degrees(math.atan2(self._Diag_Qcontrol1A, self._Diag_Icontrol1A))
-        self.push_change_event("Diag_PhControl1a", self._Diag_PhControl1a)
-        self._Diag_PhControl1b = math.degrees(math.atan2(self._Diag_Qcontrol1B, self._Diag_Icontrol1B))
-        self.push_change_event("Diag_PhControl1b", self._Diag_PhControl1b)
-        self._Diag_PhMuxfwtet2a = math.degrees(math.atan2(self._Diag_QMuxFwTet2A, self._Diag_IMuxFwTet2A))
-        self.push_change_event("Diag_PhMuxfwtet2a", self._Diag_PhMuxfwtet2a)
-        self._Diag_PhMuxcavb = math.degrees(math.atan2(self._Diag_QMuxCavB, self._Diag_IMuxCavB))
-        self.push_change_event("Diag_PhMuxcavb", self._Diag_PhMuxcavb)
-        self._Diag_PhMuxcava = math.degrees(math.atan2(self._Diag_QMuxCavA, self._Diag_IMuxCavA))
-        self.push_change_event("Diag_PhMuxcava", self._Diag_PhMuxcava)
-        self._Diag_PhMuxfwtet1b = math.degrees(math.atan2(self._Diag_QMuxFwTet1B, self._Diag_IMuxFwTet1B))
-        self.push_change_event("Diag_PhMuxfwtet1b", self._Diag_PhMuxfwtet1b)
-        self._Diag_PhControlfastpib = math.degrees(math.atan2(self._Diag_QcontrolFastpiB, self._Diag_IcontrolFastpiB))
-        self.push_change_event("Diag_PhControlfastpib", self._Diag_PhControlfastpib)
-        self._Diag_PhFwcircinloopsa = math.degrees(math.atan2(self._Diag_QFwCircInLoopsA, self._Diag_IFwCircInLoopsA))
-        self.push_change_event("Diag_PhFwcircinloopsa", self._Diag_PhFwcircinloopsa)
-        self._Diag_PhFwcircinloopsb = math.degrees(math.atan2(self._Diag_QFwCircInLoopsB, self._Diag_IFwCircInLoopsB))
-        self.push_change_event("Diag_PhFwcircinloopsb", self._Diag_PhFwcircinloopsb)
-        self._Diag_PhControlfastpia = math.degrees(math.atan2(self._Diag_QcontrolFastpiA, self._Diag_IcontrolFastpiA))
-        self.push_change_event("Diag_PhControlfastpia", self._Diag_PhControlfastpia)
-        self._Diag_PhFwcavloopsa = math.degrees(math.atan2(self._Diag_QFwCavLoopsA, self._Diag_IFwCavLoopsA))
-        self.push_change_event("Diag_PhFwcavloopsa", self._Diag_PhFwcavloopsa)
-        self._Diag_PhMuxfwtet1a = math.degrees(math.atan2(self._Diag_QMuxFwTet1A, self._Diag_IMuxFwTet1A))
-        self.push_change_event("Diag_PhMuxfwtet1a", self._Diag_PhMuxfwtet1a)
-        self._Diag_PhFwcavloopsb = math.degrees(math.atan2(self._Diag_QFwCavLoopsB, self._Diag_IFwCavLoopsB))
-        self.push_change_event("Diag_PhFwcavloopsb", self._Diag_PhFwcavloopsb)
-        self._Diag_PhMob = math.degrees(math.atan2(self._Diag_QmoB, self._Diag_ImoB))
-        self.push_change_event("Diag_PhMob", self._Diag_PhMob)
-        self._Diag_PhMoa = math.degrees(math.atan2(self._Diag_QmoA, self._Diag_ImoA))
-        self.push_change_event("Diag_PhMoa", self._Diag_PhMoa)
-        self._Diag_PhControlslowpia = math.degrees(math.atan2(self._Diag_QcontrolSlowpiA, self._Diag_IcontrolSlowpiA))
-        self.push_change_event("Diag_PhControlslowpia", self._Diag_PhControlslowpia)
-        self._Diag_PhControlslowpib = math.degrees(math.atan2(self._Diag_QcontrolSlowpiB, self._Diag_IcontrolSlowpiB))
-        self.push_change_event("Diag_PhControlslowpib", self._Diag_PhControlslowpib)
+        self.diag_connection_error = None
+        with perseus_utils.latched_diagnostics(self.perseus, 'A', 'B'):
+            timestamp = time.time()
+            with self.perseus.bits.sweep():
+                self.read_diag_values()
+        self.derive_diagnostics()
+        self.publish_diagnostics(timestamp)
+
+    def read_diag_values(self):
+        self._Diag_IcavLoopsA = self.update_diag("Diag_IcavLoopsA", perseus_utils.read_diag_milivolts, self.perseus, 0, 'A')
+        self._Diag_IcavLoopsB = self.update_diag("Diag_IcavLoopsB", perseus_utils.read_diag_milivolts, self.perseus, 0, 'B')
+        self._Diag_QcavLoopsA = self.update_diag("Diag_QcavLoopsA", perseus_utils.read_diag_milivolts, self.perseus, 1, 'A')
+        self._Diag_QcavLoopsB = self.update_diag("Diag_QcavLoopsB", perseus_utils.read_diag_milivolts, self.perseus, 1, 'B')
+        self._Diag_IcontrolA = self.update_diag("Diag_IcontrolA", perseus_utils.read_diag_milivolts, self.perseus, 2, 'A')
+        self._Diag_IcontrolB = self.update_diag("Diag_IcontrolB", perseus_utils.read_diag_milivolts, self.perseus, 2, 'B')
+        self._Diag_QcontrolA = self.update_diag("Diag_QcontrolA", perseus_utils.read_diag_milivolts, self.perseus, 3, 'A')
+        self._Diag_QcontrolB = self.update_diag("Diag_QcontrolB", perseus_utils.read_diag_milivolts, self.perseus, 3, 'B')
+        self._Diag_Icontrol1A = self.update_diag("Diag_Icontrol1A", perseus_utils.read_diag_milivolts, self.perseus, 4, 'A')
+        self._Diag_Icontrol1B = self.update_diag("Diag_Icontrol1B", perseus_utils.read_diag_milivolts, self.perseus, 4, 'B')
+        self._Diag_Qcontrol1A = self.update_diag("Diag_Qcontrol1A", perseus_utils.read_diag_milivolts, self.perseus, 5, 'A')
+        self._Diag_Qcontrol1B = self.update_diag("Diag_Qcontrol1B", perseus_utils.read_diag_milivolts, self.perseus, 5, 'B')
+        self._Diag_Icontrol2A = self.update_diag("Diag_Icontrol2A", perseus_utils.read_diag_milivolts, self.perseus, 6, 'A')
+        self._Diag_Icontrol2B = self.update_diag("Diag_Icontrol2B", perseus_utils.read_diag_milivolts, self.perseus, 6, 'B')
+        self._Diag_Qcontrol2A = self.update_diag("Diag_Qcontrol2A", perseus_utils.read_diag_milivolts, self.perseus, 7, 'A')
+        self._Diag_Qcontrol2B = self.update_diag("Diag_Qcontrol2B", perseus_utils.read_diag_milivolts, self.perseus, 7, 'B')
+        self._Diag_IerrorA = self.update_diag("Diag_IerrorA", perseus_utils.read_diag_milivolts, self.perseus, 8, 'A')
+        self._Diag_IerrorB = self.update_diag("Diag_IerrorB", perseus_utils.read_diag_milivolts, self.perseus, 8, 'B')
+        self._Diag_QerrorA = self.update_diag("Diag_QerrorA", perseus_utils.read_diag_milivolts, self.perseus, 9, 'A')
+        self._Diag_QerrorB = self.update_diag("Diag_QerrorB", perseus_utils.read_diag_milivolts, self.perseus, 9, 'B')
+        self._Diag_IerroraccumA = self.update_diag("Diag_IerroraccumA", perseus_utils.read_diag_milivolts, self.perseus, 10, 'A')
+        self._Diag_IerroraccumB = self.update_diag("Diag_IerroraccumB", perseus_utils.read_diag_milivolts, self.perseus, 10, 'B')
+        self._Diag_QerroraccumA = self.update_diag("Diag_QerroraccumA", perseus_utils.read_diag_milivolts, self.perseus, 11, 'A')
+        self._Diag_QerroraccumB = self.update_diag("Diag_QerroraccumB", perseus_utils.read_diag_milivolts, self.perseus, 11, 'B')
+        self._Diag_IrefA = self.update_diag("Diag_IrefA", perseus_utils.read_diag_milivolts, self.perseus, 12, 'A')
+        self._Diag_IrefB = self.update_diag("Diag_IrefB", perseus_utils.read_diag_milivolts, self.perseus, 12, 'B')
+        self._Diag_QrefA = self.update_diag("Diag_QrefA", perseus_utils.read_diag_milivolts, self.perseus, 13, 'A')
+        self._Diag_QrefB = self.update_diag("Diag_QrefB", perseus_utils.read_diag_milivolts, self.perseus, 13, 'B')
+        self._Diag_IFwCavLoopsA = self.update_diag("Diag_IFwCavLoopsA", perseus_utils.read_diag_milivolts, self.perseus, 14, 'A')
+        self._Diag_IFwCavLoopsB = self.update_diag("Diag_IFwCavLoopsB", perseus_utils.read_diag_milivolts, self.perseus, 14, 'B')
+        self._Diag_QFwCavLoopsA = self.update_diag("Diag_QFwCavLoopsA", perseus_utils.read_diag_milivolts, self.perseus, 15, 'A')
+        self._Diag_QFwCavLoopsB = self.update_diag("Diag_QFwCavLoopsB", perseus_utils.read_diag_milivolts, self.perseus, 15, 'B')
+        self._Diag_IFwTet1LoopsA = self.update_diag("Diag_IFwTet1LoopsA", perseus_utils.read_diag_milivolts, self.perseus, 16, 'A')
+        self._Diag_IFwTet1LoopsB = self.update_diag("Diag_IFwTet1LoopsB", perseus_utils.read_diag_milivolts, self.perseus, 16, 'B')
+        self._Diag_QFwTet1LoopsA = self.update_diag("Diag_QFwTet1LoopsA", perseus_utils.read_diag_milivolts, self.perseus, 17, 'A')
+        self._Diag_QFwTet1LoopsB = self.update_diag("Diag_QFwTet1LoopsB", perseus_utils.read_diag_milivolts, self.perseus, 17, 'B')
+        self._Diag_IFwTet2LoopsA = self.update_diag("Diag_IFwTet2LoopsA", perseus_utils.read_diag_milivolts, self.perseus, 18, 'A')
+        self._Diag_IFwTet2LoopsB = self.update_diag("Diag_IFwTet2LoopsB", perseus_utils.read_diag_milivolts, self.perseus, 18, 'B')
+        self._Diag_QFwTet2LoopsA = self.update_diag("Diag_QFwTet2LoopsA", perseus_utils.read_diag_milivolts, self.perseus, 19, 'A')
+        self._Diag_QFwTet2LoopsB = self.update_diag("Diag_QFwTet2LoopsB", perseus_utils.read_diag_milivolts, self.perseus, 19, 'B')
+        self._Diag_IFwCircInLoopsA = self.update_diag("Diag_IFwCircInLoopsA", perseus_utils.read_diag_milivolts, self.perseus, 20, 'A')
+        self._Diag_IFwCircInLoopsB = self.update_diag("Diag_IFwCircInLoopsB", perseus_utils.read_diag_milivolts, self.perseus, 20, 'B')
+        self._Diag_QFwCircInLoopsA = self.update_diag("Diag_QFwCircInLoopsA", perseus_utils.read_diag_milivolts, self.perseus, 21, 'A')
+        self._Diag_QFwCircInLoopsB = self.update_diag("Diag_QFwCircInLoopsB", perseus_utils.read_diag_milivolts, self.perseus, 21, 'B')
+        self._Diag_ImoA = self.update_diag("Diag_ImoA", perseus_utils.read_diag_milivolts, self.perseus, 22, 'A')
+        self._Diag_ImoB = self.update_diag("Diag_ImoB", perseus_utils.read_diag_milivolts, self.perseus, 22, 'B')
+        self._Diag_QmoA = self.update_diag("Diag_QmoA", perseus_utils.read_diag_milivolts, self.perseus, 23, 'A')
+        self._Diag_QmoB = self.update_diag("Diag_QmoB", perseus_utils.read_diag_milivolts, self.perseus, 23, 'B')
+        self._Diag_Ispare1A = self.update_diag("Diag_Ispare1A", perseus_utils.read_diag_milivolts, self.perseus, 24, 'A')
+        self._Diag_Ispare1B = self.update_diag("Diag_Ispare1B", perseus_utils.read_diag_milivolts, self.perseus, 24, 'B')
+        self._Diag_Qspare1A = self.update_diag("Diag_Qspare1A", perseus_utils.read_diag_milivolts, self.perseus, 25, 'A')
+        self._Diag_Qspare1B = self.update_diag("Diag_Qspare1B", perseus_utils.read_diag_milivolts, self.perseus, 25, 'B')
+        self._Diag_Ispare2A = self.update_diag("Diag_Ispare2A", perseus_utils.read_diag_milivolts, self.perseus, 26, 'A')
+        self._Diag_Ispare2B = self.update_diag("Diag_Ispare2B", perseus_utils.read_diag_milivolts, self.perseus, 26, 'B')
+        self._Diag_Qspare2A = self.update_diag("Diag_Qspare2A", perseus_utils.read_diag_milivolts, self.perseus, 27, 'A')
+        self._Diag_Qspare2B = self.update_diag("Diag_Qspare2B", perseus_utils.read_diag_milivolts, self.perseus, 27, 'B')
+        self._Diag_IMuxCavA = self.update_diag("Diag_IMuxCavA", perseus_utils.read_diag_milivolts, self.perseus, 28, 'A')
+        self._Diag_IMuxCavB = self.update_diag("Diag_IMuxCavB", perseus_utils.read_diag_milivolts, self.perseus, 28, 'B')
+        self._Diag_QMuxCavA = self.update_diag("Diag_QMuxCavA", perseus_utils.read_diag_milivolts, self.perseus, 29, 'A')
+        self._Diag_QMuxCavB = self.update_diag("Diag_QMuxCavB", perseus_utils.read_diag_milivolts, self.perseus, 29, 'B')
+        self._Diag_IMuxFwCavA = self.update_diag("Diag_IMuxFwCavA", perseus_utils.read_diag_milivolts, self.perseus, 30, 'A')
+        self._Diag_IMuxFwCavB = self.update_diag("Diag_IMuxFwCavB", perseus_utils.read_diag_milivolts, self.perseus, 30, 'B')
+        self._Diag_QMuxFwCavA = self.update_diag("Diag_QMuxFwCavA", perseus_utils.read_diag_milivolts, self.perseus, 31, 'A')
+        self._Diag_QMuxFwCavB = self.update_diag("Diag_QMuxFwCavB", perseus_utils.read_diag_milivolts, self.perseus, 31, 'B')
+        self._Diag_IMuxFwTet1A = self.update_diag("Diag_IMuxFwTet1A", perseus_utils.read_diag_milivolts, self.perseus, 32, 'A')
+        self._Diag_IMuxFwTet1B = self.update_diag("Diag_IMuxFwTet1B", perseus_utils.read_diag_milivolts, self.perseus, 32, 'B')
+        self._Diag_QMuxFwTet1A = self.update_diag("Diag_QMuxFwTet1A", perseus_utils.read_diag_milivolts, self.perseus, 33, 'A')
+        self._Diag_QMuxFwTet1B = self.update_diag("Diag_QMuxFwTet1B", perseus_utils.read_diag_milivolts, self.perseus, 33, 'B')
+        self._Diag_IMuxFwTet2A = self.update_diag("Diag_IMuxFwTet2A", perseus_utils.read_diag_milivolts, self.perseus, 34, 'A')
+        self._Diag_IMuxFwTet2B = self.update_diag("Diag_IMuxFwTet2B", perseus_utils.read_diag_milivolts, self.perseus, 34, 'B')
+        self._Diag_QMuxFwTet2A = self.update_diag("Diag_QMuxFwTet2A", perseus_utils.read_diag_milivolts, self.perseus, 35, 'A')
+        self._Diag_QMuxFwTet2B = self.update_diag("Diag_QMuxFwTet2B", perseus_utils.read_diag_milivolts, self.perseus, 35, 'B')
+        self._Diag_IMuxFwCircInA = self.update_diag("Diag_IMuxFwCircInA", perseus_utils.read_diag_milivolts, self.perseus, 36, 'A')
+        self._Diag_IMuxFwCircInB = self.update_diag("Diag_IMuxFwCircInB", perseus_utils.read_diag_milivolts, self.perseus, 36, 'B')
+        self._Diag_QMuxFwCircInA = self.update_diag("Diag_QMuxFwCircInA", perseus_utils.read_diag_milivolts, self.perseus, 37, 'A')
+        self._Diag_QMuxFwCircInB = self.update_diag("Diag_QMuxFwCircInB", perseus_utils.read_diag_milivolts, self.perseus, 37, 'B')
+        self._Diag_AmpCavA = self.update_diag("Diag_AmpCavA", perseus_utils.read_diag_milivolts, self.perseus, 38, 'A')
+        self._Diag_AmpCavB = self.update_diag("Diag_AmpCavB", perseus_utils.read_diag_milivolts, self.perseus, 38, 'B')
+        self._Diag_AmpFwA = self.update_diag("Diag_AmpFwA", perseus_utils.read_diag_milivolts, self.perseus, 39, 'A')
+        self._Diag_AmpFwB = self.update_diag("Diag_AmpFwB", perseus_utils.read_diag_milivolts, self.perseus, 39, 'B')
+        self._Diag_AngCavFwA = self.update_diag("Diag_AngCavFwA", perseus_utils.read_diag_angle, self.perseus, 40, 'A')
+        self._Diag_AngCavFwB = self.update_diag("Diag_AngCavFwB", perseus_utils.read_diag_angle, self.perseus, 40, 'B')
+        self._Diag_AngCavLA = self.update_diag("Diag_AngCavLA", perseus_utils.read_diag_angle, self.perseus, 41, 'A')
+        self._Diag_AngCavLB = self.update_diag("Diag_AngCavLB", perseus_utils.read_diag_angle, self.perseus, 41, 'B')
+        self._Diag_AngFwLA = self.update_diag("Diag_AngFwLA", perseus_utils.read_diag_angle, self.perseus, 42, 'A')
+        self._Diag_AngFwLB = self.update_diag("Diag_AngFwLB", perseus_utils.read_diag_angle, self.perseus, 42, 'B')
+        self._Diag_Vaccum1A = self.update_diag("Diag_Vaccum1A", perseus_utils.read_diag_bool, self.perseus, 43, 'A')
+        self._Diag_Vaccum1B = self.update_diag("Diag_Vaccum1B", perseus_utils.read_diag_bool, self.perseus, 43, 'B')
+        self._Diag_Vaccum2A = self.update_diag("Diag_Vaccum2A", perseus_utils.read_diag_bool, self.perseus, 44, 'A')
+        self._Diag_Vaccum2B = self.update_diag("Diag_Vaccum2B", perseus_utils.read_diag_bool, self.perseus, 44, 'B')
+        self._Diag_IcontrolSlowpiA = self.update_diag("Diag_IcontrolSlowpiA", perseus_utils.read_diag_milivolts, self.perseus, 45, 'A')
+        self._Diag_IcontrolSlowpiB = self.update_diag("Diag_IcontrolSlowpiB", perseus_utils.read_diag_milivolts, self.perseus, 45, 'B')
+        self._Diag_QcontrolSlowpiA = self.update_diag("Diag_QcontrolSlowpiA", perseus_utils.read_diag_milivolts, self.perseus, 46, 'A')
+        self._Diag_QcontrolSlowpiB = self.update_diag("Diag_QcontrolSlowpiB", perseus_utils.read_diag_milivolts, self.perseus, 46, 'B')
+        self._Diag_IcontrolFastpiA = self.update_diag("Diag_IcontrolFastpiA", perseus_utils.read_diag_milivolts, self.perseus, 47, 'A')
+        self._Diag_IcontrolFastpiB = self.update_diag("Diag_IcontrolFastpiB", perseus_utils.read_diag_milivolts, self.perseus, 47, 'B')
+        self._Diag_QcontrolFastpiA = self.update_diag("Diag_QcontrolFastpiA", perseus_utils.read_diag_milivolts, self.perseus, 48, 'A')
+        self._Diag_QcontrolFastpiB = self.update_diag("Diag_QcontrolFastpiB", perseus_utils.read_diag_milivolts, self.perseus, 48, 'B')
+        self._Diag_VcxoPoweredA = self.update_diag("Diag_VcxoPoweredA", perseus_utils.read_diag_bool, self.perseus, 50, 'A')
+        self._Diag_VcxoPoweredB = self.update_diag("Diag_VcxoPoweredB", perseus_utils.read_diag_bool, self.perseus, 50, 'B')
+        self._Diag_VcxoRefA = self.update_diag("Diag_VcxoRefA", perseus_utils.read_diag_bool, self.perseus, 51, 'A')
+        self._Diag_VcxoRefB = self.update_diag("Diag_VcxoRefB", perseus_utils.read_diag_bool, self.perseus, 51, 'B')
+        self._Diag_VcxoLockedA = self.update_diag("Diag_VcxoLockedA", perseus_utils.read_diag_bool, self.perseus, 52, 'A')
+        self._Diag_VcxoLockedB = self.update_diag("Diag_VcxoLockedB", perseus_utils.read_diag_bool, self.perseus, 52, 'B')
+        self._Diag_VcxoCableDisconnectedA = self.update_diag("Diag_VcxoCableDisconnectedA", perseus_utils.read_diag_bool, self.perseus, 53, 'A')
+        self._Diag_VcxoCableDisconnectedB = self.update_diag("Diag_VcxoCableDisconnectedB", perseus_utils.read_diag_bool, self.perseus, 53, 'B')
+        self._Diag_IpolarForAmplitudeLoopA = self.update_diag("Diag_IpolarForAmplitudeLoopA", perseus_utils.read_diag_milivolts, self.perseus, 100, 'A')
+        self._Diag_IpolarForAmplitudeLoopB = self.update_diag("Diag_IpolarForAmplitudeLoopB", perseus_utils.read_diag_milivolts, self.perseus, 100, 'B')
+        self._Diag_QpolarForAmplitudeLoopA = self.update_diag("Diag_QpolarForAmplitudeLoopA", perseus_utils.read_diag_milivolts, self.perseus, 101, 'A')
+        self._Diag_QpolarForAmplitudeLoopB = self.update_diag("Diag_QpolarForAmplitudeLoopB", perseus_utils.read_diag_milivolts, self.perseus, 101, 'B')
+        self._Diag_IpolarForPhaseLoopA = self.update_diag("Diag_IpolarForPhaseLoopA", perseus_utils.read_diag_milivolts, self.perseus, 102, 'A')
+        self._Diag_IpolarForPhaseLoopB = self.update_diag("Diag_IpolarForPhaseLoopB", perseus_utils.read_diag_milivolts, self.perseus, 102, 'B')
+        self._Diag_QpolarForPhaseLoopA = self.update_diag("Diag_QpolarForPhaseLoopA", perseus_utils.read_diag_milivolts, self.perseus, 103, 'A')
+        self._Diag_QpolarForPhaseLoopB = self.update_diag("Diag_QpolarForPhaseLoopB", perseus_utils.read_diag_milivolts, self.perseus, 103, 'B')
+        self._Diag_AmpInputOfAmpLoopA = self.update_diag("Diag_AmpInputOfAmpLoopA", perseus_utils.read_diag_milivolts, self.perseus, 104, 'A')
+        self._Diag_AmpInputOfAmpLoopB = self.update_diag("Diag_AmpInputOfAmpLoopB", perseus_utils.read_diag_milivolts, self.perseus, 104, 'B')
+        self._Diag_PhaseInputOfAmpLoopA = self.update_diag("Diag_PhaseInputOfAmpLoopA", perseus_utils.read_diag_milivolts, self.perseus, 105, 'A')
+        self._Diag_PhaseInputOfAmpLoopB = self.update_diag("Diag_PhaseInputOfAmpLoopB", perseus_utils.read_diag_milivolts, self.perseus, 105, 'B')
+        self._Diag_AmpInputOfPhaseLoopA = self.update_diag("Diag_AmpInputOfPhaseLoopA", perseus_utils.read_diag_milivolts, self.perseus, 106, 'A')
+        self._Diag_AmpInputOfPhaseLoopB = self.update_diag("Diag_AmpInputOfPhaseLoopB", perseus_utils.read_diag_milivolts, self.perseus, 106, 'B')
+        self._Diag_PhInputOfPhaseLoopA = self.update_diag("Diag_PhInputOfPhaseLoopA", perseus_utils.read_diag_milivolts, self.perseus, 107, 'A')
+        self._Diag_PhInputOfPhaseLoopB = self.update_diag("Diag_PhInputOfPhaseLoopB", perseus_utils.read_diag_milivolts, self.perseus, 107, 'B')
+        self._Diag_AmpLoopControlOutputA = self.update_diag("Diag_AmpLoopControlOutputA", perseus_utils.read_diag_milivolts, self.perseus, 108, 'A')
+        self._Diag_AmpLoopControlOutputB = self.update_diag("Diag_AmpLoopControlOutputB", perseus_utils.read_diag_milivolts, self.perseus, 108, 'B')
+        self._Diag_AmpLoopErrorA = self.update_diag("Diag_AmpLoopErrorA", perseus_utils.read_diag_milivolts, self.perseus, 109, 'A')
+        self._Diag_AmpLoopErrorB = self.update_diag("Diag_AmpLoopErrorB", perseus_utils.read_diag_milivolts, self.perseus, 109, 'B')
+        self._Diag_AmpLoopErrorAccumA = self.update_diag("Diag_AmpLoopErrorAccumA", perseus_utils.read_diag_milivolts, self.perseus, 110, 'A')
+        self._Diag_AmpLoopErrorAccumB = self.update_diag("Diag_AmpLoopErrorAccumB", perseus_utils.read_diag_milivolts, self.perseus, 110, 'B')
+        self._Diag_PhLoopControlOutputA = self.update_diag("Diag_PhLoopControlOutputA", perseus_utils.read_diag_milivolts, self.perseus, 111, 'A')
+        self._Diag_PhLoopControlOutputB = self.update_diag("Diag_PhLoopControlOutputB", perseus_utils.read_diag_milivolts, self.perseus, 111, 'B')
+        self._Diag_PhLoopErrorA = self.update_diag("Diag_PhLoopErrorA", perseus_utils.read_diag_milivolts, self.perseus, 112, 'A')
+        self._Diag_PhLoopErrorB = self.update_diag("Diag_PhLoopErrorB", perseus_utils.read_diag_milivolts, self.perseus, 112, 'B')
+        self._Diag_PhLoopErrorAccumA = self.update_diag("Diag_PhLoopErrorAccumA", perseus_utils.read_diag_milivolts, self.perseus, 113, 'A')
+        self._Diag_PhLoopErrorAccumB = self.update_diag("Diag_PhLoopErrorAccumB", perseus_utils.read_diag_milivolts, self.perseus, 113, 'B')
+        self._Diag_IpolarControlOutputA = self.update_diag("Diag_IpolarControlOutputA", perseus_utils.read_diag_milivolts, self.perseus, 114, 'A')
+        self._Diag_IpolarControlOutputB = self.update_diag("Diag_IpolarControlOutputB", perseus_utils.read_diag_milivolts, self.perseus, 114, 'B')
+        self._Diag_QpolarControlOutputA = self.update_diag("Diag_QpolarControlOutputA", perseus_utils.read_diag_milivolts, self.perseus, 115, 'A')
+        self._Diag_QpolarControlOutputB = self.update_diag("Diag_QpolarControlOutputB", perseus_utils.read_diag_milivolts, self.perseus, 115, 'B')
+        self._Diag_IcontrolSlowpiIqA = self.update_diag("Diag_IcontrolSlowpiIqA", perseus_utils.read_diag_milivolts, self.perseus, 116, 'A')
+        self._Diag_IcontrolSlowpiIqB = self.update_diag("Diag_IcontrolSlowpiIqB", perseus_utils.read_diag_milivolts, self.perseus, 116, 'B')
+        self._Diag_QcontrolSlowpiqA = self.update_diag("Diag_QcontrolSlowpiqA", perseus_utils.read_diag_milivolts, self.perseus, 117, 'A')
+        self._Diag_QcontrolSlowpiqB = self.update_diag("Diag_QcontrolSlowpiqB", perseus_utils.read_diag_milivolts, self.perseus, 117, 'B')
+        self._Diag_IcontrolFastpiIqA = self.update_diag("Diag_IcontrolFastpiIqA", perseus_utils.read_diag_milivolts, self.perseus, 118, 'A')
+        self._Diag_IcontrolFastpiIqB = self.update_diag("Diag_IcontrolFastpiIqB", perseus_utils.read_diag_milivolts, self.perseus, 118, 'B')
+        self._Diag_QcontrolFastpiIqA = self.update_diag("Diag_QcontrolFastpiIqA", perseus_utils.read_diag_milivolts, self.perseus, 119, 'A')
+        self._Diag_QcontrolFastpiIqB = self.update_diag("Diag_QcontrolFastpiIqB", perseus_utils.read_diag_milivolts, self.perseus, 119, 'B')
+        self._Diag_IloopinputSlowpiIqA = self.update_diag("Diag_IloopinputSlowpiIqA", perseus_utils.read_diag_milivolts, self.perseus, 120, 'A')
+        self._Diag_IloopinputSlowpiIqB = self.update_diag("Diag_IloopinputSlowpiIqB", perseus_utils.read_diag_milivolts, self.perseus, 120, 'B')
+        self._Diag_QloopinputSlowpiIqA = self.update_diag("Diag_QloopinputSlowpiIqA", perseus_utils.read_diag_milivolts, self.perseus, 121, 'A')
+        self._Diag_QloopinputSlowpiIqB = self.update_diag("Diag_QloopinputSlowpiIqB", perseus_utils.read_diag_milivolts, self.perseus, 121, 'B')
+        self._Diag_IloopinputFastpiIqA = self.update_diag("Diag_IloopinputFastpiIqA", perseus_utils.read_diag_milivolts, self.perseus, 122, 'A')
+        self._Diag_IloopinputFastpiIqB = self.update_diag("Diag_IloopinputFastpiIqB", perseus_utils.read_diag_milivolts, self.perseus, 122, 'B')
+        self._Diag_QloopinputFastpiIqA = self.update_diag("Diag_QloopinputFastpiIqA", perseus_utils.read_diag_milivolts, self.perseus, 123, 'A')
+        self._Diag_QloopinputFastpiIqB = self.update_diag("Diag_QloopinputFastpiIqB", perseus_utils.read_diag_milivolts, self.perseus, 123, 'B')
+        self._Diag_IrefloopinputFastpiIqA = self.update_diag("Diag_IrefloopinputFastpiIqA", perseus_utils.read_diag_milivolts, self.perseus, 124, 'A')
+        self._Diag_IrefloopinputFastpiIqB = self.update_diag("Diag_IrefloopinputFastpiIqB", perseus_utils.read_diag_milivolts, self.perseus, 124, 'B')
+        self._Diag_QrefloopinputFastpiIqA = self.update_diag("Diag_QrefloopinputFastpiIqA", perseus_utils.read_diag_milivolts, self.perseus, 125, 'A')
+        self._Diag_QrefloopinputFastpiIqB = self.update_diag("Diag_QrefloopinputFastpiIqB", perseus_utils.read_diag_milivolts, self.perseus, 125, 'B')
+        self._Diag_MovingPlungerAutoA = self.update_diag("Diag_MovingPlungerAutoA", perseus_utils.read_diag_bool, self.perseus, 300, 'A')
+        self._Diag_MovingPlungerAutoB = self.update_diag("Diag_MovingPlungerAutoB", perseus_utils.read_diag_bool, self.perseus, 300, 'B')
+        self._Diag_FreqUpA = self.update_diag("Diag_FreqUpA", perseus_utils.read_diag_bool, self.perseus, 301, 'A')
+        self._Diag_FreqUpB = self.update_diag("Diag_FreqUpB", perseus_utils.read_diag_bool, self.perseus, 301, 'B')
+        self._Diag_ManualTuningOnA = self.update_diag("Diag_ManualTuningOnA", perseus_utils.read_diag_bool, self.perseus, 302, 'A')
+        self._Diag_ManualTuningOnB = self.update_diag("Diag_ManualTuningOnB", perseus_utils.read_diag_bool, self.perseus, 302, 'B')
+        self._Diag_ManualTuningFreqUpA = self.update_diag("Diag_ManualTuningFreqUpA", perseus_utils.read_diag_bool, self.perseus, 303, 'A')
+        self._Diag_ManualTuningFreqUpB = self.update_diag("Diag_ManualTuningFreqUpB", perseus_utils.read_diag_bool, self.perseus, 303, 'B')
+        self._Diag_FwminA = self.update_diag("Diag_FwminA", perseus_utils.read_diag_bool, self.perseus, 307, 'A')
+        self._Diag_FwminB = self.update_diag("Diag_FwminB", perseus_utils.read_diag_bool, self.perseus, 307, 'B')
+        self._Diag_EpsItckDelayA = self.update_diag("Diag_EpsItckDelayA", perseus_utils.read_diag_bool, self.perseus, 400, 'A')
+        self._Diag_EpsItckDelayB = self.update_diag("Diag_EpsItckDelayB", perseus_utils.read_diag_bool, self.perseus, 400, 'B')
+        self._Diag_FimItckDelayA = self.update_diag("Diag_FimItckDelayA", perseus_utils.read_diag_bool, self.perseus, 401, 'A')
+        self._Diag_FimItckDelayB = self.update_diag("Diag_FimItckDelayB", perseus_utils.read_diag_bool, self.perseus, 401, 'B')
+        self._Diag_FdlTrigHwInputA = self.update_diag("Diag_FdlTrigHwInputA", perseus_utils.read_diag_bool, self.perseus, 402, 'A')
+        self._Diag_FdlTrigHwInputB = self.update_diag("Diag_FdlTrigHwInputB", perseus_utils.read_diag_bool, self.perseus, 402, 'B')
+        self._Diag_FdlTrigSwInputA = self.update_diag("Diag_FdlTrigSwInputA", perseus_utils.read_diag_bool, self.perseus, 403, 'A')
+        self._Diag_FdlTrigSwInputB = self.update_diag("Diag_FdlTrigSwInputB", perseus_utils.read_diag_bool, self.perseus, 403, 'B')
+        self._Diag_EpsItckA = self.update_diag("Diag_EpsItckA", perseus_utils.read_diag_bool, self.perseus, 404, 'A')
+        self._Diag_EpsItckB = self.update_diag("Diag_EpsItckB", perseus_utils.read_diag_bool, self.perseus, 404, 'B')
 
     @command
+    @prioritized(PRIORITY_ACQUISITION)
     def read_attrs(self):
+        with self.perseus.bits.sweep():
+            self.prefetch_bits()
+            self.read_attr_values()
 
+    def read_attr_values(self):
         data = self.get_KpA()
-        self.push_change_event("KpA", data)
+        self.push_setting("KpA", data)
         data = self.get_KpB()
-        self.push_change_event("KpB", data)
+        self.push_setting("KpB", data)
         data = self.get_KiA()
-        self.push_change_event("KiA", data)
+        self.push_setting("KiA", data)
         data = self.get_KiB()
-        self.push_change_event("KiB", data)
+        self.push_setting("KiB", data)
         data = self.get_PhaseShiftCavA()
-        self.push_change_event("PhaseShiftCavA", data)
+        self.push_setting("PhaseShiftCavA", data)
         data = self.get_PhaseShiftCavB()
-        self.push_change_event("PhaseShiftCavB", data)
+        self.push_setting("PhaseShiftCavB", data)
         data = self.get_PhaseShiftFwcavA()
-        self.push_change_event("PhaseShiftFwcavA", data)
+        self.push_setting("PhaseShiftFwcavA", data)
         data = self.get_PhaseShiftFwcavB()
-        self.push_change_event("PhaseShiftFwcavB", data)
+        self.push_setting("PhaseShiftFwcavB", data)
         data = self.get_PhaseShiftFwtet1A()
-        self.push_change_event("PhaseShiftFwtet1A", data)
+        self.push_setting("PhaseShiftFwtet1A", data)
         data = self.get_PhaseShiftFwtet1B()
-        self.push_change_event("PhaseShiftFwtet1B", data)
+        self.push_setting("PhaseShiftFwtet1B", data)
         data = self.get_PhaseShiftFwtet2A()
-        self.push_change_event("PhaseShiftFwtet2A", data)
+        self.push_setting("PhaseShiftFwtet2A", data)
         data = self.get_PhaseShiftFwtet2B()
-        self.push_change_event("PhaseShiftFwtet2B", data)
+        self.push_setting("PhaseShiftFwtet2B", data)
         data = self.get_PilimitA()
-        self.push_change_event("PilimitA", data)
+        self.push_setting("PilimitA", data)
         data = self.get_PilimitB()
-        self.push_change_event("PilimitB", data)
+        self.push_setting("PilimitB", data)
         data = self.get_SamplesToAverageA()
-        self.push_change_event("SamplesToAverageA", data)
+        self.push_setting("SamplesToAverageA", data)
         data = self.get_SamplesToAverageB()
-        self.push_change_event("SamplesToAverageB", data)
+        self.push_setting("SamplesToAverageB", data)
         data = self.get_FilterStagesA()
-        self.push_change_event("FilterStagesA", data)
+        self.push_setting("FilterStagesA", data)
         data = self.get_FilterStagesB()
-        self.push_change_event("FilterStagesB", data)
+        self.push_setting("FilterStagesB", data)
         data = self.get_PhaseShiftFwcircinA()
-        self.push_change_event("PhaseShiftFwcircinA", data)
+        self.push_setting("PhaseShiftFwcircinA", data)
         data = self.get_PhaseShiftFwcircinB()
-        self.push_change_event("PhaseShiftFwcircinB", data)
+        self.push_setting("PhaseShiftFwcircinB", data)
         data = self.get_PhaseShiftControlSignalTet1A()
-        self.push_change_event("PhaseShiftControlSignalTet1A", data)
+        self.push_setting("PhaseShiftControlSignalTet1A", data)
         data = self.get_PhaseShiftControlSignalTet1B()
-        self.push_change_event("PhaseShiftControlSignalTet1B", data)
+        self.push_setting("PhaseShiftControlSignalTet1B", data)
         data = self.get_PhaseShiftControlSignalTet2A()
-        self.push_change_event("PhaseShiftControlSignalTet2A", data)
+        self.push_setting("PhaseShiftControlSignalTet2A", data)
         data = self.get_PhaseShiftControlSignalTet2B()
-        self.push_change_event("PhaseShiftControlSignalTet2B", data)
+        self.push_setting("PhaseShiftControlSignalTet2B", data)
         data = self.get_GainTetrode1A()
-        self.push_change_event("GainTetrode1A", data)
+        self.push_setting("GainTetrode1A", data)
         data = self.get_GainTetrode1B()
-        self.push_change_event("GainTetrode1B", data)
+        self.push_setting("GainTetrode1B", data)
         data = self.get_GainTetrode2A()
-        self.push_change_event("GainTetrode2A", data)
+        self.push_setting("GainTetrode2A", data)
         data = self.get_GainTetrode2B()
-        self.push_change_event("GainTetrode2B", data)
+        self.push_setting("GainTetrode2B", data)
         data = bool(self.get_AutomaticStartupEnableA())
-        self.push_change_event("AutomaticStartupEnableA", data)
+        self.push_setting("AutomaticStartupEnableA", data)
         data = bool(self.get_AutomaticStartupEnableB())
-        self.push_change_event("AutomaticStartupEnableB", data)
+        self.push_setting("AutomaticStartupEnableB", data)
         data = self.get_CommandStartA()
-        self.push_change_event("CommandStartA", data)
+        self.push_setting("CommandStartA", data)
         data = self.get_CommandStartB()
-        self.push_change_event("CommandStartB", data)
+        self.push_setting("CommandStartB", data)
         data = self.get_AmprefinA()
-        self.push_change_event("AmprefinA", data)
+        self.push_setting("AmprefinA", data)
         data = self.get_AmprefinB()
-        self.push_change_event("AmprefinB", data)
+        self.push_setting("AmprefinB", data)
         data = self.get_PhrefinA()
-        self.push_change_event("PhrefinA", data)
+        self.push_setting("PhrefinA", data)
         data = self.get_PhrefinB()
-        self.push_change_event("PhrefinB", data)
+        self.push_setting("PhrefinB", data)
         data = self.get_AmprefminA()
-        self.push_change_event("AmprefminA", data)
+        self.push_setting("AmprefminA", data)
         data = self.get_AmprefminB()
-        self.push_change_event("AmprefminB", data)
+        self.push_setting("AmprefminB", data)
         data = self.get_PhrefminA()
-        self.push_change_event("PhrefminA", data)
+        self.push_setting("PhrefminA", data)
         data = self.get_PhrefminB()
-        self.push_change_event("PhrefminB", data)
+        self.push_setting("PhrefminB", data)
         data = self.get_PhaseIncreaseRateA()
-        self.push_change_event("PhaseIncreaseRateA", data)
+        self.push_setting("PhaseIncreaseRateA", data)
         data = self.get_PhaseIncreaseRateB()
-        self.push_change_event("PhaseIncreaseRateB", data)
+        self.push_setting("PhaseIncreaseRateB", data)
         data = self.get_VoltageIncreaseRateA()
-        self.push_change_event("VoltageIncreaseRateA", data)
+        self.push_setting("VoltageIncreaseRateA", data)
         data = self.get_VoltageIncreaseRateB()
-        self.push_change_event("VoltageIncreaseRateB", data)
+        self.push_setting("VoltageIncreaseRateB", data)
         data = self.get_GainOlA()
-        self.push_change_event("GainOlA", data)
+        self.push_setting("GainOlA", data)
         data = self.get_GainOlB()
-        self.push_change_event("GainOlB", data)
+        self.push_setting("GainOlB", data)
         data = bool(self.get_SpareGpioOutput01A())
-        self.push_change_event("SpareGpioOutput01A", data)
+        self.push_setting("SpareGpioOutput01A", data)
         data = bool(self.get_SpareGpioOutput01B())
-        self.push_change_event("SpareGpioOutput01B", data)
+        self.push_setting("SpareGpioOutput01B", data)
         data = bool(self.get_SpareGpioOutput02A())
-        self.push_change_event("SpareGpioOutput02A", data)
+        self.push_setting("SpareGpioOutput02A", data)
         data = bool(self.get_SpareGpioOutput02B())
-        self.push_change_event("SpareGpioOutput02B", data)
+        self.push_setting("SpareGpioOutput02B", data)
         data = bool(self.get_SpareGpioOutput03A())
-        self.push_change_event("SpareGpioOutput03A", data)
+        self.push_setting("SpareGpioOutput03A", data)
         data = bool(self.get_SpareGpioOutput03B())
-        self.push_change_event("SpareGpioOutput03B", data)
+        self.push_setting("SpareGpioOutput03B", data)
         data = bool(self.get_SpareGpioOutput04A())
-        self.push_change_event("SpareGpioOutput04A", data)
+        self.push_setting("SpareGpioOutput04A", data)
         data = bool(self.get_SpareGpioOutput04B())
-        self.push_change_event("SpareGpioOutput04B", data)
+        self.push_setting("SpareGpioOutput04B", data)
         data = bool(self.get_FdlSwTriggerA())
-        self.push_change_event("FdlSwTriggerA", data)
+        self.push_setting("FdlSwTriggerA", data)
         data = bool(self.get_FdlSwTriggerB())
-        self.push_change_event("FdlSwTriggerB", data)
+        self.push_setting("FdlSwTriggerB", data)
         data = bool(self.get_SlowIqLoopEnableA())
-        self.push_change_event("SlowIqLoopEnableA", data)
+        self.push_setting("SlowIqLoopEnableA", data)
         data = bool(self.get_SlowIqLoopEnableB())
-        self.push_change_event("SlowIqLoopEnableB", data)
+        self.push_setting("SlowIqLoopEnableB", data)
         data = bool(self.get_AdcsPhaseshiftEnableA())
-        self.push_change_event("AdcsPhaseshiftEnableA", data)
+        self.push_setting("AdcsPhaseshiftEnableA", data)
         data = bool(self.get_AdcsPhaseshiftEnableB())
-        self.push_change_event("AdcsPhaseshiftEnableB", data)
+        self.push_setting("AdcsPhaseshiftEnableB", data)
         data = bool(self.get_DacsPhaseShiftEnableA())
-        self.push_change_event("DacsPhaseShiftEnableA", data)
+        self.push_setting("DacsPhaseShiftEnableA", data)
         data = bool(self.get_DacsPhaseShiftEnableB())
-        self.push_change_event("DacsPhaseShiftEnableB", data)
+        self.push_setting("DacsPhaseShiftEnableB", data)
         data = bool(self.get_SquarerefEnableA())
-        self.push_change_event("SquarerefEnableA", data)
+        self.push_setting("SquarerefEnableA", data)
         data = bool(self.get_SquarerefEnableB())
-        self.push_change_event("SquarerefEnableB", data)
+        self.push_setting("SquarerefEnableB", data)
         data = self.get_FreqsquareA()
-        self.push_change_event("FreqsquareA", data)
+        self.push_setting("FreqsquareA", data)
         data = self.get_FreqsquareB()
-        self.push_change_event("FreqsquareB", data)
+        self.push_setting("FreqsquareB", data)
         data = bool(self.get_LookRefA())
-        self.push_change_event("LookRefA", data)
+        self.push_setting("LookRefA", data)
         data = bool(self.get_LookRefB())
-        self.push_change_event("LookRefB", data)
+        self.push_setting("LookRefB", data)
         data = self.get_QuadrantSelectionA()
-        self.push_change_event("QuadrantSelectionA", data)
+        self.push_setting("QuadrantSelectionA", data)
         data = self.get_QuadrantSelectionB()
-        self.push_change_event("QuadrantSelectionB", data)
+        self.push_setting("QuadrantSelectionB", data)
         data = self.get_SlowIqLoopInputSelectionA()
-        self.push_change_event("SlowIqLoopInputSelectionA", data)
+        self.push_setting("SlowIqLoopInputSelectionA", data)
         data = self.get_SlowIqLoopInputSelectionB()
-        self.push_change_event("SlowIqLoopInputSelectionB", data)
+        self.push_setting("SlowIqLoopInputSelectionB", data)
         data = self.get_FastIqLoopInputSelectionA()
-        self.push_change_event("FastIqLoopInputSelectionA", data)
+        self.push_setting("FastIqLoopInputSelectionA", data)
         data = self.get_FastIqLoopInputSelectionB()
-        self.push_change_event("FastIqLoopInputSelectionB", data)
+        self.push_setting("FastIqLoopInputSelectionB", data)
         data = self.get_AmplitudeLoopInputSelectionA()
-        self.push_change_event("AmplitudeLoopInputSelectionA", data)
+        self.push_setting("AmplitudeLoopInputSelectionA", data)
         data = self.get_AmplitudeLoopInputSelectionB()
-        self.push_change_event("AmplitudeLoopInputSelectionB", data)
+        self.push_setting("AmplitudeLoopInputSelectionB", data)
         data = self.get_PhaseLoopInputSelectionA()
-        self.push_change_event("PhaseLoopInputSelectionA", data)
+        self.push_setting("PhaseLoopInputSelectionA", data)
         data = self.get_PhaseLoopInputSelectionB()
-        self.push_change_event("PhaseLoopInputSelectionB", data)
+        self.push_setting("PhaseLoopInputSelectionB", data)
         data = bool(self.get_PolarLoopsEnableA())
-        self.push_change_event("PolarLoopsEnableA", data)
+        self.push_setting("PolarLoopsEnableA", data)
         data = bool(self.get_PolarLoopsEnableB())
-        self.push_change_event("PolarLoopsEnableB", data)
+        self.push_setting("PolarLoopsEnableB", data)
         data = bool(self.get_FastIqLoopEnableA())
-        self.push_change_event("FastIqLoopEnableA", data)
+        self.push_setting("FastIqLoopEnableA", data)
         data = bool(self.get_FastIqLoopEnableB())
-        self.push_change_event("FastIqLoopEnableB", data)
+        self.push_setting("FastIqLoopEnableB", data)
         data = bool(self.get_AmplitudeLoopEnableA())
-        self.push_change_event("AmplitudeLoopEnableA", data)
+        self.push_setting("AmplitudeLoopEnableA", data)
         data = bool(self.get_AmplitudeLoopEnableB())
-        self.push_change_event("AmplitudeLoopEnableB", data)
+        self.push_setting("AmplitudeLoopEnableB", data)
         data = bool(self.get_PhaseLoopEnableA())
-        self.push_change_event("PhaseLoopEnableA", data)
+        self.push_setting("PhaseLoopEnableA", data)
         data = bool(self.get_PhaseLoopEnableB())
-        self.push_change_event("PhaseLoopEnableB", data)
+        self.push_setting("PhaseLoopEnableB", data)
         data = self.get_KpFastIqLoopA()
-        self.push_change_event("KpFastIqLoopA", data)
+        self.push_setting("KpFastIqLoopA", data)
         data = self.get_KpFastIqLoopB()
-        self.push_change_event("KpFastIqLoopB", data)
+        self.push_setting("KpFastIqLoopB", data)
         data = self.get_KiFastIqLoopA()
-        self.push_change_event("KiFastIqLoopA", data)
+        self.push_setting("KiFastIqLoopA", data)
         data = self.get_KiFastIqLoopB()
-        self.push_change_event("KiFastIqLoopB", data)
+        self.push_setting("KiFastIqLoopB", data)
         data = self.get_KpAmpLoopA()
-        self.push_change_event("KpAmpLoopA", data)
+        self.push_setting("KpAmpLoopA", data)
         data = self.get_KpAmpLoopB()
-        self.push_change_event("KpAmpLoopB", data)
+        self.push_setting("KpAmpLoopB", data)
         data = self.get_KiAmpLoopA()
-        self.push_change_event("KiAmpLoopA", data)
+        self.push_setting("KiAmpLoopA", data)
         data = self.get_KiAmpLoopB()
-        self.push_change_event("KiAmpLoopB", data)
+        self.push_setting("KiAmpLoopB", data)
         data = self.get_KpPhaseLoopA()
-        self.push_change_event("KpPhaseLoopA", data)
+        self.push_setting("KpPhaseLoopA", data)
         data = self.get_KpPhaseLoopB()
-        self.push_change_event("KpPhaseLoopB", data)
+        self.push_setting("KpPhaseLoopB", data)
         data = self.get_KiPhaseLoopA()
-        self.push_change_event("KiPhaseLoopA", data)
+        self.push_setting("KiPhaseLoopA", data)
         data = self.get_KiPhaseLoopB()
-        self.push_change_event("KiPhaseLoopB", data)
+        self.push_setting("KiPhaseLoopB", data)
         data = self.get_PiLimitFastPiIqA()
-        self.push_change_event("PiLimitFastPiIqA", data)
+        self.push_setting("PiLimitFastPiIqA", data)
         data = self.get_PiLimitFastPiIqB()
-        self.push_change_event("PiLimitFastPiIqB", data)
+        self.push_setting("PiLimitFastPiIqB", data)
         data = bool(self.get_PulseModeEnableA())
-        self.push_change_event("PulseModeEnableA", data)
+        self.push_setting("PulseModeEnableA", data)
         data = bool(self.get_PulseModeEnableB())
-        self.push_change_event("PulseModeEnableB", data)
+        self.push_setting("PulseModeEnableB", data)
         data = bool(self.get_AutomaticConditioningEnableA())
-        self.push_change_event("AutomaticConditioningEnableA", data)
+        self.push_setting("AutomaticConditioningEnableA", data)
         data = bool(self.get_AutomaticConditioningEnableB())
-        self.push_change_event("AutomaticConditioningEnableB", data)
+        self.push_setting("AutomaticConditioningEnableB", data)
         data = self.get_ConditioningdutyCicleA()
-        self.push_change_event("ConditioningdutyCicleA", data)
+        self.push_setting("ConditioningdutyCicleA", data)
         data = self.get_ConditioningdutyCicleB()
-        self.push_change_event("ConditioningdutyCicleB", data)
+        self.push_setting("ConditioningdutyCicleB", data)
         data = bool(self.get_TuningEnableA())
-        self.push_change_event("TuningEnableA", data)
+        self.push_setting("TuningEnableA", data)
         data = bool(self.get_TuningEnableB())
-        self.push_change_event("TuningEnableB", data)
+        self.push_setting("TuningEnableB", data)
         data = bool(self.get_TuningPosEnA())
-        self.push_change_event("TuningPosEnA", data)
+        self.push_setting("TuningPosEnA", data)
         data = bool(self.get_TuningPosEnB())
-        self.push_change_event("TuningPosEnB", data)
+        self.push_setting("TuningPosEnB", data)
         data = self.get_NumStepsA()
-        self.push_change_event("NumStepsA", data)
+        self.push_setting("NumStepsA", data)
         data = self.get_NumStepsB()
-        self.push_change_event("NumStepsB", data)
+        self.push_setting("NumStepsB", data)
         data = self.get_PulsesFrequencyA()
-        self.push_change_event("PulsesFrequencyA", data)
+        self.push_setting("PulsesFrequencyA", data)
         data = self.get_PulsesFrequencyB()
-        self.push_change_event("PulsesFrequencyB", data)
+        self.push_setting("PulsesFrequencyB", data)
         data = self.get_PhaseOffsetA()
-        self.push_change_event("PhaseOffsetA", data)
+        self.push_setting("PhaseOffsetA", data)
         data = self.get_PhaseOffsetB()
-        self.push_change_event("PhaseOffsetB", data)
+        self.push_setting("PhaseOffsetB", data)
         data = bool(self.get_MoveA())
-        self.push_change_event("MoveA", data)
+        self.push_setting("MoveA", data)
         data = bool(self.get_MoveB())
-        self.push_change_event("MoveB", data)
+        self.push_setting("MoveB", data)
         data = bool(self.get_MoveupA())
-        self.push_change_event("MoveupA", data)
+        self.push_setting("MoveupA", data)
         data = bool(self.get_MoveupB())
-        self.push_change_event("MoveupB", data)
+        self.push_setting("MoveupB", data)
         data = bool(self.get_TuningresetA())
-        self.push_change_event("TuningresetA", data)
+        self.push_setting("TuningresetA", data)
         data = bool(self.get_TuningresetB())
-        self.push_change_event("TuningresetB", data)
+        self.push_setting("TuningresetB", data)
         data = self.get_FwminA()
-        self.push_change_event("FwminA", data)
+        self.push_setting("FwminA", data)
         data = self.get_FwminB()
-        self.push_change_event("FwminB", data)
+        self.push_setting("FwminB", data)
         data = self.get_MarginupA()
-        self.push_change_event("MarginupA", data)
+        self.push_setting("MarginupA", data)
         data = self.get_MarginupB()
-        self.push_change_event("MarginupB", data)
+        self.push_setting("MarginupB", data)
         data = self.get_MarginlowA()
-        self.push_change_event("MarginlowA", data)
+        self.push_setting("MarginlowA", data)
         data = self.get_MarginlowB()
-        self.push_change_event("MarginlowB", data)
+        self.push_setting("MarginlowB", data)
         data = self.get_TuningdelayA()
-        self.push_change_event("TuningdelayA", data)
+        self.push_setting("TuningdelayA", data)
         data = self.get_TuningdelayB()
-        self.push_change_event("TuningdelayB", data)
+        self.push_setting("TuningdelayB", data)
         data = bool(self.get_TuningfilterenableA())
-        self.push_change_event("TuningfilterenableA", data)
+        self.push_setting("TuningfilterenableA", data)
         data = bool(self.get_TuningfilterenableB())
-        self.push_change_event("TuningfilterenableB", data)
+        self.push_setting("TuningfilterenableB", data)
         data = bool(self.get_TuningtriggerenableA())
-        self.push_change_event("TuningtriggerenableA", data)
+        self.push_setting("TuningtriggerenableA", data)
         data = bool(self.get_TuningtriggerenableB())
-        self.push_change_event("TuningtriggerenableB", data)
+        self.push_setting("TuningtriggerenableB", data)
         data = bool(self.get_EpsItckDisableA())
-        self.push_change_event("EpsItckDisableA", data)
+        self.push_setting("EpsItckDisableA", data)
         data = bool(self.get_EpsItckDisableB())
-        self.push_change_event("EpsItckDisableB", data)
+        self.push_setting("EpsItckDisableB", data)
         data = bool(self.get_FimItckDisableA())
-        self.push_change_event("FimItckDisableA", data)
+        self.push_setting("FimItckDisableA", data)
         data = bool(self.get_FimItckDisableB())
-        self.push_change_event("FimItckDisableB", data)
+        self.push_setting("FimItckDisableB", data)
         data = self.get_MDividerA()
-        self.push_change_event("MDividerA", data)
+        self.push_setting("MDividerA", data)
         data = self.get_MDividerB()
-        self.push_change_event("MDividerB", data)
+        self.push_setting("MDividerB", data)
         data = self.get_NDividerA()
-        self.push_change_event("NDividerA", data)
+        self.push_setting("NDividerA", data)
         data = self.get_NDividerB()
-        self.push_change_event("NDividerB", data)
+        self.push_setting("NDividerB", data)
         data = self.get_MuxselA()
-        self.push_change_event("MuxselA", data)
+        self.push_setting("MuxselA", data)
         data = self.get_MuxselB()
-        self.push_change_event("MuxselB", data)
+        self.push_setting("MuxselB", data)
         data = self.get_Mux0DividerA()
-        self.push_change_event("Mux0DividerA", data)
+        self.push_setting("Mux0DividerA", data)
         data = self.get_Mux0DividerB()
-        self.push_change_event("Mux0DividerB", data)
+        self.push_setting("Mux0DividerB", data)
         data = self.get_Mux1DividerA()
-        self.push_change_event("Mux1DividerA", data)
+        self.push_setting("Mux1DividerA", data)
         data = self.get_Mux1DividerB()
-        self.push_change_event("Mux1DividerB", data)
+        self.push_setting("Mux1DividerB", data)
         data = self.get_Mux2DividerA()
-        self.push_change_event("Mux2DividerA", data)
+        self.push_setting("Mux2DividerA", data)
         data = self.get_Mux2DividerB()
-        self.push_change_event("Mux2DividerB", data)
+        self.push_setting("Mux2DividerB", data)
         data = self.get_Mux3DividerA()
-        self.push_change_event("Mux3DividerA", data)
+        self.push_setting("Mux3DividerA", data)
         data = self.get_Mux3DividerB()
-        self.push_change_event("Mux3DividerB", data)
+        self.push_setting("Mux3DividerB", data)
         data = self.get_Mux4DividerA()
-        self.push_change_event("Mux4DividerA", data)
+        self.push_setting("Mux4DividerA", data)
         data = self.get_Mux4DividerB()
-        self.push_change_event("Mux4DividerB", data)
+        self.push_setting("Mux4DividerB", data)
         data = bool(self.get_SendWordA())
-        self.push_change_event("SendWordA", data)
+        self.push_setting("SendWordA", data)
         data = bool(self.get_SendWordB())
-        self.push_change_event("SendWordB", data)
+        self.push_setting("SendWordB", data)
         data = bool(self.get_CpdirA())
-        self.push_change_event("CpdirA", data)
+        self.push_setting("CpdirA", data)
         data = bool(self.get_CpdirB())
-        self.push_change_event("CpdirB", data)
+        self.push_setting("CpdirB", data)
         data = bool(self.get_VcxoOutputInversionA())
-        self.push_change_event("VcxoOutputInversionA", data)
+        self.push_setting("VcxoOutputInversionA", data)
         data = bool(self.get_VcxoOutputInversionB())
-        self.push_change_event("VcxoOutputInversionB", data)
+        self.push_setting("VcxoOutputInversionB", data)
 
 
     @command
     def init_hardware(self):
-        try:
-            self.perseus.init_hardware()
-            self.set_state(DevState.RUNNING)
-        except Exception, e:
-            print e
-            self.set_state(DevState.FAULT)
+        self.initialize_hardware()
+
+    @command
+    def reset_statistics(self):
+        self.clear_statistics()
+
+    @command(dtype_in=str, dtype_out=str, doc_in="snapshot name, a file of SettingsPath", doc_out="snapshot file")
+    def save_settings(self, name):
+        return self.save_snapshot(name)
+
+    @command(dtype_in=str, dtype_out=int, doc_in="snapshot name, a file of SettingsPath", doc_out="words written")
+    def restore_settings(self, name):
+        return self.restore_snapshot(name)
+
+    @command(dtype_in=str, dtype_out=int, doc_in="json {attribute name: value} of the settings to write together",
+             doc_out="words written")
+    def apply_settings(self, argin):
+        return self.apply_values(json.loads(argin))
+
+    @command(dtype_in=str, dtype_out=str, doc_in="snapshot name, a file of SettingsPath",
+             doc_out="json list of [cavity, address, snapshot value, live value]")
+    def diff_settings(self, name):
+        return json.dumps(self.diff_snapshot(name))
+
+    def get_RampStatus(self):
+        return json.dumps(self.ramps.status())
+
+    def ramp_progress(self, ramp):
+        """Push the new setpoint and the ramps status, from the ramp thread."""
+        if ramp.value is not None:
+            self.push_change_event(ramp.name, ramp.value)
+        self.push_change_event('RampStatus', self.get_RampStatus())
+
+    def get_ConditioningStatus(self):
+        return json.dumps(dict((cavity, sequencer.status())
+                               for cavity, sequencer in self.conditioning.items()))
+
+    def get_ConditioningHistory(self):
+        return json.dumps(dict((cavity, sequencer.history_json())
+                               for cavity, sequencer in self.conditioning.items()))
+
+    def get_TuningLoopStatistics(self):
+        return json.dumps(dict((cavity, tuning_loop.statistics())
+                               for cavity, tuning_loop in self.tuning_loops.items()))
 
     @command
+    @prioritized(PRIORITY_SAFETY)
     def tuning_resetA(self):
-        perseus_utils.write_direct(self.perseus, True, TUNING_RESET_ADDRESS, 'A')
-        perseus_utils.write_direct(self.perseus, False, TUNING_RESET_ADDRESS, 'A')
+        perseus_utils.write_pulse_direct(self.perseus, TUNING_RESET_ADDRESS, 'A')
 
     @command
+    @prioritized(PRIORITY_SAFETY)
     def tuning_resetB(self):
-        perseus_utils.write_direct(self.perseus, True, TUNING_RESET_ADDRESS, 'B')
-        perseus_utils.write_direct(self.perseus, False, TUNING_RESET_ADDRESS, 'B')
+        perseus_utils.write_pulse_direct(self.perseus, TUNING_RESET_ADDRESS, 'B')
+
+    @command(dtype_in=str, doc_in='json {"setpoint": "AmprefinA", "target": mV or degrees, '
+                                  '"rate": per second, "profile": "linear" or "scurve"}')
+    def ramp_setpoint(self, argin):
+        ramp = json.loads(argin)
+        cavity = ramp['setpoint'][-1:]
+        if ramp['setpoint'] == 'Amprefin' + cavity and self.conditioning[cavity].running:
+            raise PerseusArgumentError('ramp', detail='Conditioning %s is running, it writes AmprefIn' % cavity)
+        self.writes.cancel([ramp['setpoint']])
+        self.ramps.start(ramp['setpoint'], ramp['target'], ramp['rate'], ramp.get('profile', 'linear'))
+
+    @command
+    def abort_ramps(self):
+        self.ramps.abort()
+
+    @command(dtype_in=str, doc_in='json list of steps {"duty": %, "amplitude": mV, "dwell": s}')
+    def start_conditioningA(self, profile):
+        if self.ramps.running('AmprefinA'):
+            raise PerseusArgumentError('conditioning', detail='A ramp of AmprefinA is running')
+        self.conditioning['A'].start(load_profile(profile))
+
+    @command
+    def stop_conditioningA(self):
+        self.conditioning['A'].stop()
+
+    @command(dtype_in=str, doc_in='json list of steps {"duty": %, "amplitude": mV, "dwell": s}')
+    def start_conditioningB(self, profile):
+        if self.ramps.running('AmprefinB'):
+            raise PerseusArgumentError('conditioning', detail='A ramp of AmprefinB is running')
+        self.conditioning['B'].start(load_profile(profile))
+
+    @command
+    def stop_conditioningB(self):
+        self.conditioning['B'].stop()
+
+    @command
+    def start_tuning_loopA(self):
+        self.tuning_loops['A'].start()
+
+    @command
+    def stop_tuning_loopA(self):
+        self.tuning_loops['A'].stop()
+
+    @command
+    def start_tuning_loopB(self):
+        self.tuning_loops['B'].start()
+
+    @command
+    def stop_tuning_loopB(self):
+        self.tuning_loops['B'].stop()
 
     @command
+    @prioritized(PRIORITY_MAINTENANCE)
     def sw_fast_data_logger(self):
         # Ram init ... probably this should be done in init_device
         # but for the moment ...
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Write coalescing of the nutaq settings.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module limits the writes of each setting to one per interval, for
+the bursts of writes of a GUI slider.
+
+A write of a setting not written for min_interval is done at once, in the
+caller thread, so its errors go back to the client. Otherwise it goes to
+the slot of the setting, replacing the value waiting there, and a worker
+thread does it when the interval has elapsed. So the intermediate values
+are dropped and the last one is always written.
+
+on_applied(name, value, error) is called once per value written, with the
+error (None if it was written). The errors of the deferred writes are also
+counted in failed, with the last one in last_error.
+
+A write of the settings that does not go through submit (a transaction, a
+snapshot restore, a ramp) cancels their pending values first, so a stale
+value is not written over it.
+"""
+
+__all__ = ["WriteCoalescer"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import threading
+import time
+
+DEFAULT_MIN_INTERVAL = 0.05
+
+
+class WriteCoalescer(object):
+
+    def __init__(self, min_interval=DEFAULT_MIN_INTERVAL, on_applied=None):
+        self.min_interval = min_interval
+        self.on_applied = on_applied
+        self.dropped = 0
+        self.failed = 0
+        self.last_error = None
+        self._pending = {}
+        # name of the value the worker is writing
+        self._in_flight = None
+        self._last_write = {}
+        self._condition = threading.Condition()
+        self._apply_lock = threading.Lock()
+        self._thread = None
+        self._stopped = False
+
+    def _apply(self, name, value, function, args):
+        with self._apply_lock:
+            try:
+                function(*args)
+            except Exception, e:
+                if self.on_applied is not None:
+                    self.on_applied(name, value, e)
+                raise
+        if self.on_applied is not None:
+            self.on_applied(name, value, None)
+
+    def submit(self, name, value, function, *args):
+        """Write value of setting name with function(*args)."""
+        with self._condition:
+            last = self._last_write.get(name)
+            due = last is None or time.time() - last >= self.min_interval
+            if name not in self._pending and due:
+                write_now = True
+                self._last_write[name] = time.time()
+            else:
+                write_now = False
+                if name in self._pending:
+                    self.dropped += 1
+                self._pending[name] = (value, function, args)
+                self._start_worker()
+                self._condition.notify_all()
+        if write_now:
+            self._apply(name, value, function, args)
+
+    def cancel(self, names=None):
+        """Drop the pending values of names (all if None) and wait for the
+        write in progress. Returns the number of values dropped.
+        """
+        with self._condition:
+            if names is None:
+                cancelled = self._pending.keys()
+                self._pending.clear()
+                while self._in_flight is not None:
+                    self._condition.wait()
+            else:
+                names = set(names)
+                cancelled = [name for name in names if self._pending.pop(name, None) is not None]
+                while self._in_flight in names:
+                    self._condition.wait()
+            self.dropped += len(cancelled)
+        return len(cancelled)
+
+    def is_pending(self, name):
+        """True while a value of setting name waits to be written."""
+        with self._condition:
+            return name in self._pending
+
+    def _start_worker(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name='writecoalescer')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _next_due(self):
+        """(name, seconds to wait) of the pending write due first."""
+        now = time.time()
+        due = [(self._last_write.get(name, 0) + self.min_interval - now, name) for name in self._pending]
+        wait, name = min(due)
+        return name, max(wait, 0)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                name, wait = self._next_due()
+                if wait > 0 and not self._stopped:
+                    self._condition.wait(wait)
+                    continue
+                value, function, args = self._pending.pop(name)
+                self._last_write[name] = time.time()
+                self._in_flight = name
+            try:
+                self._apply(name, value, function, args)
+            except Exception, e:
+                self.failed += 1
+                self.last_error = "Write of %s = %s failed: %s" % (name, value, e)
+                print self.last_error
+            finally:
+                with self._condition:
+                    self._in_flight = None
+                    self._condition.notify_all()
+
+    def flush(self):
+        """Write all the pending values now."""
+        with self._condition:
+            pending = self._pending.items()
+            self._pending.clear()
+        for name, (value, function, args) in pending:
+            self._apply(name, value, function, args)
+
+    def stop(self):
+        """Write the pending values and stop the worker."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+        self.flush()
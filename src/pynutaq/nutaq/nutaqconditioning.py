@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Conditioning sequencer of the nutaq loops board.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module runs the pulsed conditioning of a cavity in the device
+server.
+
+A profile is a list of steps {"duty": %, "amplitude": mV, "dwell": s}, with
+duty in 0..100, amplitude in 0..1000 (the AmprefIn range) and dwell > 0. The
+sequencer enables the pulse mode and the automatic conditioning, then
+writes the ConditioningdutyCicle and AmprefIn of each step and keeps it for
+its dwell time.
+
+A thread latches the chain every watch period and reads Vaccum1/2, and
+optionally one more diagnostic (the reflected power signal), in one batch.
+When a vacuum bit is set or the signal is over its limit (a trip), the
+sequencer goes back backoff_steps steps, once per trip: a trip that stays
+set does not back off again, and neither does a new trip within
+backoff_hold of the last back off. The sequencer holds the step while the
+trip is set and for backoff_hold seconds after it clears before going on.
+
+When conditioning is stopped or fails, the cavity is left in a safe state:
+AmprefIn 0 mV, automatic conditioning and pulse mode off. A profile that
+ends keeps its last step.
+
+Every event is kept in a fixed size history of (time, event, step, duty,
+amplitude) records.
+"""
+
+__all__ = ["ConditioningSequencer", "load_profile"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import json
+import threading
+import time
+
+import numpy
+
+import pynutaq.extra as extra_func
+import pynutaq.perseus.perseusutils as perseus_utils
+from pynutaq.perseus.perseusexceptions import PerseusArgumentError, PerseusTransportError
+from pynutaq.nutaq.nutaqdefs import AMP_REF_IN_ADDRESS, PULSE_MODE_ENABLE_ADDRESS
+from pynutaq.nutaq.nutaqdefs import AUTOMATIC_CONDITIONING_ADDRESS, CONDITIONING_DUTY_CYCLE_ADDRESS
+from pynutaq.nutaq.nutaqregisters import get_register_map
+
+EVENT_START = 0
+EVENT_STEP = 1
+EVENT_BACKOFF = 2
+EVENT_DONE = 3
+EVENT_STOP = 4
+EVENT_ERROR = 5
+
+EVENTS = ('start', 'step', 'backoff', 'done', 'stop', 'error')
+
+VACUUM_SIGNALS = ('Vaccum1', 'Vaccum2')
+
+# limits of the profile steps: duty in %, amplitude (AmprefIn) in mV
+DUTY_RANGE = (0.0, 100.0)
+AMPLITUDE_RANGE = (0.0, 1000.0)
+
+HISTORY_DTYPE = numpy.dtype([('time', numpy.float64), ('event', numpy.int8), ('step', numpy.int16),
+                             ('duty', numpy.float32), ('amplitude', numpy.float32)])
+
+
+def load_profile(text):
+    """Steps array (duty, amplitude, dwell) of a json profile."""
+    steps = json.loads(text)
+    if not steps:
+        raise PerseusArgumentError('conditioning', detail='Empty conditioning profile')
+    try:
+        profile = numpy.array([(step['duty'], step['amplitude'], step['dwell']) for step in steps],
+                              dtype=numpy.float64)
+    except (KeyError, TypeError, ValueError), e:
+        raise PerseusArgumentError('conditioning', detail='Bad conditioning step: %s' % e)
+    for index, (duty, amplitude, dwell) in enumerate(profile):
+        if not DUTY_RANGE[0] <= duty <= DUTY_RANGE[1]:
+            raise PerseusArgumentError('conditioning', detail='Step %d: duty %s out of %s'
+                                       % (index, duty, DUTY_RANGE))
+        if not AMPLITUDE_RANGE[0] <= amplitude <= AMPLITUDE_RANGE[1]:
+            raise PerseusArgumentError('conditioning', detail='Step %d: amplitude %s out of %s'
+                                       % (index, amplitude, AMPLITUDE_RANGE))
+        if not dwell > 0:
+            raise PerseusArgumentError('conditioning', detail='Step %d: dwell must be positive' % index)
+    return profile
+
+
+class ConditioningSequencer(object):
+
+    def __init__(self, perseus, cavity, nutaq_type='loops', watch_period=0.01, backoff_steps=1,
+                 backoff_hold=10.0, signal=None, signal_max=None, history_size=1000):
+        self.perseus = perseus
+        self.cavity = cavity
+        self.watch_period = watch_period
+        self.backoff_steps = backoff_steps
+        self.backoff_hold = backoff_hold
+        self.signal_max = signal_max
+
+        register_map = get_register_map(nutaq_type)
+        names = ['Diag_%s%s' % (name, cavity) for name in VACUUM_SIGNALS]
+        if signal:
+            names.append('Diag_%s%s' % (signal, cavity))
+        self.watch_names = names
+        self._watch_rows = register_map.indexes(names)
+        self._watch_addresses = register_map.address[self._watch_rows].tolist()
+        self.register_map = register_map
+
+        self.profile = numpy.zeros((0, 3))
+        self.step = -1
+        self.running = False
+        self.trips = 0
+        self.last_values = None
+        self.history = numpy.zeros(history_size, dtype=HISTORY_DTYPE)
+        self._history_count = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def log(self, event):
+        if 0 <= self.step < len(self.profile):
+            duty, amplitude = self.profile[self.step, :2]
+        else:
+            duty = amplitude = numpy.nan
+        self.history[self._history_count % len(self.history)] = (time.time(), event, self.step,
+                                                                  duty, amplitude)
+        self._history_count += 1
+
+    def get_history(self):
+        """History records, oldest first."""
+        count = min(self._history_count, len(self.history))
+        start = self._history_count % len(self.history) if self._history_count > count else 0
+        return numpy.roll(self.history, -start)[:count]
+
+    def start(self, profile):
+        if self.running:
+            raise PerseusArgumentError('conditioning', detail='Conditioning %s already running' % self.cavity)
+        self.profile = profile
+        self.step = -1
+        self.trips = 0
+        self._stop.clear()
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name='conditioning%s' % self.cavity)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def read_watch(self):
+        """Latch the chain and read the watched diagnostics in one batch."""
+        with perseus_utils.latched_diagnostics(self.perseus, self.cavity):
+            raw = perseus_utils.read_many_diag_direct(self.perseus, self._watch_addresses, self.cavity)
+        self.last_values = self.register_map.decode(self._watch_rows, raw)
+        return self.last_values
+
+    def tripped(self, values):
+        if values[:len(VACUUM_SIGNALS)].any():
+            return True
+        return self.signal_max is not None and len(values) > len(VACUUM_SIGNALS) and \
+            values[-1] > self.signal_max
+
+    def write_step(self, step):
+        self.step = step
+        duty, amplitude = self.profile[step, :2]
+        extra_func.set_ConditioningdutyCicle(self.perseus, duty, CONDITIONING_DUTY_CYCLE_ADDRESS, self.cavity)
+        perseus_utils.write_milivolts(self.perseus, amplitude, AMP_REF_IN_ADDRESS, self.cavity)
+
+    def write_safe_state(self):
+        """AmprefIn to 0 mV, then automatic conditioning and pulse mode off."""
+        try:
+            perseus_utils.write_milivolts(self.perseus, 0, AMP_REF_IN_ADDRESS, self.cavity)
+            perseus_utils.write_direct(self.perseus, 0, AUTOMATIC_CONDITIONING_ADDRESS, self.cavity)
+            perseus_utils.write_direct(self.perseus, 0, PULSE_MODE_ENABLE_ADDRESS, self.cavity)
+        except PerseusTransportError, e:
+            print "Conditioning %s: safe state not written: %s" % (self.cavity, e)
+
+    def watch(self, step_end, backoff_end, was_tripped):
+        """One watch period: back off on a new trip, or go to the next step.
+        Returns (step_end, backoff_end, tripped), step_end None when done.
+        """
+        tripped = self.tripped(self.read_watch())
+        now = time.time()
+        if tripped:
+            if not was_tripped:
+                self.trips += 1
+                if now >= backoff_end:
+                    self.write_step(max(self.step - self.backoff_steps, 0))
+                    self.log(EVENT_BACKOFF)
+                    backoff_end = step_end = now + self.backoff_hold
+            step_end = max(step_end, now + self.backoff_hold)
+        elif now >= step_end:
+            if self.step + 1 >= len(self.profile):
+                return None, backoff_end, tripped
+            self.write_step(self.step + 1)
+            self.log(EVENT_STEP)
+            step_end = now + self.profile[self.step, 2]
+        return step_end, backoff_end, tripped
+
+    def _run(self):
+        done = False
+        try:
+            perseus_utils.write_direct(self.perseus, 1, PULSE_MODE_ENABLE_ADDRESS, self.cavity)
+            perseus_utils.write_direct(self.perseus, 1, AUTOMATIC_CONDITIONING_ADDRESS, self.cavity)
+            self.log(EVENT_START)
+            self.write_step(0)
+            self.log(EVENT_STEP)
+            step_end = time.time() + self.profile[0, 2]
+            backoff_end = 0
+            tripped = False
+            scheduled = time.time()
+            while not self._stop.is_set():
+                scheduled += self.watch_period
+                delay = scheduled - time.time()
+                if delay > 0 and self._stop.wait(delay):
+                    break
+                step_end, backoff_end, tripped = self.watch(step_end, backoff_end, tripped)
+                if step_end is None:
+                    self.log(EVENT_DONE)
+                    done = True
+                    return
+            self.log(EVENT_STOP)
+        except Exception, e:
+            print "Conditioning %s stopped: %s" % (self.cavity, e)
+            self.log(EVENT_ERROR)
+        finally:
+            if not done:
+                self.write_safe_state()
+            self.running = False
+
+    def status(self):
+        return {'running': self.running,
+                'step': self.step,
+                'steps': len(self.profile),
+                'trips': self.trips,
+                'watch': dict(zip(self.watch_names, [] if self.last_values is None
+                                  else self.last_values.tolist()))}
+
+    def history_json(self):
+        """[[time, event, step, duty, amplitude]...]."""
+        history = []
+        for record in self.get_history():
+            duty, amplitude = float(record['duty']), float(record['amplitude'])
+            history.append([float(record['time']), EVENTS[record['event']], int(record['step']),
+                            None if duty != duty else duty, None if amplitude != amplitude else amplitude])
+        return history
@@ -34,12 +34,17 @@ AMP_REF_IN_ADDRESS = 19
 PHASE_REF_IN_ADDRESS = 20
 LOOP_ENABLE_ADDRESS = 100
 LOOP_INPUT_SELECTION_ADDRESS = 112
+PULSE_MODE_ENABLE_ADDRESS = 200
+AUTOMATIC_CONDITIONING_ADDRESS = 201
+CONDITIONING_DUTY_CYCLE_ADDRESS = 202
 TUNING_ENABLE_ADDRESS = 300
 NUM_STEPS_ADDRESS = 302
 PHASE_OFFSET_ADDRESS = 304
 MOVE_ADDRESS = 305
 MOVE_UP_ADDRESS = 306
 TUNING_RESET_ADDRESS = 307
+MARGIN_UP_ADDRESS = 309
+MARGIN_LOW_ADDRESS = 310
 
 RESET_MANUAL_ITCK_ADDRESS = 6
 
@@ -67,5 +72,14 @@ ANG_FW_L_ADDRESS = 42
 # Default Polling period
 DEFAULT_POLLING_PERIOD = 1000
 
-# Default rel_change
+# Default rel_change, in percent
 DEFAULT_REL_CHANGE = 0.1
+
+# Interlock records: 0 is the current one, 1..ITCK_HISTORY_RECORDS the history
+ITCK_CURRENT_ADDRESS = 150
+ITCK_HISTORY_ADDRESS = 100
+ITCK_TIMESTAMP_ADDRESS = 109
+ITCK_HISTORY_RECORDS = 7
+
+# EPS interlock diagnostic of the loops board
+EPS_ITCK_ADDRESS = 404
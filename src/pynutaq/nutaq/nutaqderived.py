@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Amplitudes and phases of the nutaq diagnostics.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module derives the Amp*/Ph* diagnostics from their I/Q parents.
+
+The derived attributes and their parents come from the register map, and
+all of them are computed with one numpy.hypot and one numpy.arctan2 call per
+sweep. A phase can be corrected with the PhaseShift setting of its signal
+(PhaseShiftCav for the cavLoops and MuxCav pairs...): the setting is added
+and the result wrapped to (-180, 180], the range of arctan2.
+"""
+
+__all__ = ["DerivedDiagnostics"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import numpy
+
+import pynutaq.perseus.perseusutils as perseus_utils
+from pynutaq.nutaq.nutaqregisters import get_register_map, CAVITIES, CONV_AMPLITUDE, CONV_PHASE, CONV_ANGLE
+from pynutaq.nutaq.nutaqregisters import SECTION_DIAGNOSTICS, SECTION_SETTINGS
+
+PHASE_SHIFT_PREFIX = 'PhaseShift'
+
+
+def _signal(i_name):
+    """Signal of an I attribute: Diag_IFwCavLoopsA -> fwcav."""
+    name = i_name[len('Diag_I'):-1]
+    if name.endswith('Loops'):
+        name = name[:-len('Loops')]
+    if name.startswith('Mux'):
+        name = name[len('Mux'):]
+    return name.lower()
+
+
+class DerivedDiagnostics(object):
+
+    def __init__(self, nutaq_type):
+        register_map = get_register_map(nutaq_type)
+        self.register_map = register_map
+        names = register_map.names
+        amplitude_rows = register_map.select(SECTION_DIAGNOSTICS, conversions=[CONV_AMPLITUDE])
+        phase_rows = register_map.select(SECTION_DIAGNOSTICS, conversions=[CONV_PHASE])
+        self.amplitude_names = [names[row] for row in amplitude_rows]
+        self.phase_names = [names[row] for row in phase_rows]
+        self._amplitude_iq = [(names[register_map.i_parent[row]], names[register_map.q_parent[row]])
+                              for row in amplitude_rows]
+        self._phase_iq = [(names[register_map.i_parent[row]], names[register_map.q_parent[row]])
+                          for row in phase_rows]
+
+        # PhaseShift setting of each phase, by signal and cavity
+        settings = register_map.select(SECTION_SETTINGS)
+        shifts = dict(((names[row][len(PHASE_SHIFT_PREFIX):-1].lower(), names[row][-1]), row)
+                      for row in settings if names[row].startswith(PHASE_SHIFT_PREFIX) and
+                      register_map.conversion[row] == CONV_ANGLE)
+        self._shift_rows = numpy.array([shifts.get((_signal(i_name), i_name[-1]), -1)
+                                        for i_name, q_name in self._phase_iq], dtype=int)
+        self.phase_offsets = numpy.zeros(len(self.phase_names))
+
+    def read_phase_shifts(self, perseus):
+        """Read the PhaseShift settings used by the phases, one batch per chain."""
+        offsets = numpy.zeros(len(self.phase_names))
+        register_map = self.register_map
+        for index, cavity in enumerate(CAVITIES):
+            used = numpy.flatnonzero((self._shift_rows >= 0) &
+                                     (register_map.cavity[self._shift_rows] == index))
+            if not len(used):
+                continue
+            rows = numpy.unique(self._shift_rows[used])
+            raw = perseus_utils.read_many_direct(perseus, register_map.address[rows], cavity)
+            values = dict(zip(rows, register_map.decode(rows, numpy.asarray(raw) & 0xFFFF)))
+            offsets[used] = [values[row] for row in self._shift_rows[used]]
+        self.phase_offsets = offsets
+
+    def _iq(self, values, pairs):
+        data = numpy.array([[values.get(i_name), values.get(q_name)] for i_name, q_name in pairs],
+                           dtype=numpy.float64).reshape(-1, 2)
+        return data[:, 0], data[:, 1]
+
+    def compute(self, values):
+        """Derived values from a {attribute name: value or None} dict. The
+        values derived from a missing parent are None.
+        """
+        # None parents become NaN, and stay NaN through hypot and arctan2
+        i_values, q_values = self._iq(values, self._amplitude_iq)
+        amplitudes = numpy.hypot(i_values, q_values)
+        i_values, q_values = self._iq(values, self._phase_iq)
+        phases = numpy.degrees(numpy.arctan2(q_values, i_values)) + self.phase_offsets
+        phases = 180.0 - (180.0 - phases) % 360.0
+
+        derived = {}
+        for names, results in ((self.amplitude_names, amplitudes), (self.phase_names, phases)):
+            for name, value in zip(names, results.tolist()):
+                derived[name] = None if value != value else value
+        return derived
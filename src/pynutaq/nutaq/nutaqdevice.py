@@ -0,0 +1,334 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Code shared by the Nutaq device servers.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module contains the code shared by the generated Nutaq (loops) and
+NutaqDiags (diags) device servers: the diagnostics sweep publication, the
+diagnostics arrays and statistics, the memorized settings and the settings
+snapshots and transactions.
+
+The tango attributes and commands are declared in the generated classes
+(templates/common.j2), which mix NutaqDeviceMixin before Device and set
+nutaq_type.
+"""
+
+__all__ = ["NutaqDeviceMixin", "QUALITIES", "MAX_DIAGNOSTICS", "STATISTICS"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import time
+import json
+
+import numpy
+
+from PyTango import AttrQuality, DevState, Util
+
+from pynutaq.perseus.perseusinit import InitProfileHistory
+from pynutaq.perseus.perseusexceptions import PerseusTransportError, PerseusConnectionError
+from pynutaq.perseus.perseusscheduler import prioritized, PRIORITY_MAINTENANCE
+from pynutaq.perseus.perseusfactory import Perseus
+
+from pynutaq.nutaq.nutaqquality import DiagnosticsQuality
+from pynutaq.nutaq.nutaqlayout import DiagnosticsLayout
+from pynutaq.nutaq.nutaqderived import DerivedDiagnostics
+from pynutaq.nutaq.nutaqstats import RollingStatistics
+from pynutaq.nutaq.nutaqcoalescer import WriteCoalescer
+from pynutaq.nutaq.nutaqmemorized import MemorizedRestore, parse_memorized
+from pynutaq.nutaq.nutaqtransaction import SettingsTransaction
+from pynutaq.nutaq.nutaqshared import SnapshotWriter
+from pynutaq.nutaq.nutaqregisters import get_register_map, SECTION_SETTINGS, CAVITIES
+from pynutaq.nutaq.nutaqsettings import SettingsSnapshot, get_snapshot_filename
+
+# nutaqquality codes to tango qualities
+QUALITIES = (AttrQuality.ATTR_VALID, AttrQuality.ATTR_INVALID, AttrQuality.ATTR_ALARM,
+             AttrQuality.ATTR_CHANGING)
+
+MAX_DIAGNOSTICS = 512
+
+STATISTICS = ('Mean', 'Std', 'Min', 'Max', 'PeakToPeak')
+
+
+def _statistic_getter(cavity, statistic):
+    def getter(self):
+        return self.get_diag_statistic(cavity, statistic)
+    getter.__name__ = 'get_Diagnostics%s%s' % (statistic, cavity)
+    return getter
+
+
+class NutaqDeviceMixin(object):
+
+    nutaq_type = None
+    # Amp*/Ph* diagnostics computed from their I/Q parents, see derive_diagnostics
+    derived_diagnostics = False
+
+    def init_nutaq(self):
+        """Create the diagnostics, settings and shared memory helpers."""
+        self.diag_connection_error = None
+        self.diag_values = {}
+        self.diag_quality = DiagnosticsQuality(self.nutaq_type, self.DiagStaleTime)
+        self.diag_layout = DiagnosticsLayout(self.nutaq_type)
+        self.diag_derived = DerivedDiagnostics(self.nutaq_type) if self.derived_diagnostics else None
+        self.diag_statistics = dict((cavity, RollingStatistics(len(self.diag_layout.names), self.StatisticsWindow))
+                                    for cavity in CAVITIES)
+        register_map = get_register_map(self.nutaq_type)
+        self.bit_words = dict((cavity, register_map.bit_addresses(SECTION_SETTINGS, cavity))
+                              for cavity in CAVITIES)
+        self.memorized = MemorizedRestore(self.nutaq_type)
+        self.writes = WriteCoalescer(self.WriteMinInterval, self.write_applied)
+        self.failed_write = None
+        self.init_profiles = InitProfileHistory(self.InitProfileDepth, self.InitProfileFile)
+        self.shared = None
+        if self.SharedMemory:
+            try:
+                self.shared = SnapshotWriter(self.get_name(), self.nutaq_type, self.SharedMemoryPath)
+            except EnvironmentError, e:
+                print "Diagnostics not exported to shared memory: %s" % e
+
+    def connect_perseus(self):
+        self.perseus = Perseus().new_perseus(self.perseusType, self.perseusIp)
+        if hasattr(self.perseus, 'transport'):
+            self.perseus.transport.set_retry_policy(self.RetryAttempts, self.RetryDeadline)
+
+    def delete_nutaq(self):
+        if hasattr(self, 'writes'):
+            self.writes.stop()
+        if getattr(self, 'shared', None) is not None:
+            self.shared.close()
+            self.shared = None
+
+    def set_diagnostics_events(self):
+        for name in ('DiagnosticsA', 'DiagnosticsB', 'DiagnosticsIQA', 'DiagnosticsIQB'):
+            self.set_change_event(name, True, False)
+
+    def initialize_hardware(self):
+        try:
+            self.perseus.init_hardware()
+            self.set_state(DevState.RUNNING)
+        except Exception, e:
+            print e
+            self.set_state(DevState.FAULT)
+        if hasattr(self, 'perseus'):
+            self.init_profiles.append(self.perseus.last_init_profile)
+
+    def get_InitProfile(self):
+        return self.init_profiles.to_json()
+
+    def get_ErrorCounts(self):
+        counts = self.perseus.errors.as_dict()
+        counts['DeferredWriteError'] = self.writes.failed
+        return json.dumps(counts)
+
+    def get_SchedulerStatistics(self):
+        if not hasattr(self.perseus, 'transport'):
+            return json.dumps({})
+        statistics = self.perseus.transport.scheduler.statistics()
+        statistics['preemptions'] = self.perseus.transport.scheduler.preemptions
+        return json.dumps(statistics)
+
+    def update_diag(self, name, function, *args):
+        """Return function(*args) as the value of diagnostic name.
+
+        A failed read, or a value derived from an invalid one, is None and
+        the sweep goes on. After a connection error the rest of the sweep
+        is None without reading.
+        """
+        value = None
+        if self.diag_connection_error is None and None not in args:
+            try:
+                value = function(*args)
+            except PerseusConnectionError, e:
+                self.diag_connection_error = e
+            except PerseusTransportError, e:
+                print "%s: %s" % (name, e)
+        self.diag_values[name] = value
+        return value
+
+    def derive_diagnostics(self):
+        """Amplitudes and phases of all the I/Q pairs of the sweep."""
+        if self.ApplyPhaseShift and self.diag_connection_error is None:
+            try:
+                self.diag_derived.read_phase_shifts(self.perseus)
+            except PerseusTransportError, e:
+                print "Phase shifts not updated: %s" % e
+        for name, value in self.diag_derived.compute(self.diag_values).items():
+            setattr(self, '_' + name, value)
+            self.diag_values[name] = value
+
+    def publish_diagnostics(self, timestamp):
+        """Set the quality of all the diagnostics and push the ones that
+        changed with the time they were latched.
+        """
+        names = sorted(self.diag_values)
+        values = [self.diag_values[name] for name in names]
+        qualities = self.diag_quality.publish(names, values, timestamp)
+        for name, value, quality, changed in zip(names, values, qualities, self.diag_quality.changed):
+            if changed:
+                self.push_change_event(name, 0 if value is None else value, timestamp, QUALITIES[quality])
+        self.diag_layout.publish(self.diag_values)
+        if self.shared is not None:
+            self.shared.publish(self.diag_layout.arrays, timestamp)
+        for cavity, statistics in self.diag_statistics.items():
+            statistics.push(self.diag_layout.arrays[cavity])
+        for cavity in CAVITIES:
+            self.push_change_event('Diagnostics' + cavity, *self.get_diag_array(self.diag_layout.arrays[cavity]))
+            self.push_change_event('DiagnosticsIQ' + cavity, *self.get_diag_array(self.diag_layout.iq_arrays[cavity]))
+
+    def prefetch_bits(self):
+        """Read the words of the bit settings in one batch per chain."""
+        for cavity, addresses in self.bit_words.items():
+            self.perseus.bits.prefetch('read', cavity, addresses)
+
+    def restore_memorized(self):
+        """Write the memorized settings to the board in one batch per chain."""
+        self.writes.cancel(self.memorized.names)
+        properties = Util.instance().get_database().get_device_attribute_property(self.get_name(),
+                                                                                  self.memorized.names)
+        restored, rejected = self.memorized.restore(self.perseus, parse_memorized(properties))
+        for name, value, reason in rejected:
+            print "Memorized %s = %s not restored: %s" % (name, value, reason)
+        for name, value in restored.items():
+            if name in self.memorized.bit_names:
+                setattr(self, '_' + name, int(value))
+        print "%d memorized settings restored" % len(restored)
+
+    def write_applied(self, name, value, error):
+        """Push the setting once it is written, see WriteCoalescer. A failed
+        write stays in the status until the setting is written again.
+        """
+        if error is None:
+            self.push_change_event(name, value)
+            if self.failed_write == name:
+                self.failed_write = None
+                self.set_status("The device is in %s state." % self.get_state())
+        else:
+            self.failed_write = name
+            self.set_status("Write of %s = %s failed: %s" % (name, value, error))
+
+    def get_setting(self, name, value):
+        """value of setting name, CHANGING while a write of it is pending."""
+        if self.writes.is_pending(name):
+            return value, time.time(), AttrQuality.ATTR_CHANGING
+        return value
+
+    def push_setting(self, name, data):
+        """Push a value of a settings getter, a value or (value, time, quality)."""
+        if isinstance(data, tuple):
+            self.push_change_event(name, *data)
+        else:
+            self.push_change_event(name, data)
+
+    def get_diag(self, name, value):
+        timestamp, quality = self.diag_quality.get(name)
+        if value is None:
+            return 0, timestamp, AttrQuality.ATTR_INVALID
+        return value, timestamp, QUALITIES[quality]
+
+    def get_diag_array(self, value):
+        """INVALID if the sweep is stale or any value (NaN) could not be read."""
+        if self.diag_quality.is_stale() or numpy.isnan(value).any():
+            quality = AttrQuality.ATTR_INVALID
+        else:
+            quality = AttrQuality.ATTR_VALID
+        return value, self.diag_quality.timestamp or time.time(), quality
+
+    def get_DiagnosticsA(self):
+        return self.get_diag_array(self.diag_layout.arrays['A'])
+
+    def get_DiagnosticsB(self):
+        return self.get_diag_array(self.diag_layout.arrays['B'])
+
+    def get_DiagnosticsNames(self):
+        return self.diag_layout.names
+
+    def get_DiagnosticsIQA(self):
+        return self.get_diag_array(self.diag_layout.iq_arrays['A'])
+
+    def get_DiagnosticsIQB(self):
+        return self.get_diag_array(self.diag_layout.iq_arrays['B'])
+
+    def get_DiagnosticsIQNames(self):
+        return self.diag_layout.iq_names
+
+    def clear_statistics(self):
+        for statistics in self.diag_statistics.values():
+            statistics.clear()
+
+    def get_diag_statistic(self, cavity, statistic):
+        return self.get_diag_array(self.diag_statistics[cavity].statistics()[statistic])
+
+    get_DiagnosticsMeanA = _statistic_getter('A', 'Mean')
+    get_DiagnosticsMeanB = _statistic_getter('B', 'Mean')
+    get_DiagnosticsStdA = _statistic_getter('A', 'Std')
+    get_DiagnosticsStdB = _statistic_getter('B', 'Std')
+    get_DiagnosticsMinA = _statistic_getter('A', 'Min')
+    get_DiagnosticsMinB = _statistic_getter('B', 'Min')
+    get_DiagnosticsMaxA = _statistic_getter('A', 'Max')
+    get_DiagnosticsMaxB = _statistic_getter('B', 'Max')
+    get_DiagnosticsPeakToPeakA = _statistic_getter('A', 'PeakToPeak')
+    get_DiagnosticsPeakToPeakB = _statistic_getter('B', 'PeakToPeak')
+
+    def load_settings_snapshot(self, name):
+        snapshot = SettingsSnapshot.load(get_snapshot_filename(self.SettingsPath, name))
+        if snapshot.nutaq_type != self.nutaq_type:
+            raise Exception("Snapshot %s is for a %s device" % (name, snapshot.nutaq_type))
+        return snapshot
+
+    @prioritized(PRIORITY_MAINTENANCE)
+    def save_snapshot(self, name):
+        """Save the settings of the board, return the snapshot file."""
+        filename = get_snapshot_filename(self.SettingsPath, name)
+        SettingsSnapshot.read(self.perseus, self.nutaq_type).save(filename)
+        return filename
+
+    @prioritized(PRIORITY_MAINTENANCE)
+    def restore_snapshot(self, name):
+        """Write a saved snapshot to the board, return the words written."""
+        snapshot = self.load_settings_snapshot(name)
+        self.writes.cancel()
+        count = snapshot.restore(self.perseus)
+        self.settings_written(snapshot.values())
+        return count
+
+    def apply_values(self, values):
+        """Write {attribute name: value} together, return the words written."""
+        transaction = SettingsTransaction(self.perseus, self.nutaq_type)
+        transaction.stage_many(values)
+        self.writes.cancel(transaction.values.keys())
+        count = transaction.commit()
+        self.settings_written(transaction.values)
+        return count
+
+    def settings_written(self, values):
+        """Update the cached bits of {attribute name: value} written
+        together, so update_fim keeps them, and push them.
+        """
+        for name, value in values.items():
+            if name in self.memorized.bit_names:
+                setattr(self, '_' + name, int(value))
+            self.push_change_event(name, value)
+
+    @prioritized(PRIORITY_MAINTENANCE)
+    def diff_snapshot(self, name):
+        """[cavity, address, snapshot value, live value] of the differences."""
+        snapshot = self.load_settings_snapshot(name)
+        live = SettingsSnapshot.read(self.perseus, self.nutaq_type)
+        return snapshot.diff(live)
@@ -30,8 +30,8 @@ __docformat__ = 'restructuredtext'
 
 # standard library imports
 import time
-import numpy
 import math
+import json
 import datetime
 
 # 3rd party imports
@@ -47,16 +47,20 @@ import pynutaq.extra as extra_func
 
 import pynutaq.perseus.perseusutils as perseus_utils
 
-try:
-    from pynutaq.perseus.perseusdefs import *
-    from pynutaq.perseus.perseusfactory import Perseus
-except ImportError, e:
-    print e
+from pynutaq.perseus.perseusscheduler import prioritized, PRIORITY_SAFETY, PRIORITY_ACQUISITION
+from pynutaq.perseus.perseusscheduler import PRIORITY_MAINTENANCE
 
+from pynutaq.nutaq.nutaqdevice import NutaqDeviceMixin, MAX_DIAGNOSTICS
+from pynutaq.nutaq.nutaqitck import ItckHistory
 
-class NutaqDiags(Device):
+from pynutaq.perseus.perseusdefs import *
+
+
+class NutaqDiags(NutaqDeviceMixin, Device):
     __metaclass__ = DeviceMeta
 
+    nutaq_type = 'diags'
+
     Rvtet1A = attribute(label='Rvtet1A',
                                    dtype=float,
                                    display_level=DispLevel.OPERATOR,
@@ -4513,17 +4517,207 @@ class NutaqDiags(Device):
     perseusType = device_property(dtype=str, default_value='simulated')
     perseusIp = device_property(dtype=str, default_value='192.168.0.142')
     FDLPath = device_property(dtype=str, default_value='/tmp')
+    SettingsPath = device_property(dtype=str, default_value='/tmp')
+    InitProfileDepth = device_property(dtype=int, default_value=10)
+    InitProfileFile = device_property(dtype=str, default_value='')
+    RetryAttempts = device_property(dtype=int, default_value=3)
+    RetryDeadline = device_property(dtype=float, default_value=1.0)
+    DiagStaleTime = device_property(dtype=float, default_value=10.0)
+    StatisticsWindow = device_property(dtype=int, default_value=100)
+    WriteMinInterval = device_property(dtype=float, default_value=0.05)
+    RestoreMemorized = device_property(dtype=bool, default_value=False)
+    SharedMemory = device_property(dtype=bool, default_value=True)
+    SharedMemoryPath = device_property(dtype=str, default_value='/dev/shm')
+
+    InitProfile = attribute(label='InitProfile',
+                            dtype=str,
+                            display_level=DispLevel.EXPERT,
+                            access=AttrWriteType.READ,
+                            fget="get_InitProfile",
+                            doc="json with the step timings of the last hardware inits"
+                            )
+
+    ErrorCounts = attribute(label='ErrorCounts',
+                            dtype=str,
+                            display_level=DispLevel.EXPERT,
+                            access=AttrWriteType.READ,
+                            fget="get_ErrorCounts",
+                            doc="json with the number of board errors of each class"
+                            )
+
+    SchedulerStatistics = attribute(label='SchedulerStatistics',
+                                    dtype=str,
+                                    display_level=DispLevel.EXPERT,
+                                    access=AttrWriteType.READ,
+                                    fget="get_SchedulerStatistics",
+                                    doc="json with the connection wait times (ms) of each priority class"
+                                    )
+
+    DiagnosticsA = attribute(label='DiagnosticsA',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsA",
+                             doc="diagnostics of chain A, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsB = attribute(label='DiagnosticsB',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsB",
+                             doc="diagnostics of chain B, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsNames = attribute(label='DiagnosticsNames',
+                                 dtype=(str,),
+                                 max_dim_x=MAX_DIAGNOSTICS,
+                                 display_level=DispLevel.EXPERT,
+                                 access=AttrWriteType.READ,
+                                 fget="get_DiagnosticsNames",
+                                 doc="diagnostics attribute names, without cavity"
+                                 )
+
+    DiagnosticsIQA = attribute(label='DiagnosticsIQA',
+                               dtype=((float,),),
+                               max_dim_x=2, max_dim_y=MAX_DIAGNOSTICS,
+                               display_level=DispLevel.EXPERT,
+                               access=AttrWriteType.READ,
+                               fget="get_DiagnosticsIQA",
+                               doc="[I, Q] pairs of chain A, indexed as DiagnosticsIQNames"
+                               )
+
+    DiagnosticsIQB = attribute(label='DiagnosticsIQB',
+                               dtype=((float,),),
+                               max_dim_x=2, max_dim_y=MAX_DIAGNOSTICS,
+                               display_level=DispLevel.EXPERT,
+                               access=AttrWriteType.READ,
+                               fget="get_DiagnosticsIQB",
+                               doc="[I, Q] pairs of chain B, indexed as DiagnosticsIQNames"
+                               )
+
+    DiagnosticsIQNames = attribute(label='DiagnosticsIQNames',
+                                   dtype=(str,),
+                                   max_dim_x=MAX_DIAGNOSTICS,
+                                   display_level=DispLevel.EXPERT,
+                                   access=AttrWriteType.READ,
+                                   fget="get_DiagnosticsIQNames",
+                                   doc="I/Q pair names, I is Diag_I<name><cavity>"
+                                   )
+
+    DiagnosticsMeanA = attribute(label='DiagnosticsMeanA',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsMeanA",
+                             doc="rolling Mean of the diagnostics of chain A, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsMeanB = attribute(label='DiagnosticsMeanB',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsMeanB",
+                             doc="rolling Mean of the diagnostics of chain B, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsStdA = attribute(label='DiagnosticsStdA',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsStdA",
+                             doc="rolling Std of the diagnostics of chain A, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsStdB = attribute(label='DiagnosticsStdB',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsStdB",
+                             doc="rolling Std of the diagnostics of chain B, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsMinA = attribute(label='DiagnosticsMinA',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsMinA",
+                             doc="rolling Min of the diagnostics of chain A, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsMinB = attribute(label='DiagnosticsMinB',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsMinB",
+                             doc="rolling Min of the diagnostics of chain B, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsMaxA = attribute(label='DiagnosticsMaxA',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsMaxA",
+                             doc="rolling Max of the diagnostics of chain A, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsMaxB = attribute(label='DiagnosticsMaxB',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsMaxB",
+                             doc="rolling Max of the diagnostics of chain B, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsPeakToPeakA = attribute(label='DiagnosticsPeakToPeakA',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsPeakToPeakA",
+                             doc="rolling PeakToPeak of the diagnostics of chain A, indexed as DiagnosticsNames"
+                             )
+
+    DiagnosticsPeakToPeakB = attribute(label='DiagnosticsPeakToPeakB',
+                             dtype=(float,),
+                             max_dim_x=MAX_DIAGNOSTICS,
+                             display_level=DispLevel.EXPERT,
+                             access=AttrWriteType.READ,
+                             fget="get_DiagnosticsPeakToPeakB",
+                             doc="rolling PeakToPeak of the diagnostics of chain B, indexed as DiagnosticsNames"
+                             )
 
     def init_device(self):
         self._itck_number = 0
         Device.init_device(self)
+        self.init_nutaq()
+        self.itck_history = ItckHistory('diags')
         try:
-            self.perseus = Perseus().new_perseus(self.perseusType, self.perseusIp)
+            self.connect_perseus()
             self.set_events()
             self.set_state(DevState.ON)
         except Exception, e:
             print e
             self.set_state(DevState.FAULT)
+            return
+        if self.RestoreMemorized:
+            try:
+                self.restore_memorized()
+            except Exception, e:
+                print "Memorized settings not restored: %s" % e
+
+    def delete_device(self):
+        self.delete_nutaq()
 
     def set_events(self):
         self.set_change_event('Rvtet1A', True)
@@ -4894,6 +5088,7 @@ class NutaqDiags(Device):
         self.set_change_event('Diag_OutputToPlcB', True)
         self.set_change_event('Diag_OutputToMpsA', True)
         self.set_change_event('Diag_OutputToMpsB', True)
+        self.set_diagnostics_events()
 
     @DebugIt()
     def get_ItckNumber(self):
@@ -4906,111 +5101,111 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_Rvtet1A(self):
-        return perseus_utils.read_settings_diag_milivolts(self.perseus, 0, 'A')
+        return self.get_setting("Rvtet1A", perseus_utils.read_settings_diag_milivolts(self.perseus, 0, 'A'))
 
     @DebugIt()
     def set_Rvtet1A(self, Rvtet1A):
-        perseus_utils.write_settings_diag_milivolts(self.perseus, Rvtet1A, 0, 'A')
-        self.push_change_event("Rvtet1A", Rvtet1A)
+        self.writes.submit("Rvtet1A", Rvtet1A, perseus_utils.write_settings_diag_milivolts,
+                           self.perseus, Rvtet1A, 0, 'A')
 
     @DebugIt()
     def get_Rvtet1B(self):
-        return perseus_utils.read_settings_diag_milivolts(self.perseus, 0, 'B')
+        return self.get_setting("Rvtet1B", perseus_utils.read_settings_diag_milivolts(self.perseus, 0, 'B'))
 
     @DebugIt()
     def set_Rvtet1B(self, Rvtet1B):
-        perseus_utils.write_settings_diag_milivolts(self.perseus, Rvtet1B, 0, 'B')
-        self.push_change_event("Rvtet1B", Rvtet1B)
+        self.writes.submit("Rvtet1B", Rvtet1B, perseus_utils.write_settings_diag_milivolts,
+                           self.perseus, Rvtet1B, 0, 'B')
 
     @DebugIt()
     def get_Rvtet2A(self):
-        return perseus_utils.read_settings_diag_milivolts(self.perseus, 1, 'A')
+        return self.get_setting("Rvtet2A", perseus_utils.read_settings_diag_milivolts(self.perseus, 1, 'A'))
 
     @DebugIt()
     def set_Rvtet2A(self, Rvtet2A):
-        perseus_utils.write_settings_diag_milivolts(self.perseus, Rvtet2A, 1, 'A')
-        self.push_change_event("Rvtet2A", Rvtet2A)
+        self.writes.submit("Rvtet2A", Rvtet2A, perseus_utils.write_settings_diag_milivolts,
+                           self.perseus, Rvtet2A, 1, 'A')
 
     @DebugIt()
     def get_Rvtet2B(self):
-        return perseus_utils.read_settings_diag_milivolts(self.perseus, 1, 'B')
+        return self.get_setting("Rvtet2B", perseus_utils.read_settings_diag_milivolts(self.perseus, 1, 'B'))
 
     @DebugIt()
     def set_Rvtet2B(self, Rvtet2B):
-        perseus_utils.write_settings_diag_milivolts(self.perseus, Rvtet2B, 1, 'B')
-        self.push_change_event("Rvtet2B", Rvtet2B)
+        self.writes.submit("Rvtet2B", Rvtet2B, perseus_utils.write_settings_diag_milivolts,
+                           self.perseus, Rvtet2B, 1, 'B')
 
     @DebugIt()
     def get_RvcircA(self):
-        return perseus_utils.read_settings_diag_milivolts(self.perseus, 2, 'A')
+        return self.get_setting("RvcircA", perseus_utils.read_settings_diag_milivolts(self.perseus, 2, 'A'))
 
     @DebugIt()
     def set_RvcircA(self, RvcircA):
-        perseus_utils.write_settings_diag_milivolts(self.perseus, RvcircA, 2, 'A')
-        self.push_change_event("RvcircA", RvcircA)
+        self.writes.submit("RvcircA", RvcircA, perseus_utils.write_settings_diag_milivolts,
+                           self.perseus, RvcircA, 2, 'A')
 
     @DebugIt()
     def get_RvcircB(self):
-        return perseus_utils.read_settings_diag_milivolts(self.perseus, 2, 'B')
+        return self.get_setting("RvcircB", perseus_utils.read_settings_diag_milivolts(self.perseus, 2, 'B'))
 
     @DebugIt()
     def set_RvcircB(self, RvcircB):
-        perseus_utils.write_settings_diag_milivolts(self.perseus, RvcircB, 2, 'B')
-        self.push_change_event("RvcircB", RvcircB)
+        self.writes.submit("RvcircB", RvcircB, perseus_utils.write_settings_diag_milivolts,
+                           self.perseus, RvcircB, 2, 'B')
 
     @DebugIt()
     def get_FwloadA(self):
-        return perseus_utils.read_settings_diag_milivolts(self.perseus, 3, 'A')
+        return self.get_setting("FwloadA", perseus_utils.read_settings_diag_milivolts(self.perseus, 3, 'A'))
 
     @DebugIt()
     def set_FwloadA(self, FwloadA):
-        perseus_utils.write_settings_diag_milivolts(self.perseus, FwloadA, 3, 'A')
-        self.push_change_event("FwloadA", FwloadA)
+        self.writes.submit("FwloadA", FwloadA, perseus_utils.write_settings_diag_milivolts,
+                           self.perseus, FwloadA, 3, 'A')
 
     @DebugIt()
     def get_FwloadB(self):
-        return perseus_utils.read_settings_diag_milivolts(self.perseus, 3, 'B')
+        return self.get_setting("FwloadB", perseus_utils.read_settings_diag_milivolts(self.perseus, 3, 'B'))
 
     @DebugIt()
     def set_FwloadB(self, FwloadB):
-        perseus_utils.write_settings_diag_milivolts(self.perseus, FwloadB, 3, 'B')
-        self.push_change_event("FwloadB", FwloadB)
+        self.writes.submit("FwloadB", FwloadB, perseus_utils.write_settings_diag_milivolts,
+                           self.perseus, FwloadB, 3, 'B')
 
     @DebugIt()
     def get_FwhybloadA(self):
-        return perseus_utils.read_settings_diag_milivolts(self.perseus, 4, 'A')
+        return self.get_setting("FwhybloadA", perseus_utils.read_settings_diag_milivolts(self.perseus, 4, 'A'))
 
     @DebugIt()
     def set_FwhybloadA(self, FwhybloadA):
-        perseus_utils.write_settings_diag_milivolts(self.perseus, FwhybloadA, 4, 'A')
-        self.push_change_event("FwhybloadA", FwhybloadA)
+        self.writes.submit("FwhybloadA", FwhybloadA, perseus_utils.write_settings_diag_milivolts,
+                           self.perseus, FwhybloadA, 4, 'A')
 
     @DebugIt()
     def get_FwhybloadB(self):
-        return perseus_utils.read_settings_diag_milivolts(self.perseus, 4, 'B')
+        return self.get_setting("FwhybloadB", perseus_utils.read_settings_diag_milivolts(self.perseus, 4, 'B'))
 
     @DebugIt()
     def set_FwhybloadB(self, FwhybloadB):
-        perseus_utils.write_settings_diag_milivolts(self.perseus, FwhybloadB, 4, 'B')
-        self.push_change_event("FwhybloadB", FwhybloadB)
+        self.writes.submit("FwhybloadB", FwhybloadB, perseus_utils.write_settings_diag_milivolts,
+                           self.perseus, FwhybloadB, 4, 'B')
 
     @DebugIt()
     def get_RvcavA(self):
-        return perseus_utils.read_settings_diag_milivolts(self.perseus, 5, 'A')
+        return self.get_setting("RvcavA", perseus_utils.read_settings_diag_milivolts(self.perseus, 5, 'A'))
 
     @DebugIt()
     def set_RvcavA(self, RvcavA):
-        perseus_utils.write_settings_diag_milivolts(self.perseus, RvcavA, 5, 'A')
-        self.push_change_event("RvcavA", RvcavA)
+        self.writes.submit("RvcavA", RvcavA, perseus_utils.write_settings_diag_milivolts,
+                           self.perseus, RvcavA, 5, 'A')
 
     @DebugIt()
     def get_RvcavB(self):
-        return perseus_utils.read_settings_diag_milivolts(self.perseus, 5, 'B')
+        return self.get_setting("RvcavB", perseus_utils.read_settings_diag_milivolts(self.perseus, 5, 'B'))
 
     @DebugIt()
     def set_RvcavB(self, RvcavB):
-        perseus_utils.write_settings_diag_milivolts(self.perseus, RvcavB, 5, 'B')
-        self.push_change_event("RvcavB", RvcavB)
+        self.writes.submit("RvcavB", RvcavB, perseus_utils.write_settings_diag_milivolts,
+                           self.perseus, RvcavB, 5, 'B')
 
     @DebugIt()
     def get_ManualInterlockA(self):
@@ -5596,75 +5791,75 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_LandauphaseoffsetA(self):
-        return perseus_utils.read_angle(self.perseus, 205, 'A')
+        return self.get_setting("LandauphaseoffsetA", perseus_utils.read_angle(self.perseus, 205, 'A'))
 
     @DebugIt()
     def set_LandauphaseoffsetA(self, LandauphaseoffsetA):
-        perseus_utils.write_angle(self.perseus, LandauphaseoffsetA, 205, 'A')
-        self.push_change_event("LandauphaseoffsetA", LandauphaseoffsetA)
+        self.writes.submit("LandauphaseoffsetA", LandauphaseoffsetA, perseus_utils.write_angle,
+                           self.perseus, LandauphaseoffsetA, 205, 'A')
 
     @DebugIt()
     def get_LandauphaseoffsetB(self):
-        return perseus_utils.read_angle(self.perseus, 205, 'B')
+        return self.get_setting("LandauphaseoffsetB", perseus_utils.read_angle(self.perseus, 205, 'B'))
 
     @DebugIt()
     def set_LandauphaseoffsetB(self, LandauphaseoffsetB):
-        perseus_utils.write_angle(self.perseus, LandauphaseoffsetB, 205, 'B')
-        self.push_change_event("LandauphaseoffsetB", LandauphaseoffsetB)
+        self.writes.submit("LandauphaseoffsetB", LandauphaseoffsetB, perseus_utils.write_angle,
+                           self.perseus, LandauphaseoffsetB, 205, 'B')
 
     @DebugIt()
     def get_LandaumarginupA(self):
-        return perseus_utils.read_settings_diag_percentage(self.perseus, 206, 'A')
+        return self.get_setting("LandaumarginupA", perseus_utils.read_settings_diag_percentage(self.perseus, 206, 'A'))
 
     @DebugIt()
     def set_LandaumarginupA(self, LandaumarginupA):
-        perseus_utils.write_settings_diag_percentage(self.perseus, LandaumarginupA, 206, 'A')
-        self.push_change_event("LandaumarginupA", LandaumarginupA)
+        self.writes.submit("LandaumarginupA", LandaumarginupA, perseus_utils.write_settings_diag_percentage,
+                           self.perseus, LandaumarginupA, 206, 'A')
 
     @DebugIt()
     def get_LandaumarginupB(self):
-        return perseus_utils.read_settings_diag_percentage(self.perseus, 206, 'B')
+        return self.get_setting("LandaumarginupB", perseus_utils.read_settings_diag_percentage(self.perseus, 206, 'B'))
 
     @DebugIt()
     def set_LandaumarginupB(self, LandaumarginupB):
-        perseus_utils.write_settings_diag_percentage(self.perseus, LandaumarginupB, 206, 'B')
-        self.push_change_event("LandaumarginupB", LandaumarginupB)
+        self.writes.submit("LandaumarginupB", LandaumarginupB, perseus_utils.write_settings_diag_percentage,
+                           self.perseus, LandaumarginupB, 206, 'B')
 
     @DebugIt()
     def get_LandauMarginLowA(self):
-        return perseus_utils.read_settings_diag_percentage(self.perseus, 207, 'A')
+        return self.get_setting("LandauMarginLowA", perseus_utils.read_settings_diag_percentage(self.perseus, 207, 'A'))
 
     @DebugIt()
     def set_LandauMarginLowA(self, LandauMarginLowA):
-        perseus_utils.write_settings_diag_percentage(self.perseus, LandauMarginLowA, 207, 'A')
-        self.push_change_event("LandauMarginLowA", LandauMarginLowA)
+        self.writes.submit("LandauMarginLowA", LandauMarginLowA, perseus_utils.write_settings_diag_percentage,
+                           self.perseus, LandauMarginLowA, 207, 'A')
 
     @DebugIt()
     def get_LandauMarginLowB(self):
-        return perseus_utils.read_settings_diag_percentage(self.perseus, 207, 'B')
+        return self.get_setting("LandauMarginLowB", perseus_utils.read_settings_diag_percentage(self.perseus, 207, 'B'))
 
     @DebugIt()
     def set_LandauMarginLowB(self, LandauMarginLowB):
-        perseus_utils.write_settings_diag_percentage(self.perseus, LandauMarginLowB, 207, 'B')
-        self.push_change_event("LandauMarginLowB", LandauMarginLowB)
+        self.writes.submit("LandauMarginLowB", LandauMarginLowB, perseus_utils.write_settings_diag_percentage,
+                           self.perseus, LandauMarginLowB, 207, 'B')
 
     @DebugIt()
     def get_MinimumLandauAmplitudeA(self):
-        return perseus_utils.read_settings_diag_milivolts(self.perseus, 208, 'A')
+        return self.get_setting("MinimumLandauAmplitudeA", perseus_utils.read_settings_diag_milivolts(self.perseus, 208, 'A'))
 
     @DebugIt()
     def set_MinimumLandauAmplitudeA(self, MinimumLandauAmplitudeA):
-        perseus_utils.write_settings_diag_milivolts(self.perseus, MinimumLandauAmplitudeA, 208, 'A')
-        self.push_change_event("MinimumLandauAmplitudeA", MinimumLandauAmplitudeA)
+        self.writes.submit("MinimumLandauAmplitudeA", MinimumLandauAmplitudeA, perseus_utils.write_settings_diag_milivolts,
+                           self.perseus, MinimumLandauAmplitudeA, 208, 'A')
 
     @DebugIt()
     def get_MinimumLandauAmplitudeB(self):
-        return perseus_utils.read_settings_diag_milivolts(self.perseus, 208, 'B')
+        return self.get_setting("MinimumLandauAmplitudeB", perseus_utils.read_settings_diag_milivolts(self.perseus, 208, 'B'))
 
     @DebugIt()
     def set_MinimumLandauAmplitudeB(self, MinimumLandauAmplitudeB):
-        perseus_utils.write_settings_diag_milivolts(self.perseus, MinimumLandauAmplitudeB, 208, 'B')
-        self.push_change_event("MinimumLandauAmplitudeB", MinimumLandauAmplitudeB)
+        self.writes.submit("MinimumLandauAmplitudeB", MinimumLandauAmplitudeB, perseus_utils.write_settings_diag_milivolts,
+                           self.perseus, MinimumLandauAmplitudeB, 208, 'B')
 
     @DebugIt()
     def get_LandauPositiveEnableA(self):
@@ -5686,21 +5881,21 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_LandauampsettingA(self):
-        return perseus_utils.read_settings_diag_milivolts(self.perseus, 210, 'A')
+        return self.get_setting("LandauampsettingA", perseus_utils.read_settings_diag_milivolts(self.perseus, 210, 'A'))
 
     @DebugIt()
     def set_LandauampsettingA(self, LandauampsettingA):
-        perseus_utils.write_settings_diag_milivolts(self.perseus, LandauampsettingA, 210, 'A')
-        self.push_change_event("LandauampsettingA", LandauampsettingA)
+        self.writes.submit("LandauampsettingA", LandauampsettingA, perseus_utils.write_settings_diag_milivolts,
+                           self.perseus, LandauampsettingA, 210, 'A')
 
     @DebugIt()
     def get_LandauampsettingB(self):
-        return perseus_utils.read_settings_diag_milivolts(self.perseus, 210, 'B')
+        return self.get_setting("LandauampsettingB", perseus_utils.read_settings_diag_milivolts(self.perseus, 210, 'B'))
 
     @DebugIt()
     def set_LandauampsettingB(self, LandauampsettingB):
-        perseus_utils.write_settings_diag_milivolts(self.perseus, LandauampsettingB, 210, 'B')
-        self.push_change_event("LandauampsettingB", LandauampsettingB)
+        self.writes.submit("LandauampsettingB", LandauampsettingB, perseus_utils.write_settings_diag_milivolts,
+                           self.perseus, LandauampsettingB, 210, 'B')
 
     @DebugIt()
     def get_Landau3gevRingEnableA(self):
@@ -5740,8 +5935,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet1DacsoffloopsstbyA(self):
-        value = perseus_utils.read_direct(self.perseus, 7, 'A')
-        self._DisitckRvtet1DacsoffloopsstbyA = (value >> 0) & 1
+        self._DisitckRvtet1DacsoffloopsstbyA = int(perseus_utils.read_bit_direct(self.perseus, 7, 0, 'A'))
         return self._DisitckRvtet1DacsoffloopsstbyA
 
     @DebugIt()
@@ -5753,8 +5947,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet1DacsoffloopsstbyB(self):
-        value = perseus_utils.read_direct(self.perseus, 7, 'B')
-        self._DisitckRvtet1DacsoffloopsstbyB = (value >> 0) & 1
+        self._DisitckRvtet1DacsoffloopsstbyB = int(perseus_utils.read_bit_direct(self.perseus, 7, 0, 'B'))
         return self._DisitckRvtet1DacsoffloopsstbyB
 
     @DebugIt()
@@ -5766,8 +5959,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet1PindiodeswitchA(self):
-        value = perseus_utils.read_direct(self.perseus, 7, 'A')
-        self._DisitckRvtet1PindiodeswitchA = (value >> 1) & 1
+        self._DisitckRvtet1PindiodeswitchA = int(perseus_utils.read_bit_direct(self.perseus, 7, 1, 'A'))
         return self._DisitckRvtet1PindiodeswitchA
 
     @DebugIt()
@@ -5779,8 +5971,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet1PindiodeswitchB(self):
-        value = perseus_utils.read_direct(self.perseus, 7, 'B')
-        self._DisitckRvtet1PindiodeswitchB = (value >> 1) & 1
+        self._DisitckRvtet1PindiodeswitchB = int(perseus_utils.read_bit_direct(self.perseus, 7, 1, 'B'))
         return self._DisitckRvtet1PindiodeswitchB
 
     @DebugIt()
@@ -5792,8 +5983,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet1FdltrgA(self):
-        value = perseus_utils.read_direct(self.perseus, 7, 'A')
-        self._DisitckRvtet1FdltrgA = (value >> 2) & 1
+        self._DisitckRvtet1FdltrgA = int(perseus_utils.read_bit_direct(self.perseus, 7, 2, 'A'))
         return self._DisitckRvtet1FdltrgA
 
     @DebugIt()
@@ -5805,8 +5995,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet1FdltrgB(self):
-        value = perseus_utils.read_direct(self.perseus, 7, 'B')
-        self._DisitckRvtet1FdltrgB = (value >> 2) & 1
+        self._DisitckRvtet1FdltrgB = int(perseus_utils.read_bit_direct(self.perseus, 7, 2, 'B'))
         return self._DisitckRvtet1FdltrgB
 
     @DebugIt()
@@ -5818,8 +6007,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet1PlctxoffA(self):
-        value = perseus_utils.read_direct(self.perseus, 7, 'A')
-        self._DisitckRvtet1PlctxoffA = (value >> 3) & 1
+        self._DisitckRvtet1PlctxoffA = int(perseus_utils.read_bit_direct(self.perseus, 7, 3, 'A'))
         return self._DisitckRvtet1PlctxoffA
 
     @DebugIt()
@@ -5831,8 +6019,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet1PlctxoffB(self):
-        value = perseus_utils.read_direct(self.perseus, 7, 'B')
-        self._DisitckRvtet1PlctxoffB = (value >> 3) & 1
+        self._DisitckRvtet1PlctxoffB = int(perseus_utils.read_bit_direct(self.perseus, 7, 3, 'B'))
         return self._DisitckRvtet1PlctxoffB
 
     @DebugIt()
@@ -5844,8 +6031,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet1MpsA(self):
-        value = perseus_utils.read_direct(self.perseus, 7, 'A')
-        self._DisitckRvtet1MpsA = (value >> 4) & 1
+        self._DisitckRvtet1MpsA = int(perseus_utils.read_bit_direct(self.perseus, 7, 4, 'A'))
         return self._DisitckRvtet1MpsA
 
     @DebugIt()
@@ -5857,8 +6043,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet1MpsB(self):
-        value = perseus_utils.read_direct(self.perseus, 7, 'B')
-        self._DisitckRvtet1MpsB = (value >> 4) & 1
+        self._DisitckRvtet1MpsB = int(perseus_utils.read_bit_direct(self.perseus, 7, 4, 'B'))
         return self._DisitckRvtet1MpsB
 
     @DebugIt()
@@ -5870,8 +6055,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet1DiagA(self):
-        value = perseus_utils.read_direct(self.perseus, 7, 'A')
-        self._DisitckRvtet1DiagA = (value >> 5) & 1
+        self._DisitckRvtet1DiagA = int(perseus_utils.read_bit_direct(self.perseus, 7, 5, 'A'))
         return self._DisitckRvtet1DiagA
 
     @DebugIt()
@@ -5883,8 +6067,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet1DiagB(self):
-        value = perseus_utils.read_direct(self.perseus, 7, 'B')
-        self._DisitckRvtet1DiagB = (value >> 5) & 1
+        self._DisitckRvtet1DiagB = int(perseus_utils.read_bit_direct(self.perseus, 7, 5, 'B'))
         return self._DisitckRvtet1DiagB
 
     @DebugIt()
@@ -5896,8 +6079,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet2DacsoffloopsstbyA(self):
-        value = perseus_utils.read_direct(self.perseus, 8, 'A')
-        self._DisitckRvtet2DacsoffloopsstbyA = (value >> 0) & 1
+        self._DisitckRvtet2DacsoffloopsstbyA = int(perseus_utils.read_bit_direct(self.perseus, 8, 0, 'A'))
         return self._DisitckRvtet2DacsoffloopsstbyA
 
     @DebugIt()
@@ -5909,8 +6091,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet2DacsoffloopsstbyB(self):
-        value = perseus_utils.read_direct(self.perseus, 8, 'B')
-        self._DisitckRvtet2DacsoffloopsstbyB = (value >> 0) & 1
+        self._DisitckRvtet2DacsoffloopsstbyB = int(perseus_utils.read_bit_direct(self.perseus, 8, 0, 'B'))
         return self._DisitckRvtet2DacsoffloopsstbyB
 
     @DebugIt()
@@ -5922,8 +6103,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet2PindiodeswitchA(self):
-        value = perseus_utils.read_direct(self.perseus, 8, 'A')
-        self._DisitckRvtet2PindiodeswitchA = (value >> 1) & 1
+        self._DisitckRvtet2PindiodeswitchA = int(perseus_utils.read_bit_direct(self.perseus, 8, 1, 'A'))
         return self._DisitckRvtet2PindiodeswitchA
 
     @DebugIt()
@@ -5935,8 +6115,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet2PindiodeswitchB(self):
-        value = perseus_utils.read_direct(self.perseus, 8, 'B')
-        self._DisitckRvtet2PindiodeswitchB = (value >> 1) & 1
+        self._DisitckRvtet2PindiodeswitchB = int(perseus_utils.read_bit_direct(self.perseus, 8, 1, 'B'))
         return self._DisitckRvtet2PindiodeswitchB
 
     @DebugIt()
@@ -5948,8 +6127,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet2FdltrgA(self):
-        value = perseus_utils.read_direct(self.perseus, 8, 'A')
-        self._DisitckRvtet2FdltrgA = (value >> 2) & 1
+        self._DisitckRvtet2FdltrgA = int(perseus_utils.read_bit_direct(self.perseus, 8, 2, 'A'))
         return self._DisitckRvtet2FdltrgA
 
     @DebugIt()
@@ -5961,8 +6139,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet2FdltrgB(self):
-        value = perseus_utils.read_direct(self.perseus, 8, 'B')
-        self._DisitckRvtet2FdltrgB = (value >> 2) & 1
+        self._DisitckRvtet2FdltrgB = int(perseus_utils.read_bit_direct(self.perseus, 8, 2, 'B'))
         return self._DisitckRvtet2FdltrgB
 
     @DebugIt()
@@ -5974,8 +6151,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet2PlctxoffA(self):
-        value = perseus_utils.read_direct(self.perseus, 8, 'A')
-        self._DisitckRvtet2PlctxoffA = (value >> 3) & 1
+        self._DisitckRvtet2PlctxoffA = int(perseus_utils.read_bit_direct(self.perseus, 8, 3, 'A'))
         return self._DisitckRvtet2PlctxoffA
 
     @DebugIt()
@@ -5987,8 +6163,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet2PlctxoffB(self):
-        value = perseus_utils.read_direct(self.perseus, 8, 'B')
-        self._DisitckRvtet2PlctxoffB = (value >> 3) & 1
+        self._DisitckRvtet2PlctxoffB = int(perseus_utils.read_bit_direct(self.perseus, 8, 3, 'B'))
         return self._DisitckRvtet2PlctxoffB
 
     @DebugIt()
@@ -6000,8 +6175,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet2MpsA(self):
-        value = perseus_utils.read_direct(self.perseus, 8, 'A')
-        self._DisitckRvtet2MpsA = (value >> 4) & 1
+        self._DisitckRvtet2MpsA = int(perseus_utils.read_bit_direct(self.perseus, 8, 4, 'A'))
         return self._DisitckRvtet2MpsA
 
     @DebugIt()
@@ -6013,8 +6187,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet2MpsB(self):
-        value = perseus_utils.read_direct(self.perseus, 8, 'B')
-        self._DisitckRvtet2MpsB = (value >> 4) & 1
+        self._DisitckRvtet2MpsB = int(perseus_utils.read_bit_direct(self.perseus, 8, 4, 'B'))
         return self._DisitckRvtet2MpsB
 
     @DebugIt()
@@ -6026,8 +6199,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet2DiagA(self):
-        value = perseus_utils.read_direct(self.perseus, 8, 'A')
-        self._DisitckRvtet2DiagA = (value >> 5) & 1
+        self._DisitckRvtet2DiagA = int(perseus_utils.read_bit_direct(self.perseus, 8, 5, 'A'))
         return self._DisitckRvtet2DiagA
 
     @DebugIt()
@@ -6039,8 +6211,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvtet2DiagB(self):
-        value = perseus_utils.read_direct(self.perseus, 8, 'B')
-        self._DisitckRvtet2DiagB = (value >> 5) & 1
+        self._DisitckRvtet2DiagB = int(perseus_utils.read_bit_direct(self.perseus, 8, 5, 'B'))
         return self._DisitckRvtet2DiagB
 
     @DebugIt()
@@ -6052,8 +6223,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcircDacsoffloopsstbyA(self):
-        value = perseus_utils.read_direct(self.perseus, 9, 'A')
-        self._DisitckRvcircDacsoffloopsstbyA = (value >> 0) & 1
+        self._DisitckRvcircDacsoffloopsstbyA = int(perseus_utils.read_bit_direct(self.perseus, 9, 0, 'A'))
         return self._DisitckRvcircDacsoffloopsstbyA
 
     @DebugIt()
@@ -6065,8 +6235,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcircDacsoffloopsstbyB(self):
-        value = perseus_utils.read_direct(self.perseus, 9, 'B')
-        self._DisitckRvcircDacsoffloopsstbyB = (value >> 0) & 1
+        self._DisitckRvcircDacsoffloopsstbyB = int(perseus_utils.read_bit_direct(self.perseus, 9, 0, 'B'))
         return self._DisitckRvcircDacsoffloopsstbyB
 
     @DebugIt()
@@ -6078,8 +6247,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcircPindiodeswitchA(self):
-        value = perseus_utils.read_direct(self.perseus, 9, 'A')
-        self._DisitckRvcircPindiodeswitchA = (value >> 1) & 1
+        self._DisitckRvcircPindiodeswitchA = int(perseus_utils.read_bit_direct(self.perseus, 9, 1, 'A'))
         return self._DisitckRvcircPindiodeswitchA
 
     @DebugIt()
@@ -6091,8 +6259,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcircPindiodeswitchB(self):
-        value = perseus_utils.read_direct(self.perseus, 9, 'B')
-        self._DisitckRvcircPindiodeswitchB = (value >> 1) & 1
+        self._DisitckRvcircPindiodeswitchB = int(perseus_utils.read_bit_direct(self.perseus, 9, 1, 'B'))
         return self._DisitckRvcircPindiodeswitchB
 
     @DebugIt()
@@ -6104,8 +6271,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcircFdltrgA(self):
-        value = perseus_utils.read_direct(self.perseus, 9, 'A')
-        self._DisitckRvcircFdltrgA = (value >> 2) & 1
+        self._DisitckRvcircFdltrgA = int(perseus_utils.read_bit_direct(self.perseus, 9, 2, 'A'))
         return self._DisitckRvcircFdltrgA
 
     @DebugIt()
@@ -6117,8 +6283,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcircFdltrgB(self):
-        value = perseus_utils.read_direct(self.perseus, 9, 'B')
-        self._DisitckRvcircFdltrgB = (value >> 2) & 1
+        self._DisitckRvcircFdltrgB = int(perseus_utils.read_bit_direct(self.perseus, 9, 2, 'B'))
         return self._DisitckRvcircFdltrgB
 
     @DebugIt()
@@ -6130,8 +6295,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcircPlctxoffA(self):
-        value = perseus_utils.read_direct(self.perseus, 9, 'A')
-        self._DisitckRvcircPlctxoffA = (value >> 3) & 1
+        self._DisitckRvcircPlctxoffA = int(perseus_utils.read_bit_direct(self.perseus, 9, 3, 'A'))
         return self._DisitckRvcircPlctxoffA
 
     @DebugIt()
@@ -6143,8 +6307,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcircPlctxoffB(self):
-        value = perseus_utils.read_direct(self.perseus, 9, 'B')
-        self._DisitckRvcircPlctxoffB = (value >> 3) & 1
+        self._DisitckRvcircPlctxoffB = int(perseus_utils.read_bit_direct(self.perseus, 9, 3, 'B'))
         return self._DisitckRvcircPlctxoffB
 
     @DebugIt()
@@ -6156,8 +6319,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcircMpsA(self):
-        value = perseus_utils.read_direct(self.perseus, 9, 'A')
-        self._DisitckRvcircMpsA = (value >> 4) & 1
+        self._DisitckRvcircMpsA = int(perseus_utils.read_bit_direct(self.perseus, 9, 4, 'A'))
         return self._DisitckRvcircMpsA
 
     @DebugIt()
@@ -6169,8 +6331,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcircMpsB(self):
-        value = perseus_utils.read_direct(self.perseus, 9, 'B')
-        self._DisitckRvcircMpsB = (value >> 4) & 1
+        self._DisitckRvcircMpsB = int(perseus_utils.read_bit_direct(self.perseus, 9, 4, 'B'))
         return self._DisitckRvcircMpsB
 
     @DebugIt()
@@ -6182,8 +6343,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcircDiagA(self):
-        value = perseus_utils.read_direct(self.perseus, 9, 'A')
-        self._DisitckRvcircDiagA = (value >> 5) & 1
+        self._DisitckRvcircDiagA = int(perseus_utils.read_bit_direct(self.perseus, 9, 5, 'A'))
         return self._DisitckRvcircDiagA
 
     @DebugIt()
@@ -6195,8 +6355,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcircDiagB(self):
-        value = perseus_utils.read_direct(self.perseus, 9, 'B')
-        self._DisitckRvcircDiagB = (value >> 5) & 1
+        self._DisitckRvcircDiagB = int(perseus_utils.read_bit_direct(self.perseus, 9, 5, 'B'))
         return self._DisitckRvcircDiagB
 
     @DebugIt()
@@ -6208,8 +6367,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwloadDacsoffloopsstbyA(self):
-        value = perseus_utils.read_direct(self.perseus, 10, 'A')
-        self._DisitckFwloadDacsoffloopsstbyA = (value >> 0) & 1
+        self._DisitckFwloadDacsoffloopsstbyA = int(perseus_utils.read_bit_direct(self.perseus, 10, 0, 'A'))
         return self._DisitckFwloadDacsoffloopsstbyA
 
     @DebugIt()
@@ -6221,8 +6379,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwloadDacsoffloopsstbyB(self):
-        value = perseus_utils.read_direct(self.perseus, 10, 'B')
-        self._DisitckFwloadDacsoffloopsstbyB = (value >> 0) & 1
+        self._DisitckFwloadDacsoffloopsstbyB = int(perseus_utils.read_bit_direct(self.perseus, 10, 0, 'B'))
         return self._DisitckFwloadDacsoffloopsstbyB
 
     @DebugIt()
@@ -6234,8 +6391,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwloadPindiodeswitchA(self):
-        value = perseus_utils.read_direct(self.perseus, 10, 'A')
-        self._DisitckFwloadPindiodeswitchA = (value >> 1) & 1
+        self._DisitckFwloadPindiodeswitchA = int(perseus_utils.read_bit_direct(self.perseus, 10, 1, 'A'))
         return self._DisitckFwloadPindiodeswitchA
 
     @DebugIt()
@@ -6247,8 +6403,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwloadPindiodeswitchB(self):
-        value = perseus_utils.read_direct(self.perseus, 10, 'B')
-        self._DisitckFwloadPindiodeswitchB = (value >> 1) & 1
+        self._DisitckFwloadPindiodeswitchB = int(perseus_utils.read_bit_direct(self.perseus, 10, 1, 'B'))
         return self._DisitckFwloadPindiodeswitchB
 
     @DebugIt()
@@ -6260,8 +6415,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwloadFdltrgA(self):
-        value = perseus_utils.read_direct(self.perseus, 10, 'A')
-        self._DisitckFwloadFdltrgA = (value >> 2) & 1
+        self._DisitckFwloadFdltrgA = int(perseus_utils.read_bit_direct(self.perseus, 10, 2, 'A'))
         return self._DisitckFwloadFdltrgA
 
     @DebugIt()
@@ -6273,8 +6427,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwloadFdltrgB(self):
-        value = perseus_utils.read_direct(self.perseus, 10, 'B')
-        self._DisitckFwloadFdltrgB = (value >> 2) & 1
+        self._DisitckFwloadFdltrgB = int(perseus_utils.read_bit_direct(self.perseus, 10, 2, 'B'))
         return self._DisitckFwloadFdltrgB
 
     @DebugIt()
@@ -6286,8 +6439,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwloadPlctxoffA(self):
-        value = perseus_utils.read_direct(self.perseus, 10, 'A')
-        self._DisitckFwloadPlctxoffA = (value >> 3) & 1
+        self._DisitckFwloadPlctxoffA = int(perseus_utils.read_bit_direct(self.perseus, 10, 3, 'A'))
         return self._DisitckFwloadPlctxoffA
 
     @DebugIt()
@@ -6299,8 +6451,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwloadPlctxoffB(self):
-        value = perseus_utils.read_direct(self.perseus, 10, 'B')
-        self._DisitckFwloadPlctxoffB = (value >> 3) & 1
+        self._DisitckFwloadPlctxoffB = int(perseus_utils.read_bit_direct(self.perseus, 10, 3, 'B'))
         return self._DisitckFwloadPlctxoffB
 
     @DebugIt()
@@ -6312,8 +6463,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwloadMpsA(self):
-        value = perseus_utils.read_direct(self.perseus, 10, 'A')
-        self._DisitckFwloadMpsA = (value >> 4) & 1
+        self._DisitckFwloadMpsA = int(perseus_utils.read_bit_direct(self.perseus, 10, 4, 'A'))
         return self._DisitckFwloadMpsA
 
     @DebugIt()
@@ -6325,8 +6475,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwloadMpsB(self):
-        value = perseus_utils.read_direct(self.perseus, 10, 'B')
-        self._DisitckFwloadMpsB = (value >> 4) & 1
+        self._DisitckFwloadMpsB = int(perseus_utils.read_bit_direct(self.perseus, 10, 4, 'B'))
         return self._DisitckFwloadMpsB
 
     @DebugIt()
@@ -6338,8 +6487,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwloadDiagA(self):
-        value = perseus_utils.read_direct(self.perseus, 10, 'A')
-        self._DisitckFwloadDiagA = (value >> 5) & 1
+        self._DisitckFwloadDiagA = int(perseus_utils.read_bit_direct(self.perseus, 10, 5, 'A'))
         return self._DisitckFwloadDiagA
 
     @DebugIt()
@@ -6351,8 +6499,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwloadDiagB(self):
-        value = perseus_utils.read_direct(self.perseus, 10, 'B')
-        self._DisitckFwloadDiagB = (value >> 5) & 1
+        self._DisitckFwloadDiagB = int(perseus_utils.read_bit_direct(self.perseus, 10, 5, 'B'))
         return self._DisitckFwloadDiagB
 
     @DebugIt()
@@ -6364,8 +6511,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwhybloadDacsoffloopsstbyA(self):
-        value = perseus_utils.read_direct(self.perseus, 11, 'A')
-        self._DisitckFwhybloadDacsoffloopsstbyA = (value >> 0) & 1
+        self._DisitckFwhybloadDacsoffloopsstbyA = int(perseus_utils.read_bit_direct(self.perseus, 11, 0, 'A'))
         return self._DisitckFwhybloadDacsoffloopsstbyA
 
     @DebugIt()
@@ -6377,8 +6523,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwhybloadDacsoffloopsstbyB(self):
-        value = perseus_utils.read_direct(self.perseus, 11, 'B')
-        self._DisitckFwhybloadDacsoffloopsstbyB = (value >> 0) & 1
+        self._DisitckFwhybloadDacsoffloopsstbyB = int(perseus_utils.read_bit_direct(self.perseus, 11, 0, 'B'))
         return self._DisitckFwhybloadDacsoffloopsstbyB
 
     @DebugIt()
@@ -6390,8 +6535,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwhybloadPindiodeswitchA(self):
-        value = perseus_utils.read_direct(self.perseus, 11, 'A')
-        self._DisitckFwhybloadPindiodeswitchA = (value >> 1) & 1
+        self._DisitckFwhybloadPindiodeswitchA = int(perseus_utils.read_bit_direct(self.perseus, 11, 1, 'A'))
         return self._DisitckFwhybloadPindiodeswitchA
 
     @DebugIt()
@@ -6403,8 +6547,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwhybloadPindiodeswitchB(self):
-        value = perseus_utils.read_direct(self.perseus, 11, 'B')
-        self._DisitckFwhybloadPindiodeswitchB = (value >> 1) & 1
+        self._DisitckFwhybloadPindiodeswitchB = int(perseus_utils.read_bit_direct(self.perseus, 11, 1, 'B'))
         return self._DisitckFwhybloadPindiodeswitchB
 
     @DebugIt()
@@ -6416,8 +6559,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwhybloadFdltrgA(self):
-        value = perseus_utils.read_direct(self.perseus, 11, 'A')
-        self._DisitckFwhybloadFdltrgA = (value >> 2) & 1
+        self._DisitckFwhybloadFdltrgA = int(perseus_utils.read_bit_direct(self.perseus, 11, 2, 'A'))
         return self._DisitckFwhybloadFdltrgA
 
     @DebugIt()
@@ -6429,8 +6571,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwhybloadFdltrgB(self):
-        value = perseus_utils.read_direct(self.perseus, 11, 'B')
-        self._DisitckFwhybloadFdltrgB = (value >> 2) & 1
+        self._DisitckFwhybloadFdltrgB = int(perseus_utils.read_bit_direct(self.perseus, 11, 2, 'B'))
         return self._DisitckFwhybloadFdltrgB
 
     @DebugIt()
@@ -6442,8 +6583,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwhybloadPlctxoffA(self):
-        value = perseus_utils.read_direct(self.perseus, 11, 'A')
-        self._DisitckFwhybloadPlctxoffA = (value >> 3) & 1
+        self._DisitckFwhybloadPlctxoffA = int(perseus_utils.read_bit_direct(self.perseus, 11, 3, 'A'))
         return self._DisitckFwhybloadPlctxoffA
 
     @DebugIt()
@@ -6455,8 +6595,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwhybloadPlctxoffB(self):
-        value = perseus_utils.read_direct(self.perseus, 11, 'B')
-        self._DisitckFwhybloadPlctxoffB = (value >> 3) & 1
+        self._DisitckFwhybloadPlctxoffB = int(perseus_utils.read_bit_direct(self.perseus, 11, 3, 'B'))
         return self._DisitckFwhybloadPlctxoffB
 
     @DebugIt()
@@ -6468,8 +6607,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwhybloadMpsA(self):
-        value = perseus_utils.read_direct(self.perseus, 11, 'A')
-        self._DisitckFwhybloadMpsA = (value >> 4) & 1
+        self._DisitckFwhybloadMpsA = int(perseus_utils.read_bit_direct(self.perseus, 11, 4, 'A'))
         return self._DisitckFwhybloadMpsA
 
     @DebugIt()
@@ -6481,8 +6619,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwhybloadMpsB(self):
-        value = perseus_utils.read_direct(self.perseus, 11, 'B')
-        self._DisitckFwhybloadMpsB = (value >> 4) & 1
+        self._DisitckFwhybloadMpsB = int(perseus_utils.read_bit_direct(self.perseus, 11, 4, 'B'))
         return self._DisitckFwhybloadMpsB
 
     @DebugIt()
@@ -6494,8 +6631,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwhybloadDiagA(self):
-        value = perseus_utils.read_direct(self.perseus, 11, 'A')
-        self._DisitckFwhybloadDiagA = (value >> 5) & 1
+        self._DisitckFwhybloadDiagA = int(perseus_utils.read_bit_direct(self.perseus, 11, 5, 'A'))
         return self._DisitckFwhybloadDiagA
 
     @DebugIt()
@@ -6507,8 +6643,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckFwhybloadDiagB(self):
-        value = perseus_utils.read_direct(self.perseus, 11, 'B')
-        self._DisitckFwhybloadDiagB = (value >> 5) & 1
+        self._DisitckFwhybloadDiagB = int(perseus_utils.read_bit_direct(self.perseus, 11, 5, 'B'))
         return self._DisitckFwhybloadDiagB
 
     @DebugIt()
@@ -6520,8 +6655,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcavDacsoffloopsstbyA(self):
-        value = perseus_utils.read_direct(self.perseus, 12, 'A')
-        self._DisitckRvcavDacsoffloopsstbyA = (value >> 0) & 1
+        self._DisitckRvcavDacsoffloopsstbyA = int(perseus_utils.read_bit_direct(self.perseus, 12, 0, 'A'))
         return self._DisitckRvcavDacsoffloopsstbyA
 
     @DebugIt()
@@ -6533,8 +6667,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcavDacsoffloopsstbyB(self):
-        value = perseus_utils.read_direct(self.perseus, 12, 'B')
-        self._DisitckRvcavDacsoffloopsstbyB = (value >> 0) & 1
+        self._DisitckRvcavDacsoffloopsstbyB = int(perseus_utils.read_bit_direct(self.perseus, 12, 0, 'B'))
         return self._DisitckRvcavDacsoffloopsstbyB
 
     @DebugIt()
@@ -6546,8 +6679,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcavPindiodeswitchA(self):
-        value = perseus_utils.read_direct(self.perseus, 12, 'A')
-        self._DisitckRvcavPindiodeswitchA = (value >> 1) & 1
+        self._DisitckRvcavPindiodeswitchA = int(perseus_utils.read_bit_direct(self.perseus, 12, 1, 'A'))
         return self._DisitckRvcavPindiodeswitchA
 
     @DebugIt()
@@ -6559,8 +6691,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcavPindiodeswitchB(self):
-        value = perseus_utils.read_direct(self.perseus, 12, 'B')
-        self._DisitckRvcavPindiodeswitchB = (value >> 1) & 1
+        self._DisitckRvcavPindiodeswitchB = int(perseus_utils.read_bit_direct(self.perseus, 12, 1, 'B'))
         return self._DisitckRvcavPindiodeswitchB
 
     @DebugIt()
@@ -6572,8 +6703,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcavFdltrgA(self):
-        value = perseus_utils.read_direct(self.perseus, 12, 'A')
-        self._DisitckRvcavFdltrgA = (value >> 2) & 1
+        self._DisitckRvcavFdltrgA = int(perseus_utils.read_bit_direct(self.perseus, 12, 2, 'A'))
         return self._DisitckRvcavFdltrgA
 
     @DebugIt()
@@ -6585,8 +6715,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcavFdltrgB(self):
-        value = perseus_utils.read_direct(self.perseus, 12, 'B')
-        self._DisitckRvcavFdltrgB = (value >> 2) & 1
+        self._DisitckRvcavFdltrgB = int(perseus_utils.read_bit_direct(self.perseus, 12, 2, 'B'))
         return self._DisitckRvcavFdltrgB
 
     @DebugIt()
@@ -6598,8 +6727,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcavPlctxoffA(self):
-        value = perseus_utils.read_direct(self.perseus, 12, 'A')
-        self._DisitckRvcavPlctxoffA = (value >> 3) & 1
+        self._DisitckRvcavPlctxoffA = int(perseus_utils.read_bit_direct(self.perseus, 12, 3, 'A'))
         return self._DisitckRvcavPlctxoffA
 
     @DebugIt()
@@ -6611,8 +6739,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcavPlctxoffB(self):
-        value = perseus_utils.read_direct(self.perseus, 12, 'B')
-        self._DisitckRvcavPlctxoffB = (value >> 3) & 1
+        self._DisitckRvcavPlctxoffB = int(perseus_utils.read_bit_direct(self.perseus, 12, 3, 'B'))
         return self._DisitckRvcavPlctxoffB
 
     @DebugIt()
@@ -6624,8 +6751,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcavMpsA(self):
-        value = perseus_utils.read_direct(self.perseus, 12, 'A')
-        self._DisitckRvcavMpsA = (value >> 4) & 1
+        self._DisitckRvcavMpsA = int(perseus_utils.read_bit_direct(self.perseus, 12, 4, 'A'))
         return self._DisitckRvcavMpsA
 
     @DebugIt()
@@ -6637,8 +6763,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcavMpsB(self):
-        value = perseus_utils.read_direct(self.perseus, 12, 'B')
-        self._DisitckRvcavMpsB = (value >> 4) & 1
+        self._DisitckRvcavMpsB = int(perseus_utils.read_bit_direct(self.perseus, 12, 4, 'B'))
         return self._DisitckRvcavMpsB
 
     @DebugIt()
@@ -6650,8 +6775,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcavDiagA(self):
-        value = perseus_utils.read_direct(self.perseus, 12, 'A')
-        self._DisitckRvcavDiagA = (value >> 5) & 1
+        self._DisitckRvcavDiagA = int(perseus_utils.read_bit_direct(self.perseus, 12, 5, 'A'))
         return self._DisitckRvcavDiagA
 
     @DebugIt()
@@ -6663,8 +6787,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckRvcavDiagB(self):
-        value = perseus_utils.read_direct(self.perseus, 12, 'B')
-        self._DisitckRvcavDiagB = (value >> 5) & 1
+        self._DisitckRvcavDiagB = int(perseus_utils.read_bit_direct(self.perseus, 12, 5, 'B'))
         return self._DisitckRvcavDiagB
 
     @DebugIt()
@@ -6676,8 +6799,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckArcsDacsoffloopsstbyA(self):
-        value = perseus_utils.read_direct(self.perseus, 13, 'A')
-        self._DisitckArcsDacsoffloopsstbyA = (value >> 0) & 1
+        self._DisitckArcsDacsoffloopsstbyA = int(perseus_utils.read_bit_direct(self.perseus, 13, 0, 'A'))
         return self._DisitckArcsDacsoffloopsstbyA
 
     @DebugIt()
@@ -6689,8 +6811,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckArcsDacsoffloopsstbyB(self):
-        value = perseus_utils.read_direct(self.perseus, 13, 'B')
-        self._DisitckArcsDacsoffloopsstbyB = (value >> 0) & 1
+        self._DisitckArcsDacsoffloopsstbyB = int(perseus_utils.read_bit_direct(self.perseus, 13, 0, 'B'))
         return self._DisitckArcsDacsoffloopsstbyB
 
     @DebugIt()
@@ -6702,8 +6823,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckArcsPindiodeswitchA(self):
-        value = perseus_utils.read_direct(self.perseus, 13, 'A')
-        self._DisitckArcsPindiodeswitchA = (value >> 1) & 1
+        self._DisitckArcsPindiodeswitchA = int(perseus_utils.read_bit_direct(self.perseus, 13, 1, 'A'))
         return self._DisitckArcsPindiodeswitchA
 
     @DebugIt()
@@ -6715,8 +6835,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckArcsPindiodeswitchB(self):
-        value = perseus_utils.read_direct(self.perseus, 13, 'B')
-        self._DisitckArcsPindiodeswitchB = (value >> 1) & 1
+        self._DisitckArcsPindiodeswitchB = int(perseus_utils.read_bit_direct(self.perseus, 13, 1, 'B'))
         return self._DisitckArcsPindiodeswitchB
 
     @DebugIt()
@@ -6728,8 +6847,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckArcsFdltrgA(self):
-        value = perseus_utils.read_direct(self.perseus, 13, 'A')
-        self._DisitckArcsFdltrgA = (value >> 2) & 1
+        self._DisitckArcsFdltrgA = int(perseus_utils.read_bit_direct(self.perseus, 13, 2, 'A'))
         return self._DisitckArcsFdltrgA
 
     @DebugIt()
@@ -6741,8 +6859,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckArcsFdltrgB(self):
-        value = perseus_utils.read_direct(self.perseus, 13, 'B')
-        self._DisitckArcsFdltrgB = (value >> 2) & 1
+        self._DisitckArcsFdltrgB = int(perseus_utils.read_bit_direct(self.perseus, 13, 2, 'B'))
         return self._DisitckArcsFdltrgB
 
     @DebugIt()
@@ -6754,8 +6871,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckArcsPlctxoffA(self):
-        value = perseus_utils.read_direct(self.perseus, 13, 'A')
-        self._DisitckArcsPlctxoffA = (value >> 3) & 1
+        self._DisitckArcsPlctxoffA = int(perseus_utils.read_bit_direct(self.perseus, 13, 3, 'A'))
         return self._DisitckArcsPlctxoffA
 
     @DebugIt()
@@ -6767,8 +6883,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckArcsPlctxoffB(self):
-        value = perseus_utils.read_direct(self.perseus, 13, 'B')
-        self._DisitckArcsPlctxoffB = (value >> 3) & 1
+        self._DisitckArcsPlctxoffB = int(perseus_utils.read_bit_direct(self.perseus, 13, 3, 'B'))
         return self._DisitckArcsPlctxoffB
 
     @DebugIt()
@@ -6780,8 +6895,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckArcsMpsA(self):
-        value = perseus_utils.read_direct(self.perseus, 13, 'A')
-        self._DisitckArcsMpsA = (value >> 4) & 1
+        self._DisitckArcsMpsA = int(perseus_utils.read_bit_direct(self.perseus, 13, 4, 'A'))
         return self._DisitckArcsMpsA
 
     @DebugIt()
@@ -6793,8 +6907,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckArcsMpsB(self):
-        value = perseus_utils.read_direct(self.perseus, 13, 'B')
-        self._DisitckArcsMpsB = (value >> 4) & 1
+        self._DisitckArcsMpsB = int(perseus_utils.read_bit_direct(self.perseus, 13, 4, 'B'))
         return self._DisitckArcsMpsB
 
     @DebugIt()
@@ -6806,8 +6919,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckArcsDiagA(self):
-        value = perseus_utils.read_direct(self.perseus, 13, 'A')
-        self._DisitckArcsDiagA = (value >> 5) & 1
+        self._DisitckArcsDiagA = int(perseus_utils.read_bit_direct(self.perseus, 13, 5, 'A'))
         return self._DisitckArcsDiagA
 
     @DebugIt()
@@ -6819,8 +6931,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckArcsDiagB(self):
-        value = perseus_utils.read_direct(self.perseus, 13, 'B')
-        self._DisitckArcsDiagB = (value >> 5) & 1
+        self._DisitckArcsDiagB = int(perseus_utils.read_bit_direct(self.perseus, 13, 5, 'B'))
         return self._DisitckArcsDiagB
 
     @DebugIt()
@@ -6832,8 +6943,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckVacuumDacsoffloopsstbyA(self):
-        value = perseus_utils.read_direct(self.perseus, 14, 'A')
-        self._DisitckVacuumDacsoffloopsstbyA = (value >> 0) & 1
+        self._DisitckVacuumDacsoffloopsstbyA = int(perseus_utils.read_bit_direct(self.perseus, 14, 0, 'A'))
         return self._DisitckVacuumDacsoffloopsstbyA
 
     @DebugIt()
@@ -6845,8 +6955,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckVacuumDacsoffloopsstbyB(self):
-        value = perseus_utils.read_direct(self.perseus, 14, 'B')
-        self._DisitckVacuumDacsoffloopsstbyB = (value >> 0) & 1
+        self._DisitckVacuumDacsoffloopsstbyB = int(perseus_utils.read_bit_direct(self.perseus, 14, 0, 'B'))
         return self._DisitckVacuumDacsoffloopsstbyB
 
     @DebugIt()
@@ -6858,8 +6967,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckVacuumPindiodeswitchA(self):
-        value = perseus_utils.read_direct(self.perseus, 14, 'A')
-        self._DisitckVacuumPindiodeswitchA = (value >> 1) & 1
+        self._DisitckVacuumPindiodeswitchA = int(perseus_utils.read_bit_direct(self.perseus, 14, 1, 'A'))
         return self._DisitckVacuumPindiodeswitchA
 
     @DebugIt()
@@ -6871,8 +6979,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckVacuumPindiodeswitchB(self):
-        value = perseus_utils.read_direct(self.perseus, 14, 'B')
-        self._DisitckVacuumPindiodeswitchB = (value >> 1) & 1
+        self._DisitckVacuumPindiodeswitchB = int(perseus_utils.read_bit_direct(self.perseus, 14, 1, 'B'))
         return self._DisitckVacuumPindiodeswitchB
 
     @DebugIt()
@@ -6884,8 +6991,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckVacuumFdltrgA(self):
-        value = perseus_utils.read_direct(self.perseus, 14, 'A')
-        self._DisitckVacuumFdltrgA = (value >> 2) & 1
+        self._DisitckVacuumFdltrgA = int(perseus_utils.read_bit_direct(self.perseus, 14, 2, 'A'))
         return self._DisitckVacuumFdltrgA
 
     @DebugIt()
@@ -6897,8 +7003,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckVacuumFdltrgB(self):
-        value = perseus_utils.read_direct(self.perseus, 14, 'B')
-        self._DisitckVacuumFdltrgB = (value >> 2) & 1
+        self._DisitckVacuumFdltrgB = int(perseus_utils.read_bit_direct(self.perseus, 14, 2, 'B'))
         return self._DisitckVacuumFdltrgB
 
     @DebugIt()
@@ -6910,8 +7015,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckVacuumPlctxoffA(self):
-        value = perseus_utils.read_direct(self.perseus, 14, 'A')
-        self._DisitckVacuumPlctxoffA = (value >> 3) & 1
+        self._DisitckVacuumPlctxoffA = int(perseus_utils.read_bit_direct(self.perseus, 14, 3, 'A'))
         return self._DisitckVacuumPlctxoffA
 
     @DebugIt()
@@ -6923,8 +7027,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckVacuumPlctxoffB(self):
-        value = perseus_utils.read_direct(self.perseus, 14, 'B')
-        self._DisitckVacuumPlctxoffB = (value >> 3) & 1
+        self._DisitckVacuumPlctxoffB = int(perseus_utils.read_bit_direct(self.perseus, 14, 3, 'B'))
         return self._DisitckVacuumPlctxoffB
 
     @DebugIt()
@@ -6936,8 +7039,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckVacuumMpsA(self):
-        value = perseus_utils.read_direct(self.perseus, 14, 'A')
-        self._DisitckVacuumMpsA = (value >> 4) & 1
+        self._DisitckVacuumMpsA = int(perseus_utils.read_bit_direct(self.perseus, 14, 4, 'A'))
         return self._DisitckVacuumMpsA
 
     @DebugIt()
@@ -6949,8 +7051,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckVacuumMpsB(self):
-        value = perseus_utils.read_direct(self.perseus, 14, 'B')
-        self._DisitckVacuumMpsB = (value >> 4) & 1
+        self._DisitckVacuumMpsB = int(perseus_utils.read_bit_direct(self.perseus, 14, 4, 'B'))
         return self._DisitckVacuumMpsB
 
     @DebugIt()
@@ -6962,8 +7063,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckVacuumDiagA(self):
-        value = perseus_utils.read_direct(self.perseus, 14, 'A')
-        self._DisitckVacuumDiagA = (value >> 5) & 1
+        self._DisitckVacuumDiagA = int(perseus_utils.read_bit_direct(self.perseus, 14, 5, 'A'))
         return self._DisitckVacuumDiagA
 
     @DebugIt()
@@ -6975,8 +7075,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckVacuumDiagB(self):
-        value = perseus_utils.read_direct(self.perseus, 14, 'B')
-        self._DisitckVacuumDiagB = (value >> 5) & 1
+        self._DisitckVacuumDiagB = int(perseus_utils.read_bit_direct(self.perseus, 14, 5, 'B'))
         return self._DisitckVacuumDiagB
 
     @DebugIt()
@@ -6988,8 +7087,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckManualInterlockDacsoffloopsstbyA(self):
-        value = perseus_utils.read_direct(self.perseus, 15, 'A')
-        self._DisitckManualInterlockDacsoffloopsstbyA = (value >> 0) & 1
+        self._DisitckManualInterlockDacsoffloopsstbyA = int(perseus_utils.read_bit_direct(self.perseus, 15, 0, 'A'))
         return self._DisitckManualInterlockDacsoffloopsstbyA
 
     @DebugIt()
@@ -7001,8 +7099,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckManualInterlockDacsoffloopsstbyB(self):
-        value = perseus_utils.read_direct(self.perseus, 15, 'B')
-        self._DisitckManualInterlockDacsoffloopsstbyB = (value >> 0) & 1
+        self._DisitckManualInterlockDacsoffloopsstbyB = int(perseus_utils.read_bit_direct(self.perseus, 15, 0, 'B'))
         return self._DisitckManualInterlockDacsoffloopsstbyB
 
     @DebugIt()
@@ -7014,8 +7111,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckManualInterlockPindiodeswitchA(self):
-        value = perseus_utils.read_direct(self.perseus, 15, 'A')
-        self._DisitckManualInterlockPindiodeswitchA = (value >> 1) & 1
+        self._DisitckManualInterlockPindiodeswitchA = int(perseus_utils.read_bit_direct(self.perseus, 15, 1, 'A'))
         return self._DisitckManualInterlockPindiodeswitchA
 
     @DebugIt()
@@ -7027,8 +7123,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckManualInterlockPindiodeswitchB(self):
-        value = perseus_utils.read_direct(self.perseus, 15, 'B')
-        self._DisitckManualInterlockPindiodeswitchB = (value >> 1) & 1
+        self._DisitckManualInterlockPindiodeswitchB = int(perseus_utils.read_bit_direct(self.perseus, 15, 1, 'B'))
         return self._DisitckManualInterlockPindiodeswitchB
 
     @DebugIt()
@@ -7040,8 +7135,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckManualInterlockFdltrgA(self):
-        value = perseus_utils.read_direct(self.perseus, 15, 'A')
-        self._DisitckManualInterlockFdltrgA = (value >> 2) & 1
+        self._DisitckManualInterlockFdltrgA = int(perseus_utils.read_bit_direct(self.perseus, 15, 2, 'A'))
         return self._DisitckManualInterlockFdltrgA
 
     @DebugIt()
@@ -7053,8 +7147,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckManualInterlockFdltrgB(self):
-        value = perseus_utils.read_direct(self.perseus, 15, 'B')
-        self._DisitckManualInterlockFdltrgB = (value >> 2) & 1
+        self._DisitckManualInterlockFdltrgB = int(perseus_utils.read_bit_direct(self.perseus, 15, 2, 'B'))
         return self._DisitckManualInterlockFdltrgB
 
     @DebugIt()
@@ -7066,8 +7159,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckManualInterlockPlctxoffA(self):
-        value = perseus_utils.read_direct(self.perseus, 15, 'A')
-        self._DisitckManualInterlockPlctxoffA = (value >> 3) & 1
+        self._DisitckManualInterlockPlctxoffA = int(perseus_utils.read_bit_direct(self.perseus, 15, 3, 'A'))
         return self._DisitckManualInterlockPlctxoffA
 
     @DebugIt()
@@ -7079,8 +7171,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckManualInterlockPlctxoffB(self):
-        value = perseus_utils.read_direct(self.perseus, 15, 'B')
-        self._DisitckManualInterlockPlctxoffB = (value >> 3) & 1
+        self._DisitckManualInterlockPlctxoffB = int(perseus_utils.read_bit_direct(self.perseus, 15, 3, 'B'))
         return self._DisitckManualInterlockPlctxoffB
 
     @DebugIt()
@@ -7092,8 +7183,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckManualInterlockMpsA(self):
-        value = perseus_utils.read_direct(self.perseus, 15, 'A')
-        self._DisitckManualInterlockMpsA = (value >> 4) & 1
+        self._DisitckManualInterlockMpsA = int(perseus_utils.read_bit_direct(self.perseus, 15, 4, 'A'))
         return self._DisitckManualInterlockMpsA
 
     @DebugIt()
@@ -7105,8 +7195,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckManualInterlockMpsB(self):
-        value = perseus_utils.read_direct(self.perseus, 15, 'B')
-        self._DisitckManualInterlockMpsB = (value >> 4) & 1
+        self._DisitckManualInterlockMpsB = int(perseus_utils.read_bit_direct(self.perseus, 15, 4, 'B'))
         return self._DisitckManualInterlockMpsB
 
     @DebugIt()
@@ -7118,8 +7207,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckManualInterlockDiagA(self):
-        value = perseus_utils.read_direct(self.perseus, 15, 'A')
-        self._DisitckManualInterlockDiagA = (value >> 5) & 1
+        self._DisitckManualInterlockDiagA = int(perseus_utils.read_bit_direct(self.perseus, 15, 5, 'A'))
         return self._DisitckManualInterlockDiagA
 
     @DebugIt()
@@ -7131,8 +7219,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckManualInterlockDiagB(self):
-        value = perseus_utils.read_direct(self.perseus, 15, 'B')
-        self._DisitckManualInterlockDiagB = (value >> 5) & 1
+        self._DisitckManualInterlockDiagB = int(perseus_utils.read_bit_direct(self.perseus, 15, 5, 'B'))
         return self._DisitckManualInterlockDiagB
 
     @DebugIt()
@@ -7144,8 +7231,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesUpDacsoffloopsstbyA(self):
-        value = perseus_utils.read_direct(self.perseus, 16, 'A')
-        self._DisitckPlungerEndSwitchesUpDacsoffloopsstbyA = (value >> 0) & 1
+        self._DisitckPlungerEndSwitchesUpDacsoffloopsstbyA = int(perseus_utils.read_bit_direct(self.perseus, 16, 0, 'A'))
         return self._DisitckPlungerEndSwitchesUpDacsoffloopsstbyA
 
     @DebugIt()
@@ -7157,8 +7243,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesUpDacsoffloopsstbyB(self):
-        value = perseus_utils.read_direct(self.perseus, 16, 'B')
-        self._DisitckPlungerEndSwitchesUpDacsoffloopsstbyB = (value >> 0) & 1
+        self._DisitckPlungerEndSwitchesUpDacsoffloopsstbyB = int(perseus_utils.read_bit_direct(self.perseus, 16, 0, 'B'))
         return self._DisitckPlungerEndSwitchesUpDacsoffloopsstbyB
 
     @DebugIt()
@@ -7170,8 +7255,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesUpPindiodeswitchA(self):
-        value = perseus_utils.read_direct(self.perseus, 16, 'A')
-        self._DisitckPlungerEndSwitchesUpPindiodeswitchA = (value >> 1) & 1
+        self._DisitckPlungerEndSwitchesUpPindiodeswitchA = int(perseus_utils.read_bit_direct(self.perseus, 16, 1, 'A'))
         return self._DisitckPlungerEndSwitchesUpPindiodeswitchA
 
     @DebugIt()
@@ -7183,8 +7267,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesUpPindiodeswitchB(self):
-        value = perseus_utils.read_direct(self.perseus, 16, 'B')
-        self._DisitckPlungerEndSwitchesUpPindiodeswitchB = (value >> 1) & 1
+        self._DisitckPlungerEndSwitchesUpPindiodeswitchB = int(perseus_utils.read_bit_direct(self.perseus, 16, 1, 'B'))
         return self._DisitckPlungerEndSwitchesUpPindiodeswitchB
 
     @DebugIt()
@@ -7196,8 +7279,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesUpFdltrgA(self):
-        value = perseus_utils.read_direct(self.perseus, 16, 'A')
-        self._DisitckPlungerEndSwitchesUpFdltrgA = (value >> 2) & 1
+        self._DisitckPlungerEndSwitchesUpFdltrgA = int(perseus_utils.read_bit_direct(self.perseus, 16, 2, 'A'))
         return self._DisitckPlungerEndSwitchesUpFdltrgA
 
     @DebugIt()
@@ -7209,8 +7291,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesUpFdltrgB(self):
-        value = perseus_utils.read_direct(self.perseus, 16, 'B')
-        self._DisitckPlungerEndSwitchesUpFdltrgB = (value >> 2) & 1
+        self._DisitckPlungerEndSwitchesUpFdltrgB = int(perseus_utils.read_bit_direct(self.perseus, 16, 2, 'B'))
         return self._DisitckPlungerEndSwitchesUpFdltrgB
 
     @DebugIt()
@@ -7222,8 +7303,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesUpPlctxoffA(self):
-        value = perseus_utils.read_direct(self.perseus, 16, 'A')
-        self._DisitckPlungerEndSwitchesUpPlctxoffA = (value >> 3) & 1
+        self._DisitckPlungerEndSwitchesUpPlctxoffA = int(perseus_utils.read_bit_direct(self.perseus, 16, 3, 'A'))
         return self._DisitckPlungerEndSwitchesUpPlctxoffA
 
     @DebugIt()
@@ -7235,8 +7315,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesUpPlctxoffB(self):
-        value = perseus_utils.read_direct(self.perseus, 16, 'B')
-        self._DisitckPlungerEndSwitchesUpPlctxoffB = (value >> 3) & 1
+        self._DisitckPlungerEndSwitchesUpPlctxoffB = int(perseus_utils.read_bit_direct(self.perseus, 16, 3, 'B'))
         return self._DisitckPlungerEndSwitchesUpPlctxoffB
 
     @DebugIt()
@@ -7248,8 +7327,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesUpMpsA(self):
-        value = perseus_utils.read_direct(self.perseus, 16, 'A')
-        self._DisitckPlungerEndSwitchesUpMpsA = (value >> 4) & 1
+        self._DisitckPlungerEndSwitchesUpMpsA = int(perseus_utils.read_bit_direct(self.perseus, 16, 4, 'A'))
         return self._DisitckPlungerEndSwitchesUpMpsA
 
     @DebugIt()
@@ -7261,8 +7339,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesUpMpsB(self):
-        value = perseus_utils.read_direct(self.perseus, 16, 'B')
-        self._DisitckPlungerEndSwitchesUpMpsB = (value >> 4) & 1
+        self._DisitckPlungerEndSwitchesUpMpsB = int(perseus_utils.read_bit_direct(self.perseus, 16, 4, 'B'))
         return self._DisitckPlungerEndSwitchesUpMpsB
 
     @DebugIt()
@@ -7274,8 +7351,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesUpDiagA(self):
-        value = perseus_utils.read_direct(self.perseus, 16, 'A')
-        self._DisitckPlungerEndSwitchesUpDiagA = (value >> 5) & 1
+        self._DisitckPlungerEndSwitchesUpDiagA = int(perseus_utils.read_bit_direct(self.perseus, 16, 5, 'A'))
         return self._DisitckPlungerEndSwitchesUpDiagA
 
     @DebugIt()
@@ -7287,8 +7363,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesUpDiagB(self):
-        value = perseus_utils.read_direct(self.perseus, 16, 'B')
-        self._DisitckPlungerEndSwitchesUpDiagB = (value >> 5) & 1
+        self._DisitckPlungerEndSwitchesUpDiagB = int(perseus_utils.read_bit_direct(self.perseus, 16, 5, 'B'))
         return self._DisitckPlungerEndSwitchesUpDiagB
 
     @DebugIt()
@@ -7300,8 +7375,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesDownDacsoffloopsstbyA(self):
-        value = perseus_utils.read_direct(self.perseus, 17, 'A')
-        self._DisitckPlungerEndSwitchesDownDacsoffloopsstbyA = (value >> 0) & 1
+        self._DisitckPlungerEndSwitchesDownDacsoffloopsstbyA = int(perseus_utils.read_bit_direct(self.perseus, 17, 0, 'A'))
         return self._DisitckPlungerEndSwitchesDownDacsoffloopsstbyA
 
     @DebugIt()
@@ -7313,8 +7387,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesDownDacsoffloopsstbyB(self):
-        value = perseus_utils.read_direct(self.perseus, 17, 'B')
-        self._DisitckPlungerEndSwitchesDownDacsoffloopsstbyB = (value >> 0) & 1
+        self._DisitckPlungerEndSwitchesDownDacsoffloopsstbyB = int(perseus_utils.read_bit_direct(self.perseus, 17, 0, 'B'))
         return self._DisitckPlungerEndSwitchesDownDacsoffloopsstbyB
 
     @DebugIt()
@@ -7326,8 +7399,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesDownPindiodeswitchA(self):
-        value = perseus_utils.read_direct(self.perseus, 17, 'A')
-        self._DisitckPlungerEndSwitchesDownPindiodeswitchA = (value >> 1) & 1
+        self._DisitckPlungerEndSwitchesDownPindiodeswitchA = int(perseus_utils.read_bit_direct(self.perseus, 17, 1, 'A'))
         return self._DisitckPlungerEndSwitchesDownPindiodeswitchA
 
     @DebugIt()
@@ -7339,8 +7411,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesDownPindiodeswitchB(self):
-        value = perseus_utils.read_direct(self.perseus, 17, 'B')
-        self._DisitckPlungerEndSwitchesDownPindiodeswitchB = (value >> 1) & 1
+        self._DisitckPlungerEndSwitchesDownPindiodeswitchB = int(perseus_utils.read_bit_direct(self.perseus, 17, 1, 'B'))
         return self._DisitckPlungerEndSwitchesDownPindiodeswitchB
 
     @DebugIt()
@@ -7352,8 +7423,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesDownFdltrgA(self):
-        value = perseus_utils.read_direct(self.perseus, 17, 'A')
-        self._DisitckPlungerEndSwitchesDownFdltrgA = (value >> 2) & 1
+        self._DisitckPlungerEndSwitchesDownFdltrgA = int(perseus_utils.read_bit_direct(self.perseus, 17, 2, 'A'))
         return self._DisitckPlungerEndSwitchesDownFdltrgA
 
     @DebugIt()
@@ -7365,8 +7435,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesDownFdltrgB(self):
-        value = perseus_utils.read_direct(self.perseus, 17, 'B')
-        self._DisitckPlungerEndSwitchesDownFdltrgB = (value >> 2) & 1
+        self._DisitckPlungerEndSwitchesDownFdltrgB = int(perseus_utils.read_bit_direct(self.perseus, 17, 2, 'B'))
         return self._DisitckPlungerEndSwitchesDownFdltrgB
 
     @DebugIt()
@@ -7378,8 +7447,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesDownPlctxoffA(self):
-        value = perseus_utils.read_direct(self.perseus, 17, 'A')
-        self._DisitckPlungerEndSwitchesDownPlctxoffA = (value >> 3) & 1
+        self._DisitckPlungerEndSwitchesDownPlctxoffA = int(perseus_utils.read_bit_direct(self.perseus, 17, 3, 'A'))
         return self._DisitckPlungerEndSwitchesDownPlctxoffA
 
     @DebugIt()
@@ -7391,8 +7459,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesDownPlctxoffB(self):
-        value = perseus_utils.read_direct(self.perseus, 17, 'B')
-        self._DisitckPlungerEndSwitchesDownPlctxoffB = (value >> 3) & 1
+        self._DisitckPlungerEndSwitchesDownPlctxoffB = int(perseus_utils.read_bit_direct(self.perseus, 17, 3, 'B'))
         return self._DisitckPlungerEndSwitchesDownPlctxoffB
 
     @DebugIt()
@@ -7404,8 +7471,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesDownMpsA(self):
-        value = perseus_utils.read_direct(self.perseus, 17, 'A')
-        self._DisitckPlungerEndSwitchesDownMpsA = (value >> 4) & 1
+        self._DisitckPlungerEndSwitchesDownMpsA = int(perseus_utils.read_bit_direct(self.perseus, 17, 4, 'A'))
         return self._DisitckPlungerEndSwitchesDownMpsA
 
     @DebugIt()
@@ -7417,8 +7483,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesDownMpsB(self):
-        value = perseus_utils.read_direct(self.perseus, 17, 'B')
-        self._DisitckPlungerEndSwitchesDownMpsB = (value >> 4) & 1
+        self._DisitckPlungerEndSwitchesDownMpsB = int(perseus_utils.read_bit_direct(self.perseus, 17, 4, 'B'))
         return self._DisitckPlungerEndSwitchesDownMpsB
 
     @DebugIt()
@@ -7430,8 +7495,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesDownDiagA(self):
-        value = perseus_utils.read_direct(self.perseus, 17, 'A')
-        self._DisitckPlungerEndSwitchesDownDiagA = (value >> 5) & 1
+        self._DisitckPlungerEndSwitchesDownDiagA = int(perseus_utils.read_bit_direct(self.perseus, 17, 5, 'A'))
         return self._DisitckPlungerEndSwitchesDownDiagA
 
     @DebugIt()
@@ -7443,8 +7507,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckPlungerEndSwitchesDownDiagB(self):
-        value = perseus_utils.read_direct(self.perseus, 17, 'B')
-        self._DisitckPlungerEndSwitchesDownDiagB = (value >> 5) & 1
+        self._DisitckPlungerEndSwitchesDownDiagB = int(perseus_utils.read_bit_direct(self.perseus, 17, 5, 'B'))
         return self._DisitckPlungerEndSwitchesDownDiagB
 
     @DebugIt()
@@ -7456,8 +7519,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckMpsDacsoffloopsstbyA(self):
-        value = perseus_utils.read_direct(self.perseus, 18, 'A')
-        self._DisitckMpsDacsoffloopsstbyA = (value >> 0) & 1
+        self._DisitckMpsDacsoffloopsstbyA = int(perseus_utils.read_bit_direct(self.perseus, 18, 0, 'A'))
         return self._DisitckMpsDacsoffloopsstbyA
 
     @DebugIt()
@@ -7469,8 +7531,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckMpsDacsoffloopsstbyB(self):
-        value = perseus_utils.read_direct(self.perseus, 18, 'B')
-        self._DisitckMpsDacsoffloopsstbyB = (value >> 0) & 1
+        self._DisitckMpsDacsoffloopsstbyB = int(perseus_utils.read_bit_direct(self.perseus, 18, 0, 'B'))
         return self._DisitckMpsDacsoffloopsstbyB
 
     @DebugIt()
@@ -7482,8 +7543,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckMpsPindiodeswitchA(self):
-        value = perseus_utils.read_direct(self.perseus, 18, 'A')
-        self._DisitckMpsPindiodeswitchA = (value >> 1) & 1
+        self._DisitckMpsPindiodeswitchA = int(perseus_utils.read_bit_direct(self.perseus, 18, 1, 'A'))
         return self._DisitckMpsPindiodeswitchA
 
     @DebugIt()
@@ -7495,8 +7555,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckMpsPindiodeswitchB(self):
-        value = perseus_utils.read_direct(self.perseus, 18, 'B')
-        self._DisitckMpsPindiodeswitchB = (value >> 1) & 1
+        self._DisitckMpsPindiodeswitchB = int(perseus_utils.read_bit_direct(self.perseus, 18, 1, 'B'))
         return self._DisitckMpsPindiodeswitchB
 
     @DebugIt()
@@ -7508,8 +7567,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckMpsFdltrgA(self):
-        value = perseus_utils.read_direct(self.perseus, 18, 'A')
-        self._DisitckMpsFdltrgA = (value >> 2) & 1
+        self._DisitckMpsFdltrgA = int(perseus_utils.read_bit_direct(self.perseus, 18, 2, 'A'))
         return self._DisitckMpsFdltrgA
 
     @DebugIt()
@@ -7521,8 +7579,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckMpsFdltrgB(self):
-        value = perseus_utils.read_direct(self.perseus, 18, 'B')
-        self._DisitckMpsFdltrgB = (value >> 2) & 1
+        self._DisitckMpsFdltrgB = int(perseus_utils.read_bit_direct(self.perseus, 18, 2, 'B'))
         return self._DisitckMpsFdltrgB
 
     @DebugIt()
@@ -7534,8 +7591,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckMpsPlctxoffA(self):
-        value = perseus_utils.read_direct(self.perseus, 18, 'A')
-        self._DisitckMpsPlctxoffA = (value >> 3) & 1
+        self._DisitckMpsPlctxoffA = int(perseus_utils.read_bit_direct(self.perseus, 18, 3, 'A'))
         return self._DisitckMpsPlctxoffA
 
     @DebugIt()
@@ -7547,8 +7603,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckMpsPlctxoffB(self):
-        value = perseus_utils.read_direct(self.perseus, 18, 'B')
-        self._DisitckMpsPlctxoffB = (value >> 3) & 1
+        self._DisitckMpsPlctxoffB = int(perseus_utils.read_bit_direct(self.perseus, 18, 3, 'B'))
         return self._DisitckMpsPlctxoffB
 
     @DebugIt()
@@ -7560,8 +7615,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckMpsMpsA(self):
-        value = perseus_utils.read_direct(self.perseus, 18, 'A')
-        self._DisitckMpsMpsA = (value >> 4) & 1
+        self._DisitckMpsMpsA = int(perseus_utils.read_bit_direct(self.perseus, 18, 4, 'A'))
         return self._DisitckMpsMpsA
 
     @DebugIt()
@@ -7573,8 +7627,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckMpsMpsB(self):
-        value = perseus_utils.read_direct(self.perseus, 18, 'B')
-        self._DisitckMpsMpsB = (value >> 4) & 1
+        self._DisitckMpsMpsB = int(perseus_utils.read_bit_direct(self.perseus, 18, 4, 'B'))
         return self._DisitckMpsMpsB
 
     @DebugIt()
@@ -7586,8 +7639,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckMpsDiagA(self):
-        value = perseus_utils.read_direct(self.perseus, 18, 'A')
-        self._DisitckMpsDiagA = (value >> 5) & 1
+        self._DisitckMpsDiagA = int(perseus_utils.read_bit_direct(self.perseus, 18, 5, 'A'))
         return self._DisitckMpsDiagA
 
     @DebugIt()
@@ -7599,8 +7651,7 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def get_DisitckMpsDiagB(self):
-        value = perseus_utils.read_direct(self.perseus, 18, 'B')
-        self._DisitckMpsDiagB = (value >> 5) & 1
+        self._DisitckMpsDiagB = int(perseus_utils.read_bit_direct(self.perseus, 18, 5, 'B'))
         return self._DisitckMpsDiagB
 
     @DebugIt()
@@ -7612,347 +7663,347 @@ class NutaqDiags(Device):
 
     @DebugIt()
     def read_Diag_Irvtet1A(self):
-        return self._Diag_Irvtet1A
+        return self.get_diag("Diag_Irvtet1A", self._Diag_Irvtet1A)
 
     @DebugIt()
     def read_Diag_Irvtet1B(self):
-        return self._Diag_Irvtet1B
+        return self.get_diag("Diag_Irvtet1B", self._Diag_Irvtet1B)
 
     @DebugIt()
     def read_Diag_Qrvtet1A(self):
-        return self._Diag_Qrvtet1A
+        return self.get_diag("Diag_Qrvtet1A", self._Diag_Qrvtet1A)
 
     @DebugIt()
     def read_Diag_Qrvtet1B(self):
-        return self._Diag_Qrvtet1B
+        return self.get_diag("Diag_Qrvtet1B", self._Diag_Qrvtet1B)
 
     @DebugIt()
     def read_Diag_Amprvtet1A(self):
-        return self._Diag_Amprvtet1A
+        return self.get_diag("Diag_Amprvtet1A", self._Diag_Amprvtet1A)
 
     @DebugIt()
     def read_Diag_Amprvtet1B(self):
-        return self._Diag_Amprvtet1B
+        return self.get_diag("Diag_Amprvtet1B", self._Diag_Amprvtet1B)
 
     @DebugIt()
     def read_Diag_Phrvtet1A(self):
-        return self._Diag_Phrvtet1A
+        return self.get_diag("Diag_Phrvtet1A", self._Diag_Phrvtet1A)
 
     @DebugIt()
     def read_Diag_Phrvtet1B(self):
-        return self._Diag_Phrvtet1B
+        return self.get_diag("Diag_Phrvtet1B", self._Diag_Phrvtet1B)
 
     @DebugIt()
     def read_Diag_Irvtet2A(self):
-        return self._Diag_Irvtet2A
+        return self.get_diag("Diag_Irvtet2A", self._Diag_Irvtet2A)
 
     @DebugIt()
     def read_Diag_Irvtet2B(self):
-        return self._Diag_Irvtet2B
+        return self.get_diag("Diag_Irvtet2B", self._Diag_Irvtet2B)
 
     @DebugIt()
     def read_Diag_Qrvtet2A(self):
-        return self._Diag_Qrvtet2A
+        return self.get_diag("Diag_Qrvtet2A", self._Diag_Qrvtet2A)
 
     @DebugIt()
     def read_Diag_Qrvtet2B(self):
-        return self._Diag_Qrvtet2B
+        return self.get_diag("Diag_Qrvtet2B", self._Diag_Qrvtet2B)
 
     @DebugIt()
     def read_Diag_Amprvtet2A(self):
-        return self._Diag_Amprvtet2A
+        return self.get_diag("Diag_Amprvtet2A", self._Diag_Amprvtet2A)
 
     @DebugIt()
     def read_Diag_Amprvtet2B(self):
-        return self._Diag_Amprvtet2B
+        return self.get_diag("Diag_Amprvtet2B", self._Diag_Amprvtet2B)
 
     @DebugIt()
     def read_Diag_Phrvtet2A(self):
-        return self._Diag_Phrvtet2A
+        return self.get_diag("Diag_Phrvtet2A", self._Diag_Phrvtet2A)
 
     @DebugIt()
     def read_Diag_Phrvtet2B(self):
-        return self._Diag_Phrvtet2B
+        return self.get_diag("Diag_Phrvtet2B", self._Diag_Phrvtet2B)
 
     @DebugIt()
     def read_Diag_IfwcircA(self):
-        return self._Diag_IfwcircA
+        return self.get_diag("Diag_IfwcircA", self._Diag_IfwcircA)
 
     @DebugIt()
     def read_Diag_IfwcircB(self):
-        return self._Diag_IfwcircB
+        return self.get_diag("Diag_IfwcircB", self._Diag_IfwcircB)
 
     @DebugIt()
     def read_Diag_QfwcircA(self):
-        return self._Diag_QfwcircA
+        return self.get_diag("Diag_QfwcircA", self._Diag_QfwcircA)
 
     @DebugIt()
     def read_Diag_QfwcircB(self):
-        return self._Diag_QfwcircB
+        return self.get_diag("Diag_QfwcircB", self._Diag_QfwcircB)
 
     @DebugIt()
     def read_Diag_AmpfwcircA(self):
-        return self._Diag_AmpfwcircA
+        return self.get_diag("Diag_AmpfwcircA", self._Diag_AmpfwcircA)
 
     @DebugIt()
     def read_Diag_AmpfwcircB(self):
-        return self._Diag_AmpfwcircB
+        return self.get_diag("Diag_AmpfwcircB", self._Diag_AmpfwcircB)
 
     @DebugIt()
     def read_Diag_PhfwcircA(self):
-        return self._Diag_PhfwcircA
+        return self.get_diag("Diag_PhfwcircA", self._Diag_PhfwcircA)
 
     @DebugIt()
     def read_Diag_PhfwcircB(self):
-        return self._Diag_PhfwcircB
+        return self.get_diag("Diag_PhfwcircB", self._Diag_PhfwcircB)
 
     @DebugIt()
     def read_Diag_IrvcircA(self):
-        return self._Diag_IrvcircA
+        return self.get_diag("Diag_IrvcircA", self._Diag_IrvcircA)
 
     @DebugIt()
     def read_Diag_IrvcircB(self):
-        return self._Diag_IrvcircB
+        return self.get_diag("Diag_IrvcircB", self._Diag_IrvcircB)
 
     @DebugIt()
     def read_Diag_QrvcircA(self):
-        return self._Diag_QrvcircA
+        return self.get_diag("Diag_QrvcircA", self._Diag_QrvcircA)
 
     @DebugIt()
     def read_Diag_QrvcircB(self):
-        return self._Diag_QrvcircB
+        return self.get_diag("Diag_QrvcircB", self._Diag_QrvcircB)
 
     @DebugIt()
     def read_Diag_AmprvcircA(self):
-        return self._Diag_AmprvcircA
+        return self.get_diag("Diag_AmprvcircA", self._Diag_AmprvcircA)
 
     @DebugIt()
     def read_Diag_AmprvcircB(self):
-        return self._Diag_AmprvcircB
+        return self.get_diag("Diag_AmprvcircB", self._Diag_AmprvcircB)
 
     @DebugIt()
     def read_Diag_PhrvcircA(self):
-        return self._Diag_PhrvcircA
+        return self.get_diag("Diag_PhrvcircA", self._Diag_PhrvcircA)
 
     @DebugIt()
     def read_Diag_PhrvcircB(self):
-        return self._Diag_PhrvcircB
+        return self.get_diag("Diag_PhrvcircB", self._Diag_PhrvcircB)
 
     @DebugIt()
     def read_Diag_IfwloadA(self):
-        return self._Diag_IfwloadA
+        return self.get_diag("Diag_IfwloadA", self._Diag_IfwloadA)
 
     @DebugIt()
     def read_Diag_IfwloadB(self):
-        return self._Diag_IfwloadB
+        return self.get_diag("Diag_IfwloadB", self._Diag_IfwloadB)
 
     @DebugIt()
     def read_Diag_QfwloadA(self):
-        return self._Diag_QfwloadA
+        return self.get_diag("Diag_QfwloadA", self._Diag_QfwloadA)
 
     @DebugIt()
     def read_Diag_QfwloadB(self):
-        return self._Diag_QfwloadB
+        return self.get_diag("Diag_QfwloadB", self._Diag_QfwloadB)
 
     @DebugIt()
     def read_Diag_AmpfwloadA(self):
-        return self._Diag_AmpfwloadA
+        return self.get_diag("Diag_AmpfwloadA", self._Diag_AmpfwloadA)
 
     @DebugIt()
     def read_Diag_AmpfwloadB(self):
-        return self._Diag_AmpfwloadB
+        return self.get_diag("Diag_AmpfwloadB", self._Diag_AmpfwloadB)
 
     @DebugIt()
     def read_Diag_PhfwloadA(self):
-        return self._Diag_PhfwloadA
+        return self.get_diag("Diag_PhfwloadA", self._Diag_PhfwloadA)
 
     @DebugIt()
     def read_Diag_PhfwloadB(self):
-        return self._Diag_PhfwloadB
+        return self.get_diag("Diag_PhfwloadB", self._Diag_PhfwloadB)
 
     @DebugIt()
     def read_Diag_IfwhybloadA(self):
-        return self._Diag_IfwhybloadA
+        return self.get_diag("Diag_IfwhybloadA", self._Diag_IfwhybloadA)
 
     @DebugIt()
     def read_Diag_IfwhybloadB(self):
-        return self._Diag_IfwhybloadB
+        return self.get_diag("Diag_IfwhybloadB", self._Diag_IfwhybloadB)
 
     @DebugIt()
     def read_Diag_QfwhybloadA(self):
-        return self._Diag_QfwhybloadA
+        return self.get_diag("Diag_QfwhybloadA", self._Diag_QfwhybloadA)
 
     @DebugIt()
     def read_Diag_QfwhybloadB(self):
-        return self._Diag_QfwhybloadB
+        return self.get_diag("Diag_QfwhybloadB", self._Diag_QfwhybloadB)
 
     @DebugIt()
     def read_Diag_AmpfwhybloadA(self):
-        return self._Diag_AmpfwhybloadA
+        return self.get_diag("Diag_AmpfwhybloadA", self._Diag_AmpfwhybloadA)
 
     @DebugIt()
     def read_Diag_AmpfwhybloadB(self):
-        return self._Diag_AmpfwhybloadB
+        return self.get_diag("Diag_AmpfwhybloadB", self._Diag_AmpfwhybloadB)
 
     @DebugIt()
     def read_Diag_PhfwhybloadA(self):
-        return self._Diag_PhfwhybloadA
+        return self.get_diag("Diag_PhfwhybloadA", self._Diag_PhfwhybloadA)
 
     @DebugIt()
     def read_Diag_PhfwhybloadB(self):
-        return self._Diag_PhfwhybloadB
+        return self.get_diag("Diag_PhfwhybloadB", self._Diag_PhfwhybloadB)
 
     @DebugIt()
     def read_Diag_IrvcavA(self):
-        return self._Diag_IrvcavA
+        return self.get_diag("Diag_IrvcavA", self._Diag_IrvcavA)
 
     @DebugIt()
     def read_Diag_IrvcavB(self):
-        return self._Diag_IrvcavB
+        return self.get_diag("Diag_IrvcavB", self._Diag_IrvcavB)
 
     @DebugIt()
     def read_Diag_QrvcavA(self):
-        return self._Diag_QrvcavA
+        return self.get_diag("Diag_QrvcavA", self._Diag_QrvcavA)
 
     @DebugIt()
     def read_Diag_QrvcavB(self):
-        return self._Diag_QrvcavB
+        return self.get_diag("Diag_QrvcavB", self._Diag_QrvcavB)
 
     @DebugIt()
     def read_Diag_AmprvcavA(self):
-        return self._Diag_AmprvcavA
+        return self.get_diag("Diag_AmprvcavA", self._Diag_AmprvcavA)
 
     @DebugIt()
     def read_Diag_AmprvcavB(self):
-        return self._Diag_AmprvcavB
+        return self.get_diag("Diag_AmprvcavB", self._Diag_AmprvcavB)
 
     @DebugIt()
     def read_Diag_PhrvcavA(self):
-        return self._Diag_PhrvcavA
+        return self.get_diag("Diag_PhrvcavA", self._Diag_PhrvcavA)
 
     @DebugIt()
     def read_Diag_PhrvcavB(self):
-        return self._Diag_PhrvcavB
+        return self.get_diag("Diag_PhrvcavB", self._Diag_PhrvcavB)
 
     @DebugIt()
     def read_Diag_ImoA(self):
-        return self._Diag_ImoA
+        return self.get_diag("Diag_ImoA", self._Diag_ImoA)
 
     @DebugIt()
     def read_Diag_ImoB(self):
-        return self._Diag_ImoB
+        return self.get_diag("Diag_ImoB", self._Diag_ImoB)
 
     @DebugIt()
     def read_Diag_QmoA(self):
-        return self._Diag_QmoA
+        return self.get_diag("Diag_QmoA", self._Diag_QmoA)
 
     @DebugIt()
     def read_Diag_QmoB(self):
-        return self._Diag_QmoB
+        return self.get_diag("Diag_QmoB", self._Diag_QmoB)
 
     @DebugIt()
     def read_Diag_AmpmoA(self):
-        return self._Diag_AmpmoA
+        return self.get_diag("Diag_AmpmoA", self._Diag_AmpmoA)
 
     @DebugIt()
     def read_Diag_AmpmoB(self):
-        return self._Diag_AmpmoB
+        return self.get_diag("Diag_AmpmoB", self._Diag_AmpmoB)
 
     @DebugIt()
     def read_Diag_PhmoA(self):
-        return self._Diag_PhmoA
+        return self.get_diag("Diag_PhmoA", self._Diag_PhmoA)
 
     @DebugIt()
     def read_Diag_PhmoB(self):
-        return self._Diag_PhmoB
+        return self.get_diag("Diag_PhmoB", self._Diag_PhmoB)
 
     @DebugIt()
     def read_Diag_IlandauA(self):
-        return self._Diag_IlandauA
+        return self.get_diag("Diag_IlandauA", self._Diag_IlandauA)
 
     @DebugIt()
     def read_Diag_IlandauB(self):
-        return self._Diag_IlandauB
+        return self.get_diag("Diag_IlandauB", self._Diag_IlandauB)
 
     @DebugIt()
     def read_Diag_QlandauA(self):
-        return self._Diag_QlandauA
+        return self.get_diag("Diag_QlandauA", self._Diag_QlandauA)
 
     @DebugIt()
     def read_Diag_QlandauB(self):
-        return self._Diag_QlandauB
+        return self.get_diag("Diag_QlandauB", self._Diag_QlandauB)
 
     @DebugIt()
     def read_Diag_AmplandauA(self):
-        return self._Diag_AmplandauA
+        return self.get_diag("Diag_AmplandauA", self._Diag_AmplandauA)
 
     @DebugIt()
     def read_Diag_AmplandauB(self):
-        return self._Diag_AmplandauB
+        return self.get_diag("Diag_AmplandauB", self._Diag_AmplandauB)
 
     @DebugIt()
     def read_Diag_PhlandauA(self):
-        return self._Diag_PhlandauA
+        return self.get_diag("Diag_PhlandauA", self._Diag_PhlandauA)
 
     @DebugIt()
     def read_Diag_PhlandauB(self):
-        return self._Diag_PhlandauB
+        return self.get_diag("Diag_PhlandauB", self._Diag_PhlandauB)
 
     @DebugIt()
     def read_Diag_PlungerMovingManualTuningA(self):
-        return self._Diag_PlungerMovingManualTuningA
+        return self.get_diag("Diag_PlungerMovingManualTuningA", self._Diag_PlungerMovingManualTuningA)
 
     @DebugIt()
     def read_Diag_PlungerMovingManualTuningB(self):
-        return self._Diag_PlungerMovingManualTuningB
+        return self.get_diag("Diag_PlungerMovingManualTuningB", self._Diag_PlungerMovingManualTuningB)
 
     @DebugIt()
     def read_Diag_PlungerMovingUpManualTuningA(self):
-        return self._Diag_PlungerMovingUpManualTuningA
+        return self.get_diag("Diag_PlungerMovingUpManualTuningA", self._Diag_PlungerMovingUpManualTuningA)
 
     @DebugIt()
     def read_Diag_PlungerMovingUpManualTuningB(self):
-        return self._Diag_PlungerMovingUpManualTuningB
+        return self.get_diag("Diag_PlungerMovingUpManualTuningB", self._Diag_PlungerMovingUpManualTuningB)
 
     @DebugIt()
     def read_Diag_PlungerMovingAutomaticTuningA(self):
-        return self._Diag_PlungerMovingAutomaticTuningA
+        return self.get_diag("Diag_PlungerMovingAutomaticTuningA", self._Diag_PlungerMovingAutomaticTuningA)
 
     @DebugIt()
     def read_Diag_PlungerMovingAutomaticTuningB(self):
-        return self._Diag_PlungerMovingAutomaticTuningB
+        return self.get_diag("Diag_PlungerMovingAutomaticTuningB", self._Diag_PlungerMovingAutomaticTuningB)
 
     @DebugIt()
     def read_Diag_PlungerMovingUpAutomaticTuningA(self):
-        return self._Diag_PlungerMovingUpAutomaticTuningA
+        return self.get_diag("Diag_PlungerMovingUpAutomaticTuningA", self._Diag_PlungerMovingUpAutomaticTuningA)
 
     @DebugIt()
     def read_Diag_PlungerMovingUpAutomaticTuningB(self):
-        return self._Diag_PlungerMovingUpAutomaticTuningB
+        return self.get_diag("Diag_PlungerMovingUpAutomaticTuningB", self._Diag_PlungerMovingUpAutomaticTuningB)
 
     @DebugIt()
     def read_Diag_DephaseMoLandauA(self):
-        return self._Diag_DephaseMoLandauA
+        return self.get_diag("Diag_DephaseMoLandauA", self._Diag_DephaseMoLandauA)
 
     @DebugIt()
     def read_Diag_DephaseMoLandauB(self):
-        return self._Diag_DephaseMoLandauB
+        return self.get_diag("Diag_DephaseMoLandauB", self._Diag_DephaseMoLandauB)
 
     @DebugIt()
     def read_Diag_EndSwitchDownA(self):
-        return self._Diag_EndSwitchDownA
+        return self.get_diag("Diag_EndSwitchDownA", self._Diag_EndSwitchDownA)
 
     @DebugIt()
     def read_Diag_EndSwitchDownB(self):
-        return self._Diag_EndSwitchDownB
+        return self.get_diag("Diag_EndSwitchDownB", self._Diag_EndSwitchDownB)
 
     @DebugIt()
     def read_Diag_EndSwitchUpA(self):
-        return self._Diag_EndSwitchUpA
+        return self.get_diag("Diag_EndSwitchUpA", self._Diag_EndSwitchUpA)
 
     @DebugIt()
     def read_Diag_EndSwitchUpB(self):
-        return self._Diag_EndSwitchUpB
+        return self.get_diag("Diag_EndSwitchUpB", self._Diag_EndSwitchUpB)
 
     @DebugIt()
     def read_Diag_Rvtet1A(self):
@@ -7960,7 +8011,7 @@ class NutaqDiags(Device):
         position = 0
         cavity = 'A'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -7972,7 +8023,7 @@ class NutaqDiags(Device):
         position = 0
         cavity = 'B'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -7984,7 +8035,7 @@ class NutaqDiags(Device):
         position = 1
         cavity = 'A'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -7996,7 +8047,7 @@ class NutaqDiags(Device):
         position = 1
         cavity = 'B'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8008,7 +8059,7 @@ class NutaqDiags(Device):
         position = 2
         cavity = 'A'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8020,7 +8071,7 @@ class NutaqDiags(Device):
         position = 2
         cavity = 'B'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8032,7 +8083,7 @@ class NutaqDiags(Device):
         position = 3
         cavity = 'A'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8044,7 +8095,7 @@ class NutaqDiags(Device):
         position = 3
         cavity = 'B'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8056,7 +8107,7 @@ class NutaqDiags(Device):
         position = 4
         cavity = 'A'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8068,7 +8119,7 @@ class NutaqDiags(Device):
         position = 4
         cavity = 'B'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8080,7 +8131,7 @@ class NutaqDiags(Device):
         position = 5
         cavity = 'A'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8092,7 +8143,7 @@ class NutaqDiags(Device):
         position = 5
         cavity = 'B'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8104,7 +8155,7 @@ class NutaqDiags(Device):
         position = 6
         cavity = 'A'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8116,7 +8167,7 @@ class NutaqDiags(Device):
         position = 6
         cavity = 'B'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8128,7 +8179,7 @@ class NutaqDiags(Device):
         position = 7
         cavity = 'A'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8140,7 +8191,7 @@ class NutaqDiags(Device):
         position = 7
         cavity = 'B'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8152,7 +8203,7 @@ class NutaqDiags(Device):
         position = 8
         cavity = 'A'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8164,7 +8215,7 @@ class NutaqDiags(Device):
         position = 8
         cavity = 'B'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8176,7 +8227,7 @@ class NutaqDiags(Device):
         position = 9
         cavity = 'A'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8188,7 +8239,7 @@ class NutaqDiags(Device):
         position = 9
         cavity = 'B'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8200,7 +8251,7 @@ class NutaqDiags(Device):
         position = 10
         cavity = 'A'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8212,7 +8263,7 @@ class NutaqDiags(Device):
         position = 10
         cavity = 'B'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8224,7 +8275,7 @@ class NutaqDiags(Device):
         position = 11
         cavity = 'A'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8236,7 +8287,7 @@ class NutaqDiags(Device):
         position = 11
         cavity = 'B'
         if self._itck_number == 0:
-            address = 150
+            address = ITCK_CURRENT_ADDRESS
         else:
             address = address + self._itck_number
         return extra_func.read_diag_bit_direct(self.perseus, address, position, cavity)
@@ -8425,792 +8476,687 @@ class NutaqDiags(Device):
 
 
     @command
+    @prioritized(PRIORITY_ACQUISITION)
     def read_diagnostics(self):
-        perseus_utils.start_reading_diagnostics(self.perseus, 'A')
-        perseus_utils.start_reading_diagnostics(self.perseus, 'B')
-
-        self._Diag_Irvtet1A = perseus_utils.read_diag_milivolts(self.perseus, 0, 'A')
-        self.push_change_event("Diag_Irvtet1A", self._Diag_Irvtet1A)
-        self._Diag_Irvtet1B = perseus_utils.read_diag_milivolts(self.perseus, 0, 'B')
-        self.push_change_event("Diag_Irvtet1B", self._Diag_Irvtet1B)
-        self._Diag_Qrvtet1A = perseus_utils.read_diag_milivolts(self.perseus, 1, 'A')
-        self.push_change_event("Diag_Qrvtet1A", self._Diag_Qrvtet1A)
-        self._Diag_Qrvtet1B = perseus_utils.read_diag_milivolts(self.perseus, 1, 'B')
-        self.push_change_event("Diag_Qrvtet1B", self._Diag_Qrvtet1B)
-        self._Diag_Amprvtet1A = perseus_utils.read_diag_milivolts(self.perseus, 2, 'A')
-        self.push_change_event("Diag_Amprvtet1A", self._Diag_Amprvtet1A)
-        self._Diag_Amprvtet1B = perseus_utils.read_diag_milivolts(self.perseus, 2, 'B')
-        self.push_change_event("Diag_Amprvtet1B", self._Diag_Amprvtet1B)
-        self._Diag_Phrvtet1A = perseus_utils.read_diag_angle(self.perseus, 3, 'A')
-        self.push_change_event("Diag_Phrvtet1A", self._Diag_Phrvtet1A)
-        self._Diag_Phrvtet1B = perseus_utils.read_diag_angle(self.perseus, 3, 'B')
-        self.push_change_event("Diag_Phrvtet1B", self._Diag_Phrvtet1B)
-        self._Diag_Irvtet2A = perseus_utils.read_diag_milivolts(self.perseus, 4, 'A')
-        self.push_change_event("Diag_Irvtet2A", self._Diag_Irvtet2A)
-        self._Diag_Irvtet2B = perseus_utils.read_diag_milivolts(self.perseus, 4, 'B')
-        self.push_change_event("Diag_Irvtet2B", self._Diag_Irvtet2B)
-        self._Diag_Qrvtet2A = perseus_utils.read_diag_milivolts(self.perseus, 5, 'A')
-        self.push_change_event("Diag_Qrvtet2A", self._Diag_Qrvtet2A)
-        self._Diag_Qrvtet2B = perseus_utils.read_diag_milivolts(self.perseus, 5, 'B')
-        self.push_change_event("Diag_Qrvtet2B", self._Diag_Qrvtet2B)
-        self._Diag_Amprvtet2A = perseus_utils.read_diag_milivolts(self.perseus, 6, 'A')
-        self.push_change_event("Diag_Amprvtet2A", self._Diag_Amprvtet2A)
-        self._Diag_Amprvtet2B = perseus_utils.read_diag_milivolts(self.perseus, 6, 'B')
-        self.push_change_event("Diag_Amprvtet2B", self._Diag_Amprvtet2B)
-        self._Diag_Phrvtet2A = perseus_utils.read_diag_angle(self.perseus, 7, 'A')
-        self.push_change_event("Diag_Phrvtet2A", self._Diag_Phrvtet2A)
-        self._Diag_Phrvtet2B = perseus_utils.read_diag_angle(self.perseus, 7, 'B')
-        self.push_change_event("Diag_Phrvtet2B", self._Diag_Phrvtet2B)
-        self._Diag_IfwcircA = perseus_utils.read_diag_milivolts(self.perseus, 8, 'A')
-        self.push_change_event("Diag_IfwcircA", self._Diag_IfwcircA)
-        self._Diag_IfwcircB = perseus_utils.read_diag_milivolts(self.perseus, 8, 'B')
-        self.push_change_event("Diag_IfwcircB", self._Diag_IfwcircB)
-        self._Diag_QfwcircA = perseus_utils.read_diag_milivolts(self.perseus, 9, 'A')
-        self.push_change_event("Diag_QfwcircA", self._Diag_QfwcircA)
-        self._Diag_QfwcircB = perseus_utils.read_diag_milivolts(self.perseus, 9, 'B')
-        self.push_change_event("Diag_QfwcircB", self._Diag_QfwcircB)
-        self._Diag_AmpfwcircA = perseus_utils.read_diag_milivolts(self.perseus, 10, 'A')
-        self.push_change_event("Diag_AmpfwcircA", self._Diag_AmpfwcircA)
-        self._Diag_AmpfwcircB = perseus_utils.read_diag_milivolts(self.perseus, 10, 'B')
-        self.push_change_event("Diag_AmpfwcircB", self._Diag_AmpfwcircB)
-        self._Diag_PhfwcircA = perseus_utils.read_diag_angle(self.perseus, 11, 'A')
-        self.push_change_event("Diag_PhfwcircA", self._Diag_PhfwcircA)
-        self._Diag_PhfwcircB = perseus_utils.read_diag_angle(self.perseus, 11, 'B')
-        self.push_change_event("Diag_PhfwcircB", self._Diag_PhfwcircB)
-        self._Diag_IrvcircA = perseus_utils.read_diag_milivolts(self.perseus, 12, 'A')
-        self.push_change_event("Diag_IrvcircA", self._Diag_IrvcircA)
-        self._Diag_IrvcircB = perseus_utils.read_diag_milivolts(self.perseus, 12, 'B')
-        self.push_change_event("Diag_IrvcircB", self._Diag_IrvcircB)
-        self._Diag_QrvcircA = perseus_utils.read_diag_milivolts(self.perseus, 13, 'A')
-        self.push_change_event("Diag_QrvcircA", self._Diag_QrvcircA)
-        self._Diag_QrvcircB = perseus_utils.read_diag_milivolts(self.perseus, 13, 'B')
-        self.push_change_event("Diag_QrvcircB", self._Diag_QrvcircB)
-        self._Diag_AmprvcircA = perseus_utils.read_diag_milivolts(self.perseus, 14, 'A')
-        self.push_change_event("Diag_AmprvcircA", self._Diag_AmprvcircA)
-        self._Diag_AmprvcircB = perseus_utils.read_diag_milivolts(self.perseus, 14, 'B')
-        self.push_change_event("Diag_AmprvcircB", self._Diag_AmprvcircB)
-        self._Diag_PhrvcircA = perseus_utils.read_diag_angle(self.perseus, 15, 'A')
-        self.push_change_event("Diag_PhrvcircA", self._Diag_PhrvcircA)
-        self._Diag_PhrvcircB = perseus_utils.read_diag_angle(self.perseus, 15, 'B')
-        self.push_change_event("Diag_PhrvcircB", self._Diag_PhrvcircB)
-        self._Diag_IfwloadA = perseus_utils.read_diag_milivolts(self.perseus, 16, 'A')
-        self.push_change_event("Diag_IfwloadA", self._Diag_IfwloadA)
-        self._Diag_IfwloadB = perseus_utils.read_diag_milivolts(self.perseus, 16, 'B')
-        self.push_change_event("Diag_IfwloadB", self._Diag_IfwloadB)
-        self._Diag_QfwloadA = perseus_utils.read_diag_milivolts(self.perseus, 17, 'A')
-        self.push_change_event("Diag_QfwloadA", self._Diag_QfwloadA)
-        self._Diag_QfwloadB = perseus_utils.read_diag_milivolts(self.perseus, 17, 'B')
-        self.push_change_event("Diag_QfwloadB", self._Diag_QfwloadB)
-        self._Diag_AmpfwloadA = perseus_utils.read_diag_milivolts(self.perseus, 18, 'A')
-        self.push_change_event("Diag_AmpfwloadA", self._Diag_AmpfwloadA)
-        self._Diag_AmpfwloadB = perseus_utils.read_diag_milivolts(self.perseus, 18, 'B')
-        self.push_change_event("Diag_AmpfwloadB", self._Diag_AmpfwloadB)
-        self._Diag_PhfwloadA = perseus_utils.read_diag_angle(self.perseus, 19, 'A')
-        self.push_change_event("Diag_PhfwloadA", self._Diag_PhfwloadA)
-        self._Diag_PhfwloadB = perseus_utils.read_diag_angle(self.perseus, 19, 'B')
-        self.push_change_event("Diag_PhfwloadB", self._Diag_PhfwloadB)
-        self._Diag_IfwhybloadA = perseus_utils.read_diag_milivolts(self.perseus, 20, 'A')
-        self.push_change_event("Diag_IfwhybloadA", self._Diag_IfwhybloadA)
-        self._Diag_IfwhybloadB = perseus_utils.read_diag_milivolts(self.perseus, 20, 'B')
-        self.push_change_event("Diag_IfwhybloadB", self._Diag_IfwhybloadB)
-        self._Diag_QfwhybloadA = perseus_utils.read_diag_milivolts(self.perseus, 21, 'A')
-        self.push_change_event("Diag_QfwhybloadA", self._Diag_QfwhybloadA)
-        self._Diag_QfwhybloadB = perseus_utils.read_diag_milivolts(self.perseus, 21, 'B')
-        self.push_change_event("Diag_QfwhybloadB", self._Diag_QfwhybloadB)
-        self._Diag_AmpfwhybloadA = perseus_utils.read_diag_milivolts(self.perseus, 22, 'A')
-        self.push_change_event("Diag_AmpfwhybloadA", self._Diag_AmpfwhybloadA)
-        self._Diag_AmpfwhybloadB = perseus_utils.read_diag_milivolts(self.perseus, 22, 'B')
-        self.push_change_event("Diag_AmpfwhybloadB", self._Diag_AmpfwhybloadB)
-        self._Diag_PhfwhybloadA = perseus_utils.read_diag_angle(self.perseus, 23, 'A')
-        self.push_change_event("Diag_PhfwhybloadA", self._Diag_PhfwhybloadA)
-        self._Diag_PhfwhybloadB = perseus_utils.read_diag_angle(self.perseus, 23, 'B')
-        self.push_change_event("Diag_PhfwhybloadB", self._Diag_PhfwhybloadB)
-        self._Diag_IrvcavA = perseus_utils.read_diag_milivolts(self.perseus, 24, 'A')
-        self.push_change_event("Diag_IrvcavA", self._Diag_IrvcavA)
-        self._Diag_IrvcavB = perseus_utils.read_diag_milivolts(self.perseus, 24, 'B')
-        self.push_change_event("Diag_IrvcavB", self._Diag_IrvcavB)
-        self._Diag_QrvcavA = perseus_utils.read_diag_milivolts(self.perseus, 25, 'A')
-        self.push_change_event("Diag_QrvcavA", self._Diag_QrvcavA)
-        self._Diag_QrvcavB = perseus_utils.read_diag_milivolts(self.perseus, 25, 'B')
-        self.push_change_event("Diag_QrvcavB", self._Diag_QrvcavB)
-        self._Diag_AmprvcavA = perseus_utils.read_diag_milivolts(self.perseus, 26, 'A')
-        self.push_change_event("Diag_AmprvcavA", self._Diag_AmprvcavA)
-        self._Diag_AmprvcavB = perseus_utils.read_diag_milivolts(self.perseus, 26, 'B')
-        self.push_change_event("Diag_AmprvcavB", self._Diag_AmprvcavB)
-        self._Diag_PhrvcavA = perseus_utils.read_diag_angle(self.perseus, 27, 'A')
-        self.push_change_event("Diag_PhrvcavA", self._Diag_PhrvcavA)
-        self._Diag_PhrvcavB = perseus_utils.read_diag_angle(self.perseus, 27, 'B')
-        self.push_change_event("Diag_PhrvcavB", self._Diag_PhrvcavB)
-        self._Diag_ImoA = perseus_utils.read_diag_milivolts(self.perseus, 28, 'A')
-        self.push_change_event("Diag_ImoA", self._Diag_ImoA)
-        self._Diag_ImoB = perseus_utils.read_diag_milivolts(self.perseus, 28, 'B')
-        self.push_change_event("Diag_ImoB", self._Diag_ImoB)
-        self._Diag_QmoA = perseus_utils.read_diag_milivolts(self.perseus, 29, 'A')
-        self.push_change_event("Diag_QmoA", self._Diag_QmoA)
-        self._Diag_QmoB = perseus_utils.read_diag_milivolts(self.perseus, 29, 'B')
-        self.push_change_event("Diag_QmoB", self._Diag_QmoB)
-        self._Diag_AmpmoA = perseus_utils.read_diag_milivolts(self.perseus, 30, 'A')
-        self.push_change_event("Diag_AmpmoA", self._Diag_AmpmoA)
-        self._Diag_AmpmoB = perseus_utils.read_diag_milivolts(self.perseus, 30, 'B')
-        self.push_change_event("Diag_AmpmoB", self._Diag_AmpmoB)
-        self._Diag_PhmoA = perseus_utils.read_diag_angle(self.perseus, 31, 'A')
-        self.push_change_event("Diag_PhmoA", self._Diag_PhmoA)
-        self._Diag_PhmoB = perseus_utils.read_diag_angle(self.perseus, 31, 'B')
-        self.push_change_event("Diag_PhmoB", self._Diag_PhmoB)
-        self._Diag_IlandauA = perseus_utils.read_diag_milivolts(self.perseus, 32, 'A')
-        self.push_change_event("Diag_IlandauA", self._Diag_IlandauA)
-        self._Diag_IlandauB = perseus_utils.read_diag_milivolts(self.perseus, 32, 'B')
-        self.push_change_event("Diag_IlandauB", self._Diag_IlandauB)
-        self._Diag_QlandauA = perseus_utils.read_diag_milivolts(self.perseus, 33, 'A')
-        self.push_change_event("Diag_QlandauA", self._Diag_QlandauA)
-        self._Diag_QlandauB = perseus_utils.read_diag_milivolts(self.perseus, 33, 'B')
-        self.push_change_event("Diag_QlandauB", self._Diag_QlandauB)
-        self._Diag_AmplandauA = perseus_utils.read_diag_milivolts(self.perseus, 34, 'A')
-        self.push_change_event("Diag_AmplandauA", self._Diag_AmplandauA)
-        self._Diag_AmplandauB = perseus_utils.read_diag_milivolts(self.perseus, 34, 'B')
-        self.push_change_event("Diag_AmplandauB", self._Diag_AmplandauB)
-        self._Diag_PhlandauA = perseus_utils.read_diag_angle(self.perseus, 35, 'A')
-        self.push_change_event("Diag_PhlandauA", self._Diag_PhlandauA)
-        self._Diag_PhlandauB = perseus_utils.read_diag_angle(self.perseus, 35, 'B')
-        self.push_change_event("Diag_PhlandauB", self._Diag_PhlandauB)
-        self._Diag_PlungerMovingManualTuningA = bool(perseus_utils.read_diag_direct(self.perseus, 60, 'A'))
-        self.push_change_event("Diag_PlungerMovingManualTuningA", self._Diag_PlungerMovingManualTuningA)
-        self._Diag_PlungerMovingManualTuningB = bool(perseus_utils.read_diag_direct(self.perseus, 60, 'B'))
-        self.push_change_event("Diag_PlungerMovingManualTuningB", self._Diag_PlungerMovingManualTuningB)
-        self._Diag_PlungerMovingUpManualTuningA = bool(perseus_utils.read_diag_direct(self.perseus, 61, 'A'))
-        self.push_change_event("Diag_PlungerMovingUpManualTuningA", self._Diag_PlungerMovingUpManualTuningA)
-        self._Diag_PlungerMovingUpManualTuningB = bool(perseus_utils.read_diag_direct(self.perseus, 61, 'B'))
-        self.push_change_event("Diag_PlungerMovingUpManualTuningB", self._Diag_PlungerMovingUpManualTuningB)
-        self._Diag_PlungerMovingAutomaticTuningA = bool(perseus_utils.read_diag_direct(self.perseus, 62, 'A'))
-        self.push_change_event("Diag_PlungerMovingAutomaticTuningA", self._Diag_PlungerMovingAutomaticTuningA)
-        self._Diag_PlungerMovingAutomaticTuningB = bool(perseus_utils.read_diag_direct(self.perseus, 62, 'B'))
-        self.push_change_event("Diag_PlungerMovingAutomaticTuningB", self._Diag_PlungerMovingAutomaticTuningB)
-        self._Diag_PlungerMovingUpAutomaticTuningA = bool(perseus_utils.read_diag_direct(self.perseus, 63, 'A'))
-        self.push_change_event("Diag_PlungerMovingUpAutomaticTuningA", self._Diag_PlungerMovingUpAutomaticTuningA)
-        self._Diag_PlungerMovingUpAutomaticTuningB = bool(perseus_utils.read_diag_direct(self.perseus, 63, 'B'))
-        self.push_change_event("Diag_PlungerMovingUpAutomaticTuningB", self._Diag_PlungerMovingUpAutomaticTuningB)
-        self._Diag_DephaseMoLandauA = perseus_utils.read_diag_angle(self.perseus, 64, 'A')
-        self.push_change_event("Diag_DephaseMoLandauA", self._Diag_DephaseMoLandauA)
-        self._Diag_DephaseMoLandauB = perseus_utils.read_diag_angle(self.perseus, 64, 'B')
-        self.push_change_event("Diag_DephaseMoLandauB", self._Diag_DephaseMoLandauB)
-        self._Diag_EndSwitchDownA = bool(perseus_utils.read_diag_direct(self.perseus, 70, 'A'))
-        self.push_change_event("Diag_EndSwitchDownA", self._Diag_EndSwitchDownA)
-        self._Diag_EndSwitchDownB = bool(perseus_utils.read_diag_direct(self.perseus, 70, 'B'))
-        self.push_change_event("Diag_EndSwitchDownB", self._Diag_EndSwitchDownB)
-        self._Diag_EndSwitchUpA = bool(perseus_utils.read_diag_direct(self.perseus, 71, 'A'))
-        self.push_change_event("Diag_EndSwitchUpA", self._Diag_EndSwitchUpA)
-        self._Diag_EndSwitchUpB = bool(perseus_utils.read_diag_direct(self.perseus, 71, 'B'))
-        self.push_change_event("Diag_EndSwitchUpB", self._Diag_EndSwitchUpB)
-        self._Diag_Rvtet1A = self.read_Diag_Rvtet1A()
-        self.push_change_event("Diag_Rvtet1A", self._Diag_Rvtet1A)
-        self._Diag_Rvtet1B = self.read_Diag_Rvtet1B()
-        self.push_change_event("Diag_Rvtet1B", self._Diag_Rvtet1B)
-        self._Diag_Rvtet2A = self.read_Diag_Rvtet2A()
-        self.push_change_event("Diag_Rvtet2A", self._Diag_Rvtet2A)
-        self._Diag_Rvtet2B = self.read_Diag_Rvtet2B()
-        self.push_change_event("Diag_Rvtet2B", self._Diag_Rvtet2B)
-        self._Diag_RvcircA = self.read_Diag_RvcircA()
-        self.push_change_event("Diag_RvcircA", self._Diag_RvcircA)
-        self._Diag_RvcircB = self.read_Diag_RvcircB()
-        self.push_change_event("Diag_RvcircB", self._Diag_RvcircB)
-        self._Diag_FwloadA = self.read_Diag_FwloadA()
-        self.push_change_event("Diag_FwloadA", self._Diag_FwloadA)
-        self._Diag_FwloadB = self.read_Diag_FwloadB()
-        self.push_change_event("Diag_FwloadB", self._Diag_FwloadB)
-        self._Diag_FwhybloadA = self.read_Diag_FwhybloadA()
-        self.push_change_event("Diag_FwhybloadA", self._Diag_FwhybloadA)
-        self._Diag_FwhybloadB = self.read_Diag_FwhybloadB()
-        self.push_change_event("Diag_FwhybloadB", self._Diag_FwhybloadB)
-        self._Diag_RvcavA = self.read_Diag_RvcavA()
-        self.push_change_event("Diag_RvcavA", self._Diag_RvcavA)
-        self._Diag_RvcavB = self.read_Diag_RvcavB()
-        self.push_change_event("Diag_RvcavB", self._Diag_RvcavB)
-        self._Diag_ArcsA = self.read_Diag_ArcsA()
-        self.push_change_event("Diag_ArcsA", self._Diag_ArcsA)
-        self._Diag_ArcsB = self.read_Diag_ArcsB()
-        self.push_change_event("Diag_ArcsB", self._Diag_ArcsB)
-        self._Diag_VacuumA = self.read_Diag_VacuumA()
-        self.push_change_event("Diag_VacuumA", self._Diag_VacuumA)
-        self._Diag_VacuumB = self.read_Diag_VacuumB()
-        self.push_change_event("Diag_VacuumB", self._Diag_VacuumB)
-        self._Diag_ManualInterlockA = self.read_Diag_ManualInterlockA()
-        self.push_change_event("Diag_ManualInterlockA", self._Diag_ManualInterlockA)
-        self._Diag_ManualInterlockB = self.read_Diag_ManualInterlockB()
-        self.push_change_event("Diag_ManualInterlockB", self._Diag_ManualInterlockB)
-        self._Diag_ExternalItckA = self.read_Diag_ExternalItckA()
-        self.push_change_event("Diag_ExternalItckA", self._Diag_ExternalItckA)
-        self._Diag_ExternalItckB = self.read_Diag_ExternalItckB()
-        self.push_change_event("Diag_ExternalItckB", self._Diag_ExternalItckB)
-        self._Diag_PlungerEndSwitchUpA = self.read_Diag_PlungerEndSwitchUpA()
-        self.push_change_event("Diag_PlungerEndSwitchUpA", self._Diag_PlungerEndSwitchUpA)
-        self._Diag_PlungerEndSwitchUpB = self.read_Diag_PlungerEndSwitchUpB()
-        self.push_change_event("Diag_PlungerEndSwitchUpB", self._Diag_PlungerEndSwitchUpB)
-        self._Diag_PlungerEndSwitchDownA = self.read_Diag_PlungerEndSwitchDownA()
-        self.push_change_event("Diag_PlungerEndSwitchDownA", self._Diag_PlungerEndSwitchDownA)
-        self._Diag_PlungerEndSwitchDownB = self.read_Diag_PlungerEndSwitchDownB()
-        self.push_change_event("Diag_PlungerEndSwitchDownB", self._Diag_PlungerEndSwitchDownB)
-        self._Diag_Timestamp1A = self.read_Diag_Timestamp1A()
-        self.push_change_event("Diag_Timestamp1A", self._Diag_Timestamp1A)
-        self._Diag_Timestamp1B = self.read_Diag_Timestamp1B()
-        self.push_change_event("Diag_Timestamp1B", self._Diag_Timestamp1B)
-        self._Diag_Timestamp2A = self.read_Diag_Timestamp2A()
-        self.push_change_event("Diag_Timestamp2A", self._Diag_Timestamp2A)
-        self._Diag_Timestamp2B = self.read_Diag_Timestamp2B()
-        self.push_change_event("Diag_Timestamp2B", self._Diag_Timestamp2B)
-        self._Diag_Timestamp3A = self.read_Diag_Timestamp3A()
-        self.push_change_event("Diag_Timestamp3A", self._Diag_Timestamp3A)
-        self._Diag_Timestamp3B = self.read_Diag_Timestamp3B()
-        self.push_change_event("Diag_Timestamp3B", self._Diag_Timestamp3B)
-        self._Diag_Timestamp4A = self.read_Diag_Timestamp4A()
-        self.push_change_event("Diag_Timestamp4A", self._Diag_Timestamp4A)
-        self._Diag_Timestamp4B = self.read_Diag_Timestamp4B()
-        self.push_change_event("Diag_Timestamp4B", self._Diag_Timestamp4B)
-        self._Diag_Timestamp5A = self.read_Diag_Timestamp5A()
-        self.push_change_event("Diag_Timestamp5A", self._Diag_Timestamp5A)
-        self._Diag_Timestamp5B = self.read_Diag_Timestamp5B()
-        self.push_change_event("Diag_Timestamp5B", self._Diag_Timestamp5B)
-        self._Diag_Timestamp6A = self.read_Diag_Timestamp6A()
-        self.push_change_event("Diag_Timestamp6A", self._Diag_Timestamp6A)
-        self._Diag_Timestamp6B = self.read_Diag_Timestamp6B()
-        self.push_change_event("Diag_Timestamp6B", self._Diag_Timestamp6B)
-        self._Diag_Timestamp7A = self.read_Diag_Timestamp7A()
-        self.push_change_event("Diag_Timestamp7A", self._Diag_Timestamp7A)
-        self._Diag_Timestamp7B = self.read_Diag_Timestamp7B()
-        self.push_change_event("Diag_Timestamp7B", self._Diag_Timestamp7B)
-        self._Diag_DacsDisableCommandA = self.read_Diag_DacsDisableCommandA()
-        self.push_change_event("Diag_DacsDisableCommandA", self._Diag_DacsDisableCommandA)
-        self._Diag_DacsDisableCommandB = self.read_Diag_DacsDisableCommandB()
-        self.push_change_event("Diag_DacsDisableCommandB", self._Diag_DacsDisableCommandB)
-        self._Diag_PinSwitchA = self.read_Diag_PinSwitchA()
-        self.push_change_event("Diag_PinSwitchA", self._Diag_PinSwitchA)
-        self._Diag_PinSwitchB = self.read_Diag_PinSwitchB()
-        self.push_change_event("Diag_PinSwitchB", self._Diag_PinSwitchB)
-        self._Diag_FdlTriggerToLoopsdiagboardA = self.read_Diag_FdlTriggerToLoopsdiagboardA()
-        self.push_change_event("Diag_FdlTriggerToLoopsdiagboardA", self._Diag_FdlTriggerToLoopsdiagboardA)
-        self._Diag_FdlTriggerToLoopsdiagboardB = self.read_Diag_FdlTriggerToLoopsdiagboardB()
-        self.push_change_event("Diag_FdlTriggerToLoopsdiagboardB", self._Diag_FdlTriggerToLoopsdiagboardB)
-        self._Diag_OutputToPlcA = self.read_Diag_OutputToPlcA()
-        self.push_change_event("Diag_OutputToPlcA", self._Diag_OutputToPlcA)
-        self._Diag_OutputToPlcB = self.read_Diag_OutputToPlcB()
-        self.push_change_event("Diag_OutputToPlcB", self._Diag_OutputToPlcB)
-        self._Diag_OutputToMpsA = self.read_Diag_OutputToMpsA()
-        self.push_change_event("Diag_OutputToMpsA", self._Diag_OutputToMpsA)
-        self._Diag_OutputToMpsB = self.read_Diag_OutputToMpsB()
-        self.push_change_event("Diag_OutputToMpsB", self._Diag_OutputToMpsB)
+        self.diag_connection_error = None
+        with perseus_utils.latched_diagnostics(self.perseus, 'A', 'B'):
+            timestamp = time.time()
+            with self.perseus.bits.sweep():
+                self.read_diag_values()
+        self.publish_diagnostics(timestamp)
+
+    def read_diag_values(self):
+        self._Diag_Irvtet1A = self.update_diag("Diag_Irvtet1A", perseus_utils.read_diag_milivolts, self.perseus, 0, 'A')
+        self._Diag_Irvtet1B = self.update_diag("Diag_Irvtet1B", perseus_utils.read_diag_milivolts, self.perseus, 0, 'B')
+        self._Diag_Qrvtet1A = self.update_diag("Diag_Qrvtet1A", perseus_utils.read_diag_milivolts, self.perseus, 1, 'A')
+        self._Diag_Qrvtet1B = self.update_diag("Diag_Qrvtet1B", perseus_utils.read_diag_milivolts, self.perseus, 1, 'B')
+        self._Diag_Amprvtet1A = self.update_diag("Diag_Amprvtet1A", perseus_utils.read_diag_milivolts, self.perseus, 2, 'A')
+        self._Diag_Amprvtet1B = self.update_diag("Diag_Amprvtet1B", perseus_utils.read_diag_milivolts, self.perseus, 2, 'B')
+        self._Diag_Phrvtet1A = self.update_diag("Diag_Phrvtet1A", perseus_utils.read_diag_angle, self.perseus, 3, 'A')
+        self._Diag_Phrvtet1B = self.update_diag("Diag_Phrvtet1B", perseus_utils.read_diag_angle, self.perseus, 3, 'B')
+        self._Diag_Irvtet2A = self.update_diag("Diag_Irvtet2A", perseus_utils.read_diag_milivolts, self.perseus, 4, 'A')
+        self._Diag_Irvtet2B = self.update_diag("Diag_Irvtet2B", perseus_utils.read_diag_milivolts, self.perseus, 4, 'B')
+        self._Diag_Qrvtet2A = self.update_diag("Diag_Qrvtet2A", perseus_utils.read_diag_milivolts, self.perseus, 5, 'A')
+        self._Diag_Qrvtet2B = self.update_diag("Diag_Qrvtet2B", perseus_utils.read_diag_milivolts, self.perseus, 5, 'B')
+        self._Diag_Amprvtet2A = self.update_diag("Diag_Amprvtet2A", perseus_utils.read_diag_milivolts, self.perseus, 6, 'A')
+        self._Diag_Amprvtet2B = self.update_diag("Diag_Amprvtet2B", perseus_utils.read_diag_milivolts, self.perseus, 6, 'B')
+        self._Diag_Phrvtet2A = self.update_diag("Diag_Phrvtet2A", perseus_utils.read_diag_angle, self.perseus, 7, 'A')
+        self._Diag_Phrvtet2B = self.update_diag("Diag_Phrvtet2B", perseus_utils.read_diag_angle, self.perseus, 7, 'B')
+        self._Diag_IfwcircA = self.update_diag("Diag_IfwcircA", perseus_utils.read_diag_milivolts, self.perseus, 8, 'A')
+        self._Diag_IfwcircB = self.update_diag("Diag_IfwcircB", perseus_utils.read_diag_milivolts, self.perseus, 8, 'B')
+        self._Diag_QfwcircA = self.update_diag("Diag_QfwcircA", perseus_utils.read_diag_milivolts, self.perseus, 9, 'A')
+        self._Diag_QfwcircB = self.update_diag("Diag_QfwcircB", perseus_utils.read_diag_milivolts, self.perseus, 9, 'B')
+        self._Diag_AmpfwcircA = self.update_diag("Diag_AmpfwcircA", perseus_utils.read_diag_milivolts, self.perseus, 10, 'A')
+        self._Diag_AmpfwcircB = self.update_diag("Diag_AmpfwcircB", perseus_utils.read_diag_milivolts, self.perseus, 10, 'B')
+        self._Diag_PhfwcircA = self.update_diag("Diag_PhfwcircA", perseus_utils.read_diag_angle, self.perseus, 11, 'A')
+        self._Diag_PhfwcircB = self.update_diag("Diag_PhfwcircB", perseus_utils.read_diag_angle, self.perseus, 11, 'B')
+        self._Diag_IrvcircA = self.update_diag("Diag_IrvcircA", perseus_utils.read_diag_milivolts, self.perseus, 12, 'A')
+        self._Diag_IrvcircB = self.update_diag("Diag_IrvcircB", perseus_utils.read_diag_milivolts, self.perseus, 12, 'B')
+        self._Diag_QrvcircA = self.update_diag("Diag_QrvcircA", perseus_utils.read_diag_milivolts, self.perseus, 13, 'A')
+        self._Diag_QrvcircB = self.update_diag("Diag_QrvcircB", perseus_utils.read_diag_milivolts, self.perseus, 13, 'B')
+        self._Diag_AmprvcircA = self.update_diag("Diag_AmprvcircA", perseus_utils.read_diag_milivolts, self.perseus, 14, 'A')
+        self._Diag_AmprvcircB = self.update_diag("Diag_AmprvcircB", perseus_utils.read_diag_milivolts, self.perseus, 14, 'B')
+        self._Diag_PhrvcircA = self.update_diag("Diag_PhrvcircA", perseus_utils.read_diag_angle, self.perseus, 15, 'A')
+        self._Diag_PhrvcircB = self.update_diag("Diag_PhrvcircB", perseus_utils.read_diag_angle, self.perseus, 15, 'B')
+        self._Diag_IfwloadA = self.update_diag("Diag_IfwloadA", perseus_utils.read_diag_milivolts, self.perseus, 16, 'A')
+        self._Diag_IfwloadB = self.update_diag("Diag_IfwloadB", perseus_utils.read_diag_milivolts, self.perseus, 16, 'B')
+        self._Diag_QfwloadA = self.update_diag("Diag_QfwloadA", perseus_utils.read_diag_milivolts, self.perseus, 17, 'A')
+        self._Diag_QfwloadB = self.update_diag("Diag_QfwloadB", perseus_utils.read_diag_milivolts, self.perseus, 17, 'B')
+        self._Diag_AmpfwloadA = self.update_diag("Diag_AmpfwloadA", perseus_utils.read_diag_milivolts, self.perseus, 18, 'A')
+        self._Diag_AmpfwloadB = self.update_diag("Diag_AmpfwloadB", perseus_utils.read_diag_milivolts, self.perseus, 18, 'B')
+        self._Diag_PhfwloadA = self.update_diag("Diag_PhfwloadA", perseus_utils.read_diag_angle, self.perseus, 19, 'A')
+        self._Diag_PhfwloadB = self.update_diag("Diag_PhfwloadB", perseus_utils.read_diag_angle, self.perseus, 19, 'B')
+        self._Diag_IfwhybloadA = self.update_diag("Diag_IfwhybloadA", perseus_utils.read_diag_milivolts, self.perseus, 20, 'A')
+        self._Diag_IfwhybloadB = self.update_diag("Diag_IfwhybloadB", perseus_utils.read_diag_milivolts, self.perseus, 20, 'B')
+        self._Diag_QfwhybloadA = self.update_diag("Diag_QfwhybloadA", perseus_utils.read_diag_milivolts, self.perseus, 21, 'A')
+        self._Diag_QfwhybloadB = self.update_diag("Diag_QfwhybloadB", perseus_utils.read_diag_milivolts, self.perseus, 21, 'B')
+        self._Diag_AmpfwhybloadA = self.update_diag("Diag_AmpfwhybloadA", perseus_utils.read_diag_milivolts, self.perseus, 22, 'A')
+        self._Diag_AmpfwhybloadB = self.update_diag("Diag_AmpfwhybloadB", perseus_utils.read_diag_milivolts, self.perseus, 22, 'B')
+        self._Diag_PhfwhybloadA = self.update_diag("Diag_PhfwhybloadA", perseus_utils.read_diag_angle, self.perseus, 23, 'A')
+        self._Diag_PhfwhybloadB = self.update_diag("Diag_PhfwhybloadB", perseus_utils.read_diag_angle, self.perseus, 23, 'B')
+        self._Diag_IrvcavA = self.update_diag("Diag_IrvcavA", perseus_utils.read_diag_milivolts, self.perseus, 24, 'A')
+        self._Diag_IrvcavB = self.update_diag("Diag_IrvcavB", perseus_utils.read_diag_milivolts, self.perseus, 24, 'B')
+        self._Diag_QrvcavA = self.update_diag("Diag_QrvcavA", perseus_utils.read_diag_milivolts, self.perseus, 25, 'A')
+        self._Diag_QrvcavB = self.update_diag("Diag_QrvcavB", perseus_utils.read_diag_milivolts, self.perseus, 25, 'B')
+        self._Diag_AmprvcavA = self.update_diag("Diag_AmprvcavA", perseus_utils.read_diag_milivolts, self.perseus, 26, 'A')
+        self._Diag_AmprvcavB = self.update_diag("Diag_AmprvcavB", perseus_utils.read_diag_milivolts, self.perseus, 26, 'B')
+        self._Diag_PhrvcavA = self.update_diag("Diag_PhrvcavA", perseus_utils.read_diag_angle, self.perseus, 27, 'A')
+        self._Diag_PhrvcavB = self.update_diag("Diag_PhrvcavB", perseus_utils.read_diag_angle, self.perseus, 27, 'B')
+        self._Diag_ImoA = self.update_diag("Diag_ImoA", perseus_utils.read_diag_milivolts, self.perseus, 28, 'A')
+        self._Diag_ImoB = self.update_diag("Diag_ImoB", perseus_utils.read_diag_milivolts, self.perseus, 28, 'B')
+        self._Diag_QmoA = self.update_diag("Diag_QmoA", perseus_utils.read_diag_milivolts, self.perseus, 29, 'A')
+        self._Diag_QmoB = self.update_diag("Diag_QmoB", perseus_utils.read_diag_milivolts, self.perseus, 29, 'B')
+        self._Diag_AmpmoA = self.update_diag("Diag_AmpmoA", perseus_utils.read_diag_milivolts, self.perseus, 30, 'A')
+        self._Diag_AmpmoB = self.update_diag("Diag_AmpmoB", perseus_utils.read_diag_milivolts, self.perseus, 30, 'B')
+        self._Diag_PhmoA = self.update_diag("Diag_PhmoA", perseus_utils.read_diag_angle, self.perseus, 31, 'A')
+        self._Diag_PhmoB = self.update_diag("Diag_PhmoB", perseus_utils.read_diag_angle, self.perseus, 31, 'B')
+        self._Diag_IlandauA = self.update_diag("Diag_IlandauA", perseus_utils.read_diag_milivolts, self.perseus, 32, 'A')
+        self._Diag_IlandauB = self.update_diag("Diag_IlandauB", perseus_utils.read_diag_milivolts, self.perseus, 32, 'B')
+        self._Diag_QlandauA = self.update_diag("Diag_QlandauA", perseus_utils.read_diag_milivolts, self.perseus, 33, 'A')
+        self._Diag_QlandauB = self.update_diag("Diag_QlandauB", perseus_utils.read_diag_milivolts, self.perseus, 33, 'B')
+        self._Diag_AmplandauA = self.update_diag("Diag_AmplandauA", perseus_utils.read_diag_milivolts, self.perseus, 34, 'A')
+        self._Diag_AmplandauB = self.update_diag("Diag_AmplandauB", perseus_utils.read_diag_milivolts, self.perseus, 34, 'B')
+        self._Diag_PhlandauA = self.update_diag("Diag_PhlandauA", perseus_utils.read_diag_angle, self.perseus, 35, 'A')
+        self._Diag_PhlandauB = self.update_diag("Diag_PhlandauB", perseus_utils.read_diag_angle, self.perseus, 35, 'B')
+        self._Diag_PlungerMovingManualTuningA = self.update_diag("Diag_PlungerMovingManualTuningA", perseus_utils.read_diag_bool, self.perseus, 60, 'A')
+        self._Diag_PlungerMovingManualTuningB = self.update_diag("Diag_PlungerMovingManualTuningB", perseus_utils.read_diag_bool, self.perseus, 60, 'B')
+        self._Diag_PlungerMovingUpManualTuningA = self.update_diag("Diag_PlungerMovingUpManualTuningA", perseus_utils.read_diag_bool, self.perseus, 61, 'A')
+        self._Diag_PlungerMovingUpManualTuningB = self.update_diag("Diag_PlungerMovingUpManualTuningB", perseus_utils.read_diag_bool, self.perseus, 61, 'B')
+        self._Diag_PlungerMovingAutomaticTuningA = self.update_diag("Diag_PlungerMovingAutomaticTuningA", perseus_utils.read_diag_bool, self.perseus, 62, 'A')
+        self._Diag_PlungerMovingAutomaticTuningB = self.update_diag("Diag_PlungerMovingAutomaticTuningB", perseus_utils.read_diag_bool, self.perseus, 62, 'B')
+        self._Diag_PlungerMovingUpAutomaticTuningA = self.update_diag("Diag_PlungerMovingUpAutomaticTuningA", perseus_utils.read_diag_bool, self.perseus, 63, 'A')
+        self._Diag_PlungerMovingUpAutomaticTuningB = self.update_diag("Diag_PlungerMovingUpAutomaticTuningB", perseus_utils.read_diag_bool, self.perseus, 63, 'B')
+        self._Diag_DephaseMoLandauA = self.update_diag("Diag_DephaseMoLandauA", perseus_utils.read_diag_angle, self.perseus, 64, 'A')
+        self._Diag_DephaseMoLandauB = self.update_diag("Diag_DephaseMoLandauB", perseus_utils.read_diag_angle, self.perseus, 64, 'B')
+        self._Diag_EndSwitchDownA = self.update_diag("Diag_EndSwitchDownA", perseus_utils.read_diag_bool, self.perseus, 70, 'A')
+        self._Diag_EndSwitchDownB = self.update_diag("Diag_EndSwitchDownB", perseus_utils.read_diag_bool, self.perseus, 70, 'B')
+        self._Diag_EndSwitchUpA = self.update_diag("Diag_EndSwitchUpA", perseus_utils.read_diag_bool, self.perseus, 71, 'A')
+        self._Diag_EndSwitchUpB = self.update_diag("Diag_EndSwitchUpB", perseus_utils.read_diag_bool, self.perseus, 71, 'B')
+        self._Diag_Rvtet1A = self.update_diag("Diag_Rvtet1A", self.read_Diag_Rvtet1A)
+        self._Diag_Rvtet1B = self.update_diag("Diag_Rvtet1B", self.read_Diag_Rvtet1B)
+        self._Diag_Rvtet2A = self.update_diag("Diag_Rvtet2A", self.read_Diag_Rvtet2A)
+        self._Diag_Rvtet2B = self.update_diag("Diag_Rvtet2B", self.read_Diag_Rvtet2B)
+        self._Diag_RvcircA = self.update_diag("Diag_RvcircA", self.read_Diag_RvcircA)
+        self._Diag_RvcircB = self.update_diag("Diag_RvcircB", self.read_Diag_RvcircB)
+        self._Diag_FwloadA = self.update_diag("Diag_FwloadA", self.read_Diag_FwloadA)
+        self._Diag_FwloadB = self.update_diag("Diag_FwloadB", self.read_Diag_FwloadB)
+        self._Diag_FwhybloadA = self.update_diag("Diag_FwhybloadA", self.read_Diag_FwhybloadA)
+        self._Diag_FwhybloadB = self.update_diag("Diag_FwhybloadB", self.read_Diag_FwhybloadB)
+        self._Diag_RvcavA = self.update_diag("Diag_RvcavA", self.read_Diag_RvcavA)
+        self._Diag_RvcavB = self.update_diag("Diag_RvcavB", self.read_Diag_RvcavB)
+        self._Diag_ArcsA = self.update_diag("Diag_ArcsA", self.read_Diag_ArcsA)
+        self._Diag_ArcsB = self.update_diag("Diag_ArcsB", self.read_Diag_ArcsB)
+        self._Diag_VacuumA = self.update_diag("Diag_VacuumA", self.read_Diag_VacuumA)
+        self._Diag_VacuumB = self.update_diag("Diag_VacuumB", self.read_Diag_VacuumB)
+        self._Diag_ManualInterlockA = self.update_diag("Diag_ManualInterlockA", self.read_Diag_ManualInterlockA)
+        self._Diag_ManualInterlockB = self.update_diag("Diag_ManualInterlockB", self.read_Diag_ManualInterlockB)
+        self._Diag_ExternalItckA = self.update_diag("Diag_ExternalItckA", self.read_Diag_ExternalItckA)
+        self._Diag_ExternalItckB = self.update_diag("Diag_ExternalItckB", self.read_Diag_ExternalItckB)
+        self._Diag_PlungerEndSwitchUpA = self.update_diag("Diag_PlungerEndSwitchUpA", self.read_Diag_PlungerEndSwitchUpA)
+        self._Diag_PlungerEndSwitchUpB = self.update_diag("Diag_PlungerEndSwitchUpB", self.read_Diag_PlungerEndSwitchUpB)
+        self._Diag_PlungerEndSwitchDownA = self.update_diag("Diag_PlungerEndSwitchDownA", self.read_Diag_PlungerEndSwitchDownA)
+        self._Diag_PlungerEndSwitchDownB = self.update_diag("Diag_PlungerEndSwitchDownB", self.read_Diag_PlungerEndSwitchDownB)
+        self._Diag_Timestamp1A = self.update_diag("Diag_Timestamp1A", self.read_Diag_Timestamp1A)
+        self._Diag_Timestamp1B = self.update_diag("Diag_Timestamp1B", self.read_Diag_Timestamp1B)
+        self._Diag_Timestamp2A = self.update_diag("Diag_Timestamp2A", self.read_Diag_Timestamp2A)
+        self._Diag_Timestamp2B = self.update_diag("Diag_Timestamp2B", self.read_Diag_Timestamp2B)
+        self._Diag_Timestamp3A = self.update_diag("Diag_Timestamp3A", self.read_Diag_Timestamp3A)
+        self._Diag_Timestamp3B = self.update_diag("Diag_Timestamp3B", self.read_Diag_Timestamp3B)
+        self._Diag_Timestamp4A = self.update_diag("Diag_Timestamp4A", self.read_Diag_Timestamp4A)
+        self._Diag_Timestamp4B = self.update_diag("Diag_Timestamp4B", self.read_Diag_Timestamp4B)
+        self._Diag_Timestamp5A = self.update_diag("Diag_Timestamp5A", self.read_Diag_Timestamp5A)
+        self._Diag_Timestamp5B = self.update_diag("Diag_Timestamp5B", self.read_Diag_Timestamp5B)
+        self._Diag_Timestamp6A = self.update_diag("Diag_Timestamp6A", self.read_Diag_Timestamp6A)
+        self._Diag_Timestamp6B = self.update_diag("Diag_Timestamp6B", self.read_Diag_Timestamp6B)
+        self._Diag_Timestamp7A = self.update_diag("Diag_Timestamp7A", self.read_Diag_Timestamp7A)
+        self._Diag_Timestamp7B = self.update_diag("Diag_Timestamp7B", self.read_Diag_Timestamp7B)
+        self._Diag_DacsDisableCommandA = self.update_diag("Diag_DacsDisableCommandA", self.read_Diag_DacsDisableCommandA)
+        self._Diag_DacsDisableCommandB = self.update_diag("Diag_DacsDisableCommandB", self.read_Diag_DacsDisableCommandB)
+        self._Diag_PinSwitchA = self.update_diag("Diag_PinSwitchA", self.read_Diag_PinSwitchA)
+        self._Diag_PinSwitchB = self.update_diag("Diag_PinSwitchB", self.read_Diag_PinSwitchB)
+        self._Diag_FdlTriggerToLoopsdiagboardA = self.update_diag("Diag_FdlTriggerToLoopsdiagboardA", self.read_Diag_FdlTriggerToLoopsdiagboardA)
+        self._Diag_FdlTriggerToLoopsdiagboardB = self.update_diag("Diag_FdlTriggerToLoopsdiagboardB", self.read_Diag_FdlTriggerToLoopsdiagboardB)
+        self._Diag_OutputToPlcA = self.update_diag("Diag_OutputToPlcA", self.read_Diag_OutputToPlcA)
+        self._Diag_OutputToPlcB = self.update_diag("Diag_OutputToPlcB", self.read_Diag_OutputToPlcB)
+        self._Diag_OutputToMpsA = self.update_diag("Diag_OutputToMpsA", self.read_Diag_OutputToMpsA)
+        self._Diag_OutputToMpsB = self.update_diag("Diag_OutputToMpsB", self.read_Diag_OutputToMpsB)
 
     @command
+    @prioritized(PRIORITY_ACQUISITION)
     def read_attrs(self):
+        with self.perseus.bits.sweep():
+            self.prefetch_bits()
+            self.read_attr_values()
 
+    def read_attr_values(self):
         data = self.get_Rvtet1A()
-        self.push_change_event("Rvtet1A", data)
+        self.push_setting("Rvtet1A", data)
         data = self.get_Rvtet1B()
-        self.push_change_event("Rvtet1B", data)
+        self.push_setting("Rvtet1B", data)
         data = self.get_Rvtet2A()
-        self.push_change_event("Rvtet2A", data)
+        self.push_setting("Rvtet2A", data)
         data = self.get_Rvtet2B()
-        self.push_change_event("Rvtet2B", data)
+        self.push_setting("Rvtet2B", data)
         data = self.get_RvcircA()
-        self.push_change_event("RvcircA", data)
+        self.push_setting("RvcircA", data)
         data = self.get_RvcircB()
-        self.push_change_event("RvcircB", data)
+        self.push_setting("RvcircB", data)
         data = self.get_FwloadA()
-        self.push_change_event("FwloadA", data)
+        self.push_setting("FwloadA", data)
         data = self.get_FwloadB()
-        self.push_change_event("FwloadB", data)
+        self.push_setting("FwloadB", data)
         data = self.get_FwhybloadA()
-        self.push_change_event("FwhybloadA", data)
+        self.push_setting("FwhybloadA", data)
         data = self.get_FwhybloadB()
-        self.push_change_event("FwhybloadB", data)
+        self.push_setting("FwhybloadB", data)
         data = self.get_RvcavA()
-        self.push_change_event("RvcavA", data)
+        self.push_setting("RvcavA", data)
         data = self.get_RvcavB()
-        self.push_change_event("RvcavB", data)
+        self.push_setting("RvcavB", data)
         data = bool(self.get_ManualInterlockA())
-        self.push_change_event("ManualInterlockA", data)
+        self.push_setting("ManualInterlockA", data)
         data = bool(self.get_ManualInterlockB())
-        self.push_change_event("ManualInterlockB", data)
+        self.push_setting("ManualInterlockB", data)
         data = self.get_DisableItckRvtet1A()
-        self.push_change_event("DisableItckRvtet1A", data)
+        self.push_setting("DisableItckRvtet1A", data)
         data = self.get_DisableItckRvtet1B()
-        self.push_change_event("DisableItckRvtet1B", data)
+        self.push_setting("DisableItckRvtet1B", data)
         data = self.get_DisableItckRvtet2A()
-        self.push_change_event("DisableItckRvtet2A", data)
+        self.push_setting("DisableItckRvtet2A", data)
         data = self.get_DisableItckRvtet2B()
-        self.push_change_event("DisableItckRvtet2B", data)
+        self.push_setting("DisableItckRvtet2B", data)
         data = self.get_DisableItckRvcircA()
-        self.push_change_event("DisableItckRvcircA", data)
+        self.push_setting("DisableItckRvcircA", data)
         data = self.get_DisableItckRvcircB()
-        self.push_change_event("DisableItckRvcircB", data)
+        self.push_setting("DisableItckRvcircB", data)
         data = self.get_DisableItckFwloadA()
-        self.push_change_event("DisableItckFwloadA", data)
+        self.push_setting("DisableItckFwloadA", data)
         data = self.get_DisableItckFwloadB()
-        self.push_change_event("DisableItckFwloadB", data)
+        self.push_setting("DisableItckFwloadB", data)
         data = self.get_DisableItckFwhybloadA()
-        self.push_change_event("DisableItckFwhybloadA", data)
+        self.push_setting("DisableItckFwhybloadA", data)
         data = self.get_DisableItckFwhybloadB()
-        self.push_change_event("DisableItckFwhybloadB", data)
+        self.push_setting("DisableItckFwhybloadB", data)
         data = self.get_DisableItckRvcavA()
-        self.push_change_event("DisableItckRvcavA", data)
+        self.push_setting("DisableItckRvcavA", data)
         data = self.get_DisableItckRvcavB()
-        self.push_change_event("DisableItckRvcavB", data)
+        self.push_setting("DisableItckRvcavB", data)
         data = self.get_DisableItckArcsA()
-        self.push_change_event("DisableItckArcsA", data)
+        self.push_setting("DisableItckArcsA", data)
         data = self.get_DisableItckArcsB()
-        self.push_change_event("DisableItckArcsB", data)
+        self.push_setting("DisableItckArcsB", data)
         data = self.get_DisableItckVaccumA()
-        self.push_change_event("DisableItckVaccumA", data)
+        self.push_setting("DisableItckVaccumA", data)
         data = self.get_DisableItckVaccumB()
-        self.push_change_event("DisableItckVaccumB", data)
+        self.push_setting("DisableItckVaccumB", data)
         data = self.get_DisableItckManualInterlockA()
-        self.push_change_event("DisableItckManualInterlockA", data)
+        self.push_setting("DisableItckManualInterlockA", data)
         data = self.get_DisableItckManualInterlockB()
-        self.push_change_event("DisableItckManualInterlockB", data)
+        self.push_setting("DisableItckManualInterlockB", data)
         data = self.get_DisableItckPlungerEndSwitchesUpA()
-        self.push_change_event("DisableItckPlungerEndSwitchesUpA", data)
+        self.push_setting("DisableItckPlungerEndSwitchesUpA", data)
         data = self.get_DisableItckPlungerEndSwitchesUpB()
-        self.push_change_event("DisableItckPlungerEndSwitchesUpB", data)
+        self.push_setting("DisableItckPlungerEndSwitchesUpB", data)
         data = self.get_DisableItckPlungerEndSwitchesDownA()
-        self.push_change_event("DisableItckPlungerEndSwitchesDownA", data)
+        self.push_setting("DisableItckPlungerEndSwitchesDownA", data)
         data = self.get_DisableItckPlungerEndSwitchesDownB()
-        self.push_change_event("DisableItckPlungerEndSwitchesDownB", data)
+        self.push_setting("DisableItckPlungerEndSwitchesDownB", data)
         data = self.get_DisableItckMpsA()
-        self.push_change_event("DisableItckMpsA", data)
+        self.push_setting("DisableItckMpsA", data)
         data = self.get_DisableItckMpsB()
-        self.push_change_event("DisableItckMpsB", data)
+        self.push_setting("DisableItckMpsB", data)
         data = self.get_SamplesToAverageA()
-        self.push_change_event("SamplesToAverageA", data)
+        self.push_setting("SamplesToAverageA", data)
         data = self.get_SamplesToAverageB()
-        self.push_change_event("SamplesToAverageB", data)
+        self.push_setting("SamplesToAverageB", data)
         data = bool(self.get_PulseupLogicInversionA())
-        self.push_change_event("PulseupLogicInversionA", data)
+        self.push_setting("PulseupLogicInversionA", data)
         data = bool(self.get_PulseupLogicInversionB())
-        self.push_change_event("PulseupLogicInversionB", data)
+        self.push_setting("PulseupLogicInversionB", data)
         data = self.get_EndSwitchesConnectedToNoNcContactA()
-        self.push_change_event("EndSwitchesConnectedToNoNcContactA", data)
+        self.push_setting("EndSwitchesConnectedToNoNcContactA", data)
         data = self.get_EndSwitchesConnectedToNoNcContactB()
-        self.push_change_event("EndSwitchesConnectedToNoNcContactB", data)
+        self.push_setting("EndSwitchesConnectedToNoNcContactB", data)
         data = bool(self.get_LookrefA())
-        self.push_change_event("LookrefA", data)
+        self.push_setting("LookrefA", data)
         data = bool(self.get_LookrefB())
-        self.push_change_event("LookrefB", data)
+        self.push_setting("LookrefB", data)
         data = self.get_QuadrefA()
-        self.push_change_event("QuadrefA", data)
+        self.push_setting("QuadrefA", data)
         data = self.get_QuadrefB()
-        self.push_change_event("QuadrefB", data)
+        self.push_setting("QuadrefB", data)
         data = bool(self.get_SpareDo1A())
-        self.push_change_event("SpareDo1A", data)
+        self.push_setting("SpareDo1A", data)
         data = bool(self.get_SpareDo1B())
-        self.push_change_event("SpareDo1B", data)
+        self.push_setting("SpareDo1B", data)
         data = bool(self.get_SpareDo2A())
-        self.push_change_event("SpareDo2A", data)
+        self.push_setting("SpareDo2A", data)
         data = bool(self.get_SpareDo2B())
-        self.push_change_event("SpareDo2B", data)
+        self.push_setting("SpareDo2B", data)
         data = bool(self.get_SpareDo3A())
-        self.push_change_event("SpareDo3A", data)
+        self.push_setting("SpareDo3A", data)
         data = bool(self.get_SpareDo3B())
-        self.push_change_event("SpareDo3B", data)
+        self.push_setting("SpareDo3B", data)
         data = bool(self.get_FdlSwTriggerA())
-        self.push_change_event("FdlSwTriggerA", data)
+        self.push_setting("FdlSwTriggerA", data)
         data = bool(self.get_FdlSwTriggerB())
-        self.push_change_event("FdlSwTriggerB", data)
+        self.push_setting("FdlSwTriggerB", data)
         data = bool(self.get_ResetInterlocksCavA())
-        self.push_change_event("ResetInterlocksCavA", data)
+        self.push_setting("ResetInterlocksCavA", data)
         data = bool(self.get_ResetInterlocksCavB())
-        self.push_change_event("ResetInterlocksCavB", data)
+        self.push_setting("ResetInterlocksCavB", data)
         data = bool(self.get_MpsSignalInversionA())
-        self.push_change_event("MpsSignalInversionA", data)
+        self.push_setting("MpsSignalInversionA", data)
         data = bool(self.get_MpsSignalInversionB())
-        self.push_change_event("MpsSignalInversionB", data)
+        self.push_setting("MpsSignalInversionB", data)
         data = self.get_InterlocksDelayA()
-        self.push_change_event("InterlocksDelayA", data)
+        self.push_setting("InterlocksDelayA", data)
         data = self.get_InterlocksDelayB()
-        self.push_change_event("InterlocksDelayB", data)
+        self.push_setting("InterlocksDelayB", data)
         data = self.get_FdlTriggerDelayA()
-        self.push_change_event("FdlTriggerDelayA", data)
+        self.push_setting("FdlTriggerDelayA", data)
         data = self.get_FdlTriggerDelayB()
-        self.push_change_event("FdlTriggerDelayB", data)
+        self.push_setting("FdlTriggerDelayB", data)
         data = bool(self.get_LandautuningenableA())
-        self.push_change_event("LandautuningenableA", data)
+        self.push_setting("LandautuningenableA", data)
         data = bool(self.get_LandautuningenableB())
-        self.push_change_event("LandautuningenableB", data)
+        self.push_setting("LandautuningenableB", data)
         data = bool(self.get_LandautuningresetA())
-        self.push_change_event("LandautuningresetA", data)
+        self.push_setting("LandautuningresetA", data)
         data = bool(self.get_LandautuningresetB())
-        self.push_change_event("LandautuningresetB", data)
+        self.push_setting("LandautuningresetB", data)
         data = bool(self.get_MovelandauupA())
-        self.push_change_event("MovelandauupA", data)
+        self.push_setting("MovelandauupA", data)
         data = bool(self.get_MovelandauupB())
-        self.push_change_event("MovelandauupB", data)
+        self.push_setting("MovelandauupB", data)
         data = bool(self.get_MovelandauplgA())
-        self.push_change_event("MovelandauplgA", data)
+        self.push_setting("MovelandauplgA", data)
         data = bool(self.get_MovelandauplgB())
-        self.push_change_event("MovelandauplgB", data)
+        self.push_setting("MovelandauplgB", data)
         data = self.get_NumstepsA()
-        self.push_change_event("NumstepsA", data)
+        self.push_setting("NumstepsA", data)
         data = self.get_NumstepsB()
-        self.push_change_event("NumstepsB", data)
+        self.push_setting("NumstepsB", data)
         data = self.get_LandauphaseoffsetA()
-        self.push_change_event("LandauphaseoffsetA", data)
+        self.push_setting("LandauphaseoffsetA", data)
         data = self.get_LandauphaseoffsetB()
-        self.push_change_event("LandauphaseoffsetB", data)
+        self.push_setting("LandauphaseoffsetB", data)
         data = self.get_LandaumarginupA()
-        self.push_change_event("LandaumarginupA", data)
+        self.push_setting("LandaumarginupA", data)
         data = self.get_LandaumarginupB()
-        self.push_change_event("LandaumarginupB", data)
+        self.push_setting("LandaumarginupB", data)
         data = self.get_LandauMarginLowA()
-        self.push_change_event("LandauMarginLowA", data)
+        self.push_setting("LandauMarginLowA", data)
         data = self.get_LandauMarginLowB()
-        self.push_change_event("LandauMarginLowB", data)
+        self.push_setting("LandauMarginLowB", data)
         data = self.get_MinimumLandauAmplitudeA()
-        self.push_change_event("MinimumLandauAmplitudeA", data)
+        self.push_setting("MinimumLandauAmplitudeA", data)
         data = self.get_MinimumLandauAmplitudeB()
-        self.push_change_event("MinimumLandauAmplitudeB", data)
+        self.push_setting("MinimumLandauAmplitudeB", data)
         data = bool(self.get_LandauPositiveEnableA())
-        self.push_change_event("LandauPositiveEnableA", data)
+        self.push_setting("LandauPositiveEnableA", data)
         data = bool(self.get_LandauPositiveEnableB())
-        self.push_change_event("LandauPositiveEnableB", data)
+        self.push_setting("LandauPositiveEnableB", data)
         data = self.get_LandauampsettingA()
-        self.push_change_event("LandauampsettingA", data)
+        self.push_setting("LandauampsettingA", data)
         data = self.get_LandauampsettingB()
-        self.push_change_event("LandauampsettingB", data)
+        self.push_setting("LandauampsettingB", data)
         data = bool(self.get_Landau3gevRingEnableA())
-        self.push_change_event("Landau3gevRingEnableA", data)
+        self.push_setting("Landau3gevRingEnableA", data)
         data = bool(self.get_Landau3gevRingEnableB())
-        self.push_change_event("Landau3gevRingEnableB", data)
+        self.push_setting("Landau3gevRingEnableB", data)
         data = bool(self.get_LandauCavEnableA())
-        self.push_change_event("LandauCavEnableA", data)
+        self.push_setting("LandauCavEnableA", data)
         data = bool(self.get_LandauCavEnableB())
-        self.push_change_event("LandauCavEnableB", data)
+        self.push_setting("LandauCavEnableB", data)
         data = bool(self.get_DisitckRvtet1DacsoffloopsstbyA())
-        self.push_change_event("DisitckRvtet1DacsoffloopsstbyA", data)
+        self.push_setting("DisitckRvtet1DacsoffloopsstbyA", data)
         data = bool(self.get_DisitckRvtet1DacsoffloopsstbyB())
-        self.push_change_event("DisitckRvtet1DacsoffloopsstbyB", data)
+        self.push_setting("DisitckRvtet1DacsoffloopsstbyB", data)
         data = bool(self.get_DisitckRvtet1PindiodeswitchA())
-        self.push_change_event("DisitckRvtet1PindiodeswitchA", data)
+        self.push_setting("DisitckRvtet1PindiodeswitchA", data)
         data = bool(self.get_DisitckRvtet1PindiodeswitchB())
-        self.push_change_event("DisitckRvtet1PindiodeswitchB", data)
+        self.push_setting("DisitckRvtet1PindiodeswitchB", data)
         data = bool(self.get_DisitckRvtet1FdltrgA())
-        self.push_change_event("DisitckRvtet1FdltrgA", data)
+        self.push_setting("DisitckRvtet1FdltrgA", data)
         data = bool(self.get_DisitckRvtet1FdltrgB())
-        self.push_change_event("DisitckRvtet1FdltrgB", data)
+        self.push_setting("DisitckRvtet1FdltrgB", data)
         data = bool(self.get_DisitckRvtet1PlctxoffA())
-        self.push_change_event("DisitckRvtet1PlctxoffA", data)
+        self.push_setting("DisitckRvtet1PlctxoffA", data)
         data = bool(self.get_DisitckRvtet1PlctxoffB())
-        self.push_change_event("DisitckRvtet1PlctxoffB", data)
+        self.push_setting("DisitckRvtet1PlctxoffB", data)
         data = bool(self.get_DisitckRvtet1MpsA())
-        self.push_change_event("DisitckRvtet1MpsA", data)
+        self.push_setting("DisitckRvtet1MpsA", data)
         data = bool(self.get_DisitckRvtet1MpsB())
-        self.push_change_event("DisitckRvtet1MpsB", data)
+        self.push_setting("DisitckRvtet1MpsB", data)
         data = bool(self.get_DisitckRvtet1DiagA())
-        self.push_change_event("DisitckRvtet1DiagA", data)
+        self.push_setting("DisitckRvtet1DiagA", data)
         data = bool(self.get_DisitckRvtet1DiagB())
-        self.push_change_event("DisitckRvtet1DiagB", data)
+        self.push_setting("DisitckRvtet1DiagB", data)
         data = bool(self.get_DisitckRvtet2DacsoffloopsstbyA())
-        self.push_change_event("DisitckRvtet2DacsoffloopsstbyA", data)
+        self.push_setting("DisitckRvtet2DacsoffloopsstbyA", data)
         data = bool(self.get_DisitckRvtet2DacsoffloopsstbyB())
-        self.push_change_event("DisitckRvtet2DacsoffloopsstbyB", data)
+        self.push_setting("DisitckRvtet2DacsoffloopsstbyB", data)
         data = bool(self.get_DisitckRvtet2PindiodeswitchA())
-        self.push_change_event("DisitckRvtet2PindiodeswitchA", data)
+        self.push_setting("DisitckRvtet2PindiodeswitchA", data)
         data = bool(self.get_DisitckRvtet2PindiodeswitchB())
-        self.push_change_event("DisitckRvtet2PindiodeswitchB", data)
+        self.push_setting("DisitckRvtet2PindiodeswitchB", data)
         data = bool(self.get_DisitckRvtet2FdltrgA())
-        self.push_change_event("DisitckRvtet2FdltrgA", data)
+        self.push_setting("DisitckRvtet2FdltrgA", data)
         data = bool(self.get_DisitckRvtet2FdltrgB())
-        self.push_change_event("DisitckRvtet2FdltrgB", data)
+        self.push_setting("DisitckRvtet2FdltrgB", data)
         data = bool(self.get_DisitckRvtet2PlctxoffA())
-        self.push_change_event("DisitckRvtet2PlctxoffA", data)
+        self.push_setting("DisitckRvtet2PlctxoffA", data)
         data = bool(self.get_DisitckRvtet2PlctxoffB())
-        self.push_change_event("DisitckRvtet2PlctxoffB", data)
+        self.push_setting("DisitckRvtet2PlctxoffB", data)
         data = bool(self.get_DisitckRvtet2MpsA())
-        self.push_change_event("DisitckRvtet2MpsA", data)
+        self.push_setting("DisitckRvtet2MpsA", data)
         data = bool(self.get_DisitckRvtet2MpsB())
-        self.push_change_event("DisitckRvtet2MpsB", data)
+        self.push_setting("DisitckRvtet2MpsB", data)
         data = bool(self.get_DisitckRvtet2DiagA())
-        self.push_change_event("DisitckRvtet2DiagA", data)
+        self.push_setting("DisitckRvtet2DiagA", data)
         data = bool(self.get_DisitckRvtet2DiagB())
-        self.push_change_event("DisitckRvtet2DiagB", data)
+        self.push_setting("DisitckRvtet2DiagB", data)
         data = bool(self.get_DisitckRvcircDacsoffloopsstbyA())
-        self.push_change_event("DisitckRvcircDacsoffloopsstbyA", data)
+        self.push_setting("DisitckRvcircDacsoffloopsstbyA", data)
         data = bool(self.get_DisitckRvcircDacsoffloopsstbyB())
-        self.push_change_event("DisitckRvcircDacsoffloopsstbyB", data)
+        self.push_setting("DisitckRvcircDacsoffloopsstbyB", data)
         data = bool(self.get_DisitckRvcircPindiodeswitchA())
-        self.push_change_event("DisitckRvcircPindiodeswitchA", data)
+        self.push_setting("DisitckRvcircPindiodeswitchA", data)
         data = bool(self.get_DisitckRvcircPindiodeswitchB())
-        self.push_change_event("DisitckRvcircPindiodeswitchB", data)
+        self.push_setting("DisitckRvcircPindiodeswitchB", data)
         data = bool(self.get_DisitckRvcircFdltrgA())
-        self.push_change_event("DisitckRvcircFdltrgA", data)
+        self.push_setting("DisitckRvcircFdltrgA", data)
         data = bool(self.get_DisitckRvcircFdltrgB())
-        self.push_change_event("DisitckRvcircFdltrgB", data)
+        self.push_setting("DisitckRvcircFdltrgB", data)
         data = bool(self.get_DisitckRvcircPlctxoffA())
-        self.push_change_event("DisitckRvcircPlctxoffA", data)
+        self.push_setting("DisitckRvcircPlctxoffA", data)
         data = bool(self.get_DisitckRvcircPlctxoffB())
-        self.push_change_event("DisitckRvcircPlctxoffB", data)
+        self.push_setting("DisitckRvcircPlctxoffB", data)
         data = bool(self.get_DisitckRvcircMpsA())
-        self.push_change_event("DisitckRvcircMpsA", data)
+        self.push_setting("DisitckRvcircMpsA", data)
         data = bool(self.get_DisitckRvcircMpsB())
-        self.push_change_event("DisitckRvcircMpsB", data)
+        self.push_setting("DisitckRvcircMpsB", data)
         data = bool(self.get_DisitckRvcircDiagA())
-        self.push_change_event("DisitckRvcircDiagA", data)
+        self.push_setting("DisitckRvcircDiagA", data)
         data = bool(self.get_DisitckRvcircDiagB())
-        self.push_change_event("DisitckRvcircDiagB", data)
+        self.push_setting("DisitckRvcircDiagB", data)
         data = bool(self.get_DisitckFwloadDacsoffloopsstbyA())
-        self.push_change_event("DisitckFwloadDacsoffloopsstbyA", data)
+        self.push_setting("DisitckFwloadDacsoffloopsstbyA", data)
         data = bool(self.get_DisitckFwloadDacsoffloopsstbyB())
-        self.push_change_event("DisitckFwloadDacsoffloopsstbyB", data)
+        self.push_setting("DisitckFwloadDacsoffloopsstbyB", data)
         data = bool(self.get_DisitckFwloadPindiodeswitchA())
-        self.push_change_event("DisitckFwloadPindiodeswitchA", data)
+        self.push_setting("DisitckFwloadPindiodeswitchA", data)
         data = bool(self.get_DisitckFwloadPindiodeswitchB())
-        self.push_change_event("DisitckFwloadPindiodeswitchB", data)
+        self.push_setting("DisitckFwloadPindiodeswitchB", data)
         data = bool(self.get_DisitckFwloadFdltrgA())
-        self.push_change_event("DisitckFwloadFdltrgA", data)
+        self.push_setting("DisitckFwloadFdltrgA", data)
         data = bool(self.get_DisitckFwloadFdltrgB())
-        self.push_change_event("DisitckFwloadFdltrgB", data)
+        self.push_setting("DisitckFwloadFdltrgB", data)
         data = bool(self.get_DisitckFwloadPlctxoffA())
-        self.push_change_event("DisitckFwloadPlctxoffA", data)
+        self.push_setting("DisitckFwloadPlctxoffA", data)
         data = bool(self.get_DisitckFwloadPlctxoffB())
-        self.push_change_event("DisitckFwloadPlctxoffB", data)
+        self.push_setting("DisitckFwloadPlctxoffB", data)
         data = bool(self.get_DisitckFwloadMpsA())
-        self.push_change_event("DisitckFwloadMpsA", data)
+        self.push_setting("DisitckFwloadMpsA", data)
         data = bool(self.get_DisitckFwloadMpsB())
-        self.push_change_event("DisitckFwloadMpsB", data)
+        self.push_setting("DisitckFwloadMpsB", data)
         data = bool(self.get_DisitckFwloadDiagA())
-        self.push_change_event("DisitckFwloadDiagA", data)
+        self.push_setting("DisitckFwloadDiagA", data)
         data = bool(self.get_DisitckFwloadDiagB())
-        self.push_change_event("DisitckFwloadDiagB", data)
+        self.push_setting("DisitckFwloadDiagB", data)
         data = bool(self.get_DisitckFwhybloadDacsoffloopsstbyA())
-        self.push_change_event("DisitckFwhybloadDacsoffloopsstbyA", data)
+        self.push_setting("DisitckFwhybloadDacsoffloopsstbyA", data)
         data = bool(self.get_DisitckFwhybloadDacsoffloopsstbyB())
-        self.push_change_event("DisitckFwhybloadDacsoffloopsstbyB", data)
+        self.push_setting("DisitckFwhybloadDacsoffloopsstbyB", data)
         data = bool(self.get_DisitckFwhybloadPindiodeswitchA())
-        self.push_change_event("DisitckFwhybloadPindiodeswitchA", data)
+        self.push_setting("DisitckFwhybloadPindiodeswitchA", data)
         data = bool(self.get_DisitckFwhybloadPindiodeswitchB())
-        self.push_change_event("DisitckFwhybloadPindiodeswitchB", data)
+        self.push_setting("DisitckFwhybloadPindiodeswitchB", data)
         data = bool(self.get_DisitckFwhybloadFdltrgA())
-        self.push_change_event("DisitckFwhybloadFdltrgA", data)
+        self.push_setting("DisitckFwhybloadFdltrgA", data)
         data = bool(self.get_DisitckFwhybloadFdltrgB())
-        self.push_change_event("DisitckFwhybloadFdltrgB", data)
+        self.push_setting("DisitckFwhybloadFdltrgB", data)
         data = bool(self.get_DisitckFwhybloadPlctxoffA())
-        self.push_change_event("DisitckFwhybloadPlctxoffA", data)
+        self.push_setting("DisitckFwhybloadPlctxoffA", data)
         data = bool(self.get_DisitckFwhybloadPlctxoffB())
-        self.push_change_event("DisitckFwhybloadPlctxoffB", data)
+        self.push_setting("DisitckFwhybloadPlctxoffB", data)
         data = bool(self.get_DisitckFwhybloadMpsA())
-        self.push_change_event("DisitckFwhybloadMpsA", data)
+        self.push_setting("DisitckFwhybloadMpsA", data)
         data = bool(self.get_DisitckFwhybloadMpsB())
-        self.push_change_event("DisitckFwhybloadMpsB", data)
+        self.push_setting("DisitckFwhybloadMpsB", data)
         data = bool(self.get_DisitckFwhybloadDiagA())
-        self.push_change_event("DisitckFwhybloadDiagA", data)
+        self.push_setting("DisitckFwhybloadDiagA", data)
         data = bool(self.get_DisitckFwhybloadDiagB())
-        self.push_change_event("DisitckFwhybloadDiagB", data)
+        self.push_setting("DisitckFwhybloadDiagB", data)
         data = bool(self.get_DisitckRvcavDacsoffloopsstbyA())
-        self.push_change_event("DisitckRvcavDacsoffloopsstbyA", data)
+        self.push_setting("DisitckRvcavDacsoffloopsstbyA", data)
         data = bool(self.get_DisitckRvcavDacsoffloopsstbyB())
-        self.push_change_event("DisitckRvcavDacsoffloopsstbyB", data)
+        self.push_setting("DisitckRvcavDacsoffloopsstbyB", data)
         data = bool(self.get_DisitckRvcavPindiodeswitchA())
-        self.push_change_event("DisitckRvcavPindiodeswitchA", data)
+        self.push_setting("DisitckRvcavPindiodeswitchA", data)
         data = bool(self.get_DisitckRvcavPindiodeswitchB())
-        self.push_change_event("DisitckRvcavPindiodeswitchB", data)
+        self.push_setting("DisitckRvcavPindiodeswitchB", data)
         data = bool(self.get_DisitckRvcavFdltrgA())
-        self.push_change_event("DisitckRvcavFdltrgA", data)
+        self.push_setting("DisitckRvcavFdltrgA", data)
         data = bool(self.get_DisitckRvcavFdltrgB())
-        self.push_change_event("DisitckRvcavFdltrgB", data)
+        self.push_setting("DisitckRvcavFdltrgB", data)
         data = bool(self.get_DisitckRvcavPlctxoffA())
-        self.push_change_event("DisitckRvcavPlctxoffA", data)
+        self.push_setting("DisitckRvcavPlctxoffA", data)
         data = bool(self.get_DisitckRvcavPlctxoffB())
-        self.push_change_event("DisitckRvcavPlctxoffB", data)
+        self.push_setting("DisitckRvcavPlctxoffB", data)
         data = bool(self.get_DisitckRvcavMpsA())
-        self.push_change_event("DisitckRvcavMpsA", data)
+        self.push_setting("DisitckRvcavMpsA", data)
         data = bool(self.get_DisitckRvcavMpsB())
-        self.push_change_event("DisitckRvcavMpsB", data)
+        self.push_setting("DisitckRvcavMpsB", data)
         data = bool(self.get_DisitckRvcavDiagA())
-        self.push_change_event("DisitckRvcavDiagA", data)
+        self.push_setting("DisitckRvcavDiagA", data)
         data = bool(self.get_DisitckRvcavDiagB())
-        self.push_change_event("DisitckRvcavDiagB", data)
+        self.push_setting("DisitckRvcavDiagB", data)
         data = bool(self.get_DisitckArcsDacsoffloopsstbyA())
-        self.push_change_event("DisitckArcsDacsoffloopsstbyA", data)
+        self.push_setting("DisitckArcsDacsoffloopsstbyA", data)
         data = bool(self.get_DisitckArcsDacsoffloopsstbyB())
-        self.push_change_event("DisitckArcsDacsoffloopsstbyB", data)
+        self.push_setting("DisitckArcsDacsoffloopsstbyB", data)
         data = bool(self.get_DisitckArcsPindiodeswitchA())
-        self.push_change_event("DisitckArcsPindiodeswitchA", data)
+        self.push_setting("DisitckArcsPindiodeswitchA", data)
         data = bool(self.get_DisitckArcsPindiodeswitchB())
-        self.push_change_event("DisitckArcsPindiodeswitchB", data)
+        self.push_setting("DisitckArcsPindiodeswitchB", data)
         data = bool(self.get_DisitckArcsFdltrgA())
-        self.push_change_event("DisitckArcsFdltrgA", data)
+        self.push_setting("DisitckArcsFdltrgA", data)
         data = bool(self.get_DisitckArcsFdltrgB())
-        self.push_change_event("DisitckArcsFdltrgB", data)
+        self.push_setting("DisitckArcsFdltrgB", data)
         data = bool(self.get_DisitckArcsPlctxoffA())
-        self.push_change_event("DisitckArcsPlctxoffA", data)
+        self.push_setting("DisitckArcsPlctxoffA", data)
         data = bool(self.get_DisitckArcsPlctxoffB())
-        self.push_change_event("DisitckArcsPlctxoffB", data)
+        self.push_setting("DisitckArcsPlctxoffB", data)
         data = bool(self.get_DisitckArcsMpsA())
-        self.push_change_event("DisitckArcsMpsA", data)
+        self.push_setting("DisitckArcsMpsA", data)
         data = bool(self.get_DisitckArcsMpsB())
-        self.push_change_event("DisitckArcsMpsB", data)
+        self.push_setting("DisitckArcsMpsB", data)
         data = bool(self.get_DisitckArcsDiagA())
-        self.push_change_event("DisitckArcsDiagA", data)
+        self.push_setting("DisitckArcsDiagA", data)
         data = bool(self.get_DisitckArcsDiagB())
-        self.push_change_event("DisitckArcsDiagB", data)
+        self.push_setting("DisitckArcsDiagB", data)
         data = bool(self.get_DisitckVacuumDacsoffloopsstbyA())
-        self.push_change_event("DisitckVacuumDacsoffloopsstbyA", data)
+        self.push_setting("DisitckVacuumDacsoffloopsstbyA", data)
         data = bool(self.get_DisitckVacuumDacsoffloopsstbyB())
-        self.push_change_event("DisitckVacuumDacsoffloopsstbyB", data)
+        self.push_setting("DisitckVacuumDacsoffloopsstbyB", data)
         data = bool(self.get_DisitckVacuumPindiodeswitchA())
-        self.push_change_event("DisitckVacuumPindiodeswitchA", data)
+        self.push_setting("DisitckVacuumPindiodeswitchA", data)
         data = bool(self.get_DisitckVacuumPindiodeswitchB())
-        self.push_change_event("DisitckVacuumPindiodeswitchB", data)
+        self.push_setting("DisitckVacuumPindiodeswitchB", data)
         data = bool(self.get_DisitckVacuumFdltrgA())
-        self.push_change_event("DisitckVacuumFdltrgA", data)
+        self.push_setting("DisitckVacuumFdltrgA", data)
         data = bool(self.get_DisitckVacuumFdltrgB())
-        self.push_change_event("DisitckVacuumFdltrgB", data)
+        self.push_setting("DisitckVacuumFdltrgB", data)
         data = bool(self.get_DisitckVacuumPlctxoffA())
-        self.push_change_event("DisitckVacuumPlctxoffA", data)
+        self.push_setting("DisitckVacuumPlctxoffA", data)
         data = bool(self.get_DisitckVacuumPlctxoffB())
-        self.push_change_event("DisitckVacuumPlctxoffB", data)
+        self.push_setting("DisitckVacuumPlctxoffB", data)
         data = bool(self.get_DisitckVacuumMpsA())
-        self.push_change_event("DisitckVacuumMpsA", data)
+        self.push_setting("DisitckVacuumMpsA", data)
         data = bool(self.get_DisitckVacuumMpsB())
-        self.push_change_event("DisitckVacuumMpsB", data)
+        self.push_setting("DisitckVacuumMpsB", data)
         data = bool(self.get_DisitckVacuumDiagA())
-        self.push_change_event("DisitckVacuumDiagA", data)
+        self.push_setting("DisitckVacuumDiagA", data)
         data = bool(self.get_DisitckVacuumDiagB())
-        self.push_change_event("DisitckVacuumDiagB", data)
+        self.push_setting("DisitckVacuumDiagB", data)
         data = bool(self.get_DisitckManualInterlockDacsoffloopsstbyA())
-        self.push_change_event("DisitckManualInterlockDacsoffloopsstbyA", data)
+        self.push_setting("DisitckManualInterlockDacsoffloopsstbyA", data)
         data = bool(self.get_DisitckManualInterlockDacsoffloopsstbyB())
-        self.push_change_event("DisitckManualInterlockDacsoffloopsstbyB", data)
+        self.push_setting("DisitckManualInterlockDacsoffloopsstbyB", data)
         data = bool(self.get_DisitckManualInterlockPindiodeswitchA())
-        self.push_change_event("DisitckManualInterlockPindiodeswitchA", data)
+        self.push_setting("DisitckManualInterlockPindiodeswitchA", data)
         data = bool(self.get_DisitckManualInterlockPindiodeswitchB())
-        self.push_change_event("DisitckManualInterlockPindiodeswitchB", data)
+        self.push_setting("DisitckManualInterlockPindiodeswitchB", data)
         data = bool(self.get_DisitckManualInterlockFdltrgA())
-        self.push_change_event("DisitckManualInterlockFdltrgA", data)
+        self.push_setting("DisitckManualInterlockFdltrgA", data)
         data = bool(self.get_DisitckManualInterlockFdltrgB())
-        self.push_change_event("DisitckManualInterlockFdltrgB", data)
+        self.push_setting("DisitckManualInterlockFdltrgB", data)
         data = bool(self.get_DisitckManualInterlockPlctxoffA())
-        self.push_change_event("DisitckManualInterlockPlctxoffA", data)
+        self.push_setting("DisitckManualInterlockPlctxoffA", data)
         data = bool(self.get_DisitckManualInterlockPlctxoffB())
-        self.push_change_event("DisitckManualInterlockPlctxoffB", data)
+        self.push_setting("DisitckManualInterlockPlctxoffB", data)
         data = bool(self.get_DisitckManualInterlockMpsA())
-        self.push_change_event("DisitckManualInterlockMpsA", data)
+        self.push_setting("DisitckManualInterlockMpsA", data)
         data = bool(self.get_DisitckManualInterlockMpsB())
-        self.push_change_event("DisitckManualInterlockMpsB", data)
+        self.push_setting("DisitckManualInterlockMpsB", data)
         data = bool(self.get_DisitckManualInterlockDiagA())
-        self.push_change_event("DisitckManualInterlockDiagA", data)
+        self.push_setting("DisitckManualInterlockDiagA", data)
         data = bool(self.get_DisitckManualInterlockDiagB())
-        self.push_change_event("DisitckManualInterlockDiagB", data)
+        self.push_setting("DisitckManualInterlockDiagB", data)
         data = bool(self.get_DisitckPlungerEndSwitchesUpDacsoffloopsstbyA())
-        self.push_change_event("DisitckPlungerEndSwitchesUpDacsoffloopsstbyA", data)
+        self.push_setting("DisitckPlungerEndSwitchesUpDacsoffloopsstbyA", data)
         data = bool(self.get_DisitckPlungerEndSwitchesUpDacsoffloopsstbyB())
-        self.push_change_event("DisitckPlungerEndSwitchesUpDacsoffloopsstbyB", data)
+        self.push_setting("DisitckPlungerEndSwitchesUpDacsoffloopsstbyB", data)
         data = bool(self.get_DisitckPlungerEndSwitchesUpPindiodeswitchA())
-        self.push_change_event("DisitckPlungerEndSwitchesUpPindiodeswitchA", data)
+        self.push_setting("DisitckPlungerEndSwitchesUpPindiodeswitchA", data)
         data = bool(self.get_DisitckPlungerEndSwitchesUpPindiodeswitchB())
-        self.push_change_event("DisitckPlungerEndSwitchesUpPindiodeswitchB", data)
+        self.push_setting("DisitckPlungerEndSwitchesUpPindiodeswitchB", data)
         data = bool(self.get_DisitckPlungerEndSwitchesUpFdltrgA())
-        self.push_change_event("DisitckPlungerEndSwitchesUpFdltrgA", data)
+        self.push_setting("DisitckPlungerEndSwitchesUpFdltrgA", data)
         data = bool(self.get_DisitckPlungerEndSwitchesUpFdltrgB())
-        self.push_change_event("DisitckPlungerEndSwitchesUpFdltrgB", data)
+        self.push_setting("DisitckPlungerEndSwitchesUpFdltrgB", data)
         data = bool(self.get_DisitckPlungerEndSwitchesUpPlctxoffA())
-        self.push_change_event("DisitckPlungerEndSwitchesUpPlctxoffA", data)
+        self.push_setting("DisitckPlungerEndSwitchesUpPlctxoffA", data)
         data = bool(self.get_DisitckPlungerEndSwitchesUpPlctxoffB())
-        self.push_change_event("DisitckPlungerEndSwitchesUpPlctxoffB", data)
+        self.push_setting("DisitckPlungerEndSwitchesUpPlctxoffB", data)
         data = bool(self.get_DisitckPlungerEndSwitchesUpMpsA())
-        self.push_change_event("DisitckPlungerEndSwitchesUpMpsA", data)
+        self.push_setting("DisitckPlungerEndSwitchesUpMpsA", data)
         data = bool(self.get_DisitckPlungerEndSwitchesUpMpsB())
-        self.push_change_event("DisitckPlungerEndSwitchesUpMpsB", data)
+        self.push_setting("DisitckPlungerEndSwitchesUpMpsB", data)
         data = bool(self.get_DisitckPlungerEndSwitchesUpDiagA())
-        self.push_change_event("DisitckPlungerEndSwitchesUpDiagA", data)
+        self.push_setting("DisitckPlungerEndSwitchesUpDiagA", data)
         data = bool(self.get_DisitckPlungerEndSwitchesUpDiagB())
-        self.push_change_event("DisitckPlungerEndSwitchesUpDiagB", data)
+        self.push_setting("DisitckPlungerEndSwitchesUpDiagB", data)
         data = bool(self.get_DisitckPlungerEndSwitchesDownDacsoffloopsstbyA())
-        self.push_change_event("DisitckPlungerEndSwitchesDownDacsoffloopsstbyA", data)
+        self.push_setting("DisitckPlungerEndSwitchesDownDacsoffloopsstbyA", data)
         data = bool(self.get_DisitckPlungerEndSwitchesDownDacsoffloopsstbyB())
-        self.push_change_event("DisitckPlungerEndSwitchesDownDacsoffloopsstbyB", data)
+        self.push_setting("DisitckPlungerEndSwitchesDownDacsoffloopsstbyB", data)
         data = bool(self.get_DisitckPlungerEndSwitchesDownPindiodeswitchA())
-        self.push_change_event("DisitckPlungerEndSwitchesDownPindiodeswitchA", data)
+        self.push_setting("DisitckPlungerEndSwitchesDownPindiodeswitchA", data)
         data = bool(self.get_DisitckPlungerEndSwitchesDownPindiodeswitchB())
-        self.push_change_event("DisitckPlungerEndSwitchesDownPindiodeswitchB", data)
+        self.push_setting("DisitckPlungerEndSwitchesDownPindiodeswitchB", data)
         data = bool(self.get_DisitckPlungerEndSwitchesDownFdltrgA())
-        self.push_change_event("DisitckPlungerEndSwitchesDownFdltrgA", data)
+        self.push_setting("DisitckPlungerEndSwitchesDownFdltrgA", data)
         data = bool(self.get_DisitckPlungerEndSwitchesDownFdltrgB())
-        self.push_change_event("DisitckPlungerEndSwitchesDownFdltrgB", data)
+        self.push_setting("DisitckPlungerEndSwitchesDownFdltrgB", data)
         data = bool(self.get_DisitckPlungerEndSwitchesDownPlctxoffA())
-        self.push_change_event("DisitckPlungerEndSwitchesDownPlctxoffA", data)
+        self.push_setting("DisitckPlungerEndSwitchesDownPlctxoffA", data)
         data = bool(self.get_DisitckPlungerEndSwitchesDownPlctxoffB())
-        self.push_change_event("DisitckPlungerEndSwitchesDownPlctxoffB", data)
+        self.push_setting("DisitckPlungerEndSwitchesDownPlctxoffB", data)
         data = bool(self.get_DisitckPlungerEndSwitchesDownMpsA())
-        self.push_change_event("DisitckPlungerEndSwitchesDownMpsA", data)
+        self.push_setting("DisitckPlungerEndSwitchesDownMpsA", data)
         data = bool(self.get_DisitckPlungerEndSwitchesDownMpsB())
-        self.push_change_event("DisitckPlungerEndSwitchesDownMpsB", data)
+        self.push_setting("DisitckPlungerEndSwitchesDownMpsB", data)
         data = bool(self.get_DisitckPlungerEndSwitchesDownDiagA())
-        self.push_change_event("DisitckPlungerEndSwitchesDownDiagA", data)
+        self.push_setting("DisitckPlungerEndSwitchesDownDiagA", data)
         data = bool(self.get_DisitckPlungerEndSwitchesDownDiagB())
-        self.push_change_event("DisitckPlungerEndSwitchesDownDiagB", data)
+        self.push_setting("DisitckPlungerEndSwitchesDownDiagB", data)
         data = bool(self.get_DisitckMpsDacsoffloopsstbyA())
-        self.push_change_event("DisitckMpsDacsoffloopsstbyA", data)
+        self.push_setting("DisitckMpsDacsoffloopsstbyA", data)
         data = bool(self.get_DisitckMpsDacsoffloopsstbyB())
-        self.push_change_event("DisitckMpsDacsoffloopsstbyB", data)
+        self.push_setting("DisitckMpsDacsoffloopsstbyB", data)
         data = bool(self.get_DisitckMpsPindiodeswitchA())
-        self.push_change_event("DisitckMpsPindiodeswitchA", data)
+        self.push_setting("DisitckMpsPindiodeswitchA", data)
         data = bool(self.get_DisitckMpsPindiodeswitchB())
-        self.push_change_event("DisitckMpsPindiodeswitchB", data)
+        self.push_setting("DisitckMpsPindiodeswitchB", data)
         data = bool(self.get_DisitckMpsFdltrgA())
-        self.push_change_event("DisitckMpsFdltrgA", data)
+        self.push_setting("DisitckMpsFdltrgA", data)
         data = bool(self.get_DisitckMpsFdltrgB())
-        self.push_change_event("DisitckMpsFdltrgB", data)
+        self.push_setting("DisitckMpsFdltrgB", data)
         data = bool(self.get_DisitckMpsPlctxoffA())
-        self.push_change_event("DisitckMpsPlctxoffA", data)
+        self.push_setting("DisitckMpsPlctxoffA", data)
         data = bool(self.get_DisitckMpsPlctxoffB())
-        self.push_change_event("DisitckMpsPlctxoffB", data)
+        self.push_setting("DisitckMpsPlctxoffB", data)
         data = bool(self.get_DisitckMpsMpsA())
-        self.push_change_event("DisitckMpsMpsA", data)
+        self.push_setting("DisitckMpsMpsA", data)
         data = bool(self.get_DisitckMpsMpsB())
-        self.push_change_event("DisitckMpsMpsB", data)
+        self.push_setting("DisitckMpsMpsB", data)
         data = bool(self.get_DisitckMpsDiagA())
-        self.push_change_event("DisitckMpsDiagA", data)
+        self.push_setting("DisitckMpsDiagA", data)
         data = bool(self.get_DisitckMpsDiagB())
-        self.push_change_event("DisitckMpsDiagB", data)
+        self.push_setting("DisitckMpsDiagB", data)
 
 
     @command
     def init_hardware(self):
-        try:
-            self.perseus.init_hardware()
-            self.set_state(DevState.RUNNING)
-        except Exception, e:
-            print e
-            self.set_state(DevState.FAULT)
+        self.initialize_hardware()
 
     @command
+    def reset_statistics(self):
+        self.clear_statistics()
+
+    @command(dtype_in=str, dtype_out=str, doc_in="snapshot name, a file of SettingsPath", doc_out="snapshot file")
+    def save_settings(self, name):
+        return self.save_snapshot(name)
+
+    @command(dtype_in=str, dtype_out=int, doc_in="snapshot name, a file of SettingsPath", doc_out="words written")
+    def restore_settings(self, name):
+        return self.restore_snapshot(name)
+
+    @command(dtype_in=str, dtype_out=int, doc_in="json {attribute name: value} of the settings to write together",
+             doc_out="words written")
+    def apply_settings(self, argin):
+        return self.apply_values(json.loads(argin))
+
+    @command(dtype_in=str, dtype_out=str, doc_in="snapshot name, a file of SettingsPath",
+             doc_out="json list of [cavity, address, snapshot value, live value]")
+    def diff_settings(self, name):
+        return json.dumps(self.diff_snapshot(name))
+
+    @command
+    @prioritized(PRIORITY_SAFETY)
     def tuning_resetA(self):
-        perseus_utils.write_direct(self.perseus, True, DIAG_TUNING_RESET_ADDRESS, 'A')
-        perseus_utils.write_direct(self.perseus, False, DIAG_TUNING_RESET_ADDRESS, 'A')
+        perseus_utils.write_pulse_direct(self.perseus, DIAG_TUNING_RESET_ADDRESS, 'A')
 
     @command
+    @prioritized(PRIORITY_SAFETY)
     def reset_manual_itckA(self):
-        perseus_utils.write_direct(self.perseus, True, RESET_MANUAL_ITCK_ADDRESS, 'A')
-        perseus_utils.write_direct(self.perseus, False, RESET_MANUAL_ITCK_ADDRESS, 'A')
+        perseus_utils.write_pulse_direct(self.perseus, RESET_MANUAL_ITCK_ADDRESS, 'A')
 
     @command
+    @prioritized(PRIORITY_SAFETY)
     def reset_itckA(self):
-        perseus_utils.write_direct(self.perseus, True, RESET_ITCK_ADDRESS, 'A')
-        perseus_utils.write_direct(self.perseus, False, RESET_ITCK_ADDRESS, 'A')
+        perseus_utils.write_pulse_direct(self.perseus, RESET_ITCK_ADDRESS, 'A')
 
     @command
+    @prioritized(PRIORITY_SAFETY)
     def tuning_resetB(self):
-        perseus_utils.write_direct(self.perseus, True, DIAG_TUNING_RESET_ADDRESS, 'B')
-        perseus_utils.write_direct(self.perseus, False, DIAG_TUNING_RESET_ADDRESS, 'B')
+        perseus_utils.write_pulse_direct(self.perseus, DIAG_TUNING_RESET_ADDRESS, 'B')
 
     @command
+    @prioritized(PRIORITY_SAFETY)
     def reset_manual_itckB(self):
-        perseus_utils.write_direct(self.perseus, True, RESET_MANUAL_ITCK_ADDRESS, 'B')
-        perseus_utils.write_direct(self.perseus, False, RESET_MANUAL_ITCK_ADDRESS, 'B')
+        perseus_utils.write_pulse_direct(self.perseus, RESET_MANUAL_ITCK_ADDRESS, 'B')
 
     @command
+    @prioritized(PRIORITY_SAFETY)
     def reset_itckB(self):
-        perseus_utils.write_direct(self.perseus, True, RESET_ITCK_ADDRESS, 'B')
-        perseus_utils.write_direct(self.perseus, False, RESET_ITCK_ADDRESS, 'B')
+        perseus_utils.write_pulse_direct(self.perseus, RESET_ITCK_ADDRESS, 'B')
 
     @command
+    @prioritized(PRIORITY_MAINTENANCE)
     def sw_fast_data_logger(self):
         # Ram init ... probably this should be done in init_device
         # but for the moment ...
@@ -9240,6 +9186,11 @@ class NutaqDiags(Device):
         # Restart RAM
         self.perseus.init_fast_data_logger()
 
+    @command(dtype_out=str, doc_out="json list of the interlock records of both cavities")
+    @prioritized(PRIORITY_MAINTENANCE)
+    def read_itck_history(self):
+        return self.itck_history.to_json(self.itck_history.read(self.perseus))
+
     def update_fim(self, cavity):
         self.update_RvTet1(cavity)
         self.update_RvTet2(cavity)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Fleet of perseus boards.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module drives many perseus boards at once, for site wide operations
+like reading the diagnostics of all the cavities or restoring their settings.
+
+Each operation runs on every board in a thread pool, so it takes about the
+time of the slowest board. An error on one board is kept in the result and
+does not stop the others. In the diagnostics, a register that cannot be read
+is NaN, and so are the amplitudes and phases derived from it.
+"""
+
+__all__ = ["NutaqFleet", "FleetBoard", "FleetResult"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import os
+from multiprocessing.pool import ThreadPool
+
+import numpy
+
+import pynutaq.perseus.perseusutils as perseus_utils
+import pynutaq.nutaq.nutaqregisters as registers
+from pynutaq.perseus.perseusfactory import Perseus
+from pynutaq.nutaq.nutaqsettings import SettingsSnapshot, get_snapshot_filename
+
+
+class FleetBoard(object):
+
+    def __init__(self, name, nutaq_type, perseus_type, perseus_ip):
+        self.name = name
+        self.nutaq_type = nutaq_type
+        self.perseus_type = perseus_type
+        self.perseus_ip = perseus_ip
+        self.perseus = None
+
+    def connect(self):
+        if self.perseus is None:
+            self.perseus = Perseus().new_perseus(self.perseus_type, self.perseus_ip)
+        return self.perseus
+
+
+class FleetResult(object):
+    """Values and errors of one fleet operation, by board name."""
+
+    def __init__(self, names, values, errors):
+        self.names = names
+        self.values = values
+        self.errors = errors
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def __getitem__(self, name):
+        if name in self.errors:
+            raise self.errors[name]
+        return self.values[name]
+
+    def stack(self, size, dtype=numpy.float64):
+        """Values as a (boards, size) array, NaN rows for the failed boards."""
+        data = numpy.empty((len(self.names), size), dtype=dtype)
+        data.fill(numpy.nan)
+        for row, name in enumerate(self.names):
+            if name in self.values:
+                data[row] = self.values[name]
+        return data
+
+
+class NutaqFleet(object):
+
+    def __init__(self, boards, processes=None):
+        """boards is a list of (name, nutaq type, perseus type, perseus ip)."""
+        self.boards = [FleetBoard(*board) for board in boards]
+        self.processes = processes or max(len(self.boards), 1)
+        self._pool = None
+
+    @property
+    def names(self):
+        return [board.name for board in self.boards]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ThreadPool(self.processes)
+        return self._pool
+
+    def run(self, function, *args, **kwargs):
+        """Call function(board, *args, **kwargs) on every board concurrently.
+
+        The board is connected first. Use the nutaq_type keyword to run only
+        on the boards of one type.
+        """
+        nutaq_type = kwargs.pop('nutaq_type', None)
+        boards = [board for board in self.boards
+                  if nutaq_type is None or board.nutaq_type == nutaq_type]
+
+        def call(board):
+            try:
+                board.connect()
+                return board.name, function(board, *args, **kwargs), None
+            except Exception, e:
+                return board.name, None, e
+
+        values, errors = {}, {}
+        for name, value, error in self._get_pool().map(call, boards):
+            if error is None:
+                values[name] = value
+            else:
+                print "%s: %s" % (name, error)
+                errors[name] = error
+        return FleetResult([board.name for board in boards], values, errors)
+
+    def connect(self):
+        return self.run(lambda board: True)
+
+    def read_diagnostics(self, nutaq_type):
+        """Diagnostics of all the boards of a type.
+
+        Returns (attribute names, (boards, attributes) array, FleetResult).
+        The values that could not be read are NaN.
+        """
+        register_map = registers.get_register_map(nutaq_type)
+        rows = register_map.select(registers.SECTION_DIAGNOSTICS)
+        result = self.run(_read_diagnostics, register_map, rows, nutaq_type=nutaq_type)
+        names = [register_map.names[row] for row in rows]
+        return names, result.stack(len(rows)), result
+
+    def read_settings(self):
+        """SettingsSnapshot of every board."""
+        return self.run(lambda board: SettingsSnapshot.read(board.perseus, board.nutaq_type))
+
+    def save_settings(self, path, name):
+        """Save a snapshot of each board as path/<board>/<name>.npz."""
+        def save(board):
+            filename = get_snapshot_filename(os.path.join(path, board.name), name)
+            SettingsSnapshot.read(board.perseus, board.nutaq_type).save(filename)
+            return filename
+        return self.run(save)
+
+    def restore_settings(self, path, name):
+        """Restore the snapshots saved by save_settings."""
+        def restore(board):
+            filename = get_snapshot_filename(os.path.join(path, board.name), name)
+            return SettingsSnapshot.load(filename).restore(board.perseus)
+        return self.run(restore)
+
+    def write_settings(self, nutaq_type, values):
+        """Write a {attribute name: value} dict on all the boards of a type."""
+        register_map = registers.get_register_map(nutaq_type)
+        rows = register_map.indexes(values.keys())
+        if not register_map.writable[rows].all():
+            raise Exception("Read only attributes in %s" % values.keys())
+        if (register_map.conversion[rows] == registers.CONV_BIT).any():
+            raise Exception("Bit attributes share their register, write them through the device")
+        words = register_map.words(rows, values.values())
+        cavities = register_map.cavity[rows]
+        return self.run(_write_words, words, cavities, nutaq_type=nutaq_type)
+
+
+def _read_diagnostics(board, register_map, rows):
+    perseus = board.perseus
+    derived = numpy.in1d(register_map.conversion[rows],
+                         [registers.CONV_AMPLITUDE, registers.CONV_PHASE])
+    raw = numpy.zeros(len(rows), dtype=numpy.int64)
+    invalid = numpy.zeros(len(rows), dtype=bool)
+    with perseus_utils.latched_diagnostics(perseus, *registers.CAVITIES):
+        for index, cavity in enumerate(registers.CAVITIES):
+            chain = (register_map.cavity[rows] == index) & ~derived
+            addresses, positions = numpy.unique(register_map.address[rows][chain], return_inverse=True)
+            values = perseus_utils.read_many_diag_direct(perseus, addresses, cavity, partial=True)
+            failed = numpy.array([value is None for value in values], dtype=bool)
+            values = numpy.array([0 if value is None else value for value in values], dtype=numpy.int64)
+            raw[numpy.flatnonzero(chain)] = values[positions]
+            invalid[numpy.flatnonzero(chain)] = failed[positions]
+    values = register_map.decode(rows, raw)
+    values[invalid] = numpy.nan
+
+    # amplitude and phase from their I/Q attributes
+    position = numpy.empty(len(register_map), dtype=numpy.int64)
+    position[rows] = numpy.arange(len(rows))
+    for conversion in (registers.CONV_AMPLITUDE, registers.CONV_PHASE):
+        selected = numpy.flatnonzero(register_map.conversion[rows] == conversion)
+        i_values = values[position[register_map.i_parent[rows[selected]]]]
+        q_values = values[position[register_map.q_parent[rows[selected]]]]
+        if conversion == registers.CONV_AMPLITUDE:
+            values[selected] = numpy.hypot(i_values, q_values)
+        else:
+            values[selected] = numpy.degrees(numpy.arctan2(q_values, i_values))
+    return values
+
+
+def _write_words(board, words, cavities):
+    for index, cavity in enumerate(registers.CAVITIES):
+        offset = perseus_utils.get_offset('write', cavity)
+        board.perseus.write_many([(offset, int(word)) for word in words[cavities == index]])
+    return len(words)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Interlock history of the nutaq diagnostics board.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module reads all the interlock records of the diagnostics board at
+once, without the ItckNumber of the device.
+
+Record 0 is the current interlock (address 150), records 1 to 7 the history
+(addresses 101 to 107) with their timestamps (addresses 110 to 116). The
+words of both chains are read in one batch per chain and decoded into a
+structured array with one row per (cavity, record):
+
+    cavity, record, word, inputs (one bool per interlock input), timestamp
+
+The current record has no timestamp (NaN).
+"""
+
+__all__ = ["ItckHistory", "ITCK_RECORDS"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import json
+
+import numpy
+
+import pynutaq.perseus.perseusutils as perseus_utils
+from pynutaq.nutaq.nutaqdefs import ITCK_CURRENT_ADDRESS, ITCK_HISTORY_ADDRESS, ITCK_TIMESTAMP_ADDRESS
+from pynutaq.nutaq.nutaqdefs import ITCK_HISTORY_RECORDS
+from pynutaq.nutaq.nutaqregisters import get_register_map, CAVITIES, CONV_BIT, SECTION_DIAGNOSTICS
+
+ITCK_RECORDS = ITCK_HISTORY_RECORDS + 1
+
+# timestamp ticks of 12.5 ns, in us
+TIMESTAMP_SCALE = 12.5 / 1000.0
+
+
+class ItckHistory(object):
+
+    def __init__(self, nutaq_type='diags'):
+        register_map = get_register_map(nutaq_type)
+        rows = [row for row in register_map.select(SECTION_DIAGNOSTICS, CAVITIES[0], [CONV_BIT])
+                if register_map.address[row] == ITCK_HISTORY_ADDRESS]
+        rows.sort(key=lambda row: register_map.pos[row])
+        self.inputs = [register_map.names[row][len('Diag_'):-1] for row in rows]
+        self.positions = numpy.array([register_map.pos[row] for row in rows], dtype=numpy.uint32)
+        records = numpy.arange(1, ITCK_RECORDS)
+        self.addresses = [ITCK_CURRENT_ADDRESS] + (ITCK_HISTORY_ADDRESS + records).tolist()
+        self.timestamp_addresses = (ITCK_TIMESTAMP_ADDRESS + records).tolist()
+        self.dtype = numpy.dtype([('cavity', 'S1'), ('record', numpy.int32), ('word', numpy.uint32),
+                                  ('inputs', numpy.bool_, (len(self.inputs),)),
+                                  ('timestamp', numpy.float64)])
+
+    def decode(self, cavity, words, timestamps):
+        """Records of a chain from the raw record words and the raw
+        timestamps of records 1 to 7.
+        """
+        words = numpy.asarray(words, dtype=numpy.int64) & 0xFFFFFFFF
+        records = numpy.zeros(len(words), dtype=self.dtype)
+        records['cavity'] = cavity
+        records['record'] = numpy.arange(len(words))
+        records['word'] = words
+        records['inputs'] = (words[:, numpy.newaxis] >> self.positions) & 1
+        records['timestamp'][0] = numpy.nan
+        records['timestamp'][1:] = numpy.asarray(timestamps, dtype=numpy.float64) * TIMESTAMP_SCALE
+        return records
+
+    def read(self, perseus):
+        """Records of both chains, one batch per chain. The diagnostics are
+        latched first, as for a diagnostics sweep.
+        """
+        chains = []
+        for cavity in CAVITIES:
+            with perseus_utils.latched_diagnostics(perseus, cavity):
+                raw = perseus_utils.read_many_diag_direct(perseus, self.addresses + self.timestamp_addresses,
+                                                          cavity)
+            chains.append(self.decode(cavity, raw[:ITCK_RECORDS], raw[ITCK_RECORDS:]))
+        return numpy.concatenate(chains)
+
+    def to_json(self, records):
+        """[{cavity, record, word, timestamp, inputs: {name: bool}}...]."""
+        result = []
+        for record in records:
+            timestamp = float(record['timestamp'])
+            result.append({'cavity': str(record['cavity']),
+                           'record': int(record['record']),
+                           'word': int(record['word']),
+                           'timestamp': None if timestamp != timestamp else timestamp,
+                           'inputs': dict(zip(self.inputs, record['inputs'].tolist()))})
+        return json.dumps(result)
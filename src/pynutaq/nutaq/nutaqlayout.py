@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Array layout of the nutaq diagnostics.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module lays out a diagnostics sweep as arrays, so clients can get
+all the diagnostics of a chain in one read.
+
+The index comes from the register map, so it only changes with the
+attributes CSV files:
+
+- one float64 array per chain, names given by ``names`` (the attribute names
+  without cavity),
+- one (pairs, 2) array of [I, Q] per chain, pairs given by ``iq_names``.
+
+The values that could not be read are NaN.
+"""
+
+__all__ = ["DiagnosticsLayout"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import numpy
+
+from pynutaq.nutaq.nutaqregisters import get_register_map, CAVITIES, SECTION_DIAGNOSTICS
+
+
+class DiagnosticsLayout(object):
+
+    def __init__(self, nutaq_type):
+        register_map = get_register_map(nutaq_type)
+        self.chain_names = {}
+        self.arrays = {}
+        self.iq_arrays = {}
+        self._iq_positions = {}
+        for cavity in CAVITIES:
+            rows = register_map.select(SECTION_DIAGNOSTICS, cavity)
+            names = [register_map.names[row] for row in rows]
+            positions = dict((row, position) for position, row in enumerate(rows))
+            pairs = register_map.iq_pairs(SECTION_DIAGNOSTICS, cavity)
+            self.chain_names[cavity] = names
+            self._iq_positions[cavity] = numpy.array([[positions[i_row], positions[q_row]]
+                                                      for name, i_row, q_row in pairs],
+                                                     dtype=int).reshape(-1, 2)
+            self.arrays[cavity] = numpy.empty(len(names))
+            self.arrays[cavity].fill(numpy.nan)
+            self.iq_arrays[cavity] = self.arrays[cavity][self._iq_positions[cavity]]
+        self.names = [name[:-1] for name in self.chain_names[CAVITIES[0]]]
+        self.iq_names = [name for name, i_row, q_row in pairs]
+
+    def publish(self, values):
+        """Fill the arrays from a {attribute name: value or None} dict."""
+        for cavity in CAVITIES:
+            data = [values.get(name) for name in self.chain_names[cavity]]
+            array = numpy.array([numpy.nan if value is None else value for value in data],
+                                dtype=numpy.float64)
+            self.arrays[cavity] = array
+            self.iq_arrays[cavity] = array[self._iq_positions[cavity]]
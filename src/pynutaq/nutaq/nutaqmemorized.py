@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Restore of the memorized nutaq settings.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module writes the memorized values of the settings attributes to
+the board at start-up, in one batch per chain, when the RestoreMemorized
+property is set (the attributes are not hw_memorized, so Tango itself
+never writes them to the board).
+
+The action settings (pulses and commands like Move or TuningReset, see
+ACTION_SETTINGS) are never restored.
+
+The values are checked against the min/max of the register map and written
+as a SettingsTransaction, without rollback. The bit attributes sharing a
+word (the DisITCK flags of NutaqDiags) are merged into it, over the
+memorized value of the whole word attribute if there is one, or over the
+word read from the board. So each word is written once, as update_fim would
+leave it.
+"""
+
+__all__ = ["MemorizedRestore", "parse_memorized"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+from pynutaq.nutaq.nutaqregisters import get_register_map, CONV_BIT, SECTION_SETTINGS
+from pynutaq.nutaq.nutaqtransaction import SettingsTransaction, check_values
+
+MEMORIZED_VALUE = '__value'
+
+
+def parse_memorized(properties):
+    """{attribute name: value} from the attribute properties of the
+    database, for the attributes with a memorized value.
+    """
+    values = {}
+    for name, attribute_properties in properties.items():
+        value = attribute_properties.get(MEMORIZED_VALUE)
+        if not value:
+            continue
+        value = value[0].strip().lower()
+        if value in ('true', 'false'):
+            values[name] = float(value == 'true')
+            continue
+        try:
+            values[name] = float(value)
+        except ValueError:
+            print "Memorized value of %s not understood: %r" % (name, value)
+    return values
+
+
+class MemorizedRestore(object):
+
+    def __init__(self, nutaq_type):
+        self.nutaq_type = nutaq_type
+        self.register_map = register_map = get_register_map(nutaq_type)
+        rows = register_map.select(SECTION_SETTINGS, writable=True)
+        self.names = [register_map.names[row] for row in
+                      register_map.select(SECTION_SETTINGS, writable=True, action=False)]
+        self.bit_names = set(register_map.names[row] for row in rows
+                             if register_map.conversion[row] == CONV_BIT)
+
+    def restore(self, perseus, values):
+        """Write the memorized values, one batch per chain.
+
+        Returns ({name: value} written, list of rejected (name, value, reason)).
+        """
+        restored = set(self.names)
+        skipped = [(name, value, 'not restored') for name, value in values.items() if name not in restored]
+        values = dict((name, value) for name, value in values.items() if name in restored)
+        rows, data, rejected = check_values(self.register_map, values)
+        rejected = skipped + rejected
+        SettingsTransaction(perseus, self.nutaq_type).commit(rows, data, rollback=False)
+        names = self.register_map.names
+        return dict((names[row], value) for row, value in zip(rows, data.tolist())), rejected
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Quality of the nutaq diagnostics.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module keeps the timestamp and the quality of the diagnostics
+attributes, computed for all of them at once when a sweep is published.
+
+The timestamp is the time the diagnostics were latched. The quality is:
+
+- INVALID when the value could not be read, or the sweep is older than the
+  stale time,
+- ALARM when the value is out of the min/max of the register map,
+- VALID otherwise.
+
+CHANGING is kept for the settings being written (see WriteCoalescer).
+rel_change is in percent, as the rel_change of the attributes: changed
+marks the values that moved more than rel_change % since the previous
+sweep, or whose quality changed, the ones worth a change event.
+"""
+
+__all__ = ["DiagnosticsQuality", "QUALITY_VALID", "QUALITY_INVALID",
+           "QUALITY_ALARM", "QUALITY_CHANGING"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import time
+
+import numpy
+
+from pynutaq.nutaq.nutaqdefs import DEFAULT_REL_CHANGE
+from pynutaq.nutaq.nutaqregisters import get_register_map
+
+QUALITY_VALID = 0
+QUALITY_INVALID = 1
+QUALITY_ALARM = 2
+QUALITY_CHANGING = 3
+
+DEFAULT_STALE_TIME = 10.0
+
+
+class DiagnosticsQuality(object):
+
+    def __init__(self, nutaq_type, stale_time=DEFAULT_STALE_TIME, rel_change=DEFAULT_REL_CHANGE):
+        self.register_map = get_register_map(nutaq_type)
+        self.stale_time = stale_time
+        self.rel_change = rel_change
+        self.timestamp = None
+        self.names = []
+        self.values = numpy.array([])
+        self.qualities = numpy.array([], dtype=numpy.int8)
+        self.changed = numpy.array([], dtype=bool)
+        self._positions = {}
+
+    def _set_names(self, names):
+        register_map = self.register_map
+        self.names = list(names)
+        self._positions = dict((name, position) for position, name in enumerate(self.names))
+        rows = numpy.array([register_map.index(name) if name in register_map else -1
+                            for name in self.names], dtype=int)
+        known = rows >= 0
+        self.min_value = numpy.where(known, register_map.min_value[rows], numpy.nan)
+        self.max_value = numpy.where(known, register_map.max_value[rows], numpy.nan)
+        self.values = numpy.empty(len(self.names))
+        self.values.fill(numpy.nan)
+        self.qualities = numpy.empty(len(self.names), dtype=numpy.int8)
+        self.qualities.fill(-1)
+
+    def publish(self, names, values, timestamp=None):
+        """Compute the qualities of a sweep. values holds None for the
+        values that could not be read. Returns the qualities array.
+        """
+        if names != self.names:
+            self._set_names(names)
+        previous = self.values
+        values = numpy.array([numpy.nan if value is None else value for value in values],
+                             dtype=numpy.float64)
+        valid = ~numpy.isnan(values)
+        with numpy.errstate(invalid='ignore'):
+            alarm = (values < self.min_value) | (values > self.max_value)
+            moved = numpy.abs(values - previous) > self.rel_change / 100.0 * numpy.abs(previous)
+
+        qualities = numpy.zeros(len(values), dtype=numpy.int8)
+        qualities[alarm] = QUALITY_ALARM
+        qualities[~valid] = QUALITY_INVALID
+
+        self.changed = moved | (qualities != self.qualities) | (valid & numpy.isnan(previous))
+        self.values = values
+        self.qualities = qualities
+        self.timestamp = time.time() if timestamp is None else timestamp
+        return qualities
+
+    def is_stale(self):
+        return self.timestamp is None or time.time() - self.timestamp > self.stale_time
+
+    def get(self, name):
+        """(timestamp, quality) of name in the last sweep."""
+        position = self._positions.get(name)
+        if position is None or self.is_stale():
+            return self.timestamp or time.time(), QUALITY_INVALID
+        return self.timestamp, int(self.qualities[position])
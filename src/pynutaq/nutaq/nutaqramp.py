@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Setpoint ramps of the nutaq loops board.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module ramps the amplitude and phase references (AmprefinA/B,
+PhrefinA/B) in the device server.
+
+A ramp goes from the current setpoint to a target at a rate (mV/s or
+degrees/s), following a profile:
+
+- linear: constant rate,
+- scurve: (1 - cos)/2, starts and ends at zero rate, same duration.
+
+A thread writes one setpoint per step period, on absolute times so the ramp
+takes the time given by the rate. Before each step the diagnostics of the
+chain are latched and EPS_ITCK is read: the ramp is aborted when it goes
+from 0 to 1. The last step writes the target, which must be in the min/max
+of the register map. An operator write of the setpoint aborts its ramp.
+"""
+
+__all__ = ["SetpointRamp", "RampEngine", "RAMP_PROFILES", "RAMP_SETPOINTS"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import math
+import threading
+import time
+
+import pynutaq.perseus.perseusutils as perseus_utils
+from pynutaq.perseus.perseusexceptions import PerseusArgumentError, PerseusTransportError
+from pynutaq.nutaq.nutaqdefs import AMP_REF_IN_ADDRESS, PHASE_REF_IN_ADDRESS, EPS_ITCK_ADDRESS
+from pynutaq.nutaq.nutaqregisters import get_register_map
+
+RAMP_PROFILES = {
+    'linear': lambda fraction: fraction,
+    'scurve': lambda fraction: (1.0 - math.cos(math.pi * fraction)) / 2.0,
+}
+
+# setpoint: (address, read, write)
+RAMP_SETPOINTS = {
+    'Amprefin': (AMP_REF_IN_ADDRESS, perseus_utils.read_milivolts, perseus_utils.write_milivolts),
+    'Phrefin': (PHASE_REF_IN_ADDRESS, perseus_utils.read_angle, perseus_utils.write_angle),
+}
+
+RAMP_IDLE = 'idle'
+RAMP_RUNNING = 'running'
+RAMP_DONE = 'done'
+RAMP_ABORTED = 'aborted'
+
+
+class SetpointRamp(object):
+
+    def __init__(self, perseus, name, target, rate, profile='linear', step_period=0.1,
+                 on_progress=None):
+        setpoint, cavity = name[:-1], name[-1]
+        if setpoint not in RAMP_SETPOINTS:
+            raise PerseusArgumentError('ramp', detail='No ramp for %r' % name)
+        if profile not in RAMP_PROFILES:
+            raise PerseusArgumentError('ramp', detail='Unknown ramp profile %r' % profile)
+        if rate <= 0:
+            raise PerseusArgumentError('ramp', detail='The ramp rate must be positive')
+        register_map = get_register_map('loops')
+        row = register_map.index(name)
+        min_value, max_value = register_map.min_value[row], register_map.max_value[row]
+        if not min_value <= target <= max_value:
+            raise PerseusArgumentError('ramp', detail='%s target %s out of [%s, %s]'
+                                       % (name, target, min_value, max_value))
+        self.perseus = perseus
+        self.name = name
+        self.cavity = cavity
+        self.address, self._read, self._write = RAMP_SETPOINTS[setpoint]
+        self.target = float(target)
+        self.rate = float(rate)
+        self.profile = profile
+        self.step_period = step_period
+        self.on_progress = on_progress
+        self.start_value = None
+        self.value = None
+        self.progress = 0.0
+        self.state = RAMP_IDLE
+        self.reason = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self.start_value = self.value = self._read(self.perseus, self.address, self.cavity)
+        self.duration = abs(self.target - self.start_value) / self.rate
+        self.state = RAMP_RUNNING
+        self._thread = threading.Thread(target=self._run, name='ramp%s' % self.name)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def abort(self, reason='aborted'):
+        if self.state == RAMP_RUNNING:
+            self.reason = reason
+            self._stop.set()
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def read_interlock(self):
+        with perseus_utils.latched_diagnostics(self.perseus, self.cavity):
+            return perseus_utils.read_diag_bool(self.perseus, EPS_ITCK_ADDRESS, self.cavity)
+
+    def _step(self, fraction):
+        shape = RAMP_PROFILES[self.profile](fraction)
+        self.value = self.start_value + (self.target - self.start_value) * shape
+        self._write(self.perseus, self.value, self.address, self.cavity)
+        self.progress = fraction
+        if self.on_progress is not None:
+            self.on_progress(self)
+
+    def _finish(self, state, reason=None):
+        self.state = state
+        self.reason = reason
+        if self.on_progress is not None:
+            self.on_progress(self)
+
+    def _run(self):
+        steps = max(int(math.ceil(self.duration / self.step_period)), 1)
+        started = time.time()
+        try:
+            interlock = self.read_interlock()
+            for step in xrange(1, steps + 1):
+                delay = started + step * self.duration / steps - time.time()
+                if self._stop.wait(max(delay, 0)):
+                    self._finish(RAMP_ABORTED, self.reason)
+                    return
+                current = self.read_interlock()
+                if current and not interlock:
+                    self._finish(RAMP_ABORTED, 'interlock')
+                    return
+                interlock = current
+                self._step(float(step) / steps)
+        except PerseusTransportError, e:
+            print "Ramp %s: %s" % (self.name, e)
+            self._finish(RAMP_ABORTED, str(e))
+            return
+        self._finish(RAMP_DONE)
+
+    def status(self):
+        return {'state': self.state,
+                'reason': self.reason,
+                'profile': self.profile,
+                'start': self.start_value,
+                'target': self.target,
+                'rate': self.rate,
+                'value': self.value,
+                'progress': self.progress}
+
+
+class RampEngine(object):
+    """The ramps of a device, one per setpoint at a time."""
+
+    def __init__(self, perseus, step_period=0.1, on_progress=None):
+        self.perseus = perseus
+        self.step_period = step_period
+        self.on_progress = on_progress
+        self.ramps = {}
+        self._lock = threading.Lock()
+
+    def start(self, name, target, rate, profile='linear'):
+        """Ramp setpoint name (AmprefinA...), aborting its running ramp."""
+        ramp = SetpointRamp(self.perseus, name, target, rate, profile, self.step_period,
+                            self.on_progress)
+        with self._lock:
+            previous = self.ramps.get(name)
+            if previous is not None:
+                previous.abort('replaced')
+                previous.join()
+            self.ramps[name] = ramp
+            ramp.start()
+        return ramp
+
+    def running(self, name):
+        with self._lock:
+            ramp = self.ramps.get(name)
+        return ramp is not None and ramp.state == RAMP_RUNNING
+
+    def abort_setpoint(self, name, reason='aborted'):
+        """Abort the ramp of setpoint name and wait for its last write."""
+        with self._lock:
+            ramp = self.ramps.get(name)
+        if ramp is not None:
+            ramp.abort(reason)
+            ramp.join()
+
+    def abort(self, reason='aborted'):
+        with self._lock:
+            ramps = self.ramps.values()
+        for ramp in ramps:
+            ramp.abort(reason)
+        for ramp in ramps:
+            ramp.join()
+
+    def status(self):
+        with self._lock:
+            return dict((name, ramp.status()) for name, ramp in self.ramps.items())
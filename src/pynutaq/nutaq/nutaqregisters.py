@@ -0,0 +1,472 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Register map of the nutaq device servers.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module builds the register map of the device servers from the
+attributes CSV files of the registers directory, the ones the code
+generator reads too, and caches it to a binary file of the user cache
+directory.
+"""
+
+__all__ = ["RegisterMap", "get_register_map", "get_cache_dir"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import os
+import csv
+import hashlib
+import tempfile
+import zipfile
+
+import numpy
+
+from pynutaq.perseus.perseusdefs import *
+from pynutaq.perseus.perseusexceptions import PerseusArgumentError
+
+REGISTERS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'registers')
+
+# (settings csv, diagnostics csv) for each type of nutaq
+CSV_FILES = {
+    'loops': ('loops_attributes.csv', 'diags_attributes.csv'),
+    'diags': ('settings_diags.csv', 'diags_diags.csv'),
+}
+
+CAVITIES = ('A', 'B')
+
+SECTION_SETTINGS = 0
+SECTION_DIAGNOSTICS = 1
+
+DTYPE_FLOAT = 0
+DTYPE_INT = 1
+DTYPE_BOOL = 2
+
+# Conversion kinds
+CONV_LINEAR = 0     # raw * scale + offset
+CONV_SIGNED = 1     # 16 bits two's complement * scale
+CONV_ANGLE = 2      # 16 bits two's complement to degrees
+CONV_BIT = 3        # (raw >> pos) & 1
+CONV_CEIL = 4       # as linear, but rounded up when encoding
+CONV_INVERSE = 5    # raw * scale, encoded as 1 / (value * scale)
+CONV_AMPLITUDE = 6  # derived from the I/Q parents
+CONV_PHASE = 7      # derived from the I/Q parents
+
+MV_SCALE = 1000.0 / 32767
+LOOPS_MV_SCALE = 1000.0 / 32767 * 1.6467602581
+ANGLE_SCALE = 180.0 / 32767
+
+# name without cavity -> (conversion, scale, offset), see pynutaq.extra
+SPECIAL_CONVERSIONS = {
+    'Pilimit': (CONV_LINEAR, 1000.0 / 32767, 0),
+    'GainTetrode1': (CONV_LINEAR, 1 / 19898.0, 0),
+    'GainTetrode2': (CONV_LINEAR, 1 / 19898.0, 0),
+    'GainOl': (CONV_CEIL, 2.0 / 127, 0),
+    'Freqsquare': (CONV_INVERSE, 1 / 80000.0, 0),
+    'ConditioningdutyCicle': (CONV_LINEAR, 256 * 100.0 / 8000000.0, 0),
+    'MDivider': (CONV_LINEAR, 1, 1),
+    'NDivider': (CONV_LINEAR, 1, 1),
+    'Fwmin': (CONV_LINEAR, 1000.0 / 32767, 0),
+    'Tuningdelay': (CONV_LINEAR, 2**12 / 80000000.0, 0),
+    'InterlocksDelay': (CONV_LINEAR, 1 / 80.0, 0),
+    'FdlTriggerDelay': (CONV_LINEAR, 2**12 / 80000.0, 0),
+    'Timestamp1': (CONV_LINEAR, 12.5 / 1000.0, 0),
+    'Timestamp2': (CONV_LINEAR, 12.5 / 1000.0, 0),
+    'Timestamp3': (CONV_LINEAR, 12.5 / 1000.0, 0),
+    'Timestamp4': (CONV_LINEAR, 12.5 / 1000.0, 0),
+    'Timestamp5': (CONV_LINEAR, 12.5 / 1000.0, 0),
+    'Timestamp6': (CONV_LINEAR, 12.5 / 1000.0, 0),
+    'Timestamp7': (CONV_LINEAR, 12.5 / 1000.0, 0),
+}
+
+# csv type -> (conversion, scale, offset)
+SETTINGS_CONVERSIONS = {
+    'direct': (CONV_LINEAR, 1, 0),
+    'angle': (CONV_ANGLE, ANGLE_SCALE, 0),
+    'mv': (CONV_LINEAR, LOOPS_MV_SCALE, 0),
+    'dmv': (CONV_LINEAR, MV_SCALE, 0),
+    'percentage': (CONV_LINEAR, 100.0 / 32767, 0),
+    'special_fim': (CONV_BIT, 1, 0),
+}
+
+DIAGNOSTICS_CONVERSIONS = {
+    'mv': (CONV_SIGNED, MV_SCALE, 0),
+    'angle': (CONV_ANGLE, ANGLE_SCALE, 0),
+    'bool': (CONV_LINEAR, 1, 0),
+    'special_itck': (CONV_BIT, 1, 0),
+    'special_itck_out': (CONV_BIT, 1, 0),
+}
+
+# csv names of the settings that trigger an action of the board (commands
+# and pulses). They are not state, so snapshots and memorized values never
+# write them back.
+ACTION_SETTINGS = {
+    'loops': ['Command Start', 'FDL Sw Trigger', 'Move', 'MoveUp', 'TuningReset'],
+    'diags': ['manual Interlock', 'FDL Sw Trigger', 'Reset Interlocks Cav', 'LandauTuningReset',
+              'MoveLandauUp', 'MoveLandauPLG'],
+}
+
+# Same exclusion as tools/codegenerator
+EXCLUDED_IQ_ATTRIBUTES = [
+    'polarforamplitudeloop',
+    'polarforphaseloop',
+]
+
+DTYPES = {'float': DTYPE_FLOAT, 'int': DTYPE_INT, 'bool': DTYPE_BOOL}
+
+COLUMNS = ['section', 'cavity', 'address', 'pos', 'conversion', 'scale', 'offset',
+           'min_value', 'max_value', 'dtype', 'writable', 'i_parent', 'q_parent',
+           'read_offset', 'write_offset']
+
+CHAIN_OFFSETS = {
+    (SECTION_SETTINGS, 'A'): (SETTINGS_READ_OFFSET_A, SETTINGS_WRITE_OFFSET_A),
+    (SECTION_SETTINGS, 'B'): (SETTINGS_READ_OFFSET_B, SETTINGS_WRITE_OFFSET_B),
+    (SECTION_DIAGNOSTICS, 'A'): (DIAGNOSTICS_OFFSET_A, DIAGNOSTICS_OFFSET_A),
+    (SECTION_DIAGNOSTICS, 'B'): (DIAGNOSTICS_OFFSET_B, DIAGNOSTICS_OFFSET_B),
+}
+
+
+def attribute_name(csv_name):
+    """Same naming rule used by the code generator."""
+    return ''.join([a.capitalize() for a in csv_name.replace('_', ' ').replace('-', ' ').split()])
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return numpy.nan
+
+
+def _to_pos(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return -1
+
+
+def _read_csv(filename):
+    with open(filename, 'rU') as fd:
+        return list(csv.DictReader(fd, delimiter=';'))
+
+
+def _get_conversion(section, csv_type, name):
+    if section == SECTION_SETTINGS:
+        conversions = SETTINGS_CONVERSIONS
+    else:
+        conversions = DIAGNOSTICS_CONVERSIONS
+    if csv_type in conversions:
+        return conversions[csv_type]
+    try:
+        return SPECIAL_CONVERSIONS[name]
+    except KeyError:
+        raise ValueError('Unknown conversion for %s (%s)' % (name, csv_type))
+
+
+class RegisterMap(object):
+    """Columns of the registers of one type of nutaq, indexed by attribute
+    name and by (section, cavity, address).
+    """
+
+    def __init__(self, names, columns, digest=''):
+        self.names = list(names)
+        self.digest = digest
+        for column in COLUMNS:
+            setattr(self, column, columns[column])
+        self._by_name = dict((name, row) for row, name in enumerate(self.names))
+        self.action = numpy.zeros(len(self.names), dtype=bool)
+        self._by_address = {}
+        for row in xrange(len(self.names)):
+            if self.conversion[row] in (CONV_AMPLITUDE, CONV_PHASE):
+                continue
+            key = (int(self.section[row]), CAVITIES[self.cavity[row]], int(self.address[row]))
+            self._by_address.setdefault(key, []).append(row)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def index(self, name):
+        return self._by_name[name]
+
+    def indexes(self, names):
+        return numpy.array([self._by_name[name] for name in names], dtype=numpy.int32)
+
+    def rows(self, cavity, address, section=SECTION_SETTINGS):
+        return self._by_address.get((section, cavity, address), [])
+
+    def set_actions(self, csv_names):
+        """Mark the settings of csv_names, of both chains, as actions."""
+        for name in csv_names:
+            for cavity in CAVITIES:
+                row = self._by_name.get(attribute_name(name) + cavity)
+                if row is not None:
+                    self.action[row] = True
+
+    def select(self, section=None, cavity=None, conversions=None, writable=None, action=None):
+        mask = numpy.ones(len(self), dtype=bool)
+        if section is not None:
+            mask &= self.section == section
+        if cavity is not None:
+            mask &= self.cavity == CAVITIES.index(cavity)
+        if conversions is not None:
+            mask &= numpy.in1d(self.conversion, conversions)
+        if writable is not None:
+            mask &= self.writable == writable
+        if action is not None:
+            mask &= self.action == action
+        return numpy.flatnonzero(mask)
+
+    def iq_pairs(self, section, cavity):
+        """(pair name, I row, Q row) of the I/Q attributes of a chain. The
+        pair name is the I attribute name without prefix, I and cavity.
+        """
+        rows = self.select(section, cavity)
+        prefix = 'Diag_' if section == SECTION_DIAGNOSTICS else ''
+        names = [self.names[row][len(prefix):] for row in rows]
+        pairs = []
+        for name in _get_iq_pairs(names):
+            i_row = self._by_name.get(prefix + 'I' + name)
+            q_row = self._by_name.get(prefix + 'Q' + name)
+            if i_row is not None and q_row is not None:
+                pairs.append((name[:-1], i_row, q_row))
+        return pairs
+
+    def bit_addresses(self, section, cavity):
+        """Addresses of the words holding the bit attributes of a chain."""
+        rows = self.select(section, cavity, [CONV_BIT])
+        return numpy.unique(self.address[rows]).tolist()
+
+    def decode(self, rows, raw):
+        """Convert raw register values of the given rows to attribute values."""
+        raw = numpy.asarray(raw, dtype=numpy.int64)
+        conversion = self.conversion[rows]
+        scale = self.scale[rows]
+        values = raw * scale + self.offset[rows]
+
+        signed = (conversion == CONV_SIGNED) | (conversion == CONV_ANGLE)
+        if signed.any():
+            signed_raw = numpy.where(raw > 32767, raw - 65536, raw)
+            values = numpy.where(signed, signed_raw * scale, values)
+
+        bits = conversion == CONV_BIT
+        if bits.any():
+            values = numpy.where(bits, (raw >> numpy.maximum(self.pos[rows], 0)) & 1, values)
+        return values
+
+    def encode(self, rows, values):
+        """Convert attribute values of the given rows to raw register values.
+
+        Raises PerseusArgumentError for a 0 of an inverse conversion.
+        """
+        values = numpy.asarray(values, dtype=numpy.float64)
+        conversion = self.conversion[rows]
+        scale = self.scale[rows]
+        zeros = (conversion == CONV_INVERSE) & (values == 0)
+        if zeros.any():
+            raise PerseusArgumentError('encode', detail='%s cannot be 0' % ', '.join(
+                self.names[row] for row in numpy.asarray(rows)[zeros]))
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            linear = (values - self.offset[rows]) / scale
+            raw = numpy.where(conversion == CONV_CEIL, numpy.ceil(linear), linear)
+            raw = numpy.where(conversion == CONV_INVERSE, 1.0 / (values * scale), raw)
+
+            angles = numpy.where(values < 0, values / scale + 65536,
+                                 numpy.where(values <= 180.0, values / scale,
+                                             (values - 360) / scale + 65536))
+            raw = numpy.where(conversion == CONV_ANGLE, angles, raw)
+
+            bits = numpy.left_shift(values.astype(numpy.int64), numpy.maximum(self.pos[rows], 0))
+            raw = numpy.where(conversion == CONV_BIT, bits, raw)
+        return numpy.trunc(raw).astype(numpy.int64)
+
+    def words(self, rows, values):
+        """Settings words (address << 17 | raw) for the given rows."""
+        return (self.address[rows].astype(numpy.int64) << 17) | self.encode(rows, values)
+
+    def save(self, filename):
+        arrays = dict((column, getattr(self, column)) for column in COLUMNS)
+        arrays['names'] = numpy.array(self.names)
+        arrays['digest'] = numpy.array(self.digest)
+        with open(filename, 'wb') as fd:
+            numpy.savez(fd, **arrays)
+
+    @classmethod
+    def load(cls, filename):
+        data = numpy.load(filename, allow_pickle=False)
+        columns = dict((column, data[column]) for column in COLUMNS)
+        return cls([str(name) for name in data['names']], columns, str(data['digest']))
+
+    @classmethod
+    def from_csv(cls, settings_filename, diagnostics_filename, extended_iq=False, digest=''):
+        entries = []
+
+        def add_entry(name, section, cavity, attr, conversion):
+            conv, scale, offset = conversion
+            address = attr.get('address') or 0
+            read_offset, write_offset = CHAIN_OFFSETS[(section, cavity)]
+            entries.append({
+                'name': name,
+                'section': section,
+                'cavity': CAVITIES.index(cavity),
+                'address': int(address),
+                'pos': _to_pos(attr.get('pos')),
+                'conversion': conv,
+                'scale': scale,
+                'offset': offset,
+                'min_value': _to_float(attr.get('min_value')),
+                'max_value': _to_float(attr.get('max_value')),
+                'dtype': DTYPES.get(attr.get('dtype'), DTYPE_FLOAT),
+                'writable': attr.get('access') == 'read_write',
+                'i_parent': attr.get('i_parent', ''),
+                'q_parent': attr.get('q_parent', ''),
+                'read_offset': read_offset,
+                'write_offset': write_offset,
+            })
+
+        for section, filename, prefix in ((SECTION_SETTINGS, settings_filename, ''),
+                                          (SECTION_DIAGNOSTICS, diagnostics_filename, 'Diag_')):
+            diag_names = []
+            for attr in _read_csv(filename):
+                base_name = attribute_name(attr['name'])
+                conversion = _get_conversion(section, attr['type'], base_name)
+                if attr['type'] == 'bool':
+                    attr['dtype'] = 'bool'
+                for cavity in CAVITIES:
+                    add_entry(prefix + base_name + cavity, section, cavity, attr, conversion)
+                    diag_names.append(base_name + cavity)
+
+            if section == SECTION_DIAGNOSTICS and extended_iq:
+                for kind, conv in (('Amp', CONV_AMPLITUDE), ('Ph', CONV_PHASE)):
+                    for name in _get_iq_pairs(diag_names):
+                        cavity = name[-1].upper() if name[-1] in 'aAbB' else 'A'
+                        attr = {'dtype': 'float',
+                                'i_parent': prefix + 'I' + name,
+                                'q_parent': prefix + 'Q' + name}
+                        add_entry(prefix + kind + name.capitalize(), section, cavity, attr, (conv, 1, 0))
+
+        names = [entry['name'] for entry in entries]
+        by_name = dict((name, row) for row, name in enumerate(names))
+        for entry in entries:
+            entry['i_parent'] = by_name.get(entry['i_parent'], -1)
+            entry['q_parent'] = by_name.get(entry['q_parent'], -1)
+
+        dtypes = {
+            'section': numpy.int8, 'cavity': numpy.int8, 'address': numpy.int32, 'pos': numpy.int8,
+            'conversion': numpy.int8, 'scale': numpy.float64, 'offset': numpy.float64,
+            'min_value': numpy.float64, 'max_value': numpy.float64, 'dtype': numpy.int8,
+            'writable': bool, 'i_parent': numpy.int32, 'q_parent': numpy.int32,
+            'read_offset': numpy.uint32, 'write_offset': numpy.uint32,
+        }
+        columns = dict((column, numpy.array([entry[column] for entry in entries], dtype=dtypes[column]))
+                       for column in COLUMNS)
+        return cls(names, columns, digest)
+
+
+def _get_iq_pairs(names):
+    """I/Q pairs as found by codegenerator.get_extended_list_of_attributes,
+    kept in order of appearance.
+    """
+    stripped = [name[1:] for name in names if name.startswith('I') or name.startswith('Q')]
+    pairs = []
+    for name in stripped:
+        if stripped.count(name) == 2 and name.lower() not in EXCLUDED_IQ_ATTRIBUTES and name not in pairs:
+            pairs.append(name)
+    return pairs
+
+
+def _get_digest(filenames):
+    digest = hashlib.sha1()
+    for filename in filenames:
+        with open(filename, 'rb') as fd:
+            digest.update(fd.read())
+    return digest.hexdigest()
+
+
+_register_maps = {}
+
+
+def get_cache_dir():
+    """Per user directory of the cached register maps."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'pynutaq')
+
+
+def _load_cache(cache_file):
+    try:
+        return RegisterMap.load(cache_file)
+    except (IOError, OSError, KeyError, ValueError, zipfile.BadZipfile), e:
+        print "Register map cache %s discarded: %s" % (cache_file, e)
+    try:
+        os.unlink(cache_file)
+    except OSError:
+        pass
+    return None
+
+
+def _save_cache(register_map, cache_dir, cache_file):
+    """Write the cache to a temporary file and rename it, so a concurrent
+    reader never loads a partial file.
+    """
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir, 0700)
+    fd, filename = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    os.close(fd)
+    try:
+        register_map.save(filename)
+        os.rename(filename, cache_file)
+    except:
+        os.unlink(filename)
+        raise
+
+
+def get_register_map(nutaq_type, cache_dir=None):
+    """Return the register map of a nutaq type {loops | diags}.
+
+    The map is built from the CSV files the first time and stored in
+    cache_dir (default get_cache_dir()); later calls load the binary file
+    while the CSVs are unchanged.
+    """
+    if nutaq_type in _register_maps:
+        return _register_maps[nutaq_type]
+
+    filenames = [os.path.join(REGISTERS_PATH, name) for name in CSV_FILES[nutaq_type]]
+    digest = _get_digest(filenames)
+
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+    cache_file = os.path.join(cache_dir, 'registermap_%s_%s.npz' % (nutaq_type, digest[:12]))
+
+    register_map = None
+    if os.path.exists(cache_file):
+        register_map = _load_cache(cache_file)
+    if register_map is None:
+        register_map = RegisterMap.from_csv(filenames[0], filenames[1],
+                                            extended_iq=(nutaq_type == 'loops'), digest=digest)
+        try:
+            _save_cache(register_map, cache_dir, cache_file)
+        except (IOError, OSError), e:
+            print "Register map not cached: %s" % e
+    register_map.set_actions(ACTION_SETTINGS[nutaq_type])
+
+    _register_maps[nutaq_type] = register_map
+    return register_map
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Snapshots of the nutaq settings.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module saves, restores and compares the raw values of all the
+settings addresses of both chains.
+
+A snapshot is a npz file with one row per (cavity, address) holding the raw
+register value, so restoring it does not depend on the attribute conversions.
+The action settings (commands and pulses, see ACTION_SETTINGS) are saved but
+never restored.
+"""
+
+__all__ = ["SettingsSnapshot", "get_settings_addresses", "get_snapshot_filename"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import os
+import time
+
+import numpy
+
+import pynutaq.perseus.perseusutils as perseus_utils
+from pynutaq.perseus.perseusexceptions import PerseusArgumentError
+from pynutaq.nutaq.nutaqregisters import get_register_map, CAVITIES, SECTION_SETTINGS
+
+SNAPSHOT_EXTENSION = '.npz'
+RAW_VALUE_MASK = (1 << 17) - 1
+
+
+def get_settings_addresses(nutaq_type, cavity, writable=None, action=None):
+    """Sorted settings addresses of one chain."""
+    register_map = get_register_map(nutaq_type)
+    rows = register_map.select(SECTION_SETTINGS, cavity, writable=writable, action=action)
+    addresses = register_map.address[rows]
+    return numpy.unique(addresses[addresses >= 0]).astype(numpy.uint32)
+
+
+def get_snapshot_filename(path, name):
+    """File of the snapshot name in path. name is a plain file name."""
+    if not name or os.sep in name or (os.altsep and os.altsep in name) or '..' in name:
+        raise PerseusArgumentError('snapshot', detail='Invalid snapshot name %r' % name)
+    name = os.path.join(path, name)
+    if not name.endswith(SNAPSHOT_EXTENSION):
+        name += SNAPSHOT_EXTENSION
+    return name
+
+
+class SettingsSnapshot(object):
+
+    def __init__(self, nutaq_type, cavity, address, value, timestamp=None):
+        self.nutaq_type = nutaq_type
+        self.cavity = numpy.asarray(cavity, dtype=numpy.uint8)
+        self.address = numpy.asarray(address, dtype=numpy.uint32)
+        self.value = numpy.asarray(value, dtype=numpy.uint32)
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    def __len__(self):
+        return len(self.address)
+
+    @classmethod
+    def read(cls, perseus, nutaq_type):
+        """Read every settings address of both chains from the board."""
+        cavities, addresses, values = [], [], []
+        for index, cavity in enumerate(CAVITIES):
+            chain_addresses = get_settings_addresses(nutaq_type, cavity)
+            chain_values = perseus_utils.read_many_direct(perseus, chain_addresses, cavity)
+            cavities.append(numpy.repeat(numpy.uint8(index), len(chain_addresses)))
+            addresses.append(chain_addresses)
+            values.append(numpy.asarray(chain_values, dtype=numpy.uint32) & RAW_VALUE_MASK)
+        return cls(nutaq_type, numpy.concatenate(cavities), numpy.concatenate(addresses),
+                   numpy.concatenate(values))
+
+    def save(self, filename):
+        directory = os.path.dirname(filename)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        with open(filename, 'wb') as fd:
+            numpy.savez(fd, nutaq_type=numpy.array(self.nutaq_type),
+                        timestamp=numpy.array(self.timestamp),
+                        cavity=self.cavity, address=self.address, value=self.value)
+
+    @classmethod
+    def load(cls, filename):
+        data = numpy.load(filename, allow_pickle=False)
+        return cls(str(data['nutaq_type']), data['cavity'], data['address'], data['value'],
+                   float(data['timestamp']))
+
+    def restore(self, perseus):
+        """Write the writable addresses of the snapshot, but the actions, one
+        batch per chain.
+
+        Returns the number of words written.
+        """
+        count = 0
+        for index, cavity in enumerate(CAVITIES):
+            writable = get_settings_addresses(self.nutaq_type, cavity, writable=True, action=False)
+            mask = (self.cavity == index) & numpy.in1d(self.address, writable)
+            perseus_utils.write_many_direct(perseus, self.value[mask], self.address[mask], cavity)
+            count += int(mask.sum())
+        return count
+
+    def values(self):
+        """{attribute name: value} of the settings written by restore."""
+        register_map = get_register_map(self.nutaq_type)
+        rows = register_map.select(SECTION_SETTINGS, writable=True, action=False)
+        rows = rows[register_map.address[rows] >= 0]
+        keys = register_map.cavity[rows].astype(numpy.uint64) << 32 | \
+            register_map.address[rows].astype(numpy.uint64)
+        snapshot_keys = self.cavity.astype(numpy.uint64) << 32 | self.address
+        found, positions = _match_rows(keys, snapshot_keys)
+        rows = rows[found]
+        values = register_map.decode(rows, self.value[positions])
+        return dict(zip([register_map.names[row] for row in rows], values.tolist()))
+
+    def diff(self, other):
+        """Rows of self whose value differ in other, as a list of
+        (cavity, address, value, other value).
+        """
+        keys = self.cavity.astype(numpy.uint64) << 32 | self.address
+        other_keys = other.cavity.astype(numpy.uint64) << 32 | other.address
+        rows, other_rows = _match_rows(keys, other_keys)
+        changed = self.value[rows] != other.value[other_rows]
+        rows, other_rows = rows[changed], other_rows[changed]
+        return [(CAVITIES[self.cavity[row]], int(self.address[row]),
+                 int(self.value[row]), int(other.value[other_row]))
+                for row, other_row in zip(rows, other_rows)]
+
+
+def _match_rows(keys, other_keys):
+    """Indexes of the keys present in both arrays."""
+    if not len(other_keys):
+        return numpy.array([], dtype=int), numpy.array([], dtype=int)
+    order = numpy.argsort(other_keys)
+    positions = numpy.searchsorted(other_keys, keys, sorter=order)
+    positions = order[numpy.minimum(positions, len(other_keys) - 1)]
+    rows = numpy.flatnonzero(other_keys[positions] == keys)
+    return rows, positions[rows]
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Shared memory export of the nutaq diagnostics.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module publishes each diagnostics sweep in a shared memory segment
+(a file of /dev/shm), so the processes of the same host read it without
+going through Tango.
+
+The segment is a header followed by the DiagnosticsLayout array of each
+chain, float64, NaN where the value could not be read:
+
+    magic       8s      'PYNUTAQ1'
+    sequence    uint64  odd while the writer is updating the arrays
+    timestamp   float64 time the sweep was latched
+    length      uint32  diagnostics per chain
+    chains      uint32
+    nutaq_type  8s      loops | diags
+    digest      40s     digest of the register map CSV files
+    <padding to HEADER_SIZE>
+    A           float64[length]
+    B           float64[length]
+
+The sequence is a seqlock: a reader takes an even sequence, reads, and
+retries if the sequence changed meanwhile.
+
+    reader = SnapshotReader('r/rf/nutaq-01')
+    timestamp, arrays = reader.read()           # consistent copy
+    while True:                                 # zero-copy
+        sequence = reader.begin()
+        value = reader.arrays['A'][index]
+        if not reader.retry(sequence):
+            break
+
+The names of the array positions are the ones of the register map of
+nutaq_type (DiagnosticsLayout.names), checked against the digest.
+"""
+
+__all__ = ["SnapshotWriter", "SnapshotReader", "get_segment_path"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import mmap
+import os
+import time
+
+import numpy
+
+from pynutaq.perseus.perseusexceptions import PerseusArgumentError
+from pynutaq.nutaq.nutaqlayout import DiagnosticsLayout
+from pynutaq.nutaq.nutaqregisters import get_register_map, CAVITIES
+
+MAGIC = 'PYNUTAQ1'
+
+SHM_PATH = '/dev/shm'
+
+HEADER_SIZE = 128
+
+HEADER_DTYPE = numpy.dtype([('magic', 'S8'), ('sequence', numpy.uint64), ('timestamp', numpy.float64),
+                            ('length', numpy.uint32), ('chains', numpy.uint32), ('nutaq_type', 'S8'),
+                            ('digest', 'S40')])
+
+RETRY_SLEEP = 1e-6
+
+
+def get_segment_path(device_name, path=SHM_PATH):
+    """Segment file of a device, r/rf/nutaq-01 -> /dev/shm/pynutaq.r.rf.nutaq-01."""
+    return os.path.join(path, 'pynutaq.' + device_name.lower().replace('/', '.'))
+
+
+def _map_arrays(data, length, readonly):
+    header = numpy.frombuffer(data, dtype=HEADER_DTYPE, count=1)
+    arrays = {}
+    for index, cavity in enumerate(CAVITIES):
+        arrays[cavity] = numpy.frombuffer(data, dtype=numpy.float64, count=length,
+                                          offset=HEADER_SIZE + index * length * 8)
+        if readonly:
+            arrays[cavity].flags.writeable = False
+    return header, arrays
+
+
+class SnapshotWriter(object):
+
+    def __init__(self, device_name, nutaq_type, path=SHM_PATH):
+        self.filename = get_segment_path(device_name, path)
+        self.layout = DiagnosticsLayout(nutaq_type)
+        length = len(self.layout.names)
+        size = HEADER_SIZE + len(CAVITIES) * length * 8
+        fd = os.open(self.filename, os.O_RDWR | os.O_CREAT, 0644)
+        try:
+            os.ftruncate(fd, size)
+            self._mmap = mmap.mmap(fd, size, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+        finally:
+            os.close(fd)
+        self.header, self.arrays = _map_arrays(self._mmap, length, False)
+        self._sequence = self.header['sequence']
+        self._sequence[0] = 0
+        self.header['timestamp'] = 0
+        self.header['length'] = length
+        self.header['chains'] = len(CAVITIES)
+        self.header['nutaq_type'] = nutaq_type
+        self.header['digest'] = get_register_map(nutaq_type).digest
+        for array in self.arrays.values():
+            array.fill(numpy.nan)
+        self.header['magic'] = MAGIC
+
+    def publish(self, arrays, timestamp):
+        """Copy the {cavity: array} of a DiagnosticsLayout into the segment."""
+        self._sequence += 1
+        try:
+            for cavity, array in arrays.items():
+                self.arrays[cavity][:] = array
+            self.header['timestamp'] = timestamp
+        finally:
+            self._sequence += 1
+
+    def close(self, remove=True):
+        self.header = self.arrays = self._sequence = None
+        self._mmap.close()
+        if remove and os.path.exists(self.filename):
+            os.unlink(self.filename)
+
+
+class SnapshotReader(object):
+
+    def __init__(self, device_name, path=SHM_PATH):
+        self.filename = get_segment_path(device_name, path)
+        with open(self.filename, 'rb') as fd:
+            self._mmap = mmap.mmap(fd.fileno(), 0, mmap.MAP_SHARED, mmap.PROT_READ)
+        if len(self._mmap) < HEADER_SIZE or self._mmap[:len(MAGIC)] != MAGIC:
+            raise PerseusArgumentError('shared', detail='%s is not a nutaq snapshot' % self.filename)
+        header = numpy.frombuffer(self._mmap, dtype=HEADER_DTYPE, count=1)[0]
+        self.nutaq_type = header['nutaq_type']
+        self.layout = DiagnosticsLayout(self.nutaq_type)
+        if header['digest'] != get_register_map(self.nutaq_type).digest or \
+                header['length'] != len(self.layout.names):
+            raise PerseusArgumentError('shared', detail='%s has another register map' % self.filename)
+        self.names = self.layout.names
+        self.header, self.arrays = _map_arrays(self._mmap, len(self.names), True)
+        self._sequence = self.header['sequence']
+
+    def begin(self):
+        """Sequence of the next consistent read, waiting for the writer."""
+        sequence = int(self._sequence[0])
+        while sequence & 1:
+            time.sleep(RETRY_SLEEP)
+            sequence = int(self._sequence[0])
+        return sequence
+
+    def retry(self, sequence):
+        """True if the segment was written since begin returned sequence."""
+        return int(self._sequence[0]) != sequence
+
+    @property
+    def sequence(self):
+        return int(self._sequence[0])
+
+    @property
+    def timestamp(self):
+        return float(self.header['timestamp'][0])
+
+    def read(self):
+        """(timestamp, {cavity: array}) copy of the last sweep."""
+        while True:
+            sequence = self.begin()
+            timestamp = self.timestamp
+            arrays = dict((cavity, array.copy()) for cavity, array in self.arrays.items())
+            if not self.retry(sequence):
+                return timestamp, arrays
+
+    def index(self, name):
+        """Position of a diagnostic (name without cavity) in the arrays."""
+        return self.names.index(name)
+
+    def close(self):
+        self.header = self.arrays = self._sequence = None
+        self._mmap.close()
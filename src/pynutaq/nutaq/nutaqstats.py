@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Rolling statistics of the nutaq diagnostics.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module keeps the last sweeps of a diagnostics chain in a ring buffer
+and computes, for each signal, the mean, standard deviation, min, max and
+peak to peak over the window.
+
+The buffer is allocated once. The values that could not be read (NaN) are
+left out of the statistics.
+"""
+
+__all__ = ["RollingStatistics", "STATISTICS"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import threading
+import warnings
+
+import numpy
+
+DEFAULT_WINDOW = 100
+
+STATISTICS = ('Mean', 'Std', 'Min', 'Max', 'PeakToPeak')
+
+
+class RollingStatistics(object):
+
+    def __init__(self, size, window=DEFAULT_WINDOW):
+        self.size = size
+        self.window = max(int(window), 1)
+        self._buffer = numpy.empty((self.window, size), dtype=numpy.float64)
+        self._buffer.fill(numpy.nan)
+        self._index = 0
+        self._count = 0
+        self._statistics = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        with self._lock:
+            self._buffer.fill(numpy.nan)
+            self._index = 0
+            self._count = 0
+            self._statistics = None
+
+    def push(self, values):
+        with self._lock:
+            self._buffer[self._index] = values
+            self._index = (self._index + 1) % self.window
+            self._count = min(self._count + 1, self.window)
+            self._statistics = None
+
+    def statistics(self):
+        """{statistic name: array with one value per signal}, NaN for the
+        signals without valid samples in the window.
+        """
+        with self._lock:
+            if self._statistics is None:
+                # an empty window gives NaN, from the NaN filled first row
+                data = self._buffer[:max(self._count, 1)]
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', RuntimeWarning)
+                    minimum = numpy.nanmin(data, axis=0)
+                    maximum = numpy.nanmax(data, axis=0)
+                    self._statistics = {
+                        'Mean': numpy.nanmean(data, axis=0),
+                        'Std': numpy.nanstd(data, axis=0),
+                        'Min': minimum,
+                        'Max': maximum,
+                        'PeakToPeak': maximum - minimum,
+                    }
+            return self._statistics
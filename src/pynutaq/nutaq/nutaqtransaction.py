@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Transactions of nutaq settings.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module writes several settings attributes together, so the loops
+do not run with half of a new configuration.
+
+    transaction = SettingsTransaction(perseus, 'loops')
+    transaction.stage('KpFastIqLoopA', 100)
+    transaction.stage('FastIqLoopEnableA', 1)
+    transaction.commit()
+
+The staged values are checked against the min/max of the register map and
+encoded at once. The bit attributes are merged into their register word,
+over the staged whole word value if there is one. Before the commit the
+words are read from the board (the shadow values); then each chain gets one
+write batch. If a write fails, the shadow values of every word of the
+transaction are written back and the error is raised.
+"""
+
+__all__ = ["SettingsTransaction", "check_values", "chain_words"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import numpy
+
+import pynutaq.perseus.perseusutils as perseus_utils
+from pynutaq.perseus.perseusexceptions import PerseusArgumentError, PerseusTransportError
+from pynutaq.nutaq.nutaqregisters import get_register_map, CAVITIES, CONV_BIT
+
+RAW_VALUE_MASK = (1 << 17) - 1
+
+
+def check_values(register_map, values):
+    """(rows, values) of the valid values of a {name: value} dict, and the
+    list of rejected (name, value, reason).
+    """
+    names = [name for name in values
+             if name in register_map and register_map.writable[register_map.index(name)]]
+    rejected = [(name, values[name], 'not a writable setting') for name in values if name not in names]
+    rows = numpy.array(register_map.indexes(names), dtype=int)
+    data = numpy.array([values[name] for name in names], dtype=numpy.float64)
+    minimum = register_map.min_value[rows]
+    maximum = register_map.max_value[rows]
+    with numpy.errstate(invalid='ignore'):
+        valid = ~numpy.isnan(data) & ~(data < minimum) & ~(data > maximum)
+    rejected += [(names[index], float(data[index]), 'out of limits')
+                 for index in numpy.flatnonzero(~valid)]
+    return rows[valid], data[valid], rejected
+
+
+def chain_words(register_map, rows, values):
+    """{cavity: (addresses, has word, word values, bit mask, bit values)}.
+
+    has word tells the addresses with a whole word value, the bit mask the
+    bits to set over it.
+    """
+    raw = register_map.encode(rows, values) & RAW_VALUE_MASK
+    bits = register_map.conversion[rows] == CONV_BIT
+    positions = numpy.maximum(register_map.pos[rows], 0).astype(numpy.int64)
+    words = {}
+    for index, cavity in enumerate(CAVITIES):
+        chain = register_map.cavity[rows] == index
+        addresses, inverse = numpy.unique(register_map.address[rows[chain]], return_inverse=True)
+        has_word = numpy.zeros(len(addresses), dtype=bool)
+        word_values = numpy.zeros(len(addresses), dtype=numpy.int64)
+        bit_mask = numpy.zeros(len(addresses), dtype=numpy.int64)
+        bit_values = numpy.zeros(len(addresses), dtype=numpy.int64)
+        chain_bits = bits[chain]
+        has_word[inverse[~chain_bits]] = True
+        word_values[inverse[~chain_bits]] = raw[chain][~chain_bits]
+        numpy.bitwise_or.at(bit_mask, inverse[chain_bits],
+                            numpy.left_shift(1, positions[chain][chain_bits]))
+        numpy.bitwise_or.at(bit_values, inverse[chain_bits], raw[chain][chain_bits])
+        words[cavity] = (addresses, has_word, word_values, bit_mask, bit_values)
+    return words
+
+
+class SettingsTransaction(object):
+
+    def __init__(self, perseus, nutaq_type):
+        self.perseus = perseus
+        self.register_map = get_register_map(nutaq_type)
+        self.values = {}
+        self.shadow = {}
+
+    def __len__(self):
+        return len(self.values)
+
+    def stage(self, name, value):
+        self.values[name] = value
+
+    def stage_many(self, values):
+        self.values.update(values)
+
+    def validate(self):
+        """(rows, values) of the staged values. Raises PerseusArgumentError
+        if any is not valid.
+        """
+        rows, data, rejected = check_values(self.register_map, self.values)
+        if rejected:
+            raise PerseusArgumentError('transaction', detail=', '.join(
+                '%s = %s %s' % (name, value, reason) for name, value, reason in rejected))
+        return rows, data
+
+    def _write(self, words):
+        for cavity, (addresses, values) in words.items():
+            if len(addresses):
+                perseus_utils.write_many_direct(self.perseus, values, addresses, cavity)
+
+    def commit(self, rows=None, data=None, rollback=True):
+        """Write the staged values, one batch per chain. Without rollback only
+        the words with bits and no whole word value are read first.
+
+        Returns the number of words written.
+        """
+        if rows is None:
+            rows, data = self.validate()
+        words = {}
+        self.shadow = {}
+        for cavity, (addresses, has_word, word_values, bit_mask, bit_values) in \
+                chain_words(self.register_map, rows, data).items():
+            read = numpy.arange(len(addresses)) if rollback else numpy.flatnonzero(~has_word)
+            if len(read):
+                current = perseus_utils.read_many_direct(self.perseus, addresses[read].tolist(), cavity)
+                current = numpy.asarray(current, dtype=numpy.int64) & RAW_VALUE_MASK
+                word_values[read[~has_word[read]]] = current[~has_word[read]]
+                if rollback:
+                    self.shadow[cavity] = (addresses.tolist(), current.tolist())
+            word_values = (word_values & ~bit_mask) | bit_values
+            words[cavity] = (addresses.tolist(), word_values.tolist())
+        try:
+            self._write(words)
+        except PerseusTransportError:
+            if rollback:
+                self.rollback()
+            raise
+        return sum(len(addresses) for addresses, values in words.values())
+
+    def rollback(self):
+        """Write back the shadow values read by the last commit."""
+        try:
+            self._write(self.shadow)
+        except PerseusTransportError, e:
+            print "Rollback of the transaction failed: %s" % e
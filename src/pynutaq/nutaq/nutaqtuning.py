@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Software plunger tuning loop of the nutaq loops board.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module closes the plunger tuning loop of a cavity in the device
+server.
+
+A worker thread latches the diagnostics of the chain and reads AngCavFw at a
+fixed period. The error is the angle minus the PhaseOffset setting, wrapped
+to [-180, 180). PhaseOffset and MarginLow/MarginUp are read every cycle, so
+a write of them applies from the next cycle. Inside the deadband nothing is
+done; outside, the plunger is moved error * gain steps (at most max_steps)
+with NumSteps, MoveUp and a Move pulse, and not more often than min_interval.
+
+MoveUp is 1 when error * move_up_sign is positive: with the default sign 1
+a phase above the target moves the plunger up. Set -1 for a cavity tuned
+the other way.
+
+The loop does not start while the FPGA tuning loop (TuningEnable) is on,
+and stops if it is turned on, so the two never move the plunger together.
+
+The cycles are scheduled on absolute times, so a late cycle does not delay
+the next ones; a cycle that starts more than a period late is skipped and
+counted as an overrun. The jitter (start time - scheduled time) and the
+duration of the cycles are kept in a RollingStatistics.
+"""
+
+__all__ = ["TuningController"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import threading
+import time
+
+import numpy
+
+import pynutaq.perseus.perseusutils as perseus_utils
+from pynutaq.perseus.perseusexceptions import PerseusTransportError
+from pynutaq.nutaq.nutaqdefs import ANG_CAV_FW_ADDRESS, PHASE_OFFSET_ADDRESS, MARGIN_UP_ADDRESS
+from pynutaq.nutaq.nutaqdefs import MARGIN_LOW_ADDRESS, NUM_STEPS_ADDRESS, MOVE_ADDRESS, MOVE_UP_ADDRESS
+from pynutaq.nutaq.nutaqdefs import TUNING_ENABLE_ADDRESS
+from pynutaq.nutaq.nutaqstats import RollingStatistics
+
+MAX_NUM_STEPS = 65535
+
+
+class TuningController(object):
+
+    def __init__(self, perseus, cavity, period=0.1, gain=1.0, max_steps=100, min_interval=1.0,
+                 window=100, move_up_sign=1):
+        self.perseus = perseus
+        self.cavity = cavity
+        self.period = period
+        self.gain = gain
+        self.max_steps = min(int(max_steps), MAX_NUM_STEPS)
+        self.min_interval = min_interval
+        self.move_up_sign = 1 if move_up_sign >= 0 else -1
+        self.target = 0.0
+        self.margin_up = 0.0
+        self.margin_low = 0.0
+        self.timing = RollingStatistics(2, window)
+        self.cycles = 0
+        self.overruns = 0
+        self.moves = 0
+        self.errors = 0
+        self.last_error = None
+        self.last_move = None
+        self.exception = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def read_settings(self):
+        """Target and deadband from the PhaseOffset and MarginUp/Low settings."""
+        self.target = perseus_utils.read_angle(self.perseus, PHASE_OFFSET_ADDRESS, self.cavity)
+        self.margin_up = perseus_utils.read_angle(self.perseus, MARGIN_UP_ADDRESS, self.cavity)
+        self.margin_low = perseus_utils.read_angle(self.perseus, MARGIN_LOW_ADDRESS, self.cavity)
+
+    def check_hardware_loop(self):
+        """Raise if the FPGA tuning loop of the cavity is enabled."""
+        if int(perseus_utils.read_direct(self.perseus, TUNING_ENABLE_ADDRESS, self.cavity)) & 0xFFFF:
+            raise Exception("Tuning loop %s: TuningEnable is on, disable the FPGA tuning loop first"
+                            % self.cavity)
+
+    def start(self):
+        if self.running:
+            return
+        self.check_hardware_loop()
+        self.read_settings()
+        self.timing.clear()
+        self.exception = None
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='tuning%s' % self.cavity)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def steps(self, error):
+        """Signed number of steps to correct error, 0 inside the deadband."""
+        if -self.margin_low <= error <= self.margin_up:
+            return 0
+        steps = min(int(round(abs(error) * self.gain)), self.max_steps)
+        return steps if error > 0 else -steps
+
+    def move(self, steps):
+        perseus_utils.write_direct(self.perseus, abs(steps), NUM_STEPS_ADDRESS, self.cavity)
+        move_up = int(steps * self.move_up_sign > 0)
+        perseus_utils.write_direct(self.perseus, move_up, MOVE_UP_ADDRESS, self.cavity)
+        perseus_utils.write_pulse_direct(self.perseus, MOVE_ADDRESS, self.cavity)
+        self.moves += 1
+        self.last_move = time.time()
+
+    def cycle(self):
+        self.check_hardware_loop()
+        self.read_settings()
+        with perseus_utils.latched_diagnostics(self.perseus, self.cavity):
+            angle = perseus_utils.read_diag_angle(self.perseus, ANG_CAV_FW_ADDRESS, self.cavity)
+        error = (angle - self.target + 180.0) % 360.0 - 180.0
+        self.last_error = error
+        steps = self.steps(error)
+        if steps and (self.last_move is None or time.time() - self.last_move >= self.min_interval):
+            self.move(steps)
+
+    def _run(self):
+        scheduled = time.time()
+        while not self._stop.is_set():
+            scheduled += self.period
+            delay = scheduled - time.time()
+            if delay > 0 and self._stop.wait(delay):
+                break
+            started = time.time()
+            jitter = started - scheduled
+            if jitter > self.period:
+                # too late: skip to the next period from now
+                self.overruns += 1
+                scheduled = started
+                continue
+            try:
+                self.cycle()
+            except PerseusTransportError, e:
+                self.errors += 1
+                print "Tuning loop %s: %s" % (self.cavity, e)
+            except Exception, e:
+                print "Tuning loop %s stopped: %s" % (self.cavity, e)
+                self.exception = e
+                break
+            self.cycles += 1
+            self.timing.push([jitter, time.time() - started])
+
+    def statistics(self):
+        """Counters and timing of the loop, times in ms."""
+        timing = self.timing.statistics()
+        result = {'running': self.running,
+                  'period': self.period * 1000.0,
+                  'cycles': self.cycles,
+                  'overruns': self.overruns,
+                  'moves': self.moves,
+                  'errors': self.errors,
+                  'target': self.target,
+                  'margin_up': self.margin_up,
+                  'margin_low': self.margin_low,
+                  'move_up_sign': self.move_up_sign,
+                  'last_error': self.last_error,
+                  'exception': None if self.exception is None else str(self.exception)}
+        for name, column in (('jitter', 0), ('duration', 1)):
+            for statistic in ('Mean', 'Std', 'Max'):
+                value = float(timing[statistic][column]) * 1000.0
+                result['%s_%s' % (name, statistic.lower())] = None if numpy.isnan(value) else value
+        return result
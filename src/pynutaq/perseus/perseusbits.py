@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Bit reads of the perseus registers.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module reads the bool attributes that share a register word with
+one hardware read per word.
+
+Outside a sweep every bit is read from the board. Inside a sweep the words
+are kept for the thread running it, so all the bits of a word come from one
+read, and prefetch can read the words of a chain in one batch:
+
+    with perseus.bits.sweep():
+        perseus.bits.prefetch('read', 'A', addresses)
+        perseus.bits.bit('read', 7, 3, 'A')
+"""
+
+__all__ = ["BitGroupReader", "unpack_bits", "WORD_BITS"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import threading
+from contextlib import contextmanager
+
+import numpy
+
+from pynutaq.perseus.perseusutils import get_offset
+
+WORD_BITS = 32
+
+_SHIFTS = numpy.arange(WORD_BITS, dtype=numpy.uint32)
+
+
+def unpack_bits(word):
+    """Bits of a register word, bit 0 first, as a bool array."""
+    return ((numpy.uint32(int(word) & 0xFFFFFFFF) >> _SHIFTS) & 1).astype(bool)
+
+
+class BitGroupReader(object):
+
+    def __init__(self, perseus):
+        self.perseus = perseus
+        self._local = threading.local()
+
+    def _cache(self):
+        return getattr(self._local, 'words', None)
+
+    @contextmanager
+    def sweep(self):
+        """Read each word once until the end of the block. Nested sweeps
+        share the outer one.
+        """
+        outer = self._cache() is not None
+        if not outer:
+            self._local.words = {}
+        try:
+            yield
+        finally:
+            if not outer:
+                self._local.words = None
+
+    def prefetch(self, offset_type, cavity, addresses):
+        """Read the words not in the sweep yet in one batch. Does nothing
+        outside a sweep.
+        """
+        words = self._cache()
+        if words is None:
+            return
+        missing = sorted(set(int(address) for address in addresses) -
+                         set(address for kind, chain, address in words
+                             if kind == offset_type and chain == cavity))
+        if not missing:
+            return
+        values = self.perseus.read_many(get_offset(offset_type, cavity), missing)
+        for address, value in zip(missing, values):
+            words[(offset_type, cavity, address)] = unpack_bits(value)
+
+    def bits(self, offset_type, address, cavity):
+        """All the bits of a register word as a bool array."""
+        words = self._cache()
+        key = (offset_type, cavity, int(address))
+        if words is not None and key in words:
+            return words[key]
+        value = self.perseus.read_many(get_offset(offset_type, cavity), [address])[0]
+        bits = unpack_bits(value)
+        if words is not None:
+            words[key] = bits
+        return bits
+
+    def bit(self, offset_type, address, position, cavity):
+        return bool(self.bits(offset_type, address, cavity)[position])
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Perseus module with the board I/O shared by loops and diagnostics.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module contains the base class of PerseusLoops and PerseusDiags:
+the eapi connection, the memory and custom register reads and writes and
+the register sequences.
+
+A subclass sets perseus_type (the name of its sequences file) and returns
+its InitSteps from get_init_steps.
+"""
+
+__all__ = ["PerseusBoard"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import threading
+
+import eapi
+from adp_exception import *
+
+from pynutaq.perseus.perseusdefs import *
+from pynutaq.perseus.perseusinit import InitOrchestrator, InitProfile, measure
+from pynutaq.perseus.perseussequences import SequenceEngine, load_sequences, get_sequences_filename
+from pynutaq.perseus.perseusdecorators import ensure_read_method, ensure_write_method
+from pynutaq.perseus.perseustransport import EapiTransport
+from pynutaq.perseus.perseusexceptions import ErrorCounter, PerseusTransportError, PerseusConnectionError
+from pynutaq.perseus.perseusbits import BitGroupReader
+
+
+class PerseusBoard(object):
+
+    perseus_type = None
+
+    def __init__(self, perseus_ip):
+        self.perseus_ip = perseus_ip
+
+        eapi.eapi_init()
+        self.errors = ErrorCounter()
+        self.transport = EapiTransport(perseus_ip)
+        self.transport.errors = self.errors
+        self.lock = threading.RLock()
+        self._chain_locks = dict((offset, threading.Lock()) for offset in CHAIN_READ_OFFSETS)
+        self._latch_locks = {'A': threading.RLock(), 'B': threading.RLock()}
+        self.bits = BitGroupReader(self)
+        self.init_profile = None
+        self.last_init_profile = None
+        self.sequences = SequenceEngine(self, load_sequences(get_sequences_filename(self.perseus_type)))
+        self.connect()
+
+    def get_init_steps(self):
+        raise NotImplementedError
+
+    def run_init_steps(self):
+        """Run get_init_steps() and keep their timing in last_init_profile."""
+        self.init_profile = InitProfile(self.perseus_type)
+        try:
+            InitOrchestrator(self.get_init_steps(), self.lock, profile=self.init_profile).run()
+        finally:
+            print "\n".join(self.init_profile.report())
+            self.last_init_profile = self.init_profile
+            self.init_profile = None
+
+    def connect(self):
+        self.transport.connect()
+
+    def chain_lock(self, offset):
+        """Lock of the reads and writes through the chain offset."""
+        return self._chain_locks.get(offset, self.lock)
+
+    def latch_lock(self, cavity):
+        """Lock held from the diagnostics latch of cavity to its last read."""
+        return self._latch_locks[cavity]
+
+    @ensure_read_method
+    def custom_read(self, register):
+        return self.transport.call(eapi.custom_register_read_send, register)
+
+    @ensure_write_method
+    def custom_write(self, register, data):
+        """
+           @todo: this method should be merge with self.write when it will be supported in all platforms.
+        """
+        return self.transport.call(eapi.custom_register_write_send, register, data)
+
+    @ensure_write_method
+    def _memory_write(self, address, value, replay=True):
+        return self.transport.call(eapi.memory_write_send, address, value, replay=replay)
+
+    def write(self, address, value, replay=True):
+        """replay=False for writes that must not be repeated, like pulses."""
+        ret = self._memory_write(address, value, replay)
+        self.sequences.track(address, value)
+        return ret
+
+    def write_many(self, words):
+        """Write a list of (address, value) as one batch."""
+        def batch():
+            for address, value in words:
+                self.transport.preempt()
+                with measure(self.init_profile, "write 0x%08x 0x%08x" % (address, value)):
+                    self.write(address, value)
+        with self.lock:
+            self.transport.run_batch(batch)
+
+    def custom_write_many(self, words):
+        """Write a list of (register, data) as one batch."""
+        def batch():
+            for register, data in words:
+                with measure(self.init_profile, "custom_write %d 0x%x" % (register, data)):
+                    self.custom_write(register, data)
+        with self.lock:
+            self.transport.run_batch(batch)
+
+    @ensure_read_method
+    def read(self, address):
+        return self.transport.call(eapi.memory_read_send, address)
+
+    def read_many(self, offset, addresses, partial=False):
+        """Read registers through offset: write each address, read back its value.
+
+        Each chain offset has its own lock, so the chains can be read in parallel.
+        With partial, a register that cannot be read gives None instead of
+        aborting the whole read.
+        """
+        def batch():
+            values = []
+            for address in addresses:
+                self.transport.preempt()
+                try:
+                    self.write(offset, address)
+                    values.append(self.read(offset))
+                except PerseusConnectionError:
+                    raise
+                except PerseusTransportError:
+                    if not partial:
+                        raise
+                    values.append(None)
+            return values
+        with self.chain_lock(offset):
+            return self.transport.run_batch(batch)
+
+    def configure_gpio_inputs_outputs(self, force=False):
+        print "configuring GPIO inputs/outputs"
+        return self.sequences.run('gpio', force, self.init_profile)
+
+    def configure_vcxo(self, force=False):
+        print "configuring VCXO"
+        return self.sequences.run('vcxo', force, self.init_profile)
@@ -31,52 +31,41 @@ __author__ = 'antmil'
 
 __docformat__ = 'restructuredtext'
 
-try:
-    import eapi
-    from adp_exception import *
-except ImportError, e:
-    print e
-    #raise
+from pynutaq.perseus.perseusexceptions import PerseusTransportError, PerseusConnectionError, get_chain
+
+
+def _error(self, error_class, meth, ret, args):
+    address = args[0] if args else None
+    error = error_class(meth.__name__.lstrip('_'), ret, address, get_chain(address))
+    errors = getattr(self, 'errors', None)
+    if errors is not None:
+        errors.count(error)
+    return error
+
 
 def ensure_write_method(meth):
     def _ensure_this_method(self, *args, **kwargs):
-        try:
-            ret = meth(self, *args, **kwargs)
-            if ret is not None and ret < 0:
-                msg = "Error in: " + meth.__name__ + ", Error code = " + str(ret)
-                raise Exception(msg)
-#                raise adp_exception(ret)
-            return ret
-        except Exception, e:
-            raise e
+        ret = meth(self, *args, **kwargs)
+        if ret is not None and ret < 0:
+            raise _error(self, PerseusTransportError, meth, ret, args)
+        return ret
 
     return _ensure_this_method
 
 def ensure_read_method(meth):
     def _ensure_this_method(self, *args, **kwargs):
-        try:
-            ret, value = meth(self, *args, **kwargs)
-            #value = meth(self, *args, **kwargs)
-            if ret < 0:
-                msg = "Error in: " + meth.__name__ + ", Error code = " + str(ret)
-                raise Exception(msg)
- #               raise adp_exception(ret)
-            return value
-        except Exception:
-            raise
+        ret, value = meth(self, *args, **kwargs)
+        if ret < 0:
+            raise _error(self, PerseusTransportError, meth, ret, args)
+        return value
 
     return _ensure_this_method
 
 def ensure_connect_method(meth):
     def _ensure_this_method(self, *args, **kwargs):
-        try:
-            ret = meth(self, *args, **kwargs)
-            if ret:
-                msg = "Error in: " + meth.__name__ + ", Error code = " + str(ret)
-                raise Exception(msg)
-#                raise adp_exception(ret)
-            return ret
-        except Exception, e:
-            raise e
+        ret = meth(self, *args, **kwargs)
+        if ret:
+            raise _error(self, PerseusConnectionError, meth, ret, ())
+        return ret
 
     return _ensure_this_method
@@ -39,6 +39,13 @@ SETTINGS_WRITE_OFFSET_B = 0x70000068
 SETTINGS_READ_OFFSET_B = 0x7000006C
 DIAGNOSTICS_OFFSET_B = 0x70000070
 
+# Offsets used to read registers (write the address, then read the value)
+CHAIN_READ_OFFSETS = [SETTINGS_READ_OFFSET_A, DIAGNOSTICS_OFFSET_A,
+                      SETTINGS_READ_OFFSET_B, DIAGNOSTICS_OFFSET_B]
+
+OFFSET_CHAINS = {SETTINGS_WRITE_OFFSET_A: 'A', SETTINGS_READ_OFFSET_A: 'A', DIAGNOSTICS_OFFSET_A: 'A',
+                 SETTINGS_WRITE_OFFSET_B: 'B', SETTINGS_READ_OFFSET_B: 'B', DIAGNOSTICS_OFFSET_B: 'B'}
+
 # Init RAM
 RAM_INIT_OFFSET = 0x73000018
 RAM_INIT_VALUE = 0x26E82
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Perseus exceptions.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module defines the errors raised when talking to the boards.
+
+    PerseusError
+     +-- PerseusArgumentError     bad cavity, offset type... (also a ValueError)
+     +-- PerseusTimeoutError      the hardware did not get ready in time
+     +-- PerseusTransportError    an eapi call returned an error code
+          +-- PerseusConnectionError   the connection is down or cannot be opened
+
+The errors keep the eapi error code, the operation, the address and the
+chain as attributes. The message is only built when the error is printed.
+"""
+
+__all__ = ["PerseusError", "PerseusArgumentError", "PerseusTimeoutError",
+           "PerseusTransportError", "PerseusConnectionError", "ErrorCounter",
+           "get_chain"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import threading
+
+from pynutaq.perseus.perseusdefs import OFFSET_CHAINS
+
+
+def get_chain(address):
+    """Chain (A or B) of a chain offset, None for other addresses."""
+    return OFFSET_CHAINS.get(address)
+
+
+class PerseusError(Exception):
+
+    def __init__(self, operation=None, code=None, address=None, chain=None, detail=None):
+        Exception.__init__(self)
+        self.operation = operation
+        self.code = code
+        self.address = address
+        self.chain = chain
+        self.detail = detail
+
+    def __str__(self):
+        msg = "Error in: %s" % self.operation
+        if self.code is not None:
+            msg += ", Error code = %s" % self.code
+        if self.address is not None:
+            msg += ", address = 0x%08x" % self.address
+        if self.chain is not None:
+            msg += ", chain = %s" % self.chain
+        if self.detail:
+            msg += " (%s)" % self.detail
+        return msg
+
+
+class PerseusArgumentError(PerseusError, ValueError):
+    pass
+
+
+class PerseusTimeoutError(PerseusError):
+    pass
+
+
+class PerseusTransportError(PerseusError):
+    pass
+
+
+class PerseusConnectionError(PerseusTransportError):
+    pass
+
+
+class ErrorCounter(object):
+    """Number of errors of each class."""
+
+    def __init__(self):
+        self.counts = {}
+        self._lock = threading.Lock()
+
+    def count(self, error):
+        name = error.__class__.__name__
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+    def as_dict(self):
+        with self._lock:
+            return dict(self.counts)
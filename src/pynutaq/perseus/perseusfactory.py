@@ -28,20 +28,29 @@ __author__ = 'antmil'
 
 __docformat__ = 'restructuredtext'
 
-try:
-    from pynutaq.perseus.perseusloops import PerseusLoops
-    from pynutaq.perseus.perseusdiags import PerseusDiags
-except ImportError, e:
-    print e
-    raise
-from pynutaq.perseus.perseussimulated import PerseusSimulated
+import importlib
+
+# The hardware classes pull in the eapi bindings, so they are only imported
+# when a device asks for them.
+PERSEUS_CLASSES = {
+    'simulated': ('pynutaq.perseus.perseussimulated', 'PerseusSimulated'),
+    'loops': ('pynutaq.perseus.perseusloops', 'PerseusLoops'),
+    'diags': ('pynutaq.perseus.perseusdiags', 'PerseusDiags'),
+}
+
+
+def get_perseus_class(perseus_type):
+    try:
+        module_name, class_name = PERSEUS_CLASSES[perseus_type.lower()]
+    except KeyError:
+        raise Exception('Unknown perseus type: %s' % perseus_type)
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
 
 
 class Perseus(object):
     def new_perseus(self, perseus_type, perseus_ip):
+        perseus_class = get_perseus_class(perseus_type)
         if perseus_type.lower() == 'simulated':
-            return PerseusSimulated()
-        elif perseus_type.lower() == 'loops':
-            return PerseusLoops(perseus_ip)
-        elif perseus_type.lower() == 'diags':
-            return PerseusDiags(perseus_ip)
+            return perseus_class()
+        return perseus_class(perseus_ip)
@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Perseus hardware initialisation orchestrator.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module runs the hardware initialisation as a graph of steps.
+
+Each step runs once all the steps it requires are done. Steps whose
+requirements are met are started in their own threads. A step can provide
+a ``done`` check, used to skip it when the hardware is already in the
+expected state, a ``settle`` time, waited after the action, and a ``ready``
+check, polled after the settle time until it passes or the step deadline
+expires.
+
+The step actions and the checks run one at a time holding the board lock,
+so the board calls stay serial. Only the settle times and the polling waits
+of different steps overlap.
+"""
+
+__all__ = ["InitStep", "InitOrchestrator", "InitProfile", "InitProfileHistory",
+           "measure", "wait_until"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import collections
+import json
+import os
+import threading
+import time
+
+from pynutaq.perseus.perseusexceptions import PerseusTimeoutError
+
+DEFAULT_STEP_TIMEOUT = 5.0
+DEFAULT_POLL_PERIOD = 0.05
+DEFAULT_PROFILE_DEPTH = 10
+
+
+def wait_until(check, timeout=DEFAULT_STEP_TIMEOUT, period=DEFAULT_POLL_PERIOD, lock=None):
+    """Poll check() until it returns True. Returns False when timeout expires."""
+    deadline = time.time() + timeout
+    while True:
+        if lock is None:
+            ready = check()
+        else:
+            with lock:
+                ready = check()
+        if ready:
+            return True
+        if time.time() >= deadline:
+            return False
+        time.sleep(period)
+
+
+class _Measure(object):
+
+    def __init__(self, profile, call):
+        self.profile = profile
+        self.call = call
+
+    def __enter__(self):
+        self.start = time.time()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        error = None if exc_type is None else str(exc_value)
+        self.profile.record(self.call, self.start, time.time() - self.start, error)
+        return False
+
+
+class _NoMeasure(object):
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+def measure(profile, call):
+    """Time call in profile, does nothing when profile is None."""
+    if profile is None:
+        return _NoMeasure()
+    return profile.measure(call)
+
+
+class InitProfile(object):
+    """Timing of one hardware initialisation.
+
+    Calls are recorded against the step running in the current thread.
+    """
+
+    def __init__(self, name=''):
+        self.name = name
+        self.start = time.time()
+        self.duration = None
+        self.error = None
+        self.steps = []
+        self.calls = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def set_step(self, step):
+        self._local.step = step
+
+    def measure(self, call):
+        return _Measure(self, call)
+
+    def record(self, call, start, duration, error=None):
+        entry = {'step': getattr(self._local, 'step', None),
+                 'call': call,
+                 'start': start - self.start,
+                 'duration': duration,
+                 'error': error}
+        with self._lock:
+            self.calls.append(entry)
+
+    def record_step(self, step, status, start, duration, error=None):
+        entry = {'step': step,
+                 'status': status,
+                 'start': start - self.start,
+                 'duration': duration,
+                 'error': error}
+        with self._lock:
+            self.steps.append(entry)
+
+    def finish(self, error=None):
+        self.duration = time.time() - self.start
+        self.error = error
+
+    def as_dict(self):
+        return {'name': self.name,
+                'start': self.start,
+                'duration': self.duration,
+                'error': self.error,
+                'steps': list(self.steps),
+                'calls': list(self.calls)}
+
+    def report(self, count=5):
+        """Return the slowest steps as printable lines."""
+        steps = sorted(self.steps, key=lambda entry: entry['duration'], reverse=True)
+        lines = ["Init %s took %.2f s" % (self.name, self.duration or 0.0)]
+        for entry in steps[:count]:
+            lines.append("  %-45s %-8s %.3f s" % (entry['step'], entry['status'], entry['duration']))
+        return lines
+
+
+class InitProfileHistory(object):
+    """The last init profiles, optionally persisted in a json file."""
+
+    def __init__(self, depth=DEFAULT_PROFILE_DEPTH, filename=''):
+        self.filename = filename
+        self.profiles = collections.deque(maxlen=max(depth, 1))
+        if filename and os.path.exists(filename):
+            try:
+                with open(filename) as f:
+                    self.profiles.extend(json.load(f))
+            except Exception, e:
+                print "Cannot load init profiles from %s: %s" % (filename, e)
+
+    def append(self, profile):
+        if profile is None:
+            return
+        self.profiles.append(profile.as_dict())
+        if self.filename:
+            try:
+                with open(self.filename, 'w') as f:
+                    json.dump(list(self.profiles), f)
+            except Exception, e:
+                print "Cannot save init profiles in %s: %s" % (self.filename, e)
+
+    def to_json(self):
+        return json.dumps(list(self.profiles))
+
+
+class InitStep(object):
+
+    def __init__(self, name, action, requires=(), done=None, ready=None,
+                 timeout=DEFAULT_STEP_TIMEOUT, settle=0):
+        self.name = name
+        self.action = action
+        self.requires = tuple(requires)
+        self.done = done
+        self.ready = ready
+        self.timeout = timeout
+        self.settle = settle
+
+
+class InitOrchestrator(object):
+
+    def __init__(self, steps, lock=None, poll_period=DEFAULT_POLL_PERIOD, profile=None):
+        self.steps = list(steps)
+        self.lock = lock or threading.RLock()
+        self.profile = profile or InitProfile()
+        self.poll_period = poll_period
+        self.results = {}
+        self._check_graph()
+
+    def _check_graph(self):
+        names = [step.name for step in self.steps]
+        if len(set(names)) != len(names):
+            raise Exception("Duplicated init step names")
+        for step in self.steps:
+            for name in step.requires:
+                if name not in names:
+                    raise Exception("Init step %s requires unknown step %s" % (step.name, name))
+
+    def log(self, msg):
+        # the boards print while holding the lock too, keep lines whole
+        with self.lock:
+            print msg
+
+    def _is_done(self, step):
+        if step.done is None:
+            return False
+        try:
+            with self.lock:
+                return bool(step.done())
+        except Exception:
+            return False
+
+    def run_step(self, step):
+        start = time.time()
+        self.profile.set_step(step.name)
+        try:
+            if self._is_done(step):
+                self.log("%s: already done, skipped" % step.name)
+                self.results[step.name] = ('skipped', 0.0)
+                self.profile.record_step(step.name, 'skipped', start, time.time() - start)
+                return
+            self.log("%s..." % step.name)
+            with self.lock:
+                step.action()
+            if step.settle:
+                with self.profile.measure('settle'):
+                    time.sleep(step.settle)
+            if step.ready is not None:
+                with self.profile.measure('wait ready'):
+                    ready = wait_until(step.ready, step.timeout, self.poll_period, self.lock)
+                if not ready:
+                    raise PerseusTimeoutError(step.name, detail="not ready after %.1f s" % step.timeout)
+            self.results[step.name] = ('done', time.time() - start)
+            self.profile.record_step(step.name, 'done', start, time.time() - start)
+            self.log("%s: DONE (%.2f s)" % (step.name, time.time() - start))
+        except Exception, e:
+            self.results[step.name] = ('failed', e)
+            self.profile.record_step(step.name, 'failed', start, time.time() - start, str(e))
+            self.log("%s: FAILED (%s)" % (step.name, e))
+
+    def run(self):
+        """Run all the steps. Raises an Exception if any step fails."""
+        self.results = {}
+        pending = list(self.steps)
+        running = {}
+        while pending or running:
+            for name, thread in running.items():
+                if not thread.is_alive():
+                    del running[name]
+            failed = [name for name, result in self.results.items() if result[0] == 'failed']
+            if failed and not running:
+                break
+            if not failed:
+                for step in list(pending):
+                    finished = [name in self.results for name in step.requires]
+                    if all(finished):
+                        pending.remove(step)
+                        thread = threading.Thread(target=self.run_step, args=(step,),
+                                                  name=step.name)
+                        thread.daemon = True
+                        running[step.name] = thread
+                        thread.start()
+                if pending and not running:
+                    msg = "Circular dependency in init steps: " + \
+                          ", ".join(step.name for step in pending)
+                    self.profile.finish(msg)
+                    raise Exception(msg)
+            if running:
+                running.values()[0].join(self.poll_period)
+        failed = [name for name, result in self.results.items() if result[0] == 'failed']
+        if failed:
+            msg = "Init failed in: " + ", ".join(sorted(failed))
+            self.profile.finish(msg)
+            raise Exception(msg)
+        self.profile.finish()
+        return self.results
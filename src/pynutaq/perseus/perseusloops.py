@@ -28,113 +28,99 @@ __author__ = 'antmil'
 
 __docformat__ = 'restructuredtext'
 
-try:
-    import eapi
-    from adp_exception import *
-except ImportError, e:
-    print e
-    #raise
+import eapi
+from adp_exception import *
 
 from pynutaq.perseus.perseusdefs import *
-from pynutaq.boards.mo1000 import Mo1000
+from pynutaq.perseus.perseusinit import InitStep, measure
+from pynutaq.perseus.perseusboard import PerseusBoard
+from pynutaq.boards.mo1000 import Mo1000, PORTS_SETTLE_TIME
 from pynutaq.boards.mi125 import Mi125
-from pynutaq.perseus.perseusdecorators import ensure_read_method, ensure_write_method, ensure_connect_method
+from pynutaq.perseus.perseusdecorators import ensure_read_method, ensure_write_method
 
 MO1000_BOARD_NUMBER = 1
 MI125_BOARD_NUMBER = 2
 MI125_CLK_SRC = "bottomfmc"
 
-class PerseusLoops(object):
+class PerseusLoops(PerseusBoard):
 
-    def __init__(self, perseus_ip=PERSEUS_LOOP_IP):
-        self.perseus_ip = perseus_ip
+    perseus_type = 'loops'
 
-        eapi.eapi_init()
-        self._board_state = eapi.connection_state()
-        self.connect()
+    def __init__(self, perseus_ip=PERSEUS_LOOP_IP):
+        PerseusBoard.__init__(self, perseus_ip)
 
     def init_hardware(self):
-        self.custom_write(4, 1)
-
-        print "MO1000 1 initialization..."
-        self.mo1000 = Mo1000(self._board_state, MO1000_BOARD_NUMBER)
-
-        print "Mi125 2 initialization..."
-        self.mi125 = Mi125(self._board_state, MI125_BOARD_NUMBER, MI125_CLK_SRC)
-        print "DONE"
-
-        self.mo1000.enable_dac_outputs()
-
-        print "Remove reset MI125 - MO1000 intercore fifo"
-        self.custom_write(4, 0)
-        print "DONE"
-
-        self.mo1000.display_dac_error()
-
-        self.configure_gpio_inputs_outputs()
-
-        self.configure_vcxo()
+        if getattr(self, 'mo1000', None) is None:
+            self.mo1000 = Mo1000(self.transport, MO1000_BOARD_NUMBER, configure=False)
+        if getattr(self, 'mi125', None) is None:
+            self.mi125 = Mi125(self.transport, MI125_BOARD_NUMBER, MI125_CLK_SRC, configure=False)
 
-        self.configure_loops_registers()
+        self.run_init_steps()
 
         print "Init DONE"
 
-    @ensure_connect_method
-    def connect(self):
-        return eapi.connect_cce(self.perseus_ip, self._board_state)
-
-    @ensure_read_method
-    def custom_read(self, register):
-        return eapi.custom_register_read_send(self._board_state, register)
-
-    @ensure_write_method
-    def custom_write(self, register, data):
-        """
-           @todo: this method should be merge with self.write when it will be supported in all platforms.
-        """
-        return eapi.custom_register_write_send(self._board_state, register, data)
-
-    @ensure_write_method
-    def write(self, address, value):
-        return eapi.memory_write_send(self._board_state, address, value)
-
-    @ensure_read_method
-    def read(self, address):
-        return eapi.memory_read_send(self._board_state, address)
-
-    def configure_gpio_inputs_outputs(self):
-        print "configuring GPIO inputs/outputs"
-        register = 13
-        values = [0x1, 0x0, 0x1ffff, 0x20000, 0x30000, 0x30001, 0x40001, 0x40000]
-        for value in values:
-            self.custom_write(register, value)
-
-    def configure_vcxo(self):
-        print "configuring VCXO"
-        register = 10
-        values = [0x3e80009, 0x3eA0001, 0x3eC0001, 0x3eE0000, 0x3f00002,
-                  0x3f20000, 0x3f40000, 0x3f60000, 0x3FA0001, 0x3F80000, 0x3F80001]
-        for value in values:
-            self.custom_write(register, value)
-
-    def configure_loops_registers(self):
+    def get_init_steps(self):
+        mo1000 = self.mo1000
+        mi125 = self.mi125
+
+        def timed(name, method, *args, **kwargs):
+            def _timed():
+                with measure(self.init_profile, name):
+                    return method(*args, **kwargs)
+            return _timed
+
+        def mo1000_setup():
+            for name in ('power_up', 'reset', 'init', 'configure_dacs', 'configure_clock'):
+                timed('Mo1000.' + name, getattr(mo1000, name))()
+            timed('Mo1000.configure_ports', mo1000.configure_ports, settle=False)()
+
+        def mi125_setup():
+            for name in ('power_up', 'reset', 'm125_configure'):
+                timed('Mi125.' + name, getattr(mi125, name))()
+            timed('Mi125.set_clock_source', mi125.set_clock_source, MI125_CLK_SRC)()
+
+        def reset_fifo():
+            # the boards lost their configuration, do not trust the shadow values
+            self.sequences.clear_shadow()
+            timed('custom_write 4 1', self.custom_write, 4, 1)()
+
+        def boards_calibrated():
+            return mo1000.is_calibrated() and mi125.is_calibrated()
+
+        return [
+            InitStep("Reset MI125 - MO1000 intercore fifo", reset_fifo,
+                     done=boards_calibrated),
+            InitStep("MO1000 1 initialization", mo1000_setup,
+                     requires=["Reset MI125 - MO1000 intercore fifo"],
+                     done=mo1000.is_calibrated, settle=PORTS_SETTLE_TIME),
+            InitStep("MO1000 1 calibration", timed('Mo1000.calibration', mo1000.calibration),
+                     requires=["MO1000 1 initialization"],
+                     done=mo1000.is_calibrated, ready=mo1000.is_calibrated),
+            InitStep("Mi125 2 initialization", mi125_setup,
+                     requires=["Reset MI125 - MO1000 intercore fifo"],
+                     done=mi125.is_calibrated, ready=mi125.is_calibrated),
+            InitStep("MO1000 1 enable dac outputs", timed('Mo1000.enable_dac_outputs', mo1000.enable_dac_outputs),
+                     requires=["MO1000 1 calibration"]),
+            InitStep("Remove reset MI125 - MO1000 intercore fifo", timed('custom_write 4 0', self.custom_write, 4, 0),
+                     requires=["MO1000 1 enable dac outputs", "Mi125 2 initialization"]),
+            InitStep("Display dac errors", timed('Mo1000.display_dac_error', mo1000.display_dac_error),
+                     requires=["Remove reset MI125 - MO1000 intercore fifo"]),
+            InitStep("Configure GPIO", self.configure_gpio_inputs_outputs,
+                     requires=["Remove reset MI125 - MO1000 intercore fifo"]),
+            InitStep("Configure VCXO", self.configure_vcxo,
+                     requires=["Configure GPIO"]),
+            InitStep("Configure loops registers", self.configure_loops_registers,
+                     requires=["Configure VCXO"]),
+        ]
+
+    def configure_loops_registers(self, force=False):
         print "configuring Loops Board registers"
-        values = [0x00000000, 0x00020001, 0x00040000, 0x00060000, 0x00080000, 0x000A0000,
-                  0x000C3FFF, 0x000E0000, 0x00100000, 0x00120000, 0x00140000, 0x00160000,
-                  0x00180000, 0x001A4DBA, 0x001C4DBA, 0x001E0000, 0x00200005, 0x00220000,
-                  0x00240000, 0x002607C6, 0x00282000, 0x002A07C6, 0x002C0E39, 0x002E0007,
-                  0x0032003F, 0x00340000, 0x00360000, 0x00380000, 0x003A0000, 0x003C0000,
-                  0x003E0000, 0x00DC0006, 0x03200001, 0x00C80000, 0x00CA0000, 0x025E0003,
-                  0x025A0001, 0x026A0222, 0x026C00B6, 0x03220001]
-
-        for i, value in enumerate(values):
-            self.write(SETTINGS_WRITE_OFFSET_A, value)
-            self.write(SETTINGS_WRITE_OFFSET_B, value)
+        return self.sequences.run('loops_registers', force, self.init_profile)
 
     @ensure_write_method
     def init_fast_data_logger(self):
         """Initialize ram"""
-        return eapi.ram_init(self._board_state)
+        return self.transport.call(eapi.ram_init, replay=False)
 
     def write_fast_data_logger_delay(self):
         # set 10ms delay to continue recording data after a trigger
@@ -143,7 +129,7 @@ class PerseusLoops(object):
     @ensure_write_method
     def start_recording_data_in_ram(self, size=65536, triggersource=0):
         """Start recording data in RAM"""
-        return eapi.recplay_record(self._board_state, size, triggersource)
+        return self.transport.call(eapi.recplay_record, size, triggersource, replay=False)
 
     # @ensure_read_method
     def get_ram_data(self, filename, channel=0, bufsize=65536, framesize=1024, framegap=200):
@@ -202,7 +188,8 @@ class PerseusLoops(object):
 
         # Back to the old API ... @todo: to be remove
         with open(filename, 'wb') as file:
-            ret, rsize, data = eapi.ram_get(self._board_state, channel, startaddr, neededsize, framesize, framegap)
+            ret, rsize, data = self.transport.call(eapi.ram_get, channel, startaddr, neededsize, framesize,
+                                                   framegap, replay=False)
             # if ret<0:
             #     raise adp_exception(ret)
             if (neededsize != bufsize):
@@ -224,7 +211,7 @@ class PerseusLoops(object):
         return self.custom_read(RAM_TRANSFER_REGISTER)
 
     def check_transfer_done(self, timeout):
-        ret, addr, trigoffset = eapi.recplay_record_check_transfer_done(self._board_state, timeout)
+        ret, addr, trigoffset = self.transport.call(eapi.recplay_record_check_transfer_done, timeout)
 
     def fast_data_logger(self, filename):
         print "# Ram init"
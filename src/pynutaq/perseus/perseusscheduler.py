@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Priority scheduling of the perseus connections.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module gives the connections of a transport to the waiting threads
+by priority class, then in arrival order:
+
+    PRIORITY_SAFETY         interlock and tuning resets
+    PRIORITY_OPERATOR       settings writes (default)
+    PRIORITY_ACQUISITION    diagnostics and attributes sweeps
+    PRIORITY_MAINTENANCE    snapshots, fast data logger, history
+
+The class of a thread is set with the priority context manager or the
+prioritized decorator. A long batch calls preempt() between registers: if a
+thread of a higher class is waiting, the connection is handed to it and the
+batch goes on when it gets a connection back.
+
+The time each class waits for a connection is kept (count, mean, max and
+99th percentile of the last waits).
+"""
+
+__all__ = ["PriorityScheduler", "priority", "prioritized", "get_priority",
+           "PRIORITY_SAFETY", "PRIORITY_OPERATOR", "PRIORITY_ACQUISITION",
+           "PRIORITY_MAINTENANCE", "PRIORITY_NAMES"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import collections
+import functools
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy
+
+PRIORITY_SAFETY = 0
+PRIORITY_OPERATOR = 1
+PRIORITY_ACQUISITION = 2
+PRIORITY_MAINTENANCE = 3
+
+PRIORITY_NAMES = ('safety', 'operator', 'acquisition', 'maintenance')
+
+LATENCY_WINDOW = 1000
+
+_local = threading.local()
+
+
+def get_priority():
+    """Priority class of the current thread."""
+    return getattr(_local, 'priority', PRIORITY_OPERATOR)
+
+
+@contextmanager
+def priority(value):
+    """Run the block with the priority class value."""
+    previous = get_priority()
+    _local.priority = value
+    try:
+        yield
+    finally:
+        _local.priority = previous
+
+
+def prioritized(value):
+    """Decorator running a method with the priority class value."""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with priority(value):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class _Waiter(object):
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.resource = None
+
+
+class PriorityScheduler(object):
+
+    def __init__(self, resources):
+        self._free = list(resources)
+        self._waiters = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self._waits = [collections.deque(maxlen=LATENCY_WINDOW) for name in PRIORITY_NAMES]
+        self._counts = [0] * len(PRIORITY_NAMES)
+        self.preemptions = 0
+
+    def acquire(self, value=None):
+        """Wait for a resource, by priority class."""
+        value = get_priority() if value is None else value
+        start = time.time()
+        with self._lock:
+            if self._free and not self._waiters:
+                resource = self._free.pop()
+                self._record(value, start)
+                return resource
+            waiter = _Waiter()
+            heapq.heappush(self._waiters, (value, next(self._order), waiter))
+        waiter.event.wait()
+        with self._lock:
+            self._record(value, start)
+        return waiter.resource
+
+    def release(self, resource):
+        with self._lock:
+            if self._waiters:
+                value, order, waiter = heapq.heappop(self._waiters)
+                waiter.resource = resource
+                waiter.event.set()
+            else:
+                self._free.append(resource)
+
+    def preempt(self, resource, value=None):
+        """Hand resource to a waiting thread of a higher class, if any, and
+        wait for a resource again. Returns the resource to go on with.
+        """
+        value = get_priority() if value is None else value
+        with self._lock:
+            if not self._waiters or self._waiters[0][0] >= value:
+                return resource
+            self.preemptions += 1
+        self.release(resource)
+        return self.acquire(value)
+
+    def _record(self, value, start):
+        self._waits[value].append(time.time() - start)
+        self._counts[value] += 1
+
+    def statistics(self):
+        """{class name: {count, mean, max, p99}}, waits in ms."""
+        with self._lock:
+            waits = [numpy.array(window) * 1000.0 for window in self._waits]
+            counts = list(self._counts)
+        result = {}
+        for name, count, window in zip(PRIORITY_NAMES, counts, waits):
+            result[name] = {'count': count,
+                            'mean': float(window.mean()) if len(window) else None,
+                            'max': float(window.max()) if len(window) else None,
+                            'p99': float(numpy.percentile(window, 99)) if len(window) else None}
+        return result
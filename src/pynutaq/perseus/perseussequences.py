@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Perseus register sequences.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module loads and writes the named register sequences used to program
+the boards (GPIO, VCXO and the default loops registers).
+
+The sequences are read from the csv files in the sequences directory. Words
+go to a custom register or, for the settings words, to the write offset of
+one chain. Settings words are skipped when the last value written to the
+same address, by a sequence or by any other write, is the same. Custom register sequences are protocols (the same
+register is written several times), so they are skipped only as a whole,
+when the same sequence was already written.
+"""
+
+__all__ = ["RegisterSequence", "SequenceEngine", "load_sequences",
+           "get_sequences_filename"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import csv
+import os
+import time
+
+from pynutaq.perseus.perseusdefs import *
+from pynutaq.perseus.perseusinit import measure
+
+SEQUENCES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sequences')
+
+TARGET_CUSTOM = 'custom'
+SETTINGS_TARGETS = {'settings_a': SETTINGS_WRITE_OFFSET_A,
+                    'settings_b': SETTINGS_WRITE_OFFSET_B}
+SETTINGS_OFFSETS = SETTINGS_TARGETS.values()
+
+MAX_WORD = 0xFFFFFFFF
+MAX_CUSTOM_REGISTER = 0xFF
+SETTINGS_ADDRESS_SHIFT = 17
+
+
+def get_sequences_filename(perseus_type):
+    return os.path.join(SEQUENCES_PATH, perseus_type + '.csv')
+
+
+class RegisterSequence(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.words = []
+
+    def add(self, target, register, value):
+        self.words.append((target, register, value))
+
+    def batches(self):
+        """Split the words in batches of the same target.
+
+        The settings words between two custom register words go in one batch
+        per chain, in file order, so interleaved chains are not split in one
+        word batches. Custom register words are protocols and keep their
+        place: consecutive ones make a batch.
+        """
+        batches = []
+        settings = {}
+        for target, register, value in self.words:
+            if target == TARGET_CUSTOM:
+                settings = {}
+                if batches and batches[-1][0] == TARGET_CUSTOM:
+                    batches[-1][1].append((register, value))
+                    continue
+            elif target in settings:
+                settings[target].append((register, value))
+                continue
+            batches.append((target, [(register, value)]))
+            if target != TARGET_CUSTOM:
+                settings[target] = batches[-1][1]
+        return batches
+
+
+def _parse_int(text, filename, line):
+    try:
+        return int(text, 0)
+    except ValueError:
+        raise Exception("%s:%d: invalid number %r" % (filename, line, text))
+
+
+def load_sequences(filename):
+    """Return the RegisterSequences defined in filename, in file order."""
+    sequences = []
+    by_name = {}
+    with open(filename) as f:
+        lines = [(number + 1, line) for number, line in enumerate(f)
+                 if line.strip() and not line.startswith('#')]
+    reader = csv.DictReader([line for number, line in lines])
+    for (number, line), row in zip(lines[1:], reader):
+        name = (row['sequence'] or '').strip()
+        target = (row['target'] or '').strip()
+        if not name:
+            raise Exception("%s:%d: missing sequence name" % (filename, number))
+        value = _parse_int(row['value'].strip(), filename, number)
+        if not 0 <= value <= MAX_WORD:
+            raise Exception("%s:%d: value out of 32 bits" % (filename, number))
+        if target == TARGET_CUSTOM:
+            register = _parse_int(row['register'].strip(), filename, number)
+            if not 0 <= register <= MAX_CUSTOM_REGISTER:
+                raise Exception("%s:%d: invalid custom register %d" % (filename, number, register))
+        elif target in SETTINGS_TARGETS:
+            register = SETTINGS_TARGETS[target]
+        else:
+            raise Exception("%s:%d: unknown target %r" % (filename, number, target))
+        if name not in by_name:
+            by_name[name] = RegisterSequence(name)
+            sequences.append(by_name[name])
+        by_name[name].add(target, register, value)
+    return sequences
+
+
+class SequenceEngine(object):
+    """Writes the sequences through the batched write methods of perseus.
+
+    perseus must provide write_many([(address, value), ...]) and
+    custom_write_many([(register, value), ...]), and report every memory
+    write to track().
+    """
+
+    def __init__(self, perseus, sequences):
+        self.perseus = perseus
+        self.sequences = dict((sequence.name, sequence) for sequence in sequences)
+        self.names = [sequence.name for sequence in sequences]
+        self.stats = {}
+        self.clear_shadow()
+
+    def clear_shadow(self):
+        self._settings_shadow = {}
+        self._written_sequences = set()
+
+    def _settings_key(self, offset, value):
+        return offset, value >> SETTINGS_ADDRESS_SHIFT
+
+    def track(self, address, value):
+        """Keep the shadow up to date with a word written to address."""
+        if address in SETTINGS_OFFSETS:
+            self._settings_shadow[self._settings_key(address, value)] = value
+
+    def _pending_words(self, sequence, force):
+        customs = [word for word in sequence.words if word[0] == TARGET_CUSTOM]
+        if customs and (force or sequence.name not in self._written_sequences):
+            return list(sequence.words)
+        pending = []
+        for word in sequence.words:
+            target, register, value = word
+            if target == TARGET_CUSTOM:
+                continue
+            if force or self._settings_shadow.get(self._settings_key(register, value)) != value:
+                pending.append(word)
+        return pending
+
+    def run(self, name, force=False, profile=None):
+        """Write sequence name. Returns a dict with the write statistics."""
+        sequence = self.sequences[name]
+        start = time.time()
+        pending = RegisterSequence(name)
+        pending.words = self._pending_words(sequence, force)
+        with measure(profile, "sequence " + name):
+            for target, words in pending.batches():
+                if target == TARGET_CUSTOM:
+                    self.perseus.custom_write_many(words)
+                else:
+                    self.perseus.write_many(words)
+        self._written_sequences.add(name)
+        stats = {'words': len(sequence.words),
+                 'written': len(pending.words),
+                 'skipped': len(sequence.words) - len(pending.words),
+                 'duration': time.time() - start}
+        self.stats[name] = stats
+        print "sequence %s: %d words written, %d skipped (%.3f s)" % (
+            name, stats['written'], stats['skipped'], stats['duration'])
+        return stats
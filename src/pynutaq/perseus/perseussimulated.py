@@ -28,22 +28,56 @@ __author__ = 'antmil'
 
 __docformat__ = 'restructuredtext'
 
+import threading
 from random import randint
 
+from pynutaq.perseus.perseusinit import InitOrchestrator, InitStep, InitProfile
+from pynutaq.perseus.perseusexceptions import ErrorCounter
+from pynutaq.perseus.perseusbits import BitGroupReader
+
 MI125_BOARD_NUMBER = 1
 
 
 class PerseusSimulated(object):
 
     def __init__(self):
+        self.last_init_profile = None
+        self.lock = threading.RLock()
+        self.errors = ErrorCounter()
+        self.bits = BitGroupReader(self)
         self.connect()
         print "Init DONE"
 
+    def init_hardware(self):
+        self.last_init_profile = InitProfile('simulated')
+        steps = [InitStep("Simulated initialization", self.connect)]
+        InitOrchestrator(steps, profile=self.last_init_profile).run()
+
     def connect(self):
         print "Connected"
 
-    def write(self, address, value):
+    def chain_lock(self, offset):
+        return self.lock
+
+    def latch_lock(self, cavity):
+        return self.lock
+
+    def write(self, address, value, replay=True):
         print "Value to write in address %d -> %d" % (address, value)
 
+    def custom_write(self, register, data):
+        print "Value to write in custom register %d -> %d" % (register, data)
+
+    def write_many(self, words):
+        for address, value in words:
+            self.write(address, value)
+
+    def custom_write_many(self, words):
+        for register, data in words:
+            self.custom_write(register, data)
+
     def read(self, address):
         return randint(0, 0xFFFFFFFF)
+
+    def read_many(self, offset, addresses, partial=False):
+        return [self.read(offset) for address in addresses]
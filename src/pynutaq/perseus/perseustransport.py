@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Perseus eapi transport.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""This module manages the eapi connections to one perseus board.
+
+The transport keeps a pool of connection_state objects, so independent
+chains can be driven in parallel. Every eapi call goes through call(). When
+a call fails, the connection is probed; if the probe fails too the
+connection is considered dead and is reopened with exponential back-off.
+Single calls are then replayed when that is safe. Batches run with
+run_batch() are replayed as a whole, so a read through an offset (write the
+address, read the value) is never left half done. Errors that are not
+caused by the connection (bad arguments) are raised at once, without probing.
+
+When a call returns an error code on a live connection, it is retried as
+allowed by the RetryPolicy of its eapi function: a number of attempts, a
+back-off between them and a total deadline. Calls made with replay=False
+(pulses, RAM transfers) are neither retried nor replayed.
+
+The connections of the pool are given by priority class, and the boards
+call preempt() between the registers of a batch, see perseusscheduler.
+"""
+
+__all__ = ["EapiTransport", "ConnectionLost", "RetryPolicy"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import threading
+import time
+from contextlib import contextmanager
+
+import eapi
+
+from pynutaq.perseus.perseusexceptions import PerseusConnectionError
+from pynutaq.perseus.perseusscheduler import PriorityScheduler
+
+DEFAULT_POOL_SIZE = 2
+BACKOFF_START = 0.1
+BACKOFF_MAX = 5.0
+CONNECT_TIMEOUT = 10.0
+RECONNECT_TIMEOUT = 30.0
+
+# custom register read to check if a connection is still alive
+PROBE_REGISTER = 0
+
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.01
+RETRY_MAX_BACKOFF = 0.2
+RETRY_DEADLINE = 1.0
+
+
+class ConnectionLost(PerseusConnectionError):
+    pass
+
+
+def _get_ret(result):
+    if isinstance(result, tuple):
+        return result[0]
+    return result
+
+
+class RetryPolicy(object):
+    """Retry budget of one eapi operation."""
+
+    def __init__(self, attempts=RETRY_ATTEMPTS, backoff=RETRY_BACKOFF,
+                 max_backoff=RETRY_MAX_BACKOFF, deadline=RETRY_DEADLINE):
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+
+    def delay(self, attempt, start):
+        """Seconds to wait before attempt (counted from 1), None when the
+        budget is exhausted.
+        """
+        if attempt > self.attempts:
+            return None
+        delay = min(self.backoff * 2 ** (attempt - 2), self.max_backoff)
+        if time.time() + delay - start > self.deadline:
+            return None
+        return delay
+
+
+NO_RETRY = RetryPolicy(attempts=1)
+
+# Writes are idempotent (the same word to the same address) unless they are
+# made with replay=False
+DEFAULT_POLICIES = {
+    'memory_read_send': RetryPolicy(),
+    'memory_write_send': RetryPolicy(),
+    'custom_register_read_send': RetryPolicy(),
+    'custom_register_write_send': RetryPolicy(attempts=2),
+}
+
+
+class _Connection(object):
+
+    def __init__(self, index):
+        self.index = index
+        self.state = eapi.connection_state()
+        self.connected = False
+        self.lock = threading.Lock()
+
+
+class EapiTransport(object):
+
+    def __init__(self, perseus_ip, pool_size=DEFAULT_POOL_SIZE,
+                 connect_timeout=CONNECT_TIMEOUT, reconnect_timeout=RECONNECT_TIMEOUT):
+        self.perseus_ip = perseus_ip
+        self.connect_timeout = connect_timeout
+        self.reconnect_timeout = reconnect_timeout
+        self.reconnections = 0
+        self.retries = 0
+        self.errors = None
+        self.policies = dict(DEFAULT_POLICIES)
+        self.default_policy = NO_RETRY
+        self._connections = [_Connection(index) for index in range(max(pool_size, 1))]
+        self.scheduler = PriorityScheduler(self._connections)
+        self._local = threading.local()
+
+    @property
+    def connected(self):
+        return all(connection.connected for connection in self._connections)
+
+    def connect(self):
+        for connection in self._connections:
+            self._reconnect(connection, self.connect_timeout)
+
+    def _open(self, connection):
+        disconnect = getattr(eapi, 'disconnect_cce', None)
+        if connection.connected and disconnect is not None:
+            try:
+                disconnect(connection.state)
+            except Exception:
+                pass
+        connection.connected = False
+        ret = eapi.connect_cce(self.perseus_ip, connection.state)
+        if ret:
+            raise ConnectionLost('connect_cce', ret, detail=self.perseus_ip)
+        connection.connected = True
+
+    def _reconnect(self, connection, timeout):
+        """Reopen connection, with exponential back-off until timeout."""
+        with connection.lock:
+            deadline = time.time() + timeout
+            delay = BACKOFF_START
+            while True:
+                try:
+                    self._open(connection)
+                    return
+                except Exception, e:
+                    if time.time() + delay > deadline:
+                        raise self._lost('connect_cce', getattr(e, 'code', None),
+                                         "cannot connect to %s" % self.perseus_ip)
+                    print "Connection %d to %s failed (%s), retrying in %.1f s" % (
+                        connection.index, self.perseus_ip, e, delay)
+                    time.sleep(delay)
+                    delay = min(delay * 2, BACKOFF_MAX)
+
+    def set_retry_policy(self, attempts, deadline, names=None):
+        """Change the attempts and deadline of the policies of names (all by default)."""
+        for name in names or self.policies.keys():
+            policy = self.policies.get(name, self.default_policy)
+            self.policies[name] = RetryPolicy(attempts, policy.backoff, policy.max_backoff, deadline)
+
+    def _lost(self, operation, code=None, detail=None):
+        error = ConnectionLost(operation, code, detail=detail)
+        if self.errors is not None:
+            self.errors.count(error)
+        return error
+
+    def _is_alive(self, connection):
+        try:
+            return _get_ret(eapi.custom_register_read_send(connection.state, PROBE_REGISTER)) >= 0
+        except Exception:
+            return False
+
+    @contextmanager
+    def session(self):
+        """Bind one connection of the pool to the current thread."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            yield connection
+            return
+        self._local.connection = self.scheduler.acquire()
+        try:
+            yield self._local.connection
+        finally:
+            connection, self._local.connection = self._local.connection, None
+            self.scheduler.release(connection)
+
+    def preempt(self):
+        """Between two calls of a batch: let a thread of a higher priority
+        class use the connection first.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            self._local.connection = self.scheduler.preempt(connection)
+
+    def _call(self, connection, function, args):
+        """Returns (result, lost)."""
+        if not connection.connected:
+            return None, True
+        try:
+            result = function(connection.state, *args)
+        except (TypeError, ValueError):
+            raise
+        except Exception:
+            if self._is_alive(connection):
+                raise
+            return None, True
+        ret = _get_ret(result)
+        if ret is not None and ret < 0 and not self._is_alive(connection):
+            return result, True
+        return result, False
+
+    def _call_with_retries(self, connection, function, args, policy):
+        start = time.time()
+        attempt = 1
+        while True:
+            result, lost = self._call(connection, function, args)
+            ret = _get_ret(result)
+            if lost or ret is None or ret >= 0:
+                return result, lost
+            attempt += 1
+            delay = policy.delay(attempt, start)
+            if delay is None:
+                return result, lost
+            self.retries += 1
+            time.sleep(delay)
+
+    def call(self, function, *args, **kwargs):
+        """Call eapi function(connection_state, *args) and return its result.
+
+        replay=False marks the call as not idempotent: it is not retried on
+        an error code nor repeated after a reconnect.
+        """
+        replay = kwargs.get('replay', True)
+        if replay:
+            policy = self.policies.get(function.__name__, self.default_policy)
+        else:
+            policy = NO_RETRY
+        with self.session() as connection:
+            result, lost = self._call_with_retries(connection, function, args, policy)
+            if not lost:
+                return result
+            connection.connected = False
+            if getattr(self._local, 'batch', False):
+                raise self._lost(function.__name__, detail="connection to %s lost" % self.perseus_ip)
+            self._reconnect(connection, self.reconnect_timeout)
+            self.reconnections += 1
+            if not replay:
+                raise self._lost(function.__name__, detail="connection to %s lost, reconnected" %
+                                 self.perseus_ip)
+            return function(connection.state, *args)
+
+    def run_batch(self, batch, replay=True):
+        """Run batch() on one connection. If the connection is lost the
+        connection is reopened and, if replay, the whole batch runs again.
+        """
+        with self.session():
+            if getattr(self._local, 'batch', False):
+                return batch()
+            self._local.batch = True
+            try:
+                try:
+                    return batch()
+                except ConnectionLost:
+                    self._reconnect(self._local.connection, self.reconnect_timeout)
+                    self.reconnections += 1
+                    if not replay:
+                        raise
+                return batch()
+            finally:
+                self._local.batch = False
@@ -27,7 +27,9 @@ __author__ = 'antmil'
 __docformat__ = 'restructuredtext'
 
 import math
+from contextlib import contextmanager
 from pynutaq.perseus.perseusdefs import *
+from pynutaq.perseus.perseusexceptions import PerseusArgumentError
 
 def get_offset(type, cavity):
     if type == 'read':
@@ -36,23 +38,23 @@ def get_offset(type, cavity):
         elif cavity == 'B':
             return SETTINGS_READ_OFFSET_B
         else:
-            raise 'Unknown cavity. Must be A or B.'
+            raise PerseusArgumentError('get_offset', detail='Unknown cavity %r. Must be A or B.' % cavity)
     elif type == 'write':
         if cavity == 'A':
             return SETTINGS_WRITE_OFFSET_A
         elif cavity == 'B':
             return SETTINGS_WRITE_OFFSET_B
         else:
-            raise 'Unknown cavity. Must be A or B.'
+            raise PerseusArgumentError('get_offset', detail='Unknown cavity %r. Must be A or B.' % cavity)
     elif type == 'diag':
         if cavity == 'A':
             return DIAGNOSTICS_OFFSET_A
         elif cavity == 'B':
             return DIAGNOSTICS_OFFSET_B
         else:
-            raise 'Unknown cavity. Must be A or B.'
+            raise PerseusArgumentError('get_offset', detail='Unknown cavity %r. Must be A or B.' % cavity)
     else:
-        raise 'Wrong type of offset!'
+        raise PerseusArgumentError('get_offset', detail='Wrong type of offset %r!' % type)
 
 
 def read_angle(perseus, address, cavity):
@@ -60,8 +62,7 @@ def read_angle(perseus, address, cavity):
 
     offset = get_offset('read', cavity)
 
-    perseus.write(offset, address)
-    value = perseus.read(offset)
+    value = perseus.read_many(offset, [address])[0]
 
     if value > 32767:
         angle = (value - 65536) * 180.0 / 32767
@@ -98,8 +99,7 @@ def read_milivolts(perseus, address, cavity):
     """
     offset = get_offset('read', cavity)
 
-    perseus.write(offset, address)
-    value = perseus.read(offset)
+    value = perseus.read_many(offset, [address])[0]
 
     milis = value * 1000.0 / 32767 * 1.6467602581
     return milis
@@ -129,8 +129,7 @@ def read_settings_diag_milivolts(perseus, address, cavity):
 
     offset = get_offset('read', cavity)
 
-    perseus.write(offset, address)
-    value = perseus.read(offset)
+    value = perseus.read_many(offset, [address])[0]
 
     milis = value * 1000.0 / 32767
     return milis
@@ -160,8 +159,7 @@ def read_settings_diag_percentage(perseus, address, cavity):
     """
 
     offset = get_offset('read', cavity)
-    perseus.write(offset, address)
-    value = perseus.read(offset)
+    value = perseus.read_many(offset, [address])[0]
 
     percentage = value * 100.0 / 32767
     return percentage
@@ -185,8 +183,7 @@ def read_direct(perseus, address, cavity):
 
     offset = get_offset('read', cavity)
 
-    perseus.write(offset, address)
-    value = perseus.read(offset)
+    value = perseus.read_many(offset, [address])[0]
     return value
 
 def write_direct(perseus, value, address, cavity):
@@ -195,12 +192,41 @@ def write_direct(perseus, value, address, cavity):
     offset = get_offset('write', cavity)
     perseus.write(offset, value)
 
+def write_pulse_direct(perseus, address, cavity):
+    """Set and clear a bit register. The writes are not retried, so a
+    transient error cannot give a second pulse.
+    """
+    offset = get_offset('write', cavity)
+    perseus.write(offset, address << 17 | 1, replay=False)
+    perseus.write(offset, address << 17 | 0, replay=False)
+
+def read_many_direct(perseus, addresses, cavity, partial=False):
+    """Raw values of a list of settings addresses, read in one batch.
+
+    With partial, the registers that cannot be read are None.
+    """
+    offset = get_offset('read', cavity)
+    return perseus.read_many(offset, addresses, partial)
+
+def write_many_direct(perseus, values, addresses, cavity):
+    """Write raw values to a list of settings addresses in one batch."""
+    offset = get_offset('write', cavity)
+    words = [(offset, int(address) << 17 | int(value)) for address, value in zip(addresses, values)]
+    perseus.write_many(words)
+
+def read_many_diag_direct(perseus, addresses, cavity, partial=False):
+    """Raw values of a list of diagnostics addresses, read in one batch.
+
+    With partial, the registers that cannot be read are None.
+    """
+    offset = get_offset('diag', cavity)
+    return perseus.read_many(offset, addresses, partial)
+
 def read_diag_angle(perseus, address, cavity):
 
     offset = get_offset('diag', cavity)
 
-    perseus.write(offset, address)
-    value = perseus.read(offset)
+    value = perseus.read_many(offset, [address])[0]
     # =IF(D49>32767;
     #    (D49-65536)/32767*180;
     #     D49/32767*180)
@@ -214,15 +240,13 @@ def read_diag_direct(perseus, address, cavity):
 
     offset = get_offset('diag', cavity)
 
-    perseus.write(offset, address)
-    value = perseus.read(offset)
+    value = perseus.read_many(offset, [address])[0]
     return value
 
 def read_diag_milivolts(perseus, address, cavity):
 
     offset = get_offset('diag', cavity)
-    perseus.write(offset, address)
-    value = perseus.read(offset)
+    value = perseus.read_many(offset, [address])[0]
     #and now convert the value
     #=IF(D9<32768;
     #    D9/32767*1000;
@@ -241,16 +265,48 @@ def calc_phase(perseus, ivalue, qvalue):
     phase = math.atan2(qvalue, ivalue)
     return phase
 
+def read_diag_bool(perseus, address, cavity):
+    return bool(read_diag_direct(perseus, address, cavity))
+
+def read_bit_direct(perseus, address, position, cavity):
+    """One bit of a settings word. In a sweep of perseus.bits the word is
+    only read once for all its bits.
+    """
+    return perseus.bits.bit('read', address, position, cavity)
+
+def read_diag_bit_direct(perseus, address, position, cavity):
+    """One bit of a diagnostics word, see read_bit_direct."""
+    return perseus.bits.bit('diag', address, position, cavity)
+
 
 def start_reading_diagnostics(perseus, cavity):
 
     offset = get_offset('diag', cavity)
-    value = 1 << 16
-    perseus.write(offset, value)
-    #@warning: I know ... this is not needed
-    value = 0 << 16
-    #lets continue
-    perseus.write(offset, value)
+    # a read through the offset of the chain must not run between the writes
+    with perseus.chain_lock(offset):
+        value = 1 << 16
+        perseus.write(offset, value, replay=False)
+        #@warning: I know ... this is not needed
+        value = 0 << 16
+        #lets continue
+        perseus.write(offset, value, replay=False)
+
+@contextmanager
+def latched_diagnostics(perseus, *cavities):
+    """Latch the diagnostics of cavities and keep the latch for the block:
+    the other latches of these chains wait, so all the values read in the
+    block are of the same latch.
+    """
+    locks = [perseus.latch_lock(cavity) for cavity in sorted(cavities)]
+    for lock in locks:
+        lock.acquire()
+    try:
+        for cavity in cavities:
+            start_reading_diagnostics(perseus, cavity)
+        yield
+    finally:
+        for lock in reversed(locks):
+            lock.release()
 
 def end_reading_diagnostics(perseus, cavity):
 
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Perseus board simulated in memory for the unit tests.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+
+"""This module contains FakePerseus, a board of settings and diagnostics
+registers kept in dicts, with the methods of PerseusBoard used by the
+nutaq modules.
+
+A settings word written to the write offset of a chain sets the register
+of its address (word >> 17) to its low 17 bits, and the read offset returns
+it. The diagnostics registers are set by the tests.
+"""
+
+__all__ = ["FakePerseus"]
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import threading
+
+from pynutaq.perseus.perseusdefs import *
+from pynutaq.perseus.perseusexceptions import PerseusTransportError
+
+ADDRESS_SHIFT = 17
+VALUE_MASK = (1 << ADDRESS_SHIFT) - 1
+
+SETTINGS_WRITE_OFFSETS = {SETTINGS_WRITE_OFFSET_A: 'A', SETTINGS_WRITE_OFFSET_B: 'B'}
+SETTINGS_READ_OFFSETS = {SETTINGS_READ_OFFSET_A: 'A', SETTINGS_READ_OFFSET_B: 'B'}
+DIAGNOSTICS_OFFSETS = {DIAGNOSTICS_OFFSET_A: 'A', DIAGNOSTICS_OFFSET_B: 'B'}
+
+
+class FakePerseus(object):
+
+    def __init__(self):
+        self.settings = {'A': {}, 'B': {}}
+        self.diagnostics = {'A': {}, 'B': {}}
+        self.writes = []
+        self.custom_writes = []
+        self.batches = []
+        self.latches = {'A': 0, 'B': 0}
+        # number of writes to accept before raising, None to never fail
+        self.fail_after = None
+        self.lock = threading.RLock()
+
+    def chain_lock(self, offset):
+        return self.lock
+
+    def latch_lock(self, cavity):
+        return self.lock
+
+    def write(self, address, value, replay=True):
+        if self.fail_after is not None:
+            if self.fail_after <= 0:
+                self.fail_after = None
+                raise PerseusTransportError('write', address=address)
+            self.fail_after -= 1
+        self.writes.append((address, value))
+        if address in SETTINGS_WRITE_OFFSETS:
+            self.settings[SETTINGS_WRITE_OFFSETS[address]][value >> ADDRESS_SHIFT] = value & VALUE_MASK
+        elif address in DIAGNOSTICS_OFFSETS and value == 1 << 16:
+            self.latches[DIAGNOSTICS_OFFSETS[address]] += 1
+
+    def write_many(self, words):
+        self.batches.append(('write', list(words)))
+        for address, value in words:
+            self.write(address, value)
+
+    def custom_write(self, register, data):
+        self.custom_writes.append((register, data))
+
+    def custom_write_many(self, words):
+        self.batches.append(('custom', list(words)))
+        for register, data in words:
+            self.custom_write(register, data)
+
+    def read_many(self, offset, addresses, partial=False):
+        if offset in DIAGNOSTICS_OFFSETS:
+            registers = self.diagnostics[DIAGNOSTICS_OFFSETS[offset]]
+        else:
+            registers = self.settings[SETTINGS_READ_OFFSETS[offset]]
+        return [registers.get(int(address), 0) for address in addresses]
+
+    def read(self, address):
+        return 0
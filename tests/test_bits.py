@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Tests of the bit sweeps.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import threading
+import unittest
+
+import numpy
+
+from tests.fakeperseus import FakePerseus
+from pynutaq.perseus.perseusbits import BitGroupReader, unpack_bits
+
+
+class CountingPerseus(FakePerseus):
+
+    def __init__(self):
+        FakePerseus.__init__(self)
+        self.reads = []
+
+    def read_many(self, offset, addresses, partial=False):
+        self.reads.append(list(addresses))
+        return FakePerseus.read_many(self, offset, addresses, partial)
+
+
+class BitGroupReaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.perseus = CountingPerseus()
+        self.perseus.settings['A'].update({7: 0b1010, 8: 0b1})
+        self.perseus.settings['B'][7] = 0b100
+        self.bits = BitGroupReader(self.perseus)
+
+    def test_unpack_bits(self):
+        numpy.testing.assert_array_equal(unpack_bits(0b1011)[:5], [True, True, False, True, False])
+        self.assertTrue(unpack_bits(-1).all())
+
+    def test_reads_outside_sweep(self):
+        self.assertTrue(self.bits.bit('read', 7, 1, 'A'))
+        self.assertFalse(self.bits.bit('read', 7, 2, 'A'))
+        self.assertEqual(self.perseus.reads, [[7], [7]])
+
+    def test_one_read_per_word_in_sweep(self):
+        with self.bits.sweep():
+            values = [self.bits.bit('read', 7, position, 'A') for position in range(4)]
+            self.assertTrue(self.bits.bit('read', 7, 2, 'B'))
+            self.perseus.settings['A'][7] = 0
+            self.assertTrue(self.bits.bit('read', 7, 3, 'A'))
+        self.assertEqual(values, [False, True, False, True])
+        self.assertEqual(self.perseus.reads, [[7], [7]])
+        self.assertFalse(self.bits.bit('read', 7, 3, 'A'))
+
+    def test_prefetch(self):
+        self.bits.prefetch('read', 'A', [7, 8])
+        self.assertEqual(self.perseus.reads, [])
+        with self.bits.sweep():
+            self.bits.bit('read', 7, 0, 'A')
+            with self.bits.sweep():
+                self.bits.prefetch('read', 'A', [8, 7, 8])
+            self.assertTrue(self.bits.bit('read', 8, 0, 'A'))
+        self.assertEqual(self.perseus.reads, [[7], [8]])
+
+    def test_sweep_per_thread(self):
+        reads = []
+        with self.bits.sweep():
+            self.bits.bit('read', 7, 0, 'A')
+            thread = threading.Thread(target=lambda: reads.append(self.bits.bit('read', 7, 1, 'A')))
+            thread.start()
+            thread.join(2)
+        self.assertEqual(reads, [True])
+        self.assertEqual(self.perseus.reads, [[7], [7]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Tests of the write coalescer.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import threading
+import time
+import unittest
+
+from pynutaq.nutaq.nutaqcoalescer import WriteCoalescer
+
+
+class WriteCoalescerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.written = []
+        self.applied = []
+        self.coalescer = WriteCoalescer(0.05, lambda name, value, error: self.applied.append((name, value, error)))
+
+    def tearDown(self):
+        self.coalescer.stop()
+
+    def write(self, value):
+        self.written.append(value)
+
+    def wait_written(self, count, timeout=2.0):
+        end = time.time() + timeout
+        while len(self.written) < count and time.time() < end:
+            time.sleep(0.005)
+
+    def test_first_write_at_once_last_value_kept(self):
+        for value in range(5):
+            self.coalescer.submit('KpA', value, self.write, value)
+        self.assertEqual(self.written, [0])
+        self.assertTrue(self.coalescer.is_pending('KpA'))
+        self.wait_written(2)
+        self.assertEqual(self.written, [0, 4])
+        self.assertEqual(self.coalescer.dropped, 3)
+        self.assertFalse(self.coalescer.is_pending('KpA'))
+
+    def test_flush(self):
+        self.coalescer.submit('KpA', 1, self.write, 1)
+        self.coalescer.submit('KpA', 2, self.write, 2)
+        self.coalescer.flush()
+        self.assertEqual(self.written, [1, 2])
+
+    def test_cancel_drops_pending(self):
+        self.coalescer.submit('KpA', 1, self.write, 1)
+        self.coalescer.submit('KpA', 2, self.write, 2)
+        self.coalescer.submit('KiA', 3, self.write, 3)
+        self.coalescer.submit('KiA', 4, self.write, 4)
+        self.assertEqual(self.coalescer.cancel(['KpA']), 1)
+        time.sleep(0.15)
+        self.assertEqual(self.written, [1, 3, 4])
+        self.assertEqual(self.coalescer.cancel(), 0)
+
+    def test_cancel_waits_for_the_write_in_flight(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_write(value):
+            started.set()
+            release.wait(2)
+            self.written.append(value)
+
+        self.coalescer.submit('KpA', 1, self.write, 1)
+        self.coalescer.submit('KpA', 2, slow_write, 2)
+        self.assertTrue(started.wait(2))
+        cancelled = threading.Event()
+        thread = threading.Thread(target=lambda: (self.coalescer.cancel(['KpA']), cancelled.set()))
+        thread.start()
+        time.sleep(0.05)
+        self.assertFalse(cancelled.is_set())
+        release.set()
+        thread.join(2)
+        self.assertTrue(cancelled.is_set())
+        self.assertEqual(self.written, [1, 2])
+
+    def test_deferred_error_counted(self):
+        def fail(value):
+            raise IOError('board unreachable')
+
+        self.coalescer.submit('KpA', 1, self.write, 1)
+        self.coalescer.submit('KpA', 2, fail, 2)
+        end = time.time() + 2
+        while not self.coalescer.failed and time.time() < end:
+            time.sleep(0.005)
+        self.assertEqual(self.coalescer.failed, 1)
+        self.assertTrue('KpA' in self.coalescer.last_error)
+        self.assertEqual(self.applied[-1][:2], ('KpA', 2))
+        self.assertTrue(isinstance(self.applied[-1][2], IOError))
+
+
+if __name__ == '__main__':
+    unittest.main()
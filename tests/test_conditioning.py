@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Tests of the conditioning sequencer.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import time
+import unittest
+
+from tests.fakeperseus import FakePerseus
+from pynutaq.perseus.perseusexceptions import PerseusArgumentError
+from pynutaq.nutaq.nutaqdefs import AMP_REF_IN_ADDRESS, PULSE_MODE_ENABLE_ADDRESS
+from pynutaq.nutaq.nutaqdefs import AUTOMATIC_CONDITIONING_ADDRESS
+from pynutaq.nutaq.nutaqregisters import get_register_map
+from pynutaq.nutaq.nutaqconditioning import ConditioningSequencer, load_profile, EVENTS
+
+PROFILE = '[{"duty": 10, "amplitude": 100, "dwell": 0.05}, ' \
+          '{"duty": 20, "amplitude": 200, "dwell": 0.05}, ' \
+          '{"duty": 30, "amplitude": 300, "dwell": 10}]'
+
+
+class LoadProfileTest(unittest.TestCase):
+
+    def test_profile(self):
+        self.assertEqual(load_profile(PROFILE).tolist(), [[10, 100, 0.05], [20, 200, 0.05], [30, 300, 10]])
+
+    def test_invalid_steps(self):
+        for text in ('[]', '[{"duty": 10}]', '[{"duty": 101, "amplitude": 1, "dwell": 1}]',
+                     '[{"duty": 10, "amplitude": 1001, "dwell": 1}]',
+                     '[{"duty": 10, "amplitude": -1, "dwell": 1}]',
+                     '[{"duty": 10, "amplitude": 1, "dwell": 0}]'):
+            self.assertRaises(PerseusArgumentError, load_profile, text)
+
+
+class ConditioningSequencerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.perseus = FakePerseus()
+        register_map = get_register_map('loops')
+        self.vacuum_address = int(register_map.address[register_map.index('Diag_Vaccum1A')])
+        self.sequencer = ConditioningSequencer(self.perseus, 'A', watch_period=0.005, backoff_steps=1,
+                                               backoff_hold=0.2)
+
+    def events(self):
+        return [EVENTS[record['event']] for record in self.sequencer.get_history()]
+
+    def wait_step(self, step, timeout=2.0):
+        end = time.time() + timeout
+        while self.sequencer.step != step and time.time() < end:
+            time.sleep(0.005)
+        self.assertEqual(self.sequencer.step, step)
+
+    def test_held_trip_backs_off_once(self):
+        self.sequencer.start(load_profile(PROFILE))
+        self.wait_step(2)
+        self.perseus.diagnostics['A'][self.vacuum_address] = 1
+        self.wait_step(1)
+        time.sleep(0.1)
+        self.assertEqual(self.sequencer.step, 1)
+        self.assertEqual(self.events().count('backoff'), 1)
+
+        # trips again within the hold: counted, no new back off
+        self.perseus.diagnostics['A'][self.vacuum_address] = 0
+        time.sleep(0.02)
+        self.perseus.diagnostics['A'][self.vacuum_address] = 1
+        time.sleep(0.02)
+        self.assertEqual(self.sequencer.trips, 2)
+        self.assertEqual(self.events().count('backoff'), 1)
+
+        # goes on after the hold
+        self.perseus.diagnostics['A'][self.vacuum_address] = 0
+        self.wait_step(2)
+        self.sequencer.stop()
+
+    def test_stop_writes_safe_state(self):
+        self.sequencer.start(load_profile(PROFILE))
+        self.wait_step(1)
+        self.sequencer.stop()
+        self.assertFalse(self.sequencer.running)
+        self.assertEqual(self.events()[-1], 'stop')
+        settings = self.perseus.settings['A']
+        self.assertEqual(settings[AMP_REF_IN_ADDRESS], 0)
+        self.assertEqual(settings[AUTOMATIC_CONDITIONING_ADDRESS], 0)
+        self.assertEqual(settings[PULSE_MODE_ENABLE_ADDRESS], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
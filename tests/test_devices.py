@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Tests of the generated device classes.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""The generated devices need PyTango, so they are checked from their
+source: every self attribute they use must be assigned by them or by
+NutaqDeviceMixin, or be a method, property or attribute of the class.
+"""
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import ast
+import os
+import unittest
+
+from pynutaq.nutaq.nutaqderived import DerivedDiagnostics
+
+NUTAQ_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          'src', 'pynutaq', 'nutaq')
+
+# methods of PyTango.server.Device
+DEVICE_METHODS = set(['get_name', 'get_state', 'set_state', 'set_status', 'push_change_event',
+                      'set_change_event'])
+
+
+def self_attributes(filename):
+    """(used, assigned, defined) names of the self attributes of the
+    classes of filename.
+    """
+    with open(os.path.join(NUTAQ_PATH, filename)) as f:
+        tree = ast.parse(f.read())
+    used, assigned, defined = set(), set(), set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            for item in node.body:
+                if isinstance(item, ast.FunctionDef):
+                    defined.add(item.name)
+                elif isinstance(item, ast.Assign):
+                    defined.update(target.id for target in item.targets if isinstance(target, ast.Name))
+        elif isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == 'self':
+            if isinstance(node.ctx, ast.Store):
+                assigned.add(node.attr)
+            else:
+                used.add(node.attr)
+    return used, assigned, defined
+
+
+class GeneratedDeviceTest(unittest.TestCase):
+
+    def check(self, filename, dynamic=()):
+        used, assigned, defined = self_attributes(filename)
+        mixin_used, mixin_assigned, mixin_defined = self_attributes('nutaqdevice.py')
+        known = assigned | defined | mixin_assigned | mixin_defined | DEVICE_METHODS | set(dynamic)
+        self.assertEqual(sorted(used - known), [])
+
+    def test_nutaq(self):
+        derived = DerivedDiagnostics('loops')
+        # set by derive_diagnostics
+        self.check('nutaq.py', ['_' + name for name in derived.amplitude_names + derived.phase_names])
+
+    def test_nutaq_diags(self):
+        self.check('nutaqdiags.py')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Tests of the interlock history.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import json
+import unittest
+
+import numpy
+
+from tests.fakeperseus import FakePerseus
+from pynutaq.nutaq.nutaqitck import ItckHistory, ITCK_RECORDS
+
+
+class ItckHistoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.history = ItckHistory('diags')
+        self.perseus = FakePerseus()
+
+    def position(self, name):
+        return int(self.history.positions[self.history.inputs.index(name)])
+
+    def test_read_both_chains(self):
+        vacuum, arcs = self.position('Vacuum'), self.position('Arcs')
+        self.perseus.diagnostics['A'].update({150: 1 << vacuum, 101: 1 << arcs | 1 << vacuum, 110: 800})
+        self.perseus.diagnostics['B'][107] = 1 << arcs
+        records = self.history.read(self.perseus)
+
+        self.assertEqual(len(records), 2 * ITCK_RECORDS)
+        self.assertEqual(self.perseus.latches, {'A': 1, 'B': 1})
+        self.assertEqual(records['cavity'].tolist(), ['A'] * ITCK_RECORDS + ['B'] * ITCK_RECORDS)
+        self.assertEqual(records['record'][:ITCK_RECORDS].tolist(), range(ITCK_RECORDS))
+        current, first = records[0], records[1]
+        self.assertEqual(current['word'], 1 << vacuum)
+        self.assertTrue(numpy.isnan(current['timestamp']))
+        self.assertEqual(first['timestamp'], 10.0)
+        inputs = dict(zip(self.history.inputs, first['inputs']))
+        self.assertEqual(sorted(name for name, value in inputs.items() if value), ['Arcs', 'Vacuum'])
+        self.assertEqual(numpy.flatnonzero(records['inputs'].any(axis=1)).tolist(), [0, 1, 2 * ITCK_RECORDS - 1])
+
+    def test_decode_negative_word(self):
+        records = self.history.decode('A', [-1] + [0] * (ITCK_RECORDS - 1), [0] * (ITCK_RECORDS - 1))
+        self.assertEqual(records['word'][0], 0xFFFFFFFF)
+        self.assertTrue(records['inputs'][0].all())
+
+    def test_to_json(self):
+        self.perseus.diagnostics['B'][150] = 1 << self.position('ManualInterlock')
+        result = json.loads(self.history.to_json(self.history.read(self.perseus)))
+        current = result[ITCK_RECORDS]
+        self.assertEqual((current['cavity'], current['record'], current['timestamp']), ('B', 0, None))
+        self.assertTrue(current['inputs']['ManualInterlock'])
+        self.assertFalse(current['inputs']['Vacuum'])
+        self.assertEqual(result[1]['timestamp'], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
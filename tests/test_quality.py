@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Tests of the diagnostics quality.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import time
+import unittest
+
+from pynutaq.nutaq.nutaqquality import DiagnosticsQuality, QUALITY_VALID, QUALITY_INVALID, QUALITY_ALARM
+
+NAMES = ['Diag_AmpCavloopsa', 'Diag_Vaccum1A']
+
+
+class DiagnosticsQualityTest(unittest.TestCase):
+
+    def setUp(self):
+        self.quality = DiagnosticsQuality('loops', stale_time=10.0, rel_change=1.0)
+
+    def test_qualities(self):
+        qualities = self.quality.publish(NAMES, [100.0, None])
+        self.assertEqual(qualities.tolist(), [QUALITY_VALID, QUALITY_INVALID])
+        qualities = self.quality.publish(NAMES, [100.0, 5.0])
+        self.assertEqual(qualities.tolist(), [QUALITY_VALID, QUALITY_ALARM])
+
+    def test_rel_change_in_percent(self):
+        self.quality.publish(NAMES, [100.0, 0.0])
+        self.assertEqual(self.quality.changed.tolist(), [True, True])
+        # 0.5 % is under the 1 % threshold
+        self.quality.publish(NAMES, [100.5, 0.0])
+        self.assertEqual(self.quality.changed.tolist(), [False, False])
+        self.quality.publish(NAMES, [102.0, 0.0])
+        self.assertEqual(self.quality.changed.tolist(), [True, False])
+
+    def test_quality_change_is_a_change(self):
+        self.quality.publish(NAMES, [100.0, 0.0])
+        self.quality.publish(NAMES, [100.0, None])
+        self.assertEqual(self.quality.changed.tolist(), [False, True])
+
+    def test_get(self):
+        self.quality.publish(NAMES, [100.0, None], timestamp=time.time() - 1)
+        timestamp, quality = self.quality.get('Diag_AmpCavloopsa')
+        self.assertEqual(quality, QUALITY_VALID)
+        self.assertEqual(self.quality.get('Diag_Vaccum1A')[1], QUALITY_INVALID)
+        self.assertEqual(self.quality.get('unknown')[1], QUALITY_INVALID)
+
+    def test_stale(self):
+        self.quality.publish(NAMES, [100.0, 0.0], timestamp=time.time() - 20)
+        self.assertTrue(self.quality.is_stale())
+        self.assertEqual(self.quality.get('Diag_AmpCavloopsa')[1], QUALITY_INVALID)
+
+
+if __name__ == '__main__':
+    unittest.main()
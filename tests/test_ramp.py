@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Tests of the setpoint ramps.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import time
+import unittest
+
+from tests.fakeperseus import FakePerseus
+from pynutaq.perseus.perseusexceptions import PerseusArgumentError
+from pynutaq.nutaq.nutaqdefs import EPS_ITCK_ADDRESS
+from pynutaq.nutaq.nutaqramp import SetpointRamp, RampEngine, RAMP_PROFILES, RAMP_DONE, RAMP_ABORTED
+
+
+class RampProfilesTest(unittest.TestCase):
+
+    def test_profiles_go_from_start_to_target(self):
+        for name, profile in RAMP_PROFILES.items():
+            self.assertAlmostEqual(profile(0.0), 0.0, msg=name)
+            self.assertAlmostEqual(profile(1.0), 1.0, msg=name)
+            self.assertAlmostEqual(profile(0.5), 0.5, msg=name)
+
+    def test_scurve_starts_slow(self):
+        self.assertTrue(RAMP_PROFILES['scurve'](0.1) < RAMP_PROFILES['linear'](0.1))
+
+
+class SetpointRampTest(unittest.TestCase):
+
+    def setUp(self):
+        self.perseus = FakePerseus()
+        self.values = []
+
+    def progress(self, ramp):
+        self.values.append(ramp.value)
+
+    def ramp(self, name, target, rate, profile='linear'):
+        return SetpointRamp(self.perseus, name, target, rate, profile, step_period=0.01,
+                            on_progress=self.progress)
+
+    def test_ramp_ends_at_target(self):
+        for profile in RAMP_PROFILES:
+            self.perseus = FakePerseus()
+            del self.values[:]
+            ramp = self.ramp('AmprefinA', 100.0, 2000.0, profile)
+            ramp.start()
+            ramp.join(5)
+            self.assertEqual(ramp.state, RAMP_DONE)
+            self.assertEqual(self.values[-1], 100.0)
+            self.assertEqual(self.values, sorted(self.values))
+            self.assertTrue(len(self.values) > 2)
+
+    def test_interlock_aborts(self):
+        ramp = self.ramp('PhrefinB', 90.0, 90.0)
+        ramp.start()
+        time.sleep(0.1)
+        self.perseus.diagnostics['B'][EPS_ITCK_ADDRESS] = 1
+        ramp.join(5)
+        self.assertEqual(ramp.state, RAMP_ABORTED)
+        self.assertTrue(ramp.value < 90.0)
+
+    def test_target_out_of_limits(self):
+        self.assertRaises(PerseusArgumentError, self.ramp, 'AmprefinA', 1001.0, 10.0)
+        self.assertRaises(PerseusArgumentError, self.ramp, 'PhrefinA', -181.0, 10.0)
+
+    def test_bad_arguments(self):
+        self.assertRaises(PerseusArgumentError, self.ramp, 'KpA', 1.0, 10.0)
+        self.assertRaises(PerseusArgumentError, self.ramp, 'AmprefinA', 1.0, 0.0)
+        self.assertRaises(PerseusArgumentError, self.ramp, 'AmprefinA', 1.0, 10.0, 'cubic')
+
+
+class RampEngineTest(unittest.TestCase):
+
+    def test_operator_write_aborts_ramp(self):
+        engine = RampEngine(FakePerseus(), step_period=0.01)
+        ramp = engine.start('AmprefinA', 500.0, 100.0)
+        self.assertTrue(engine.running('AmprefinA'))
+        self.assertFalse(engine.running('AmprefinB'))
+        engine.abort_setpoint('AmprefinA', 'operator write')
+        self.assertFalse(engine.running('AmprefinA'))
+        self.assertEqual((ramp.state, ramp.reason), (RAMP_ABORTED, 'operator write'))
+        engine.abort_setpoint('PhrefinB')
+
+
+if __name__ == '__main__':
+    unittest.main()
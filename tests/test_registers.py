@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Tests of the register map conversions.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import unittest
+
+from pynutaq.perseus.perseusexceptions import PerseusArgumentError
+from pynutaq.nutaq.nutaqregisters import get_register_map
+
+
+class RegisterMapTest(unittest.TestCase):
+
+    def setUp(self):
+        self.register_map = get_register_map('loops')
+
+    def test_inverse_round_trip(self):
+        rows = self.register_map.indexes(['FreqsquareA'])
+        raw = self.register_map.encode(rows, [4.0])
+        self.assertEqual(raw.tolist(), [20000])
+        self.assertAlmostEqual(self.register_map.decode(rows, raw)[0], 0.25)
+
+    def test_inverse_zero_rejected(self):
+        rows = self.register_map.indexes(['AmprefinA', 'FreqsquareB'])
+        self.assertRaises(PerseusArgumentError, self.register_map.encode, rows, [100.0, 0.0])
+        self.assertRaises(PerseusArgumentError, self.register_map.words, rows, [100.0, 0.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
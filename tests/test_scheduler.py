@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Tests of the priority scheduler.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import threading
+import time
+import unittest
+
+from pynutaq.perseus.perseusscheduler import PriorityScheduler, priority, get_priority, \
+    PRIORITY_SAFETY, PRIORITY_OPERATOR, PRIORITY_ACQUISITION, PRIORITY_MAINTENANCE
+
+
+class SchedulerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = PriorityScheduler(['connection'])
+        self.order = []
+
+    def wait_waiters(self, count):
+        deadline = time.time() + 2
+        while len(self.scheduler._waiters) < count and time.time() < deadline:
+            time.sleep(0.001)
+        self.assertEqual(len(self.scheduler._waiters), count)
+
+    def start(self, name, value):
+        def run():
+            resource = self.scheduler.acquire(value)
+            self.order.append(name)
+            self.scheduler.release(resource)
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread
+
+    def test_priority_then_arrival(self):
+        resource = self.scheduler.acquire(PRIORITY_OPERATOR)
+        threads = [self.start('maintenance', PRIORITY_MAINTENANCE)]
+        self.wait_waiters(1)
+        threads.append(self.start('acquisition', PRIORITY_ACQUISITION))
+        self.wait_waiters(2)
+        threads.append(self.start('safety', PRIORITY_SAFETY))
+        self.wait_waiters(3)
+        threads.append(self.start('acquisition 2', PRIORITY_ACQUISITION))
+        self.wait_waiters(4)
+        self.scheduler.release(resource)
+        for thread in threads:
+            thread.join(2)
+        self.assertEqual(self.order, ['safety', 'acquisition', 'acquisition 2', 'maintenance'])
+
+    def test_preempt_for_higher_class(self):
+        resource = self.scheduler.acquire(PRIORITY_MAINTENANCE)
+        thread = self.start('safety', PRIORITY_SAFETY)
+        self.wait_waiters(1)
+        resource = self.scheduler.preempt(resource, PRIORITY_MAINTENANCE)
+        self.order.append('maintenance')
+        thread.join(2)
+        self.assertEqual(resource, 'connection')
+        self.assertEqual(self.order, ['safety', 'maintenance'])
+        self.assertEqual(self.scheduler.preemptions, 1)
+
+    def test_no_preempt_for_lower_class(self):
+        resource = self.scheduler.acquire(PRIORITY_OPERATOR)
+        thread = self.start('acquisition', PRIORITY_ACQUISITION)
+        self.wait_waiters(1)
+        self.assertEqual(self.scheduler.preempt(resource, PRIORITY_OPERATOR), resource)
+        self.assertEqual((self.order, self.scheduler.preemptions), ([], 0))
+        self.scheduler.release(resource)
+        thread.join(2)
+        self.assertEqual(self.order, ['acquisition'])
+
+    def test_priority_context(self):
+        self.assertEqual(get_priority(), PRIORITY_OPERATOR)
+        with priority(PRIORITY_SAFETY):
+            self.assertEqual(get_priority(), PRIORITY_SAFETY)
+            self.scheduler.release(self.scheduler.acquire())
+        self.assertEqual(get_priority(), PRIORITY_OPERATOR)
+        statistics = self.scheduler.statistics()
+        self.assertEqual(statistics['safety']['count'], 1)
+        self.assertEqual(statistics['maintenance']['mean'], None)
+
+
+if __name__ == '__main__':
+    unittest.main()
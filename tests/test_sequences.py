@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Tests of the register sequences.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import unittest
+
+from tests.fakeperseus import FakePerseus
+from pynutaq.perseus.perseusdefs import SETTINGS_WRITE_OFFSET_A, SETTINGS_WRITE_OFFSET_B
+from pynutaq.perseus.perseussequences import RegisterSequence, SequenceEngine, TARGET_CUSTOM
+from pynutaq.perseus.perseussequences import load_sequences, get_sequences_filename
+
+
+def make_sequence(name, words):
+    sequence = RegisterSequence(name)
+    for target, register, value in words:
+        sequence.add(target, register, value)
+    return sequence
+
+
+class RegisterSequenceTest(unittest.TestCase):
+
+    def test_interleaved_chains_batched(self):
+        sequence = make_sequence('settings', [('settings_a', SETTINGS_WRITE_OFFSET_A, 1),
+                                              ('settings_b', SETTINGS_WRITE_OFFSET_B, 2),
+                                              ('settings_a', SETTINGS_WRITE_OFFSET_A, 3),
+                                              ('settings_b', SETTINGS_WRITE_OFFSET_B, 4)])
+        self.assertEqual(sequence.batches(), [('settings_a', [(SETTINGS_WRITE_OFFSET_A, 1),
+                                                              (SETTINGS_WRITE_OFFSET_A, 3)]),
+                                              ('settings_b', [(SETTINGS_WRITE_OFFSET_B, 2),
+                                                              (SETTINGS_WRITE_OFFSET_B, 4)])])
+
+    def test_custom_words_keep_their_place(self):
+        sequence = make_sequence('gpio', [(TARGET_CUSTOM, 1, 10),
+                                          (TARGET_CUSTOM, 2, 20),
+                                          ('settings_a', SETTINGS_WRITE_OFFSET_A, 1),
+                                          (TARGET_CUSTOM, 1, 30),
+                                          ('settings_a', SETTINGS_WRITE_OFFSET_A, 2)])
+        self.assertEqual([(target, len(words)) for target, words in sequence.batches()],
+                         [(TARGET_CUSTOM, 2), ('settings_a', 1), (TARGET_CUSTOM, 1), ('settings_a', 1)])
+
+
+class SequenceEngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.perseus = FakePerseus()
+        words = [('settings_a', SETTINGS_WRITE_OFFSET_A, 1 << 17 | 5),
+                 ('settings_a', SETTINGS_WRITE_OFFSET_A, 2 << 17 | 6)]
+        self.engine = SequenceEngine(self.perseus, [make_sequence('settings', words),
+                                                    make_sequence('gpio', [(TARGET_CUSTOM, 1, 10)])])
+        self.perseus.sequences = self.engine
+
+    def test_written_settings_skipped(self):
+        self.assertEqual(self.engine.run('settings')['written'], 2)
+        for address, value in self.perseus.writes:
+            self.engine.track(address, value)
+        self.assertEqual(self.engine.run('settings')['skipped'], 2)
+        self.assertEqual(self.engine.run('settings', force=True)['written'], 2)
+
+    def test_changed_setting_rewritten(self):
+        self.engine.run('settings')
+        self.engine.track(SETTINGS_WRITE_OFFSET_A, 1 << 17 | 5)
+        self.engine.track(SETTINGS_WRITE_OFFSET_A, 2 << 17 | 7)
+        stats = self.engine.run('settings')
+        self.assertEqual((stats['written'], stats['skipped']), (1, 1))
+
+    def test_custom_sequence_written_once(self):
+        self.assertEqual(self.engine.run('gpio')['written'], 1)
+        self.assertEqual(self.engine.run('gpio')['written'], 0)
+        self.assertEqual(self.perseus.custom_writes, [(1, 10)])
+
+
+class SequenceFilesTest(unittest.TestCase):
+
+    def test_files_load_and_batch_per_chain(self):
+        for perseus_type in ('loops', 'diags'):
+            for sequence in load_sequences(get_sequences_filename(perseus_type)):
+                targets = [target for target, words in sequence.batches()]
+                if TARGET_CUSTOM not in targets:
+                    # settings only: one batch per chain
+                    self.assertEqual(len(targets), len(set(targets)), sequence.name)
+                self.assertEqual(sum(len(words) for target, words in sequence.batches()),
+                                 len(sequence.words))
+
+
+if __name__ == '__main__':
+    unittest.main()
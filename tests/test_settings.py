@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Tests of the settings snapshots.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests.fakeperseus import FakePerseus
+from pynutaq.perseus.perseusexceptions import PerseusArgumentError
+from pynutaq.nutaq.nutaqregisters import get_register_map
+from pynutaq.nutaq.nutaqsettings import SettingsSnapshot, get_snapshot_filename
+from pynutaq.nutaq.nutaqtransaction import SettingsTransaction
+
+
+class SettingsSnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.perseus = FakePerseus()
+        transaction = SettingsTransaction(self.perseus, 'diags')
+        transaction.stage_many({'Rvtet1A': 100, 'Rvtet2B': 200, 'DisitckRvtet2FdltrgA': 1})
+        transaction.commit()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_save_restore(self):
+        filename = get_snapshot_filename(self.path, 'operation')
+        SettingsSnapshot.read(self.perseus, 'diags').save(filename)
+        saved = dict((cavity, dict(registers)) for cavity, registers in self.perseus.settings.items())
+
+        perseus = FakePerseus()
+        snapshot = SettingsSnapshot.load(filename)
+        self.assertTrue(snapshot.restore(perseus) > 0)
+        for cavity in saved:
+            for address, value in saved[cavity].items():
+                self.assertEqual(perseus.settings[cavity].get(address, 0), value)
+        self.assertEqual(snapshot.diff(SettingsSnapshot.read(perseus, 'diags')), [])
+
+    def test_restored_values(self):
+        values = SettingsSnapshot.read(self.perseus, 'diags').values()
+        self.assertAlmostEqual(values['Rvtet1A'], 100, places=0)
+        self.assertAlmostEqual(values['Rvtet2B'], 200, places=0)
+        self.assertEqual(values['DisitckRvtet2FdltrgA'], 1)
+        self.assertEqual(values['DisitckRvtet2MpsA'], 0)
+
+    def test_actions_not_restored(self):
+        register_map = get_register_map('loops')
+        values = SettingsSnapshot.read(self.perseus, 'loops').values()
+        self.assertFalse('MoveA' in values)
+        self.assertTrue('KpA' in values)
+        self.assertTrue(all(register_map.writable[register_map.index(name)] for name in values))
+
+    def test_snapshot_names(self):
+        self.assertEqual(get_snapshot_filename(self.path, 'a'), os.path.join(self.path, 'a.npz'))
+        for name in ('', '../a', 'a/b', '..'):
+            self.assertRaises(PerseusArgumentError, get_snapshot_filename, self.path, name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Tests of the shared memory export of the diagnostics.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from pynutaq.perseus.perseusexceptions import PerseusArgumentError
+from pynutaq.nutaq.nutaqshared import SnapshotWriter, SnapshotReader, get_segment_path
+
+DEVICE = 'test/nutaq/1'
+
+
+class SharedSnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.writer = SnapshotWriter(DEVICE, 'loops', self.path)
+
+    def tearDown(self):
+        self.writer.close()
+        shutil.rmtree(self.path)
+
+    def arrays(self, value):
+        length = len(self.writer.layout.names)
+        return {'A': numpy.arange(length) + value, 'B': numpy.arange(length) - value}
+
+    def test_segment_path(self):
+        self.assertEqual(get_segment_path('R/RF/Nutaq-01', '/dev/shm'), '/dev/shm/pynutaq.r.rf.nutaq-01')
+
+    def test_read_published_sweep(self):
+        reader = SnapshotReader(DEVICE, self.path)
+        timestamp, arrays = reader.read()
+        self.assertEqual(timestamp, 0)
+        self.assertTrue(numpy.isnan(arrays['A']).all())
+
+        self.writer.publish(self.arrays(1), 123.5)
+        timestamp, arrays = reader.read()
+        self.assertEqual(timestamp, 123.5)
+        numpy.testing.assert_array_equal(arrays['A'], self.arrays(1)['A'])
+        numpy.testing.assert_array_equal(arrays['B'], self.arrays(1)['B'])
+        self.assertEqual(reader.names, self.writer.layout.names)
+        self.assertEqual(reader.index(reader.names[3]), 3)
+        reader.close()
+
+    def test_retry_after_write(self):
+        reader = SnapshotReader(DEVICE, self.path)
+        sequence = reader.begin()
+        self.assertFalse(reader.retry(sequence))
+        self.writer.publish(self.arrays(2), 1.0)
+        self.assertTrue(reader.retry(sequence))
+        self.assertEqual(reader.sequence % 2, 0)
+        reader.close()
+
+    def test_reader_arrays_read_only(self):
+        reader = SnapshotReader(DEVICE, self.path)
+        self.assertRaises(ValueError, reader.arrays['A'].fill, 0)
+        reader.close()
+
+    def test_not_a_snapshot(self):
+        with open(get_segment_path('test/other/1', self.path), 'wb') as f:
+            f.write('x' * 256)
+        self.assertRaises(PerseusArgumentError, SnapshotReader, 'test/other/1', self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
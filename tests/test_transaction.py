@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Tests of the settings transactions.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import unittest
+
+from tests.fakeperseus import FakePerseus
+from pynutaq.perseus.perseusexceptions import PerseusArgumentError, PerseusTransportError
+from pynutaq.nutaq.nutaqregisters import get_register_map
+from pynutaq.nutaq.nutaqtransaction import SettingsTransaction
+
+
+class SettingsTransactionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.perseus = FakePerseus()
+        self.register_map = get_register_map('diags')
+
+    def address(self, name):
+        return int(self.register_map.address[self.register_map.index(name)])
+
+    def test_bits_merged_over_board_word(self):
+        address = self.address('DisitckRvtet2DacsoffloopsstbyA')
+        self.perseus.settings['A'][address] = 1 << 5
+        transaction = SettingsTransaction(self.perseus, 'diags')
+        transaction.stage('DisitckRvtet2DacsoffloopsstbyA', 1)
+        transaction.stage('DisitckRvtet2FdltrgA', 1)
+        self.assertEqual(transaction.commit(), 1)
+        self.assertEqual(self.perseus.settings['A'][address], 1 << 5 | 1 << 2 | 1)
+        self.assertEqual(len(self.perseus.writes), 1)
+
+    def test_one_batch_per_chain(self):
+        transaction = SettingsTransaction(self.perseus, 'diags')
+        transaction.stage_many({'Rvtet1A': 100, 'Rvtet2A': 200, 'Rvtet1B': 300})
+        self.assertEqual(transaction.commit(), 3)
+        self.assertEqual(sorted(len(words) for kind, words in self.perseus.batches), [1, 2])
+
+    def test_out_of_limits_rejected(self):
+        transaction = SettingsTransaction(self.perseus, 'diags')
+        transaction.stage('Rvtet1A', 2000)
+        self.assertRaises(PerseusArgumentError, transaction.commit)
+        self.assertEqual(self.perseus.writes, [])
+
+    def test_rollback(self):
+        transaction = SettingsTransaction(self.perseus, 'diags')
+        transaction.stage_many({'Rvtet1A': 100, 'Rvtet2A': 200})
+        transaction.commit()
+        before = dict(self.perseus.settings['A'])
+
+        transaction = SettingsTransaction(self.perseus, 'diags')
+        transaction.stage_many({'Rvtet1A': 500, 'Rvtet2A': 600})
+        self.perseus.fail_after = 1
+        self.assertRaises(PerseusTransportError, transaction.commit)
+        self.assertEqual(self.perseus.settings['A'], before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Tests of the eapi transport.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import sys
+import types
+import unittest
+
+try:
+    import eapi
+except ImportError:
+    # perseustransport imports eapi at load time; the tests swap in FakeEapi
+    sys.modules['eapi'] = types.ModuleType('eapi')
+
+from pynutaq.perseus import perseustransport
+from pynutaq.perseus.perseustransport import EapiTransport, ConnectionLost
+
+
+class FakeEapi(object):
+    """The eapi functions used by the transport, with a link that can go down."""
+
+    def __init__(self):
+        self.alive = True
+        self.connects = 0
+
+    def connection_state(self):
+        return object()
+
+    def connect_cce(self, ip, state):
+        self.connects += 1
+        self.alive = True
+        return 0
+
+    def custom_register_read_send(self, state, address):
+        return (0, 0) if self.alive else -1
+
+
+class EapiCall(object):
+    """An eapi function failing with each item of failures in turn."""
+
+    def __init__(self, eapi, name, failures=()):
+        self.__name__ = name
+        self.eapi = eapi
+        self.failures = list(failures)
+        self.calls = 0
+
+    def __call__(self, state, address):
+        self.calls += 1
+        if self.failures:
+            failure = self.failures.pop(0)
+            if failure == 'lost':
+                self.eapi.alive = False
+                raise IOError('link down')
+            return failure
+        return (0, address)
+
+
+class TransportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.eapi = FakeEapi()
+        self.previous, perseustransport.eapi = perseustransport.eapi, self.eapi
+        self.transport = EapiTransport('127.0.0.1', pool_size=1)
+        self.transport.connect()
+
+    def tearDown(self):
+        perseustransport.eapi = self.previous
+
+    def test_retry_error_code(self):
+        read = EapiCall(self.eapi, 'memory_read_send', [-1, -1])
+        self.assertEqual(self.transport.call(read, 5), (0, 5))
+        self.assertEqual((read.calls, self.transport.retries), (3, 2))
+        self.assertEqual(self.transport.reconnections, 0)
+
+    def test_retry_budget_exhausted(self):
+        read = EapiCall(self.eapi, 'memory_read_send', [-1] * 5)
+        self.assertEqual(self.transport.call(read, 5), -1)
+        self.assertEqual(read.calls, 3)
+
+    def test_no_retry_without_replay(self):
+        write = EapiCall(self.eapi, 'memory_write_send', [-1])
+        self.assertEqual(self.transport.call(write, 5, replay=False), -1)
+        self.assertEqual(write.calls, 1)
+
+    def test_reconnect_and_replay(self):
+        read = EapiCall(self.eapi, 'memory_read_send', ['lost'])
+        self.assertEqual(self.transport.call(read, 7), (0, 7))
+        self.assertEqual((read.calls, self.eapi.connects), (2, 2))
+        self.assertEqual(self.transport.reconnections, 1)
+        self.assertTrue(self.transport.connected)
+
+    def test_reconnect_without_replay(self):
+        write = EapiCall(self.eapi, 'memory_write_send', ['lost'])
+        self.assertRaises(ConnectionLost, self.transport.call, write, 7, replay=False)
+        self.assertEqual(write.calls, 1)
+        self.assertEqual(self.transport.reconnections, 1)
+
+    def test_batch_replayed_as_a_whole(self):
+        write = EapiCall(self.eapi, 'custom_register_write_send')
+        read = EapiCall(self.eapi, 'custom_register_read_send', ['lost'])
+
+        def batch():
+            self.transport.call(write, 1)
+            return self.transport.call(read, 2)
+
+        self.assertEqual(self.transport.run_batch(batch), (0, 2))
+        self.assertEqual((write.calls, read.calls), (2, 2))
+        self.assertEqual(self.transport.reconnections, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+###############################################################################
+#     Import time benchmark for the pynutaq device servers.
+#
+#     Copyright (C) 2013  Max IV Laboratory, Lund Sweden
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see [http://www.gnu.org/licenses/].
+###############################################################################
+
+"""Measures the time needed to import the device server modules.
+
+Every import runs in a fresh interpreter, so the numbers are close to what
+the Starter sees when it restarts a device server. The heavy modules loaded
+by each import are listed as well.
+"""
+
+__author__ = 'antmil'
+
+__docformat__ = 'restructuredtext'
+
+import argparse
+import json
+import subprocess
+import sys
+
+DEFAULT_MODULES = ['pynutaq.nutaq.nutaq',
+                   'pynutaq.nutaq.nutaqdiags',
+                   'pynutaq.perseus.perseusfactory',
+                   'pynutaq.perseus.perseusutils',
+                   'pynutaq.nutaq.nutaqregisters']
+
+HEAVY_MODULES = ['PyTango', 'numpy', 'eapi', 'adp_exception',
+                 'pynutaq.perseus.perseusloops',
+                 'pynutaq.perseus.perseusdiags']
+
+IMPORT_CODE = """
+import json, sys, time
+start = time.time()
+try:
+    __import__(%(module)r)
+    error = None
+except Exception, e:
+    error = '%%s: %%s' %% (e.__class__.__name__, e)
+elapsed = time.time() - start
+loaded = [name for name in %(heavy)r if name in sys.modules]
+print json.dumps({'elapsed': elapsed, 'error': error, 'loaded': loaded})
+"""
+
+
+def time_import(python, module):
+    code = IMPORT_CODE % {'module': module, 'heavy': HEAVY_MODULES}
+    output = subprocess.check_output([python, '-c', code])
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def benchmark(python, modules, repeat):
+    results = []
+    for module in modules:
+        times = []
+        for i in range(repeat):
+            result = time_import(python, module)
+            if result['error']:
+                break
+            times.append(result['elapsed'])
+        times.sort()
+        results.append({'module': module,
+                        'error': result['error'],
+                        'loaded': result['loaded'],
+                        'min': times[0] if times else None,
+                        'median': times[len(times) / 2] if times else None})
+    return results
+
+
+def print_results(results):
+    for result in results:
+        if result['error']:
+            print "%-32s  import failed (%s)" % (result['module'], result['error'])
+            continue
+        print "%-32s  min %7.1f ms  median %7.1f ms  loads: %s" % (
+            result['module'], result['min'] * 1000, result['median'] * 1000,
+            ', '.join(result['loaded']) or '-')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import time benchmark.')
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES)
+    parser.add_argument('--python', default=sys.executable,
+                        help='interpreter used for the imports')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', action='store_true',
+                        help='print the results as json')
+    args = parser.parse_args()
+
+    results = benchmark(args.python, args.modules, args.repeat)
+    if args.json:
+        print json.dumps(results, indent=4)
+    else:
+        print_results(results)
+
+
+if __name__ == '__main__':
+    main()
@@ -23,8 +23,12 @@ __author__ = 'antmil'
 
 import argparse
 import csv
+import hashlib
+import json
+import os
+import re
 
-from jinja2 import Environment, PackageLoader
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 
 #attributes_list = [attribute1, attribute2]
 # ''.join([i.capitalize() for i in name.split('_')])
@@ -109,7 +113,147 @@ def _create_attributes_for_both_cavities(attributes_list):
 
     return final_attributes_list
 
-def generate_code(input_filename_loops, input_filename_diags, output_filename, nutaq_type):
+# Macros of fragments.j2, one fragment per attribute
+ATTRIBUTE_FRAGMENTS = ['attribute_definition', 'method', 'read_attr']
+DIAG_ATTRIBUTE_FRAGMENTS = ['diag_attribute_definition', 'diag_method', 'diag_read']
+
+TEMPLATES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+
+def get_digest(*items):
+    digest = hashlib.sha1()
+    for item in items:
+        digest.update(json.dumps(item, sort_keys=True))
+    return digest.hexdigest()
+
+
+def get_templates_digest():
+    contents = []
+    for filename in sorted(os.listdir(TEMPLATES_PATH)):
+        with open(os.path.join(TEMPLATES_PATH, filename), 'rb') as fd:
+            contents.append([filename, fd.read()])
+    return get_digest(contents)
+
+
+class FragmentCache(object):
+    """Rendered fragments stored in a json file, keyed by the digest of the
+    templates and of the attribute row they come from.
+    """
+
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.fragments = {}
+        self.found = {}
+        self.used = set()
+        self.rendered = []
+        if filename and os.path.exists(filename):
+            with open(filename) as fd:
+                data = json.load(fd)
+            self.fragments = data['fragments']
+            self.found = data['found']
+
+    def get(self, key, name, render):
+        self.used.add(key)
+        if key not in self.fragments:
+            self.fragments[key] = render()
+            self.rendered.append(name)
+        return self.fragments[key]
+
+    def is_found(self, key, reference_digest, search):
+        """Cached result of looking for a fragment in a reference file."""
+        found_key = key + reference_digest
+        if found_key not in self.found:
+            self.found[found_key] = search()
+        return self.found[found_key]
+
+    def save(self):
+        if not self.filename:
+            return
+        directory = os.path.dirname(self.filename)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        fragments = dict((key, value) for key, value in self.fragments.items() if key in self.used)
+        found = dict((key, value) for key, value in self.found.items() if key[:40] in self.used)
+        with open(self.filename, 'w') as fd:
+            json.dump({'fragments': fragments, 'found': found}, fd)
+
+
+def get_environment(cache_filename=None):
+    kwargs = {}
+    if cache_filename:
+        bytecode_path = os.path.join(os.path.dirname(os.path.abspath(cache_filename)), 'bytecode')
+        if not os.path.isdir(bytecode_path):
+            os.makedirs(bytecode_path)
+        kwargs['bytecode_cache'] = FileSystemBytecodeCache(bytecode_path)
+    return Environment(loader=FileSystemLoader(TEMPLATES_PATH), trim_blocks=True, lstrip_blocks=True, **kwargs)
+
+
+def render_fragments(env, cache, attributes, diags_attributes, nutaq_type):
+    """Render one fragment per attribute and macro of fragments.j2.
+
+    Returns the fragments and their cache keys by macro name.
+    """
+    templates_digest = get_templates_digest()
+    macros = []
+    fragments = {}
+    keys = {}
+
+    def _render_macro(fragment_name, attr):
+        if not macros:
+            macros.append(env.get_template('fragments.j2').module)
+        return unicode(getattr(macros[0], fragment_name)(attr))
+
+    def _render(attrs, fragment_names):
+        digests = [get_digest(templates_digest, nutaq_type, attr) for attr in attrs]
+        for fragment_name in fragment_names:
+            fragments[fragment_name] = []
+            keys[fragment_name] = []
+            for attr, digest in zip(attrs, digests):
+                key = hashlib.sha1(digest + fragment_name).hexdigest()
+                fragment = cache.get(key, attr['name'], lambda: _render_macro(fragment_name, attr))
+                fragments[fragment_name].append(fragment)
+                keys[fragment_name].append(key)
+
+    _render(attributes, ATTRIBUTE_FRAGMENTS)
+    _render(diags_attributes, DIAG_ATTRIBUTE_FRAGMENTS)
+    return fragments, keys
+
+
+def get_diff_report(cache, fragments, keys, attributes, diags_attributes, output, reference_filename):
+    """Compare the generated fragments with a checked-in device server."""
+    with open(reference_filename) as fd:
+        reference = fd.read().decode('utf-8')
+    reference_digest = hashlib.sha1(reference.encode('utf-8')).hexdigest()
+
+    reference_names = set(re.findall(r'^    (\w+) = attribute\(', reference, re.M))
+    generated_names = set()
+    changed = {}
+
+    def _compare(attrs, fragment_names, prefix):
+        for fragment_name in fragment_names:
+            for attr, fragment, key in zip(attrs, fragments[fragment_name], keys[fragment_name]):
+                name = prefix + attr['name']
+                generated_names.add(name)
+                if not cache.is_found(key, reference_digest, lambda: fragment in reference):
+                    changed.setdefault(name, []).append(fragment_name)
+
+    _compare(attributes, ATTRIBUTE_FRAGMENTS, '')
+    _compare(diags_attributes, DIAG_ATTRIBUTE_FRAGMENTS, 'Diag_')
+
+    added = sorted(generated_names - reference_names)
+    removed = sorted(reference_names - generated_names)
+
+    return {
+        'reference': reference_filename,
+        'identical': output == reference,
+        'added': added,
+        'removed': removed,
+        'changed': dict((name, kinds) for name, kinds in changed.items() if name not in added),
+    }
+
+
+def generate_code(input_filename_loops, input_filename_diags, output_filename, nutaq_type,
+                  cache_filename=None, reference_filename=None, report_filename=None):
 
     def _extract_data_from_csv(input_filename):
         with open(input_filename, 'rU') as fd:
@@ -135,17 +279,36 @@ def generate_code(input_filename_loops, input_filename_diags, output_filename, n
         attributes_diags = get_extended_list_of_attributes(attributes_diags)
     
     # Prepare environment
-    env = Environment(loader=PackageLoader('codegenerator', 'templates'), trim_blocks=True, lstrip_blocks=True)
+    env = get_environment(cache_filename)
     template = env.get_template('methods.j2')
 
+    # Render only the fragments of the attributes not found in the cache
+    cache = FragmentCache(cache_filename)
+    fragments, keys = render_fragments(env, cache, attributes_loops, attributes_diags, nutaq_type)
+
     # Code Generation
-    output = template.render(attributes=attributes_loops, diags_attributes=attributes_diags, nutaq_type=nutaq_type)
+    output = template.render(attributes=attributes_loops, diags_attributes=attributes_diags, nutaq_type=nutaq_type,
+                             fragments=fragments)
 
     # Write files
     fd = open(output_filename, 'w')
     fd.write(output)
     fd.close()
 
+    if reference_filename:
+        report = get_diff_report(cache, fragments, keys, attributes_loops, attributes_diags, output,
+                                 reference_filename)
+        report['output'] = output_filename
+        report['rendered'] = sorted(set(cache.rendered))
+        report = json.dumps(report, indent=4, sort_keys=True)
+        if report_filename:
+            with open(report_filename, 'w') as fd:
+                fd.write(report)
+        else:
+            print report
+
+    cache.save()
+
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
@@ -153,6 +316,10 @@ if __name__ == '__main__':
     parser.add_argument('input_filename_diags', help='Input Filename from where to extract the data')
     parser.add_argument('output_filename', help='Filename for generated file')
     parser.add_argument('nutaq_type', help='Nutaq type: {loops | diags}')
+    parser.add_argument('--cache', dest='cache_filename', help='File where the rendered fragments are cached')
+    parser.add_argument('--reference', dest='reference_filename', help='Checked-in file to compare the output with')
+    parser.add_argument('--report', dest='report_filename', help='Filename for the json diff report')
     args = parser.parse_args()
 
-    generate_code(args.input_filename_loops, args.input_filename_diags, args.output_filename, args.nutaq_type)
+    generate_code(args.input_filename_loops, args.input_filename_diags, args.output_filename, args.nutaq_type,
+                  args.cache_filename, args.reference_filename, args.report_filename)
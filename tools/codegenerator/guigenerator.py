@@ -5,13 +5,16 @@ __author__ = 'antmil'
 import argparse
 import csv
 import operator
+import os
 
 from jinja2 import Environment, PackageLoader
 
+from codegenerator import FragmentCache, get_digest, get_templates_digest
+
 #attributes_list = [attribute1, attribute2]
 # ''.join([i.capitalize() for i in name.split('_')])
 
-def generate_gui(input_filename_loops, input_filename_diags, output_filename):
+def generate_gui(input_filename_loops, input_filename_diags, output_filename, cache_filename=None):
 
     def _extract_data_from_csv(input_filename):
         widget_dict = {}
@@ -32,11 +35,24 @@ def generate_gui(input_filename_loops, input_filename_diags, output_filename):
             widget_dict[widget] = sorted(widget_dict[widget], key=operator.itemgetter('position'))
         return widget_dict
 
-    widgets_loops = _extract_data_from_csv(input_filename_loops)
-    widgets_diags = _extract_data_from_csv(input_filename_diags)
-    env = Environment(loader=PackageLoader('codegenerator', 'templates'), trim_blocks=True, lstrip_blocks=True )
-    template = env.get_template('panelsattr.j2')
-    output = template.render(widgets_loops=widgets_loops, widget_diags=widgets_diags)
+    def _render():
+        widgets_loops = _extract_data_from_csv(input_filename_loops)
+        widgets_diags = _extract_data_from_csv(input_filename_diags)
+        env = Environment(loader=PackageLoader('codegenerator', 'templates'), trim_blocks=True, lstrip_blocks=True )
+        template = env.get_template('panelsattr.j2')
+        return template.render(widgets_loops=widgets_loops, widget_diags=widgets_diags)
+
+    # The whole panel file is only rendered again when a csv or a template changes
+    inputs = []
+    for filename in (input_filename_loops, input_filename_diags):
+        with open(filename, 'rb') as fd:
+            inputs.append(fd.read())
+    key = get_digest(get_templates_digest(), inputs)
+
+    cache = FragmentCache(cache_filename)
+    output = cache.get(key, os.path.basename(output_filename), _render)
+    cache.save()
+
     fd = open(output_filename, 'w')
     fd.write(output)
     fd.close()
@@ -46,7 +62,8 @@ if __name__ == '__main__':
     parser.add_argument('input_filename_loops', help='Input Filename from where to extract the data')
     parser.add_argument('input_filename_diags', help='Input Filename from where to extract the data')
     parser.add_argument('output_filename', help='Filename for generated file')
+    parser.add_argument('--cache', dest='cache_filename', help='File where the rendered panels are cached')
     args = parser.parse_args()
 
-    generate_gui(args.input_filename_loops, args.input_filename_diags, args.output_filename)
+    generate_gui(args.input_filename_loops, args.input_filename_diags, args.output_filename, args.cache_filename)
 